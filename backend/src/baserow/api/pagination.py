@@ -1,8 +1,82 @@
+import base64
+import binascii
+import json
+from functools import cached_property
+from typing import Any, List, Optional
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, OrderBy, Q
+
 from rest_framework.exceptions import APIException, NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.pagination import (
+    LimitOffsetPagination as RestFrameworkLimitOffsetPagination,
+)
 from rest_framework.pagination import (
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
+from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.utils.urls import replace_query_param
+
+
+class PrecountedPaginator(Paginator):
+    """
+    A paginator that uses an already known count instead of counting the objects
+    of the queryset, which can be expensive for large tables.
+    """
+
+    def __init__(self, object_list, per_page, precomputed_count: int, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.precomputed_count = precomputed_count
+
+    @cached_property
+    def count(self):
+        return self.precomputed_count
+
+
+class EstimatedCountPage(Page):
+    def __init__(self, object_list, number, paginator, has_next: bool):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class EstimatedCountPaginator(PrecountedPaginator):
+    """
+    A paginator that reports an estimated count. The estimate can be lower or higher
+    than the actual number of objects, so it's not used to validate the page number.
+    Instead, one more object than the page size is fetched to know whether the page
+    and the next one exist.
+    """
+
+    def validate_number(self, number):
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        objects = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not objects and (number > 1 or not self.allow_empty_first_page):
+            raise EmptyPage(self.error_messages["no_results"])
+        return EstimatedCountPage(
+            objects[: self.per_page],
+            number,
+            self,
+            has_next=len(objects) > self.per_page,
+        )
 
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
@@ -11,10 +85,40 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
     page_size = 100
     page_size_query_param = "size"
 
-    def __init__(self, limit_page_size=None, *args, **kwargs):
+    def __init__(
+        self,
+        limit_page_size=None,
+        *args,
+        count: Optional[int] = None,
+        count_is_exact: Optional[bool] = None,
+        **kwargs,
+    ):
+        """
+        :param limit_page_size: The maximum page size that can be requested.
+        :param count: If provided, this count is used instead of counting the
+            objects of the queryset.
+        :param count_is_exact: If provided, it's added to the response to
+            indicate whether the count is exact or an estimate. An estimated count
+            is only reported, the page number is validated using the objects of
+            the page.
+        """
+
         self.limit_page_size = limit_page_size
+        self.precomputed_count = count
+        self.count_is_exact = count_is_exact
         super().__init__(*args, **kwargs)
 
+    def django_paginator_class(self, object_list, per_page, **kwargs):
+        if self.precomputed_count is None:
+            return Paginator(object_list, per_page, **kwargs)
+        if self.count_is_exact is False:
+            return EstimatedCountPaginator(
+                object_list, per_page, self.precomputed_count, **kwargs
+            )
+        return PrecountedPaginator(
+            object_list, per_page, self.precomputed_count, **kwargs
+        )
+
     def get_page_size(self, request):
         page_size = super().get_page_size(request)
 
@@ -39,3 +143,278 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.count_is_exact is not None:
+            response.data["count_is_exact"] = self.count_is_exact
+        return response
+
+
+class LimitOffsetPagination(RestFrameworkLimitOffsetPagination):
+    def __init__(
+        self,
+        *args,
+        count: Optional[int] = None,
+        count_is_exact: Optional[bool] = None,
+        **kwargs,
+    ):
+        """
+        :param count: If provided, this count is used instead of counting the
+            objects of the queryset.
+        :param count_is_exact: If provided, it's added to the response to
+            indicate whether the count is exact or an estimate. An estimated count
+            is only reported, whether there is a next page is checked using the
+            objects of the queryset.
+        """
+
+        self.precomputed_count = count
+        self.count_is_exact = count_is_exact
+        self.has_next = None
+        super().__init__(*args, **kwargs)
+
+    def get_count(self, queryset):
+        if self.precomputed_count is None:
+            return super().get_count(queryset)
+        return self.precomputed_count
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.count_is_exact is not False:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.count = self.get_count(queryset)
+        self.offset = self.get_offset(request)
+        # The estimated count can't be compared with the offset, so one more object
+        # is fetched to know whether there is a next page.
+        objects = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(objects) > self.limit
+        return objects[: self.limit]
+
+    def get_next_link(self):
+        if self.has_next is None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url, self.offset_query_param, self.offset + self.limit
+        )
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.count_is_exact is not None:
+            response.data["count_is_exact"] = self.count_is_exact
+        return response
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginates a queryset using the values of the ordering expressions of the last
+    row of the previous page instead of an offset. PostgreSQL can then seek directly
+    to the first row of the next page using the index matching the ordering, so
+    fetching a page takes the same time regardless of how deep the page is.
+
+    The ordering of the queryset is respected, including annotated ordering
+    expressions and the position of null values. The `id` is always added as the
+    last ordering expression to make sure that the ordering is unique.
+    """
+
+    page_size = 100
+    page_size_query_param = "size"
+    cursor_query_param = "cursor"
+    key_annotation_prefix = "_keyset_key_"
+
+    def __init__(self, limit_page_size=None):
+        self.limit_page_size = limit_page_size
+        self.next_cursor = None
+        self.request = None
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size <= 0:
+                raise ValueError()
+        except (KeyError, ValueError):
+            page_size = self.page_size
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            exception = APIException(
+                {
+                    "error": "ERROR_PAGE_SIZE_LIMIT",
+                    "detail": f"The page size is limited to {self.limit_page_size}.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        return page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        order_by = self.get_order_by(queryset)
+
+        key_names = [f"{self.key_annotation_prefix}{i}" for i in range(len(order_by))]
+        queryset = queryset.annotate(
+            **{name: o.expression for name, o in zip(key_names, order_by)}
+        ).order_by(*order_by)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.decode_cursor(cursor, len(key_names))
+            nullable = [self.is_nullable(queryset.model, o) for o in order_by]
+            queryset = queryset.filter(
+                self.get_after_keys_filter(key_names, order_by, nullable, values)
+            )
+
+        rows = list(queryset[: page_size + 1])
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.next_cursor = self.encode_cursor(
+                [getattr(rows[-1], name) for name in key_names]
+            )
+
+        return rows
+
+    def get_order_by(self, queryset) -> List[OrderBy]:
+        """
+        Returns the ordering of the queryset as a list of `OrderBy` expressions that
+        always ends with the `id`, so that every row has a unique position.
+        """
+
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+
+        order_by = []
+        for order in ordering:
+            if isinstance(order, str):
+                descending = order.startswith("-")
+                order = F(order.lstrip("-")).desc() if descending else F(order).asc()
+            elif not isinstance(order, OrderBy):
+                order = order.asc()
+            order_by.append(order)
+
+        if not any(
+            isinstance(o.expression, F) and o.expression.name in ("id", "pk")
+            for o in order_by
+        ):
+            order_by.append(F("id").asc())
+
+        return order_by
+
+    @staticmethod
+    def is_nullable(model, order: OrderBy) -> bool:
+        """
+        Checks whether the ordering expression can be null. Only a direct reference
+        to a non-nullable column is known not to be null, which allows leaving out
+        null checks that would otherwise prevent an index range scan.
+        """
+
+        if not isinstance(order.expression, F):
+            return True
+
+        try:
+            return model._meta.get_field(order.expression.name).null
+        except FieldDoesNotExist:
+            return True
+
+    @classmethod
+    def get_after_keys_filter(
+        cls,
+        key_names: List[str],
+        order_by: List[OrderBy],
+        nullable: List[bool],
+        values: List[Any],
+    ) -> Q:
+        """
+        Builds a filter that only matches the rows positioned after the row having
+        the provided key values, given the direction and null ordering of every key.
+        The first key is additionally bounded on its own, so that the database can
+        start an index scan at the right position.
+        """
+
+        after = Q(pk__in=[])
+        equal_to_previous_keys = Q()
+        for name, order, can_be_null, value in zip(
+            key_names, order_by, nullable, values
+        ):
+            after |= equal_to_previous_keys & cls._after_key_filter(
+                name, order, can_be_null, value
+            )
+            if value is None:
+                equal_to_previous_keys &= Q(**{f"{name}__isnull": True})
+            else:
+                equal_to_previous_keys &= Q(**{name: value})
+
+        first_name, first_value = key_names[0], values[0]
+        if first_value is None:
+            at_or_after_first_key = Q(**{f"{first_name}__isnull": True})
+        else:
+            at_or_after_first_key = Q(**{first_name: first_value})
+        at_or_after_first_key |= cls._after_key_filter(
+            first_name, order_by[0], nullable[0], first_value
+        )
+
+        return at_or_after_first_key & after
+
+    @staticmethod
+    def _after_key_filter(
+        name: str, order: OrderBy, can_be_null: bool, value: Any
+    ) -> Q:
+        # PostgreSQL sorts nulls last in ascending order and first in descending
+        # order, unless explicitly specified otherwise.
+        nulls_first = order.nulls_first or (order.descending and not order.nulls_last)
+
+        if value is None:
+            return Q(**{f"{name}__isnull": False}) if nulls_first else Q(pk__in=[])
+
+        lookup = "lt" if order.descending else "gt"
+        after = Q(**{f"{name}__{lookup}": value})
+        if can_be_null and not nulls_first:
+            after |= Q(**{f"{name}__isnull": True})
+        return after
+
+    def encode_cursor(self, values: List[Any]) -> str:
+        serialized = json.dumps(values, cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(serialized.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, cursor: str, expected_length: int) -> List[Any]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except (ValueError, TypeError, binascii.Error):
+            values = None
+
+        if not isinstance(values, list) or len(values) != expected_length:
+            exception = APIException(
+                {
+                    "error": "ERROR_INVALID_CURSOR",
+                    "detail": "The provided cursor is invalid. Make sure to use the "
+                    "cursor of a previous response with the same ordering.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        return values
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "next_cursor": self.next_cursor,
+                "results": data,
+            }
+        )
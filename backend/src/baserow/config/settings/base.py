@@ -310,6 +310,20 @@ BUILDER_PUBLICLY_USED_PROPERTIES_CACHE_TTL_SECONDS = int(
     os.getenv("BASEROW_BUILDER_PUBLICLY_USED_PROPERTIES_CACHE_TTL_SECONDS")
     or 600
 )
+# The maximum number of threads used to dispatch the independent data sources of the
+# pages concurrently. The threads are shared by all the requests of a process and
+# every thread keeps its own database connection. Set it to 1 to dispatch the data
+# sources one after the other.
+BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS = int(
+    os.getenv("BASEROW_BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS") or 4
+)
+# The elements, data sources and workflow actions of the pages of a published
+# builder are cached for the visitors. A new publication is cached under new keys,
+# but the context data of the data sources can still depend on the data, like the
+# select options of a table, so they're also refreshed after this number of seconds.
+BUILDER_PUBLIC_PAYLOAD_CACHE_TTL_SECONDS = int(
+    os.getenv("BASEROW_BUILDER_PUBLIC_PAYLOAD_CACHE_TTL_SECONDS") or 600
+)
 
 
 def install_cachalot():
@@ -339,6 +353,16 @@ CELERY_SINGLETON_BACKEND_CLASS = (
 # This flag enable automatic index creation for table views based on sortings.
 AUTO_INDEX_VIEW_ENABLED = os.getenv("BASEROW_AUTO_INDEX_VIEW_ENABLED", "true") == "true"
 AUTO_INDEX_LOCK_EXPIRY = os.getenv("BASEROW_AUTO_INDEX_LOCK_EXPIRY", 60 * 2)
+# This flag enable automatic trigram index creation for the text fields of tables
+# searched with the trigram search mode.
+AUTO_INDEX_TRIGRAM_SEARCH_ENABLED = (
+    os.getenv("BASEROW_AUTO_INDEX_TRIGRAM_SEARCH_ENABLED", "true") == "true"
+)
+# The number of seconds after which a missing trigram index is looked up again,
+# and its creation scheduled again if it's still missing.
+AUTO_INDEX_TRIGRAM_SEARCH_RECHECK_DELAY = int(
+    os.getenv("BASEROW_AUTO_INDEX_TRIGRAM_SEARCH_RECHECK_DELAY", 60 * 10)
+)
 
 # Should contain the database connection name of the database where the user tables
 # are stored. This can be different than the default database because there are not
@@ -969,6 +993,26 @@ HOURS_UNTIL_TRASH_PERMANENTLY_DELETED = int(
     os.getenv("HOURS_UNTIL_TRASH_PERMANENTLY_DELETED", 24 * 3)
 )
 OLD_TRASH_CLEANUP_CHECK_INTERVAL_MINUTES = 5
+# The trashed rows marked for permanent deletion are deleted in bulk, table per table,
+# by batches of at most this number of trash entries. The batch size is halved when a
+# batch exceeds the `max_locks_per_transaction` of PostgreSQL.
+TRASH_PERMANENT_DELETION_BATCH_SIZE = int(
+    os.getenv("BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE") or 1000
+)
+# The maximum number of threads deleting the trashed rows of different workspaces
+# concurrently. Every thread uses its own database connection. Set it to 1 to delete
+# the workspaces one after the other.
+TRASH_PERMANENT_DELETION_MAX_WORKERS = int(
+    os.getenv("BASEROW_TRASH_PERMANENT_DELETION_MAX_WORKERS") or 2
+)
+# When enabled, the trashed rows are moved out of their table to an archive shortly
+# after being trashed, so that the queries of the table don't have to skip them, and
+# are moved back when restored. Creating a field, or changing the type or the
+# properties of a field, directly or through the formulas depending on it, moves all
+# the archived rows of the affected tables back and archives them again afterwards,
+# which makes that slower for tables with many trashed rows. Disabling it doesn't
+# move the archived rows back, but they can still be restored or permanently deleted.
+TRASH_ARCHIVE_ROWS = os.getenv("BASEROW_TRASH_ARCHIVE_ROWS", "false") == "true"
 
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
@@ -979,6 +1023,19 @@ FILE_UPLOAD_PERMISSIONS = None
 
 MAX_FORMULA_STRING_LENGTH = 10000
 MAX_FIELD_REFERENCE_DEPTH = 1000
+# The number of parsed formulas kept in memory by every process. Parsing a formula is
+# slow, and the same formulas are parsed every time their fields are fetched.
+BASEROW_FORMULA_AST_CACHE_SIZE = int(os.getenv("BASEROW_FORMULA_AST_CACHE_SIZE", 4096))
+# If set, the parsed formulas are also stored in the shared cache for this number of
+# seconds, so that they can be reused by the other processes.
+BASEROW_FORMULA_AST_SHARED_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_FORMULA_AST_SHARED_CACHE_TIMEOUT", 0)
+)
+# The number of compiled runtime formulas, used by the application builder, kept in
+# memory by every process.
+BASEROW_RUNTIME_FORMULA_CACHE_SIZE = int(
+    os.getenv("BASEROW_RUNTIME_FORMULA_CACHE_SIZE", 4096)
+)
 DONT_UPDATE_FORMULAS_AFTER_MIGRATION = bool(
     os.getenv("DONT_UPDATE_FORMULAS_AFTER_MIGRATION", "")
 )
@@ -1002,6 +1059,10 @@ BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES = int(
 BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL = int(
     os.getenv("BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL", 8)
 )
+# The webhook calls can be sent to a dedicated queue, so that they can be consumed
+# by workers using a pool suited for I/O bound tasks, like
+# `celery worker -Q webhooks --pool threads --concurrency 100`.
+BASEROW_WEBHOOKS_QUEUE_NAME = os.getenv("BASEROW_WEBHOOKS_QUEUE_NAME", "export")
 BASEROW_WEBHOOKS_MAX_PER_TABLE = int(os.getenv("BASEROW_WEBHOOKS_MAX_PER_TABLE", 20))
 BASEROW_WEBHOOKS_MAX_CALL_LOG_ENTRIES = int(
     os.getenv("BASEROW_WEBHOOKS_MAX_CALL_LOG_ENTRIES", 10)
@@ -1009,6 +1070,26 @@ BASEROW_WEBHOOKS_MAX_CALL_LOG_ENTRIES = int(
 BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS = int(
     os.getenv("BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS", 5)
 )
+# The maximum number of calls of a single webhook that can be in progress at the
+# same time. 0 disables the limit. The calls of a webhook without batching can
+# reach the receiver in another order than the events occurred, which is more
+# likely with a higher limit. Use 1 to preserve the order as much as possible.
+BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK", 4)
+)
+# The number of times a call waits, with an exponential backoff, for a free call
+# slot of its webhook before it counts as a failed attempt.
+BASEROW_WEBHOOKS_MAX_CALL_SLOT_WAITS = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_CALL_SLOT_WAITS", 10)
+)
+# The events of the webhooks having batching enabled are collected for this number
+# of seconds and then delivered in calls of at most the max number of events.
+BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS = int(
+    os.getenv("BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS", 2)
+)
+BASEROW_WEBHOOKS_BATCH_MAX_EVENTS = int(
+    os.getenv("BASEROW_WEBHOOKS_BATCH_MAX_EVENTS", 100)
+)
 BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS = bool(
     os.getenv("BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS", False)
 )
@@ -1170,6 +1251,23 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# Views of tables having more rows than this threshold according to the PostgreSQL
+# statistics show an estimated count when not filtered, and cache the exact count when
+# filtered, because counting all the rows of a large table requires a full scan.
+BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = int(
+    os.getenv("BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD", 100000)
+)
+# The maximum number of generated table model classes that each worker process keeps
+# in memory. Set to 0 to disable the in-memory model class cache entirely.
+BASEROW_MODEL_CLASS_CACHE_MAX_ENTRIES = int(
+    os.getenv("BASEROW_MODEL_CLASS_CACHE_MAX_ENTRIES", 256)
+)
+# The in-memory model class cache also evicts the least recently used models once the
+# sum of the number of fields of all the cached models exceeds this value, because
+# wide tables take up significantly more memory than narrow ones.
+BASEROW_MODEL_CLASS_CACHE_MAX_FIELDS = int(
+    os.getenv("BASEROW_MODEL_CLASS_CACHE_MAX_FIELDS", 20000)
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1201,6 +1299,17 @@ USE_PG_FULLTEXT_SEARCH = str_to_bool(
 PG_SEARCH_CONFIG = os.getenv("BASEROW_PG_SEARCH_CONFIG", "simple")
 AUTO_VACUUM_AFTER_SEARCH_UPDATE = str_to_bool(os.getenv("BASEROW_AUTO_VACUUM", "true"))
 TSV_UPDATE_CHUNK_SIZE = int(os.getenv("BASEROW_TSV_UPDATE_CHUNK_SIZE", "2000"))
+# When enabled, new tables and the tables that are loaded get a single weighted
+# search document column per row instead of a tsvector column per field, which
+# reduces the write amplification and index size of wide tables.
+PG_SEARCH_ROW_DOCUMENT_ENABLED = str_to_bool(
+    os.getenv("BASEROW_PG_SEARCH_ROW_DOCUMENT_ENABLED", "false")
+)
+# When enabled, the search vector of every cell is also stored in a single side
+# table, so that all the tables of a workspace can be searched with one query.
+WORKSPACE_SEARCH_INDEX_ENABLED = str_to_bool(
+    os.getenv("BASEROW_WORKSPACE_SEARCH_INDEX_ENABLED", "false")
+)
 
 POSTHOG_PROJECT_API_KEY = os.getenv("POSTHOG_PROJECT_API_KEY", "")
 POSTHOG_HOST = os.getenv("POSTHOG_HOST", "")
@@ -56,8 +56,14 @@ if "cachalot" not in INSTALLED_APPS:
 CACHALOT_ENABLED = False
 
 BUILDER_PUBLICLY_USED_PROPERTIES_CACHE_TTL_SECONDS = 10
+# The public payloads are modified directly by the tests, so they're not cached.
+BUILDER_PUBLIC_PAYLOAD_CACHE_TTL_SECONDS = 0
 
 AUTO_INDEX_VIEW_ENABLED = False
+AUTO_INDEX_TRIGRAM_SEARCH_ENABLED = False
+# Tests often mutate the field instances of a generated model, so they should not be
+# shared between tests by the in-memory model class cache unless a test enables it.
+BASEROW_MODEL_CLASS_CACHE_MAX_ENTRIES = 0
 # For ease of testing tests assume this setting is set to this. Set it explicitly to
 # prevent any dev env config from breaking the tests.
 BASEROW_PERSONAL_VIEW_LOWEST_ROLE_ALLOWED = "VIEWER"
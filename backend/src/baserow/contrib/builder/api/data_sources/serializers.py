@@ -35,6 +35,9 @@ class DataSourceSerializer(ServiceSerializer):
         help_text=DataSource._meta.get_field("order").help_text
     )
     type = serializers.SerializerMethodField(help_text="The type of the data source.")
+    public_cache_ttl = serializers.SerializerMethodField(
+        help_text=DataSource._meta.get_field("public_cache_ttl").help_text
+    )
 
     def _get_service_instance(self, instance):
         # We generate the service schema using a `Service` instance.
@@ -66,6 +69,10 @@ class DataSourceSerializer(ServiceSerializer):
     def get_order(self, instance):
         return self.context["data_source"].order
 
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_public_cache_ttl(self, instance):
+        return self.context["data_source"].public_cache_ttl
+
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_schema(self, instance):
         service_instance = self._get_service_instance(instance)
@@ -90,10 +97,16 @@ class DataSourceSerializer(ServiceSerializer):
             return None
 
     class Meta(ServiceSerializer.Meta):
-        fields = ServiceSerializer.Meta.fields + ("name", "page_id", "order")
+        fields = ServiceSerializer.Meta.fields + (
+            "name",
+            "page_id",
+            "order",
+            "public_cache_ttl",
+        )
         extra_kwargs = {
             **ServiceSerializer.Meta.extra_kwargs,
             "name": {"read_only": True},
+            "public_cache_ttl": {"read_only": True},
             "page_id": {"read_only": True},
             "order": {"read_only": True, "help_text": "Lowest first."},
         }
@@ -125,29 +138,41 @@ class CreateDataSourceSerializer(CreateServiceSerializer):
         required=False,
         help_text="The type of the service.",
     )
+    public_cache_ttl = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text=DataSource._meta.get_field("public_cache_ttl").help_text,
+    )
 
     class Meta(ServiceSerializer.Meta):
         fields = CreateServiceSerializer.Meta.fields + (
             "name",
             "page_id",
             "before_id",
+            "public_cache_ttl",
         )
 
 
 class BaseUpdateDataSourceSerializer(serializers.ModelSerializer):
     class Meta(ServiceSerializer.Meta):
         model = DataSource
-        fields = ("name",)
+        fields = ("name", "public_cache_ttl")
         extra_kwargs = {
             "name": {"required": False},
+            "public_cache_ttl": {"required": False},
         }
 
 
 class UpdateDataSourceSerializer(UpdateServiceSerializer):
     name = serializers.CharField(required=False)
+    public_cache_ttl = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text=DataSource._meta.get_field("public_cache_ttl").help_text,
+    )
 
     class Meta(ServiceSerializer.Meta):
-        fields = UpdateServiceSerializer.Meta.fields + ("name",)
+        fields = UpdateServiceSerializer.Meta.fields + ("name", "public_cache_ttl")
 
 
 class MoveDataSourceSerializer(serializers.Serializer):
@@ -523,7 +523,9 @@ class DispatchDataSourcesView(APIView):
             ),
         },
     )
-    @transaction.atomic
+    # Not atomic, so that the independent data sources can be dispatched
+    # concurrently using their own database connections. The handler dispatches
+    # every data source in a transaction.
     @map_exceptions(
         {
             PageDoesNotExist: ERROR_PAGE_DOES_NOT_EXIST,
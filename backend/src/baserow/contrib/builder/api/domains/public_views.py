@@ -1,4 +1,8 @@
+from typing import Dict, List
+
 from django.db import transaction
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
 
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
@@ -38,9 +42,11 @@ from baserow.contrib.builder.data_sources.exceptions import (
 )
 from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.service import DataSourceService
+from baserow.contrib.builder.domains.public_payload_handler import (
+    PublicPagePayloadHandler,
+)
 from baserow.contrib.builder.domains.service import DomainService
 from baserow.contrib.builder.elements.registries import element_type_registry
-from baserow.contrib.builder.elements.service import ElementService
 from baserow.contrib.builder.errors import ERROR_BUILDER_DOES_NOT_EXIST
 from baserow.contrib.builder.exceptions import BuilderDoesNotExist
 from baserow.contrib.builder.pages.exceptions import PageDoesNotExist
@@ -49,9 +55,6 @@ from baserow.contrib.builder.service import BuilderService
 from baserow.contrib.builder.workflow_actions.registries import (
     builder_workflow_action_type_registry,
 )
-from baserow.contrib.builder.workflow_actions.service import (
-    BuilderWorkflowActionService,
-)
 from baserow.core.exceptions import ApplicationDoesNotExist, PermissionException
 from baserow.core.services.exceptions import DoesNotExist, ServiceImproperlyConfigured
 from baserow.core.services.registries import service_type_registry
@@ -59,6 +62,30 @@ from baserow.core.services.registries import service_type_registry
 from .serializers import PublicDataSourceSerializer, PublicElementSerializer
 
 
+def public_page_payload_response(
+    request: HttpRequest, payload: List[Dict], etag: str
+) -> HttpResponseBase:
+    """
+    Responds with the public payload, or with a `304 Not Modified` if the client
+    already has the version matching the ETag. The client must revalidate every
+    time because the payload depends on the user.
+
+    :param request: The request of the client.
+    :param payload: The public payload.
+    :param etag: The ETag of the payload.
+    :return: The response.
+    """
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = Response(payload)
+
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+
+    return response
+
+
 class PublicBuilderByDomainNameView(APIView):
     permission_classes = (AllowAny,)
 
@@ -177,13 +204,11 @@ class PublicElementsView(APIView):
 
         page = PageHandler().get_page(page_id)
 
-        elements = ElementService().get_elements(request.user, page)
+        data, etag = PublicPagePayloadHandler().get_payload(
+            "elements", request.user, page
+        )
 
-        data = [
-            element_type_registry.get_serializer(element, PublicElementSerializer).data
-            for element in elements
-        ]
-        return Response(data)
+        return public_page_payload_response(request, data, etag)
 
 
 class PublicDataSourcesView(APIView):
@@ -225,18 +250,11 @@ class PublicDataSourcesView(APIView):
 
         page = PageHandler().get_page(page_id)
 
-        data_sources = DataSourceService().get_data_sources(request.user, page)
+        data, etag = PublicPagePayloadHandler().get_payload(
+            "data_sources", request.user, page
+        )
 
-        data = [
-            service_type_registry.get_serializer(
-                data_source.service,
-                PublicDataSourceSerializer,
-                context={"data_source": data_source},
-            ).data
-            for data_source in data_sources
-            if data_source.service and data_source.service.integration_id
-        ]
-        return Response(data)
+        return public_page_payload_response(request, data, etag)
 
 
 class PublicBuilderWorkflowActionsView(APIView):
@@ -278,20 +296,11 @@ class PublicBuilderWorkflowActionsView(APIView):
     def get(self, request, page_id: int):
         page = PageHandler().get_page(page_id)
 
-        workflow_actions = BuilderWorkflowActionService().get_workflow_actions(
-            request.user, page
+        data, etag = PublicPagePayloadHandler().get_payload(
+            "workflow_actions", request.user, page
         )
 
-        data = [
-            builder_workflow_action_type_registry.get_serializer(
-                workflow_action,
-                BuilderWorkflowActionSerializer,
-                extra_params={"public": True},
-            ).data
-            for workflow_action in workflow_actions
-        ]
-
-        return Response(data)
+        return public_page_payload_response(request, data, etag)
 
 
 class PublicDispatchDataSourceView(APIView):
@@ -392,7 +401,9 @@ class PublicDispatchDataSourcesView(APIView):
             ),
         },
     )
-    @transaction.atomic
+    # Not atomic, so that the independent data sources can be dispatched
+    # concurrently using their own database connections. The handler dispatches
+    # every data source in a transaction.
     @map_exceptions(
         {
             PageDoesNotExist: ERROR_PAGE_DOES_NOT_EXIST,
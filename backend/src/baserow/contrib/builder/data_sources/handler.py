@@ -1,9 +1,19 @@
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 from zipfile import ZipFile
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.files.storage import Storage
+from django.db import close_old_connections, connection, models, transaction
 from django.db.models import Q, QuerySet
 
+from redis.exceptions import LockNotOwnedError
+
 from baserow.contrib.builder.data_sources.builder_dispatch_context import (
     BuilderDispatchContext,
 )
@@ -13,6 +23,9 @@ from baserow.contrib.builder.data_sources.exceptions import (
 )
 from baserow.contrib.builder.data_sources.models import DataSource
 from baserow.contrib.builder.formula_importer import import_formula
+from baserow.contrib.builder.formula_property_extractor import (
+    get_data_source_dependencies,
+)
 from baserow.contrib.builder.pages.models import Page
 from baserow.contrib.builder.types import DataSourceDict
 from baserow.core.integrations.models import Integration
@@ -27,6 +40,31 @@ from .types import DataSourceForUpdate
 if TYPE_CHECKING:
     from baserow.contrib.builder.models import Builder
 
+DISPATCH_CACHE_KEY_PREFIX = "builder_data_source_dispatch"
+DISPATCH_CACHE_VERSION_KEY_PREFIX = "builder_data_source_table_version"
+
+_dispatch_executor: Optional[ThreadPoolExecutor] = None
+_dispatch_executor_lock = threading.Lock()
+
+
+def get_data_sources_dispatch_executor() -> ThreadPoolExecutor:
+    """
+    Returns the thread pool used by all the requests of the process to dispatch
+    independent data sources concurrently. Its threads are kept alive, so their
+    database connections are reused across requests and respect the `CONN_MAX_AGE`
+    setting, like the connections of the request threads.
+    """
+
+    global _dispatch_executor
+
+    with _dispatch_executor_lock:
+        if _dispatch_executor is None:
+            _dispatch_executor = ThreadPoolExecutor(
+                max_workers=settings.BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS,
+                thread_name_prefix="builder-data-source-dispatch",
+            )
+        return _dispatch_executor
+
 
 class DataSourceHandler:
     def __init__(self):
@@ -262,6 +300,7 @@ class DataSourceHandler:
         name: str,
         service_type: Optional[ServiceType] = None,
         before: Optional[DataSource] = None,
+        public_cache_ttl: int = 0,
         **kwargs,
     ) -> DataSource:
         """
@@ -271,6 +310,8 @@ class DataSourceHandler:
         :param name: The human name of the data_source.
         :param service_type: The type of the service related to the data_source.
         :param before: If set, the new data_source is inserted before this data_source.
+        :param public_cache_ttl: The number of seconds the results are cached for the
+            anonymous visitors of the published site.
         :param kwargs: Additional attributes of the related service.
         :raises CannotCalculateIntermediateOrder: If it's not possible to find an
             intermediate order. The full order of the data_source of the page must be
@@ -291,7 +332,11 @@ class DataSourceHandler:
             service = None
 
         data_source = DataSource.objects.create(
-            page=page, order=order, name=name, service=service
+            page=page,
+            order=order,
+            name=name,
+            service=service,
+            public_cache_ttl=public_cache_ttl,
         )
         data_source.save()
 
@@ -303,6 +348,7 @@ class DataSourceHandler:
         service_type: Optional[ServiceType] = None,
         name: Optional[str] = None,
         page: Optional[Page] = None,
+        public_cache_ttl: Optional[int] = None,
         **kwargs,
     ) -> DataSource:
         """
@@ -310,6 +356,8 @@ class DataSourceHandler:
 
         :param data_source: The data_source that should be updated.
         :param name: A new name for the data_source.
+        :param public_cache_ttl: A new number of seconds the results are cached for
+            the anonymous visitors of the published site.
         :param values: The values that should be set on the data_source.
         :return: The updated data_source.
         """
@@ -360,6 +408,9 @@ class DataSourceHandler:
         if name is not None:
             data_source.name = name
 
+        if public_cache_ttl is not None:
+            data_source.public_cache_ttl = public_cache_ttl
+
         data_source.save()
 
         return data_source
@@ -386,18 +437,111 @@ class DataSourceHandler:
             result for this data source.
         """
 
-        data_sources_dispatch = {}
-        for data_source in data_sources:
-            # Add the initial call to the call stack
-            dispatch_context.add_call(data_source.id)
+        data_sources = list(data_sources)
+
+        # The data sources that don't read from other data sources are dispatched
+        # first and concurrently if possible. The dependent ones are dispatched
+        # afterward and can then use the cached results of the others.
+        data_sources_dispatch = self._dispatch_independent_data_sources_concurrently(
+            data_sources, dispatch_context
+        )
+
+        with transaction.atomic():
+            for data_source in data_sources:
+                if data_source.id in data_sources_dispatch:
+                    continue
+
+                # Add the initial call to the call stack
+                dispatch_context.add_call(data_source.id)
+                try:
+                    data_sources_dispatch[data_source.id] = self.dispatch_data_source(
+                        data_source, dispatch_context
+                    )
+                except Exception as e:
+                    data_sources_dispatch[data_source.id] = e
+                # Reset the stack as we are starting a new dispatch
+                dispatch_context.reset_call_stack()
+
+        return {
+            data_source.id: data_sources_dispatch[data_source.id]
+            for data_source in data_sources
+        }
+
+    def _dispatch_independent_data_sources_concurrently(
+        self, data_sources: List[DataSource], dispatch_context: BuilderDispatchContext
+    ) -> Dict[int, Union[Any, Exception]]:
+        """
+        Dispatches the data sources that don't depend on any other data source on the
+        shared thread pool, each in a transaction on the connection of its thread and
+        with its own copy of the dispatch context. The results are added to the cache
+        of the given dispatch context, so they can be used by the dependent data
+        sources.
+
+        Nothing is dispatched if there are fewer than two independent data sources, if
+        the thread pool is disabled with the
+        `BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS` setting, or if we're in a
+        transaction because the other connections wouldn't see its changes.
+
+        :param data_sources: The data sources to be dispatched.
+        :param dispatch_context: The context used for the dispatch.
+        :return: The result of dispatching the independent data sources mapped by
+            data source ID.
+        """
+
+        max_workers = settings.BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS
+        if max_workers < 2 or connection.in_atomic_block:
+            return {}
+
+        cached_contents = dispatch_context.cache.get("data_source_contents", {})
+        independent_data_sources = [
+            data_source
+            for data_source in data_sources
+            if data_source.service_id
+            and data_source.id not in cached_contents
+            and not get_data_source_dependencies(data_source)
+        ]
+        if len(independent_data_sources) < 2:
+            return {}
+
+        # The public formula fields are the same for all the data sources, so
+        # they're computed once instead of once per thread.
+        public_formula_fields = dispatch_context.public_formula_fields
+
+        def dispatch_in_thread(data_source: DataSource) -> Union[Any, Exception]:
+            thread_dispatch_context = type(dispatch_context).from_context(
+                dispatch_context
+            )
+            thread_dispatch_context.public_formula_fields = public_formula_fields
+            thread_dispatch_context.cache["data_source_contents"] = {**cached_contents}
+
+            close_old_connections()
             try:
-                data_sources_dispatch[data_source.id] = self.dispatch_data_source(
-                    data_source, dispatch_context
-                )
+                with transaction.atomic():
+                    thread_dispatch_context.add_call(data_source.id)
+                    return self.dispatch_data_source(
+                        data_source, thread_dispatch_context
+                    )
             except Exception as e:
-                data_sources_dispatch[data_source.id] = e
-            # Reset the stack as we are starting a new dispatch
-            dispatch_context.reset_call_stack()
+                return e
+            finally:
+                # Like at the end of a request, the connection is only closed if it's
+                # unusable or older than `CONN_MAX_AGE`.
+                close_old_connections()
+
+        results = list(
+            get_data_sources_dispatch_executor().map(
+                dispatch_in_thread, independent_data_sources
+            )
+        )
+
+        data_sources_dispatch = {}
+        data_source_contents = dispatch_context.cache.setdefault(
+            "data_source_contents", {}
+        )
+        for data_source, result in zip(independent_data_sources, results):
+            data_sources_dispatch[data_source.id] = result
+            if not isinstance(result, Exception):
+                data_source_contents[data_source.id] = result
 
         return data_sources_dispatch
 
@@ -420,9 +564,16 @@ class DataSourceHandler:
         if data_source.id not in dispatch_context.cache.setdefault(
             "data_source_contents", {}
         ):
-            service_dispatch = self.service_handler.dispatch_service(
-                data_source.service.specific, dispatch_context
-            )
+            service = data_source.service.specific
+
+            if self._can_cache_dispatch(data_source, service, dispatch_context):
+                service_dispatch = self._dispatch_service_with_cache(
+                    data_source, service, dispatch_context
+                )
+            else:
+                service_dispatch = self.service_handler.dispatch_service(
+                    service, dispatch_context
+                )
 
             # Cache the dispatch in the formula cache if we have formulas that need
             # it later
@@ -432,6 +583,164 @@ class DataSourceHandler:
 
         return dispatch_context.cache["data_source_contents"][data_source.id]
 
+    def _can_cache_dispatch(
+        self,
+        data_source: DataSource,
+        service: Service,
+        dispatch_context: BuilderDispatchContext,
+    ) -> bool:
+        """
+        Returns whether the result of the dispatch can be shared by the visitors. It's
+        only the case if the data source opted in, if the builder is published and
+        so can't be modified, if the visitor is anonymous and if the service reads a
+        table, so that the result can be invalidated when its rows change.
+        """
+
+        return (
+            data_source.public_cache_ttl > 0
+            and dispatch_context.page.builder.workspace_id is None
+            and dispatch_context.request.user.is_anonymous
+            and service.integration_id is not None
+            and getattr(service, "table_id", None) is not None
+        )
+
+    def _get_dispatch_version_cache_key(self, table_id: int) -> str:
+        """
+        Returns the cache key of the data version of the specified table.
+        """
+
+        return f"{DISPATCH_CACHE_VERSION_KEY_PREFIX}__{table_id}"
+
+    def _get_dispatch_version(self, table_id: int) -> int:
+        """
+        Returns the data version of the specified table. The version only exists
+        while results of the table are cached. If it doesn't exist yet, or if it
+        has been evicted, it starts from the current timestamp instead of a fixed
+        value, so that the results cached with a previous version can't be served
+        again.
+        """
+
+        cache_key = self._get_dispatch_version_cache_key(table_id)
+        version = cache.get(cache_key)
+        if version is None:
+            cache.add(cache_key, time.time_ns(), timeout=None)
+            version = cache.get(cache_key)
+        return version
+
+    def _get_dispatch_cache_key(
+        self,
+        data_source: DataSource,
+        service: Service,
+        resolved_values: Dict[str, Any],
+        dispatch_context: BuilderDispatchContext,
+    ) -> str:
+        """
+        Returns the cache key of the dispatch result. It contains the data version of
+        the table so that the key changes as soon as its rows change, and a hash of
+        everything the result depends on. The filter values are resolved during the
+        dispatch, so the data sent by the visitor is part of the hash as well.
+        """
+
+        def serialize_value(value):
+            if isinstance(value, models.Model):
+                return f"{value._meta.label}_{value.pk}"
+            return str(value)
+
+        version = self._get_dispatch_version(service.table_id)
+        parameters = json.dumps(
+            {
+                "resolved_values": sorted(
+                    [str(key), value] for key, value in resolved_values.items()
+                ),
+                "data": getattr(dispatch_context.request, "data", None),
+                "query": dict(dispatch_context.request.GET.lists()),
+                "element_id": getattr(dispatch_context.element, "id", None),
+                "range": dispatch_context.range(service),
+            },
+            sort_keys=True,
+            default=serialize_value,
+        )
+        parameters_hash = sha256(parameters.encode("utf-8")).hexdigest()
+
+        return (
+            f"{DISPATCH_CACHE_KEY_PREFIX}__{data_source.id}_{version}_"
+            f"{parameters_hash}"
+        )
+
+    def _dispatch_service_with_cache(
+        self,
+        data_source: DataSource,
+        service: Service,
+        dispatch_context: BuilderDispatchContext,
+    ) -> Any:
+        """
+        Dispatches the service of the data source with
+        `ServiceHandler.dispatch_service`, but shares the result between the visitors
+        requesting the same parameters for `data_source.public_cache_ttl` seconds, or
+        until the rows of the table change. Only one visitor computes a missing result
+        while the others wait for it, to prevent many identical queries from hitting
+        the database at the same time.
+
+        :param data_source: The data source to be dispatched.
+        :param service: The specific service of the data source.
+        :param dispatch_context: The context used for the dispatch.
+        :return: The result of dispatching the service.
+        """
+
+        # The formulas are resolved first because the result depends on their
+        # values, and they're passed to the dispatch so that they're resolved once.
+        resolved_values = service.get_type().resolve_service_formulas(
+            service, dispatch_context
+        )
+        cache_key = self._get_dispatch_cache_key(
+            data_source, service, resolved_values, dispatch_context
+        )
+
+        result = cache.get(cache_key)
+        if result is not None:
+            return result
+
+        use_lock = hasattr(cache, "lock")
+        if use_lock:
+            # This lock is optional. It avoids computing the same result many times
+            # but doesn't break anything if it fails, so the timeout is low.
+            cache_lock = cache.lock(f"{cache_key}__lock", timeout=10)
+            cache_lock.acquire()
+
+        try:
+            # The result may have been computed while waiting for the lock.
+            result = cache.get(cache_key) if use_lock else None
+            if result is None:
+                result = self.service_handler.dispatch_service(
+                    service, dispatch_context, resolved_values=resolved_values
+                )
+                cache.set(cache_key, result, timeout=data_source.public_cache_ttl)
+        finally:
+            if use_lock:
+                try:
+                    cache_lock.release()
+                except LockNotOwnedError:
+                    # If the lock release fails, it might be because of the timeout
+                    # and it's been stolen so we don't really care
+                    pass
+
+        return result
+
+    def clear_dispatch_cache(self, table_ids: Iterable[int]):
+        """
+        Increments the data version in cache for the specified tables, which
+        invalidates the cached dispatch results of all the data sources reading
+        them.
+        """
+
+        for table_id in set(table_ids):
+            try:
+                cache.incr(self._get_dispatch_version_cache_key(table_id), 1)
+            except ValueError:
+                # Nothing has been cached for the table, or the version has been
+                # evicted and the next one starts from a new timestamp anyway.
+                pass
+
     def move_data_source(
         self, data_source: DataSourceForUpdate, before: Optional[DataSource] = None
     ) -> DataSource:
@@ -497,6 +806,7 @@ class DataSourceHandler:
             name=data_source.name,
             order=str(data_source.order),
             service=serialized_service,
+            public_cache_ttl=data_source.public_cache_ttl,
         )
 
     def import_data_source(
@@ -553,6 +863,7 @@ class DataSourceHandler:
             service=service,
             order=serialized_data_source["order"],
             name=serialized_data_source["name"],
+            public_cache_ttl=serialized_data_source.get("public_cache_ttl", 0),
         )
 
         id_mapping["builder_data_sources"][
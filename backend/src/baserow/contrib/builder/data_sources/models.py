@@ -46,6 +46,11 @@ class DataSource(
     service = models.OneToOneField(
         Service, on_delete=models.SET_NULL, null=True, related_name="data_source"
     )
+    public_cache_ttl = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of seconds the results of the data source are cached for "
+        "the anonymous visitors of the published site. 0 disables the cache.",
+    )
 
     class Meta:
         ordering = ("page_id", "order", "id")
@@ -1,6 +1,14 @@
+from django.db import transaction
 from django.db.models.signals import pre_delete
+from django.dispatch import receiver
 
+from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.rows.signals import (
+    rows_created,
+    rows_deleted,
+    rows_updated,
+)
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.registries import service_type_registry
 
@@ -19,3 +27,18 @@ def before_data_source_permanently_deleted(sender, instance, **kwargs):
 
 def connect_to_data_source_pre_delete_signal():
     pre_delete.connect(before_data_source_permanently_deleted, DataSource)
+
+
+@receiver([rows_created, rows_updated, rows_deleted])
+def clear_data_source_dispatch_cache_on_rows_change(
+    sender, rows, user, table, model, **kwargs
+):
+    """
+    Invalidates the cached dispatch results of the data sources reading the table
+    once the rows change is committed, so that a concurrent dispatch can't cache
+    the data as it was before the change. The data version of a table only exists
+    while results of a data source with a `public_cache_ttl` reading it are cached,
+    so nothing is written for the other tables.
+    """
+
+    transaction.on_commit(lambda: DataSourceHandler().clear_dispatch_cache([table.id]))
@@ -236,4 +236,12 @@ class DomainHandler:
         domain.last_published = datetime.now(tz=timezone.utc)
         domain.save()
 
+        # The published builder can't change anymore, so its public pages are
+        # already prepared for the visitors.
+        from baserow.contrib.builder.domains.public_payload_handler import (
+            PublicPagePayloadHandler,
+        )
+
+        PublicPagePayloadHandler().populate_cache(duplicate_builder)
+
         return domain
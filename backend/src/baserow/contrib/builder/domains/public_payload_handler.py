@@ -0,0 +1,223 @@
+import json
+from hashlib import sha256
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractUser, AnonymousUser
+from django.core.cache import cache
+from django.db import transaction
+
+from loguru import logger
+from rest_framework.utils.encoders import JSONEncoder
+
+from baserow.contrib.builder.data_sources.operations import (
+    ListDataSourcesPageOperationType,
+)
+from baserow.contrib.builder.data_sources.service import DataSourceService
+from baserow.contrib.builder.elements.operations import ListElementsPageOperationType
+from baserow.contrib.builder.elements.registries import element_type_registry
+from baserow.contrib.builder.elements.service import ElementService
+from baserow.contrib.builder.models import Builder
+from baserow.contrib.builder.pages.models import Page
+from baserow.contrib.builder.workflow_actions.operations import (
+    ListBuilderWorkflowActionsPageOperationType,
+)
+from baserow.contrib.builder.workflow_actions.registries import (
+    builder_workflow_action_type_registry,
+)
+from baserow.contrib.builder.workflow_actions.service import (
+    BuilderWorkflowActionService,
+)
+from baserow.core.handler import CoreHandler
+from baserow.core.services.registries import service_type_registry
+
+CACHE_KEY_PREFIX = "builder_public_payload"
+
+PayloadFunction = Callable[[AbstractUser, Page], List[Dict]]
+
+User = get_user_model()
+
+
+class PublicPagePayloadHandler:
+    """
+    Computes the public elements, data sources and workflow actions of the pages
+    of a builder, as they're sent to the visitors, and caches them for the pages of
+    the published builders.
+    """
+
+    def get_elements_payload(self, user: AbstractUser, page: Page) -> List[Dict]:
+        """
+        Returns the serialized elements of the page visible to the given user.
+        """
+
+        from baserow.contrib.builder.api.domains.serializers import (
+            PublicElementSerializer,
+        )
+
+        elements = ElementService().get_elements(user, page)
+
+        return [
+            element_type_registry.get_serializer(element, PublicElementSerializer).data
+            for element in elements
+        ]
+
+    def get_data_sources_payload(self, user: AbstractUser, page: Page) -> List[Dict]:
+        """
+        Returns the serialized data sources of the page visible to the given user.
+        """
+
+        from baserow.contrib.builder.api.domains.serializers import (
+            PublicDataSourceSerializer,
+        )
+
+        data_sources = DataSourceService().get_data_sources(user, page)
+
+        return [
+            service_type_registry.get_serializer(
+                data_source.service,
+                PublicDataSourceSerializer,
+                context={"data_source": data_source},
+            ).data
+            for data_source in data_sources
+            if data_source.service and data_source.service.integration_id
+        ]
+
+    def get_workflow_actions_payload(
+        self, user: AbstractUser, page: Page
+    ) -> List[Dict]:
+        """
+        Returns the serialized public workflow actions of the page visible to the
+        given user.
+        """
+
+        from baserow.contrib.builder.api.workflow_actions.serializers import (
+            BuilderWorkflowActionSerializer,
+        )
+
+        workflow_actions = BuilderWorkflowActionService().get_workflow_actions(
+            user, page
+        )
+
+        return [
+            builder_workflow_action_type_registry.get_serializer(
+                workflow_action,
+                BuilderWorkflowActionSerializer,
+                extra_params={"public": True},
+            ).data
+            for workflow_action in workflow_actions
+        ]
+
+    @property
+    def payloads(self) -> Dict[str, Tuple[str, PayloadFunction]]:
+        """
+        The public payloads of a page mapped by name to the operation checked to
+        access them and the function computing them.
+        """
+
+        return {
+            "elements": (
+                ListElementsPageOperationType.type,
+                self.get_elements_payload,
+            ),
+            "data_sources": (
+                ListDataSourcesPageOperationType.type,
+                self.get_data_sources_payload,
+            ),
+            "workflow_actions": (
+                ListBuilderWorkflowActionsPageOperationType.type,
+                self.get_workflow_actions_payload,
+            ),
+        }
+
+    def get_cache_key(
+        self, payload_name: str, user: AbstractUser, page: Page
+    ) -> Optional[str]:
+        """
+        Returns the key used to cache the public payload of the page for the given
+        user. Only the payloads of published builders are cached because they can't
+        be modified. Publishing again creates a new builder with new pages, so the
+        key, containing the ids of the published builder and page, is versioned by
+        the publication. The elements visible to a user only depend on its role, so
+        the payloads are shared by all the users having the same role.
+
+        If the user is a Django user, return None because the editor must always get
+        the latest version.
+
+        :param payload_name: The name of the public payload.
+        :param user: The user requesting the payload.
+        :param page: The page the payload is requested for.
+        :return: The cache key, or None if the payload must not be cached.
+        """
+
+        if page.builder.workspace_id is not None or isinstance(user, User):
+            return None
+        elif user.is_anonymous:
+            role = ""
+        else:
+            role = f"_{user.role}"
+
+        return f"{CACHE_KEY_PREFIX}_{payload_name}_{page.builder_id}_{page.id}{role}"
+
+    def get_payload(
+        self, payload_name: str, user: AbstractUser, page: Page
+    ) -> Tuple[List[Dict], str]:
+        """
+        Returns the public payload of the page for the given user and its ETag. The
+        payload is read from the cache if possible, but the permissions of the user
+        are always checked.
+
+        :param payload_name: The name of the public payload, one of `payloads`.
+        :param user: The user requesting the payload.
+        :param page: The page the payload is requested for.
+        :raises PermissionException: If the user isn't allowed to access the
+            payload.
+        :return: The payload and its ETag.
+        """
+
+        operation_type, compute_payload = self.payloads[payload_name]
+        cache_key = self.get_cache_key(payload_name, user, page)
+
+        if cache_key:
+            cached_payload = cache.get(cache_key)
+            if cached_payload is not None:
+                CoreHandler().check_permissions(
+                    user, operation_type, workspace=page.builder.workspace, context=page
+                )
+                return cached_payload
+
+        payload = compute_payload(user, page)
+        payload_json = json.dumps(payload, cls=JSONEncoder, sort_keys=True)
+        etag = f'"{sha256(payload_json.encode("utf-8")).hexdigest()}"'
+
+        if cache_key:
+            cache.set(
+                cache_key,
+                (payload, etag),
+                timeout=settings.BUILDER_PUBLIC_PAYLOAD_CACHE_TTL_SECONDS,
+            )
+
+        return payload, etag
+
+    def populate_cache(self, builder: Builder):
+        """
+        Computes and caches the public payloads of all the pages of a published
+        builder for the anonymous visitors, so that the first visitors of a new
+        publication don't have to wait for them.
+
+        :param builder: The published builder.
+        """
+
+        user = AnonymousUser()
+        for page in builder.page_set.select_related("builder__workspace"):
+            for payload_name in self.payloads:
+                try:
+                    with transaction.atomic():
+                        self.get_payload(payload_name, user, page)
+                except Exception as e:
+                    # The payload will be computed by the first visitor instead, so
+                    # it must not prevent the builder from being published.
+                    logger.warning(
+                        f"Could not cache the public {payload_name} of page "
+                        f"{page.id}: {e}"
+                    )
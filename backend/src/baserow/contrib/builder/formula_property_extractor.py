@@ -1,5 +1,7 @@
-from typing import TYPE_CHECKING, Dict, List, Set
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Set
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 
 from antlr4.tree import Tree
@@ -11,6 +13,8 @@ from baserow.contrib.builder.elements.models import Element
 from baserow.contrib.builder.formula_importer import BaserowFormulaImporter
 from baserow.core.formula import BaserowFormula
 from baserow.core.formula.exceptions import InvalidBaserowFormula
+from baserow.core.formula.parser.exceptions import BaserowFormulaSyntaxError
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
 from baserow.core.utils import merge_dicts_no_duplicates, to_path
 
 if TYPE_CHECKING:
@@ -81,6 +85,84 @@ class FormulaFieldVisitor(BaserowFormulaImporter):
                 pass
 
 
+class DataSourceDependencyVisitor(BaserowFormulaImporter):
+    """
+    This visitor will visit all nodes of a formula and return the IDs of the data
+    sources it reads data from.
+    """
+
+    def __init__(self, data_provider_name: str):
+        """
+        :param data_provider_name: The name of the data provider that reads data
+            from other data sources.
+        """
+
+        self.data_provider_name = data_provider_name
+        self.results = set()
+
+    def visit(self, tree: Tree) -> Set[int]:
+        self.results = set()
+        super().visit(tree)
+        return self.results
+
+    def visitFunctionCall(self, ctx: BaserowFormula.FunctionCallContext):
+        function_name = ctx.func_name().accept(self).lower()
+        function_argument_expressions = ctx.expr()
+
+        parts = [expr.accept(self) for expr in function_argument_expressions]
+
+        if function_name == "get" and isinstance(
+            function_argument_expressions[0], BaserowFormula.StringLiteralContext
+        ):
+            data_provider_name, *path = to_path(parts[0][1:-1])
+
+            if data_provider_name == self.data_provider_name and path:
+                try:
+                    self.results.add(int(path[0]))
+                except ValueError:
+                    pass
+
+
+def get_data_source_dependencies(data_source: "DataSource") -> Set[int]:
+    """
+    Given a data source, find its formulas and the formulas of its service and
+    return the IDs of the data sources they read data from. A data source without
+    any dependency can be dispatched independently of the other data sources.
+
+    Formulas with a syntax error are ignored as they can't read from any data source.
+    """
+
+    results = set()
+
+    for formula in data_source.formula_generator(data_source):
+        if formula:
+            results |= _get_formula_data_source_dependencies(formula)
+
+    return results
+
+
+@lru_cache(maxsize=settings.BASEROW_RUNTIME_FORMULA_CACHE_SIZE)
+def _get_formula_data_source_dependencies(formula: str) -> FrozenSet[int]:
+    """
+    Returns the IDs of the data sources the formula reads data from. The result is
+    cached by the formula text, so that the formulas don't have to be parsed again
+    each time the data sources of a page are dispatched.
+    """
+
+    from baserow.contrib.builder.data_providers.data_provider_types import (
+        DataSourceDataProviderType,
+    )
+
+    try:
+        tree = get_parse_tree_for_formula(formula)
+    except BaserowFormulaSyntaxError:
+        return frozenset()
+
+    return frozenset(
+        DataSourceDependencyVisitor(DataSourceDataProviderType.type).visit(tree)
+    )
+
+
 def get_element_property_names(
     elements: List[Element],
     element_map: Dict[str, Element],
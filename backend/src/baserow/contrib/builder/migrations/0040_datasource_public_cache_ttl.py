@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("builder", "0039_alter_page_options_page_shared"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasource",
+            name="public_cache_ttl",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of seconds the results of the data source are "
+                "cached for the anonymous visitors of the published site. 0 disables "
+                "the cache.",
+            ),
+        ),
+    ]
@@ -45,6 +45,7 @@ class DataSourceDict(TypedDict):
     name: str
     order: int
     service: Optional[ServiceDictSubClass]
+    public_cache_ttl: int
 
 
 class PageDict(TypedDict):
@@ -19,7 +19,10 @@ SEARCH_MODE_API_PARAM = OpenApiParameter(
         f"If the default `{SearchModes.MODE_FT_WITH_COUNT}` is used, then Postgres "
         f"full-text search is used. If `{SearchModes.MODE_COMPAT}` is "
         "provided then the search term will be exactly searched for including "
-        "whitespace on each cell. This is the Baserow legacy search behaviour."
+        "whitespace on each cell. This is the Baserow legacy search behaviour. "
+        f"If `{SearchModes.MODE_TRIGRAM}` is provided then the text cells are "
+        "searched like the legacy search behaviour, but using trigram indexes "
+        "that are created in the background the first time a table is searched."
     ),
 )
 
@@ -189,6 +192,17 @@ ADHOC_SORTING_API_PARAM = OpenApiParameter(
     "descending (Z-A).",
 )
 
+CURSOR_PAGINATION_API_PARAM = OpenApiParameter(
+    name="cursor",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    description="If provided, the rows are paginated using the values of the last "
+    "row of the previous page instead of an offset, which is much faster for deep "
+    "pages. Provide an empty value to get the first page and the `next_cursor` of "
+    "the response to get the next page. The `size` parameter defines how many rows "
+    "should be returned. The response does not contain a `count` in this mode.",
+)
+
 PAGINATION_API_PARAMS = (
     OpenApiParameter(
         name="limit",
@@ -218,6 +232,7 @@ PAGINATION_API_PARAMS = (
         description="Can only be used in combination with the `page` parameter "
         "and defines how many rows should be returned.",
     ),
+    CURSOR_PAGINATION_API_PARAM,
 )
 
 INCLUDE_FIELDS_API_PARAM = OpenApiParameter(
@@ -17,3 +17,39 @@ row_names_response_schema = build_object_type(
         },
     },
 )
+
+ranked_search_results_response_schema = build_object_type(
+    {
+        "results": {
+            "type": "array",
+            "description": "The rows matching the search best, by relevance.",
+            "items": build_object_type(
+                {
+                    "rank": {
+                        "type": "number",
+                        "description": (
+                            "The relevance of the row for the search. The higher, "
+                            "the more relevant."
+                        ),
+                    },
+                    "highlights": {
+                        "type": "object",
+                        "description": (
+                            "A snippet of the value of every field matching the "
+                            "search, by field key, where the matching words are "
+                            "surrounded by `<b>` and `</b>`. The value is HTML "
+                            "escaped, so the snippet can be rendered as HTML."
+                        ),
+                        "additionalProperties": {"type": "string"},
+                    },
+                    "row": {
+                        "type": "object",
+                        "description": (
+                            "The row, in the same format as the list rows endpoint."
+                        ),
+                    },
+                }
+            ),
+        }
+    }
+)
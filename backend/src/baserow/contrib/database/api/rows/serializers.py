@@ -378,6 +378,16 @@ class ListRowsQueryParamsSerializer(
     view_id = serializers.IntegerField(required=False)
 
 
+class RankedSearchRowsQueryParamsSerializer(UserFieldNamesSerializer):
+    search = serializers.CharField()
+    size = serializers.IntegerField(
+        required=False,
+        default=20,
+        min_value=1,
+        max_value=settings.ROW_PAGE_SIZE_LIMIT,
+    )
+
+
 class BatchUpdateRowsSerializer(serializers.Serializer):
     items = serializers.ListField(
         child=RowSerializer(),
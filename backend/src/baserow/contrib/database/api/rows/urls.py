@@ -3,6 +3,7 @@ from django.urls import re_path
 from .views import (
     BatchDeleteRowsView,
     BatchRowsView,
+    RankedSearchRowsView,
     RowAdjacentView,
     RowHistoryView,
     RowMoveView,
@@ -25,6 +26,11 @@ urlpatterns = [
         RowAdjacentView.as_view(),
         name="adjacent",
     ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/search/$",
+        RankedSearchRowsView.as_view(),
+        name="search",
+    ),
     re_path(
         r"table/(?P<table_id>[0-9]+)/batch/$",
         BatchRowsView.as_view(),
@@ -24,7 +24,7 @@ from baserow.api.exceptions import (
     QueryParameterValidationException,
     RequestBodyValidationException,
 )
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import KeysetPagination, PageNumberPagination
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
@@ -91,6 +91,7 @@ from baserow.contrib.database.rows.operations import (
     ReadDatabaseRowHistoryOperationType,
 )
 from baserow.contrib.database.rows.signals import rows_loaded
+from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.models import Table
@@ -114,21 +115,27 @@ from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.handler import CoreHandler
 from baserow.core.trash.exceptions import CannotDeleteAlreadyDeletedItem
 
-from ..constants import ADHOC_FILTERS_API_PARAMS, SEARCH_MODE_API_PARAM
+from ..constants import (
+    ADHOC_FILTERS_API_PARAMS,
+    CURSOR_PAGINATION_API_PARAM,
+    SEARCH_MODE_API_PARAM,
+)
 from .example_serializers import example_pagination_row_serializer_class
-from .schemas import row_names_response_schema
+from .schemas import ranked_search_results_response_schema, row_names_response_schema
 from .serializers import (
     BatchCreateRowsQueryParamsSerializer,
     BatchDeleteRowsSerializer,
     CreateRowQueryParamsSerializer,
     ListRowsQueryParamsSerializer,
     MoveRowQueryParamsSerializer,
+    RankedSearchRowsQueryParamsSerializer,
     RowHistorySerializer,
     RowSerializer,
     get_batch_row_serializer_class,
     get_example_batch_rows_serializer_class,
     get_example_row_serializer_class,
     get_row_serializer_class,
+    serialize_rows_for_response,
 )
 
 
@@ -257,6 +264,7 @@ class RowsView(APIView):
                 description="Includes all the filters and sorts of the provided view.",
             ),
             SEARCH_MODE_API_PARAM,
+            CURSOR_PAGINATION_API_PARAM,
         ],
         tags=["Database table rows"],
         operation_id="list_database_table_rows",
@@ -282,6 +290,7 @@ class RowsView(APIView):
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
                     "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -401,7 +410,12 @@ class RowsView(APIView):
         if order_by:
             queryset = queryset.order_by_fields_string(order_by, user_field_names)
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if KeysetPagination.cursor_query_param in request.GET:
+            paginator = KeysetPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
             model,
@@ -658,6 +672,121 @@ class RowNamesView(APIView):
         return Response(result)
 
 
+class RankedSearchRowsView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Searches the rows of the table related to the provided "
+                "value.",
+            ),
+            OpenApiParameter(
+                name="search",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="The search query the rows must match.",
+            ),
+            OpenApiParameter(
+                name="size",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="The maximum number of rows to return, 20 by default.",
+            ),
+            OpenApiParameter(
+                name="user_field_names",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "A flag query parameter that, if provided with one of the "
+                    "following values: `y`, `yes`, `true`, `t`, `on`, `1`, or an "
+                    "empty value, will cause the returned JSON to use the "
+                    "user-specified field names instead of the internal Baserow "
+                    "field names (e.g., field_123)."
+                ),
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="search_database_table_rows",
+        description=(
+            "Returns the rows of the table matching the provided search query the "
+            "best, ordered by relevance. Contrary to the **list_database_table_rows** "
+            "endpoint, the result isn't paginated, but limited to the `size` most "
+            "relevant rows. For every row, a highlighted snippet of the value of "
+            "every field matching the search is included. If the table doesn't "
+            "support full-text search, the matching rows are returned by id, without "
+            "rank or highlights."
+        ),
+        responses={
+            200: ranked_search_results_response_schema,
+            400: get_error_schema(
+                ["ERROR_USER_NOT_IN_GROUP", "ERROR_QUERY_PARAMETER_VALIDATION"]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(["ERROR_TABLE_DOES_NOT_EXIST"]),
+        },
+    )
+    @map_exceptions(
+        {
+            UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+        }
+    )
+    @validate_query_parameters(RankedSearchRowsQueryParamsSerializer)
+    def get(self, request, table_id, query_params):
+        """
+        Returns the rows of the table matching the search the best, by relevance.
+        """
+
+        table = TableHandler().get_table(table_id)
+
+        CoreHandler().check_permissions(
+            request.user,
+            ListRowsDatabaseTableOperationType.type,
+            workspace=table.database.workspace,
+            context=table,
+        )
+
+        TokenHandler().check_table_permissions(request, "read", table, False)
+        user_field_names = query_params["user_field_names"]
+
+        model = table.get_model()
+        results = SearchHandler.get_ranked_search_results(
+            table, query_params["search"], query_params["size"], model=model
+        )
+        serialized_rows = serialize_rows_for_response(
+            [result.row for result in results], model, user_field_names
+        )
+
+        def get_field_key(field_id):
+            if user_field_names:
+                return model._field_objects[field_id]["field"].name
+            return f"field_{field_id}"
+
+        rows_loaded.send(sender=self, table=table)
+
+        return Response(
+            {
+                "results": [
+                    {
+                        "rank": result.rank,
+                        "highlights": {
+                            get_field_key(field_id): highlight
+                            for field_id, highlight in result.highlights.items()
+                        },
+                        "row": serialized_row,
+                    }
+                    for result, serialized_row in zip(results, serialized_rows)
+                ]
+            }
+        )
+
+
 class RowView(APIView):
     authentication_classes = APIView.authentication_classes + [TokenAuthentication]
     permission_classes = (IsAuthenticated,)
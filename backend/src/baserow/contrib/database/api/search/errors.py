@@ -0,0 +1,7 @@
+from rest_framework.status import HTTP_400_BAD_REQUEST
+
+ERROR_WORKSPACE_SEARCH_INDEX_DISABLED = (
+    "ERROR_WORKSPACE_SEARCH_INDEX_DISABLED",
+    HTTP_400_BAD_REQUEST,
+    "The workspace search index is not enabled on this instance.",
+)
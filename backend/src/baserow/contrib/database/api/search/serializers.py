@@ -0,0 +1,32 @@
+from django.conf import settings
+
+from rest_framework import serializers
+
+from baserow.contrib.database.search.models import WorkspaceSearchEntry
+
+
+class WorkspaceSearchQueryParamsSerializer(serializers.Serializer):
+    search = serializers.CharField()
+    size = serializers.IntegerField(
+        required=False,
+        default=20,
+        min_value=1,
+        max_value=settings.ROW_PAGE_SIZE_LIMIT,
+    )
+
+
+class WorkspaceSearchResultSerializer(serializers.ModelSerializer):
+    rank = serializers.FloatField(
+        help_text="The relevance of the cell for the search. The higher, the more "
+        "relevant."
+    )
+
+    class Meta:
+        model = WorkspaceSearchEntry
+        fields = ("table_id", "row_id", "field_id", "rank")
+
+
+class WorkspaceSearchResultsSerializer(serializers.Serializer):
+    results = WorkspaceSearchResultSerializer(
+        many=True, help_text="The cells matching the search best, by relevance."
+    )
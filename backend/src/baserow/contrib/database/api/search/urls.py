@@ -0,0 +1,13 @@
+from django.urls import re_path
+
+from .views import WorkspaceSearchView
+
+app_name = "baserow.contrib.database.api.search"
+
+urlpatterns = [
+    re_path(
+        r"workspace/(?P<workspace_id>[0-9]+)/$",
+        WorkspaceSearchView.as_view(),
+        name="workspace",
+    ),
+]
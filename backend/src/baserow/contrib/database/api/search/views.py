@@ -0,0 +1,97 @@
+from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from baserow.api.decorators import map_exceptions, validate_query_parameters
+from baserow.api.errors import ERROR_GROUP_DOES_NOT_EXIST, ERROR_USER_NOT_IN_GROUP
+from baserow.api.schemas import get_error_schema
+from baserow.contrib.database.search.exceptions import (
+    WorkspaceSearchIndexDisabledException,
+)
+from baserow.contrib.database.search.handler import WorkspaceSearchHandler
+from baserow.core.exceptions import UserNotInWorkspace, WorkspaceDoesNotExist
+from baserow.core.handler import CoreHandler
+from baserow.core.operations import ListApplicationsWorkspaceOperationType
+
+from .errors import ERROR_WORKSPACE_SEARCH_INDEX_DISABLED
+from .serializers import (
+    WorkspaceSearchQueryParamsSerializer,
+    WorkspaceSearchResultsSerializer,
+)
+
+
+class WorkspaceSearchView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="workspace_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Searches the tables of the workspace related to the "
+                "provided value.",
+            ),
+            OpenApiParameter(
+                name="search",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="The search query the cells must match.",
+            ),
+            OpenApiParameter(
+                name="size",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="The maximum number of cells to return, 20 by default.",
+            ),
+        ],
+        tags=["Database tables"],
+        operation_id="search_workspace_tables",
+        description=(
+            "Searches the cells of all the tables of the workspace the user has "
+            "access to, and returns the ones matching the search the best, ordered "
+            "by relevance. Only available if the workspace search index is enabled."
+        ),
+        responses={
+            200: WorkspaceSearchResultsSerializer,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_QUERY_PARAMETER_VALIDATION",
+                    "ERROR_WORKSPACE_SEARCH_INDEX_DISABLED",
+                ]
+            ),
+            404: get_error_schema(["ERROR_GROUP_DOES_NOT_EXIST"]),
+        },
+    )
+    @map_exceptions(
+        {
+            WorkspaceDoesNotExist: ERROR_GROUP_DOES_NOT_EXIST,
+            UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+            WorkspaceSearchIndexDisabledException: (
+                ERROR_WORKSPACE_SEARCH_INDEX_DISABLED
+            ),
+        }
+    )
+    @validate_query_parameters(WorkspaceSearchQueryParamsSerializer)
+    def get(self, request, workspace_id, query_params):
+        """
+        Returns the cells of the tables of the workspace matching the search the
+        best, by relevance.
+        """
+
+        workspace = CoreHandler().get_workspace(workspace_id)
+
+        CoreHandler().check_permissions(
+            request.user,
+            ListApplicationsWorkspaceOperationType.type,
+            workspace=workspace,
+            context=workspace,
+        )
+
+        entries = WorkspaceSearchHandler.search_workspace(
+            request.user, workspace, query_params["search"], query_params["size"]
+        )
+        return Response(WorkspaceSearchResultsSerializer({"results": entries}).data)
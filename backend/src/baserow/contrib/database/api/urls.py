@@ -5,6 +5,7 @@ from .export import urls as export_urls
 from .fields import urls as field_urls
 from .formula import urls as formula_urls
 from .rows import urls as row_urls
+from .search import urls as search_urls
 from .tables import urls as table_urls
 from .tokens import urls as token_urls
 from .views import urls as view_urls
@@ -18,6 +19,7 @@ urlpatterns = [
     path("fields/", include(field_urls, namespace="fields")),
     path("webhooks/", include(webhook_urls, namespace="webhooks")),
     path("rows/", include(row_urls, namespace="rows")),
+    path("search/", include(search_urls, namespace="search")),
     path("tokens/", include(token_urls, namespace="tokens")),
     path("export/", include(export_urls, namespace="export")),
     path("formula/", include(formula_urls, namespace="formula")),
@@ -2,6 +2,7 @@ from decimal import Decimal
 
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.utils import extend_schema
+from rest_framework import serializers
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -173,6 +174,11 @@ class GridViewView(APIView):
                         serializer_class=GridViewFieldOptionsSerializer, required=False
                     ),
                     "row_metadata": get_example_row_metadata_field_serializer(),
+                    "count_is_exact": serializers.BooleanField(
+                        help_text="Indicates whether the count is exact. The count "
+                        "of a large table can be estimated to avoid counting all "
+                        "the rows."
+                    ),
                 },
                 serializer_name="PaginationSerializerWithGridViewFieldOptions",
             ),
@@ -249,10 +255,13 @@ class GridViewView(APIView):
         model = queryset.model
 
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            row_count = view_handler.get_view_row_count(view, queryset)
+            return Response(
+                {"count": row_count.count, "count_is_exact": row_count.exact}
+            )
 
         response, page, _ = paginate_and_serialize_queryset(
-            queryset, request, field_ids
+            queryset, request, field_ids, view=view
         )
 
         if view_type.can_group_by and view.viewgroupby_set.all():
@@ -261,7 +270,7 @@ class GridViewView(APIView):
                 for group_by in view.viewgroupby_set.all()
             ]
             serialized_group_by_metadata = serialize_group_by_fields_metadata(
-                queryset, group_by_fields, page
+                queryset, group_by_fields, page, view=view
             )
             response.data.update(group_by_metadata=serialized_group_by_metadata)
 
@@ -745,6 +754,11 @@ class PublicGridViewRowsView(APIView):
                     "field_options": FieldOptionsField(
                         serializer_class=GridViewFieldOptionsSerializer, required=False
                     ),
+                    "count_is_exact": serializers.BooleanField(
+                        help_text="Indicates whether the count is exact. The count "
+                        "of a large table can be estimated to avoid counting all "
+                        "the rows."
+                    ),
                 },
                 serializer_name="PublicPaginationSerializerWithGridViewFieldOptions",
             ),
@@ -809,10 +823,13 @@ class PublicGridViewRowsView(APIView):
 
         count = "count" in request.GET
         if count:
-            return Response({"count": queryset.count()})
+            row_count = ViewHandler().get_view_row_count(view, queryset)
+            return Response(
+                {"count": row_count.count, "count_is_exact": row_count.exact}
+            )
 
         response, page, _ = paginate_and_serialize_queryset(
-            queryset, request, field_ids
+            queryset, request, field_ids, view=view
         )
 
         if field_options:
@@ -834,7 +851,7 @@ class PublicGridViewRowsView(APIView):
                 for field_string in split_comma_separated_string(group_by)
             ]
             serialized_group_by_metadata = serialize_group_by_fields_metadata(
-                queryset, group_by_fields, page
+                queryset, group_by_fields, page, view=view
             )
 
             response.data.update(group_by_metadata=serialized_group_by_metadata)
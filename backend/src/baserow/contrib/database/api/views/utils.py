@@ -5,11 +5,14 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db.models.query import QuerySet
 
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import (
+    KeysetPagination,
+    LimitOffsetPagination,
+    PageNumberPagination,
+)
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
     get_row_serializer_class,
@@ -142,28 +145,42 @@ def get_public_view_filtered_queryset(
 class PaginatedData(NamedTuple):
     response: Response
     page: QuerySet
-    paginator: Union[LimitOffsetPagination, PageNumberPagination]
+    paginator: Union[LimitOffsetPagination, PageNumberPagination, KeysetPagination]
 
 
 def paginate_and_serialize_queryset(
     queryset: QuerySet[GeneratedTableModel],
     request: Request,
     field_ids: Optional[Iterable[int]],
+    view: Optional[View] = None,
 ) -> PaginatedData:
     """
     Paginate and serialize the data for the provided queryset and view.
 
     :param queryset: The queryset to paginate and serialize.
-    :param request: The request containing the pagination query parameters.
+    :param request: The request containing the pagination query parameters. If the
+        `cursor` query parameter is provided, keyset pagination is used, which is
+        much faster than offset pagination for deep pages.
     :param field_ids: The (optional) field IDs to restrict the serialized data to.
+    :param view: If provided, the rows are counted using `get_view_row_count`,
+        which can estimate or cache the count of large tables, and the response
+        indicates whether the count is exact.
     :return: The paginated data containing the paginator, the page of results, and
         response containing the serialized data.
     """
 
-    if LimitOffsetPagination.limit_query_param in request.GET:
-        paginator = LimitOffsetPagination()
+    if KeysetPagination.cursor_query_param in request.GET:
+        paginator = KeysetPagination()
     else:
-        paginator = PageNumberPagination()
+        count_kwargs = {}
+        if view is not None:
+            row_count = ViewHandler().get_view_row_count(view, queryset)
+            count_kwargs = {"count": row_count.count, "count_is_exact": row_count.exact}
+
+        if LimitOffsetPagination.limit_query_param in request.GET:
+            paginator = LimitOffsetPagination(**count_kwargs)
+        else:
+            paginator = PageNumberPagination(**count_kwargs)
 
     page = paginator.paginate_queryset(queryset, request)
     serializer_class = get_row_serializer_class(
@@ -225,9 +242,10 @@ def serialize_group_by_fields_metadata(
     queryset: QuerySet[GeneratedTableModel],
     group_by_fields: List[Field],
     page: QuerySet[GeneratedTableModel],
+    view: Optional[View] = None,
 ):
     group_by_metadata = ViewHandler().get_group_by_metadata_in_rows(
-        group_by_fields, page, queryset
+        group_by_fields, page, queryset, view=view
     )
     serialized_group_by_metadata = serialize_group_by_metadata(group_by_metadata)
     return serialized_group_by_metadata
@@ -65,6 +65,7 @@ class TableWebhookCreateRequestSerializer(serializers.ModelSerializer):
             "headers",
             "name",
             "use_user_field_names",
+            "batch_events",
         )
 
 
@@ -104,12 +105,14 @@ class TableWebhookUpdateRequestSerializer(serializers.ModelSerializer):
             "name",
             "active",
             "use_user_field_names",
+            "batch_events",
         )
         extra_kwargs = {
             "name": {"required": False},
             "active": {"required": False},
             "use_user_field_names": {"required": False},
             "request_method": {"required": False},
+            "batch_events": {"required": False},
         }
 
 
@@ -178,6 +181,7 @@ class TableWebhookSerializer(serializers.ModelSerializer):
             "include_all_events",
             "failed_triggers",
             "active",
+            "batch_events",
         ]
 
     @extend_schema_field(OpenApiTypes.OBJECT)
@@ -36,11 +36,15 @@ from baserow.core.utils import ChildProgressBuilder, grouper
 from .constants import IMPORT_SERIALIZED_IMPORTING, IMPORT_SERIALIZED_IMPORTING_TABLE
 from .data_sync.registries import data_sync_type_registry
 from .db.atomic import read_repeatable_single_database_atomic_transaction
+from .db.bulk_insert import bulk_insert_with_copy
 from .export_serialized import DatabaseExportSerializedStructure
 from .fields.utils import DeferredFieldImporter, DeferredForeignKeyUpdater
 from .search.handler import SearchHandler
 from .table.models import GeneratedTableModel, Table
 
+# The number of imported rows that are copied into the table at once.
+BULK_INSERT_CHUNK_SIZE = 5000
+
 
 @dataclass
 class ImportedFields:
@@ -645,11 +649,11 @@ class DatabaseApplicationType(ApplicationType):
                     state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}"
                 )
 
-            # We want to insert the rows in bulk because there could potentially be
-            # hundreds of thousands of rows in there and this will result in better
-            # performance.
-            for chunk in grouper(512, rows_to_be_inserted):
-                table_model.objects.bulk_create(chunk, batch_size=512)
+            # We want to insert the rows in bulk with the `COPY` statement because
+            # there could potentially be hundreds of thousands of rows in there and
+            # this will result in better performance.
+            for chunk in grouper(BULK_INSERT_CHUNK_SIZE, rows_to_be_inserted):
+                bulk_insert_with_copy(table_model, chunk)
                 progress.increment(
                     len(chunk),
                     state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}",
@@ -659,7 +663,8 @@ class DatabaseApplicationType(ApplicationType):
             # like for example the m2m relationships. We want to efficiently import
             # them in bulk here.
             for model, objects in additional_objects_to_be_inserted.items():
-                model.objects.bulk_create(objects, batch_size=512)
+                for chunk in grouper(BULK_INSERT_CHUNK_SIZE, objects):
+                    bulk_insert_with_copy(model, chunk)
 
             # When the rows are inserted we keep the provide the old ids and because of
             # that the auto increment is still set at `1`. This needs to be set to the
@@ -468,6 +468,10 @@ class DatabaseConfig(AppConfig):
 
         table_exporter_registry.register(CsvTableExporter())
 
+        from .export.table_exporters.parquet_table_exporter import ParquetTableExporter
+
+        table_exporter_registry.register(ParquetTableExporter())
+
         from .trash.trash_types import (
             FieldTrashableItemType,
             RowsTrashableItemType,
@@ -857,6 +861,8 @@ class DatabaseConfig(AppConfig):
         import baserow.contrib.database.rows.tasks  # noqa: F401
         import baserow.contrib.database.search.tasks  # noqa: F401
         import baserow.contrib.database.table.receivers  # noqa: F401
+        import baserow.contrib.database.trash.tasks  # noqa: F401
+        import baserow.contrib.database.views.receivers  # noqa: F401
         import baserow.contrib.database.views.tasks  # noqa: F401
 
 
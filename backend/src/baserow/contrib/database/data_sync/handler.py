@@ -103,6 +103,9 @@ class DataSyncHandler:
             order=last_order,
             name=table_name,
             needs_background_update_column_added=True,
+            row_search_document_column_added=(
+                SearchHandler.row_search_document_enabled()
+            ),
         )
         values["table"] = table
 
@@ -321,6 +324,7 @@ class DataSyncHandler:
                 send_realtime_update=False,
                 send_webhook_events=False,
                 skip_search_update=True,
+                use_copy=True,
             )
 
         if len(rows_to_update) > 0:
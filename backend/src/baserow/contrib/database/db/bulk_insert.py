@@ -0,0 +1,180 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from io import StringIO
+from typing import Any, Iterable, List, Type
+from uuid import UUID
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import AutoField, Model, Value
+from django.db.models.expressions import RawSQL
+
+from cachalot.api import invalidate
+from psycopg2 import sql
+from psycopg2.extras import Json
+
+
+class CopyValueNotSupported(Exception):
+    """
+    Raised when a value can't be written in the text format of the `COPY` statement.
+    """
+
+
+COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
+def to_copy_text(value: Any) -> str:
+    """
+    Converts a value prepared for the database to its representation in the text
+    format of the PostgreSQL `COPY` statement.
+
+    :param value: The value returned by the `get_db_prep_save` method of a field.
+    :raises CopyValueNotSupported: If the type of the value isn't supported.
+    :return: The escaped text representation of the value.
+    """
+
+    if value is None:
+        return "\\N"
+    elif isinstance(value, bool):
+        return "t" if value else "f"
+    elif isinstance(value, (int, float, Decimal, UUID)):
+        return str(value)
+    elif isinstance(value, str):
+        return value.translate(COPY_TEXT_ESCAPES)
+    elif isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    elif isinstance(value, timedelta):
+        return (
+            f"{value.days} days {value.seconds} seconds "
+            f"{value.microseconds} microseconds"
+        )
+    elif isinstance(value, Json):
+        return value.dumps(value.adapted).translate(COPY_TEXT_ESCAPES)
+
+    raise CopyValueNotSupported(f"Can't copy a value of type {type(value)}.")
+
+
+def bulk_insert_with_copy(model: Type[Model], objs: Iterable[Model]) -> List[Model]:
+    """
+    Inserts the provided model instances with a single `COPY ... FROM STDIN`
+    statement instead of the `INSERT` statements of `bulk_create`, which is a lot
+    faster for a big number of rows. Just like `bulk_create`, the `pre_save` method
+    of every field is called, the primary keys of the instances are set, and no
+    signals are sent. Primary keys and values of fields that are computed by a
+    sequence, like the autonumber field, are fetched in bulk before the copy.
+
+    If a value can't be written in the `COPY` text format, it falls back to
+    `bulk_create`, so this function can safely be used with any model.
+
+    :param model: The model of the instances to insert.
+    :param objs: The unsaved model instances to insert.
+    :return: The inserted model instances.
+    """
+
+    objs = list(objs)
+    if not objs:
+        return objs
+
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if not getattr(field, "generated", False)
+    ]
+    pk_field = model._meta.pk
+    objs_without_pk = [obj for obj in objs if obj.pk is None]
+
+    try:
+        if objs_without_pk and not isinstance(pk_field, AutoField):
+            raise CopyValueNotSupported("Only auto primary keys can be generated.")
+        rows = _get_copy_rows(objs, fields)
+    except CopyValueNotSupported:
+        return model.objects.bulk_create(objs)
+
+    with connection.cursor() as cursor:
+        if objs_without_pk:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+                "FROM generate_series(1, %s)",
+                [
+                    connection.ops.quote_name(model._meta.db_table),
+                    pk_field.column,
+                    len(objs_without_pk),
+                ],
+            )
+            for obj, (pk,) in zip(objs_without_pk, cursor.fetchall()):
+                obj.pk = pk
+
+        pk_index = fields.index(pk_field)
+        buffer = StringIO()
+        for obj, row in zip(objs, rows):
+            row[pk_index] = to_copy_text(obj.pk)
+            buffer.write("\t".join(row))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        copy_sql = sql.SQL("COPY {table} ({columns}) FROM STDIN").format(
+            table=sql.Identifier(model._meta.db_table),
+            columns=sql.SQL(", ").join(
+                sql.Identifier(field.column) for field in fields
+            ),
+        )
+        cursor.copy_expert(copy_sql, buffer)
+
+    for obj in objs:
+        obj._state.adding = False
+        obj._state.db = connection.alias
+
+    if settings.CACHALOT_ENABLED:
+        # The `COPY` statement isn't detected by cachalot, so the cached queries of
+        # the table must be invalidated manually.
+        invalidate(model)
+
+    return objs
+
+
+def _get_copy_rows(objs: List[Model], fields: List[Any]) -> List[List[str]]:
+    """
+    Returns the `COPY` text representation of every field value of every instance.
+    Values that must be computed by the database are resolved in bulk and set on the
+    instances, like `bulk_create` does for the fields returned by the insert.
+    """
+
+    rows = []
+    raw_sql_values = defaultdict(list)
+    for obj in objs:
+        row = []
+        for field in fields:
+            if field.primary_key:
+                # The missing primary keys are set right before the copy.
+                row.append(None)
+                continue
+
+            value = field.pre_save(obj, True)
+            if isinstance(value, Value):
+                value = value.value
+            elif isinstance(value, RawSQL):
+                # Typically the `nextval` of a sequence, like the `SerialField`.
+                raw_sql_values[(field, value.sql, tuple(value.params))].append(
+                    (obj, row, len(row))
+                )
+                row.append("\\N")
+                continue
+            elif hasattr(value, "resolve_expression"):
+                raise CopyValueNotSupported(f"Can't copy the expression {value}.")
+
+            row.append(to_copy_text(field.get_db_prep_save(value, connection)))
+        rows.append(row)
+
+    if raw_sql_values:
+        with connection.cursor() as cursor:
+            for (field, raw_sql, params), targets in raw_sql_values.items():
+                cursor.execute(
+                    f"SELECT {raw_sql} FROM generate_series(1, %s)",  # nosec B608
+                    [*params, len(targets)],
+                )
+                for (obj, row, index), (value,) in zip(targets, cursor.fetchall()):
+                    setattr(obj, field.attname, value)
+                    row[index] = to_copy_text(value)
+
+    return rows
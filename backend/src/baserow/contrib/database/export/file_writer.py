@@ -2,12 +2,17 @@ import abc
 import time
 from typing import Any, Callable
 
-from django.core.paginator import Paginator
 from django.db.models import QuerySet
 
+import pyarrow.parquet as pq
 import unicodecsv as csv
 
 from baserow.contrib.database.export.exceptions import ExportJobCanceledException
+from baserow.contrib.database.export.models import (
+    EXPORT_JOB_CANCELLED_STATUS,
+    EXPORT_JOB_EXPIRED_STATUS,
+    ExportJob,
+)
 from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
@@ -58,15 +63,20 @@ class FileWriter(abc.ABC):
     def get_csv_dict_writer(self, headers, **kwargs):
         return csv.DictWriter(self._file, headers, **kwargs)
 
+    def get_parquet_writer(self, schema, **kwargs):
+        return pq.ParquetWriter(self._file, schema, **kwargs)
+
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Streams querysets to files using a server side cursor, fetching
+    EXPORT_JOB_CHUNK_SIZE rows at a time, in a memory efficient manner. Also updates
+    the provided job as it progresses through any queryset writes every
+    EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
+    EXPORT_JOB_CHUNK_SIZE = 2000
 
     def __init__(self, file, job):
         super().__init__(file)
@@ -94,14 +104,27 @@ class PaginatedExportJobFileWriter(FileWriter):
         """
 
         self.last_check = time.perf_counter()
-        paginator = Paginator(queryset.all(), 2000)
+        # The count is only used to report the progress. Paginating with offsets
+        # would make the export quadratic, so the rows are streamed instead and
+        # the last row is detected by looking one row ahead.
+        total_rows = queryset.count()
+        rows = queryset.all().iterator(chunk_size=self.EXPORT_JOB_CHUNK_SIZE)
+        previous_row = next(rows, None)
+        if previous_row is None:
+            return
+
         i = 0
-        for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
-                i = i + 1
-                is_last_row = i == paginator.count
-                write_row(row, is_last_row)
-                self._check_and_update_job(i, paginator.count)
+        for row in rows:
+            i = i + 1
+            write_row(previous_row, False)
+            # Rows can be created while exporting, so the total is never reached
+            # before the last row.
+            self._check_and_update_job(i, max(total_rows, i + 1))
+            previous_row = row
+
+        i = i + 1
+        write_row(previous_row, True)
+        self._check_and_update_job(i, i)
 
     def _check_and_update_job(self, current_row, total_rows):
         """
@@ -124,12 +147,19 @@ class PaginatedExportJobFileWriter(FileWriter):
         is_last_row = current_row == total_rows
         if enough_time_has_passed or is_last_row:
             self.last_check = time.perf_counter()
-            self.job.refresh_from_db()
-            if self.job.is_cancelled_or_expired():
+            self.job.progress_percentage = current_row / total_rows * 100
+            # Checking whether the job has been cancelled and updating its progress
+            # is done in a single query, without reading or writing the other
+            # columns of the job.
+            updated = (
+                ExportJob.objects.filter(id=self.job.id)
+                .exclude(
+                    state__in=[EXPORT_JOB_CANCELLED_STATUS, EXPORT_JOB_EXPIRED_STATUS]
+                )
+                .update(progress_percentage=self.job.progress_percentage)
+            )
+            if not updated:
                 raise ExportJobCanceledException()
-            else:
-                self.job.progress_percentage = current_row / total_rows * 100
-                self.job.save()
 
 
 class QuerysetSerializer(abc.ABC):
@@ -198,19 +228,24 @@ class QuerysetSerializer(abc.ABC):
             for export.
         """
 
+        # Resolve everything that doesn't depend on the row once, instead of for
+        # every exported row.
+        field_name = field_object["name"]
+        human_field_name = field_object["field"].name
+        get_export_value = field_object["type"].get_export_value
+        rich_value = self.can_handle_rich_value
+
         def serializer_func(row):
-            value = getattr(row, field_object["name"])
+            value = getattr(row, field_name)
 
             if value is None:
                 result = ""
             else:
-                result = field_object["type"].get_export_value(
-                    value, field_object, rich_value=self.can_handle_rich_value
-                )
+                result = get_export_value(value, field_object, rich_value=rich_value)
 
             return (
-                field_object["name"],
-                field_object["field"].name,
+                field_name,
+                human_field_name,
                 result,
             )
 
@@ -0,0 +1,155 @@
+from typing import Any, Callable, List, Tuple, Type
+
+from django.db import models
+
+import pyarrow as pa
+
+from baserow.contrib.database.api.export.serializers import (
+    BaseExporterOptionsSerializer,
+)
+from baserow.contrib.database.export.file_writer import FileWriter, QuerysetSerializer
+from baserow.contrib.database.export.registries import TableExporter
+from baserow.contrib.database.table.models import FieldObject
+from baserow.contrib.database.views.view_types import GridViewType
+
+
+class ParquetTableExporter(TableExporter):
+    type = "parquet"
+
+    @property
+    def option_serializer_class(self) -> Type[BaseExporterOptionsSerializer]:
+        return BaseExporterOptionsSerializer
+
+    @property
+    def can_export_table(self) -> bool:
+        return True
+
+    @property
+    def supported_views(self) -> List[str]:
+        return [GridViewType.type]
+
+    @property
+    def file_extension(self) -> str:
+        return ".parquet"
+
+    @property
+    def queryset_serializer_class(self):
+        return ParquetQuerysetSerializer
+
+
+class ParquetQuerysetSerializer(QuerysetSerializer):
+    # The number of rows that are written to the file as a single record batch.
+    BATCH_SIZE = 10000
+    COMPRESSION = "zstd"
+
+    def __init__(self, queryset, ordered_field_objects):
+        super().__init__(queryset, ordered_field_objects)
+
+        self.column_names = ["id"]
+        self.column_types = [pa.int64()]
+        self.column_getters = [lambda row: row.id]
+
+        for field_object in ordered_field_objects:
+            column_type, column_getter = self._get_column_type_and_getter(field_object)
+            self.column_names.append(
+                self._get_unique_column_name(field_object["field"].name)
+            )
+            self.column_types.append(column_type)
+            self.column_getters.append(column_getter)
+
+    def _get_unique_column_name(self, name: str) -> str:
+        unique_name = name
+        count = 2
+        while unique_name in self.column_names:
+            unique_name = f"{name} ({count})"
+            count += 1
+        return unique_name
+
+    def _get_column_type_and_getter(
+        self, field_object: FieldObject
+    ) -> Tuple[Any, Callable[[Any], Any]]:
+        """
+        Maps the model field of the provided field object to a typed Arrow column.
+        Fields that don't have a directly matching type, like link rows, select
+        options and formulas, are exported as a string column containing the same
+        value as a CSV export.
+
+        :param field_object: The field object to get the column type for.
+        :return: The Arrow data type of the column and a callable function which
+            returns the value of the column for the provided row.
+        """
+
+        field_name = field_object["name"]
+        model_field = self.queryset.model._meta.get_field(field_name)
+
+        if isinstance(model_field, models.BooleanField):
+            column_type = pa.bool_()
+        elif isinstance(model_field, models.DecimalField):
+            column_type = pa.decimal256(
+                model_field.max_digits, model_field.decimal_places
+            )
+        elif isinstance(model_field, models.DateTimeField):
+            column_type = pa.timestamp("us", tz="UTC")
+        elif isinstance(model_field, models.DateField):
+            column_type = pa.date32()
+        elif isinstance(model_field, models.DurationField):
+            column_type = pa.duration("us")
+        elif isinstance(model_field, models.IntegerField):
+            column_type = pa.int64()
+        else:
+            get_export_value = field_object["type"].get_export_value
+
+            def column_getter(row):
+                value = getattr(row, field_name)
+                if value is None:
+                    return None
+                return str(get_export_value(value, field_object))
+
+            return pa.string(), column_getter
+
+        return column_type, lambda row: getattr(row, field_name)
+
+    def write_to_file(self, file_writer: FileWriter, export_charset="utf-8"):
+        """
+        Writes the queryset to the provided file in the Parquet format. Every field
+        is written to a typed and compressed column, in record batches of
+        BATCH_SIZE rows. The charset is ignored because Parquet strings are always
+        encoded in utf-8.
+
+        :param file_writer: The file writer to use to do the writing.
+        :param export_charset: Unused, the charset to write to the file using.
+        """
+
+        schema = pa.schema(
+            [
+                pa.field(name, column_type)
+                for name, column_type in zip(self.column_names, self.column_types)
+            ]
+        )
+        parquet_writer = file_writer.get_parquet_writer(
+            schema, compression=self.COMPRESSION
+        )
+        columns = [[] for _ in self.column_getters]
+
+        def write_batch():
+            parquet_writer.write_batch(
+                pa.record_batch(
+                    [
+                        pa.array(values, type=column_type)
+                        for values, column_type in zip(columns, self.column_types)
+                    ],
+                    schema=schema,
+                )
+            )
+            for values in columns:
+                values.clear()
+
+        def write_row(row, last_row):
+            for values, column_getter in zip(columns, self.column_getters):
+                values.append(column_getter(row))
+
+            if last_row or len(columns[0]) >= self.BATCH_SIZE:
+                write_batch()
+
+        file_writer.write_rows(self.queryset, write_row)
+        parquet_writer.close()
@@ -125,6 +125,16 @@ class PathBasedUpdateStatementCollector:
             collector = self.sub_paths[broken_name]
         return collector
 
+    def tables(self) -> List[Table]:
+        """
+        Returns the tables of this collector and all its sub paths.
+        """
+
+        tables = [self.table]
+        for sub_path in self.sub_paths.values():
+            tables.extend(sub_path.tables())
+        return tables
+
     def execute_all(
         self,
         field_cache: FieldCache,
@@ -132,6 +142,11 @@ class PathBasedUpdateStatementCollector:
         path_to_starting_table: StartingRowIdsType = None,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
     ) -> int:
+        if not path_to_starting_table:
+            # Generate all the models that are going to be needed at once instead
+            # of one by one while executing the update statements per table.
+            field_cache.get_models(self.tables())
+
         updated_rows = 0
         path_to_starting_table = path_to_starting_table or []
         if self.connection_here is not None:
@@ -1,9 +1,12 @@
 from collections import defaultdict
-from typing import Optional, Type
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Type
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Model
 
+if TYPE_CHECKING:
+    from baserow.contrib.database.table.models import Table
+
 
 class FieldCache:
     """
@@ -43,10 +46,29 @@ class FieldCache:
             self.cache_field(field_object["field"])
 
     def get_model(self, table):
-        table_id = table.id
-        if table_id not in self._model_cache:
-            self._model_cache[table_id] = table.get_model()
-        return self._model_cache[table_id]
+        return self.get_models([table])[table.id]
+
+    def get_models(self, tables: Iterable["Table"]) -> Dict[int, Type[Model]]:
+        """
+        Returns the models of all the provided tables. The models which are not
+        cached yet are generated in bulk to avoid a version query and cache round
+        trip per table.
+
+        :param tables: The tables to get the models for.
+        :return: A dict containing the model per table id.
+        """
+
+        from baserow.contrib.database.table.model_factory import TableModelFactory
+
+        tables = list(tables)
+        tables_to_generate = {
+            table.id: table for table in tables if table.id not in self._model_cache
+        }
+        if tables_to_generate:
+            self._model_cache.update(
+                TableModelFactory.get_models(tables_to_generate.values())
+            )
+        return {table.id: self._model_cache[table.id] for table in tables}
 
     def uncache_field(self, field):
         return self._cached_field_by_name_per_table[field.table_id].pop(
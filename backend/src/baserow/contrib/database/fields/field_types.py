@@ -260,6 +260,8 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
           altering a column to being an email type.
     """
 
+    can_be_trigram_indexed = True
+
     @property
     @abstractmethod
     def regex(self):
@@ -380,6 +382,7 @@ class TextFieldType(CollationSortMixin, FieldType):
     allowed_fields = ["text_default"]
     serializer_field_names = ["text_default"]
     _can_group_by = True
+    can_be_trigram_indexed = True
 
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
@@ -425,6 +428,7 @@ class LongTextFieldType(CollationSortMixin, FieldType):
     model_class = LongTextField
     allowed_fields = ["long_text_enable_rich_text"]
     serializer_field_names = ["long_text_enable_rich_text"]
+    can_be_trigram_indexed = True
 
     def check_can_group_by(self, field: Field) -> bool:
         return not field.long_text_enable_rich_text
@@ -49,6 +49,7 @@ from baserow.contrib.database.fields.operations import (
     UpdateFieldOperationType,
 )
 from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.trash.handler import RowArchiveHandler
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.core.db import specific_iterator
 from baserow.core.handler import CoreHandler
@@ -63,7 +64,7 @@ from baserow.core.utils import (
     set_allowed_attrs,
 )
 
-from ..search.handler import SearchHandler
+from ..search.handler import SearchHandler, TrigramIndexingHandler
 from ..table.cache import invalidate_table_in_model_cache
 from .backup_handler import FieldDataBackupHandler
 from .dependencies.handler import FieldDependencyHandler
@@ -87,7 +88,7 @@ from .exceptions import (
 )
 from .field_cache import FieldCache
 from .models import Field, SelectOption, SpecificFieldForUpdate
-from .registries import field_converter_registry, field_type_registry
+from .registries import FieldType, field_converter_registry, field_type_registry
 from .signals import (
     before_field_deleted,
     field_created,
@@ -377,7 +378,7 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
             order=last_order,
             primary=primary,
             pk=primary_key,
-            tsvector_column_created=table.tsvectors_are_supported,
+            tsvector_column_created=table.field_tsvectors_are_supported,
             description=description,
             **field_values,
         )
@@ -388,6 +389,10 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
             workspace, user, instance, field_cache, ReadFieldOperationType.type
         )
 
+        # The archived trashed rows are moved back to the table, so that the values of
+        # the new field are set for them like for the other rows.
+        RowArchiveHandler().restore_table_archive(table)
+
         # Add the field to the table schema.
         with safe_django_schema_editor(atomic=False) as schema_editor:
             to_model = instance.table.get_model(field_ids=[], fields=[instance])
@@ -518,9 +523,18 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
 
         old_field = deepcopy(field)
         from_field_type = field_type_registry.get_by_model(field)
-        from_model = table.get_model(field_ids=[], fields=[field])
         to_field_type_name = new_type_name or from_field_type.type
 
+        # The archived trashed rows are moved back to the table, so that their values
+        # are converted like the other ones, and archived again afterwards. That's
+        # not needed if only the name or the description of the field changes.
+        if self._field_type_or_properties_change(
+            field, from_field_type, to_field_type_name, kwargs
+        ):
+            RowArchiveHandler().restore_table_archive(table)
+
+        from_model = table.get_model(field_ids=[], fields=[field])
+
         # If the provided field type does not match with the current one we need to
         # migrate the field to the new type.
         baserow_field_type_changed = from_field_type.type != to_field_type_name
@@ -587,6 +601,8 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         SearchHandler.entire_field_values_changed_or_created(
             field.table, updated_fields=[field]
         )
+        if baserow_field_type_changed:
+            TrigramIndexingHandler.drop_index_if_exists(field)
 
         # Before a field is updated we are going to call the before_schema_change
         # method of the old field because some cleanup of related instances might
@@ -915,6 +931,7 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
                 field,
                 existing_trash_entry=existing_trash_entry,
             )
+        SearchHandler.after_field_deleted(field)
         # The trash call above might have just caused a massive field update to lots of
         # different fields. We need to reset our cache accordingly.
         field_cache.reset_cache()
@@ -1448,6 +1465,36 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
 
         return new_primary_field, existing_primary_field
 
+    def _field_type_or_properties_change(
+        self,
+        field: Field,
+        field_type: FieldType,
+        to_field_type_name: str,
+        field_values: Dict[str, Any],
+    ) -> bool:
+        """
+        Checks whether updating the field with the provided values changes its type
+        or one of its type specific properties, which can change the values of its
+        column. A property that isn't an attribute of the field is considered changed.
+
+        :param field: The field that is going to be updated.
+        :param field_type: The current type of the field.
+        :param to_field_type_name: The type the field is going to have.
+        :param field_values: The values the field is going to be updated with.
+        :return: Whether the type or a type specific property changes.
+        """
+
+        if to_field_type_name != field_type.type:
+            return True
+
+        missing = object()
+        return any(
+            getattr(field, name, missing) != value
+            for name, value in extract_allowed(
+                field_values, field_type.allowed_fields
+            ).items()
+        )
+
     def _validate_name_and_optionally_rename_if_collision(
         self,
         field: Field,
@@ -182,6 +182,13 @@ class FieldType(
     some fields can depend on it like the `lookup` field.
     """
 
+    can_be_trigram_indexed = False
+    """
+    Set to True if the field values are stored in a text column that is searched with
+    the `icontains` lookup, so that a `pg_trgm` index can be used by the trigram
+    search mode.
+    """
+
     @property
     def db_column_fields(self) -> Set[str]:
         if self._db_column_fields is not None:
@@ -973,7 +980,7 @@ class FieldType(
         )
         should_create_tsvector_column = (
             not import_export_config.reduce_disk_space_usage
-            and table.tsvectors_are_supported
+            and table.field_tsvectors_are_supported
         )
         field = self.model_class(
             table=table,
@@ -0,0 +1,47 @@
+import json
+from typing import IO, Any, Iterable, Iterator, List, Optional
+
+from django.db.models.fields.files import FieldFile
+
+
+def write_data_file(data: Iterable[List[Any]], file: IO[bytes]):
+    """
+    Writes the provided rows to the file in the newline delimited JSON format,
+    so one JSON array per line. This allows the rows to be read back one by one
+    instead of loading the whole dataset in memory.
+
+    :param data: The rows to write.
+    :param file: The binary file to write to.
+    """
+
+    for row in data:
+        file.write(json.dumps(row, ensure_ascii=False).encode("utf8"))
+        file.write(b"\n")
+
+
+class DataFileRows:
+    """
+    Lazily reads the rows of a file import data file written by `write_data_file`.
+    The file is read line by line every time the rows are iterated, so only one row
+    is in memory at a time.
+    """
+
+    def __init__(self, data_file: FieldFile):
+        self.data_file = data_file
+        self._row_count: Optional[int] = None
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        with self.data_file.storage.open(self.data_file.name, "rb") as fin:
+            for line in fin:
+                if not line.endswith(b"\n"):
+                    # Data files created before the rows were written line by line
+                    # contain a single JSON array with all the rows, without a
+                    # trailing newline.
+                    yield from json.loads(line)
+                elif line.strip():
+                    yield json.loads(line)
+
+    def __len__(self) -> int:
+        if self._row_count is None:
+            self._row_count = sum(1 for _ in self)
+        return self._row_count
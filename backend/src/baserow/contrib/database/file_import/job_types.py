@@ -1,7 +1,7 @@
-import json
+from tempfile import TemporaryFile
 from typing import Any
 
-from django.core.files.base import ContentFile
+from django.core.files import File
 from django.db import transaction
 
 from rest_framework import serializers
@@ -35,11 +35,10 @@ from baserow.contrib.database.table.exceptions import (
 from baserow.core.action.registries import action_type_registry
 from baserow.core.jobs.registries import JobType
 
+from .data_file import DataFileRows, write_data_file
 from .models import FileImportJob
 from .serializers import ReportSerializer
 
-BATCH_SIZE = 1024
-
 
 class FileImportJobType(JobType):
     type = "file_import"
@@ -95,13 +94,14 @@ class FileImportJobType(JobType):
 
     def after_job_creation(self, job, values):
         """
-        Save the data file for the newly created job.
+        Save the data file for the newly created job. The rows are written one per
+        line, so that they can be read back one by one when the job runs.
         """
 
-        data_file = ContentFile(
-            json.dumps(values["data"], ensure_ascii=False).encode("utf8")
-        )
-        job.data_file.save(None, data_file)
+        with TemporaryFile() as data_file:
+            write_data_file(values["data"], data_file)
+            data_file.seek(0)
+            job.data_file.save(None, File(data_file))
 
     def before_delete(self, job):
         """
@@ -150,11 +150,11 @@ class FileImportJobType(JobType):
     def run(self, job, progress):
         """
         Fills the provided table with the normalized data that needs to be created upon
-        creation of the table.
+        creation of the table. The rows are lazily read from the data file and
+        imported by chunk, so the whole dataset is never loaded in memory.
         """
 
-        with job.data_file.open("r") as fin:
-            data = json.load(fin)
+        data = DataFileRows(job.data_file)
 
         try:
             if job.table is None:
@@ -405,6 +405,14 @@ class BaserowFunctionCall(BaserowExpression[A]):
         return f"{self.function_def.type}({args_string})"
 
 
+def _get_registered_function_definition(
+    function_type: str,
+) -> "BaserowFunctionDefinition":
+    from baserow.contrib.database.formula.registries import formula_function_registry
+
+    return formula_function_registry.get(function_type)
+
+
 class BaserowFunctionDefinition(Instance, abc.ABC):
     """
     A registrable instance which defines a function for use in the Baserow Formula
@@ -419,6 +427,16 @@ class BaserowFunctionDefinition(Instance, abc.ABC):
     is_wrapper = False
     try_coerce_nullable_args_to_not_null: bool = True
 
+    def __deepcopy__(self, memo):
+        # Function definitions are registered instances without any state, so the
+        # copies of an expression share them instead of copying them.
+        return self
+
+    def __reduce__(self):
+        # A pickled expression references the registered function definition by its
+        # type, so it's the same instance once unpickled.
+        return _get_registered_function_definition, (self.type,)
+
     @property
     @abc.abstractmethod
     def type(self) -> str:
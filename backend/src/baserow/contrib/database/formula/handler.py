@@ -1,6 +1,11 @@
 import typing
+from copy import deepcopy
+from functools import lru_cache
+from hashlib import sha256
 from typing import Dict, Optional, Set, Tuple, Type
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Expression, Model
 
 from opentelemetry import trace
@@ -45,6 +50,7 @@ from baserow.contrib.database.formula.types.visitors import (
 from baserow.core.formula import BaserowFormulaException
 from baserow.core.formula.parser.parser import get_parse_tree_for_formula
 from baserow.core.telemetry.utils import baserow_trace_methods
+from baserow.version import VERSION
 
 if typing.TYPE_CHECKING:
     from baserow.contrib.database.fields.models import FormulaField
@@ -53,6 +59,43 @@ if typing.TYPE_CHECKING:
 tracer = trace.get_tracer(__name__)
 
 
+def _get_untyped_expression_cache_key(formula_string: str) -> str:
+    # The key contains the versions because the expressions are pickled, so they
+    # can't be shared between versions of the code that might differ.
+    formula_hash = sha256(formula_string.encode("utf-8")).hexdigest()
+    return f"formula_ast_{VERSION}_{BASEROW_FORMULA_VERSION}_{formula_hash}"
+
+
+@lru_cache(maxsize=settings.BASEROW_FORMULA_AST_CACHE_SIZE)
+def _get_cached_untyped_expression(formula_string: str) -> BaserowExpression:
+    """
+    Parses the formula string into an untyped expression, which is cached in a
+    bounded LRU cache of the process and, if `BASEROW_FORMULA_AST_SHARED_CACHE_TIMEOUT`
+    is set, in the shared cache to be reused by the other processes. Parsing a formula
+    is slow, and the same formulas are parsed over and over when the fields are
+    fetched again, during dependency updates and model generation.
+
+    The cached expressions must never be modified, so they must be copied first.
+    """
+
+    use_shared_cache = settings.BASEROW_FORMULA_AST_SHARED_CACHE_TIMEOUT > 0
+    if use_shared_cache:
+        cache_key = _get_untyped_expression_cache_key(formula_string)
+        expression = cache.get(cache_key)
+        if expression is not None:
+            return expression
+
+    expression = raw_formula_to_untyped_expression(formula_string)
+
+    if use_shared_cache:
+        cache.set(
+            cache_key,
+            expression,
+            timeout=settings.BASEROW_FORMULA_AST_SHARED_CACHE_TIMEOUT,
+        )
+    return expression
+
+
 def _needs_periodic_update(expression: BaserowExpression):
     functions_used: Set[BaserowFunctionDefinition] = expression.accept(
         FunctionsUsedVisitor()
@@ -277,7 +320,9 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
             expression language.
         """
 
-        return raw_formula_to_untyped_expression(formula_string)
+        # The expressions are modified in place when they're typed, so a copy of the
+        # cached expression is returned. Copying is a lot faster than parsing.
+        return deepcopy(_get_cached_untyped_expression(formula_string))
 
     @classmethod
     def get_formula_type_from_field(cls, formula_field) -> BaserowFormulaType:
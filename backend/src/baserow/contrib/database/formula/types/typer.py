@@ -68,10 +68,17 @@ def recreate_formula_field_if_needed(
     if force_recreate_column or _check_if_formula_type_change_requires_drop_recreate(
         old_field, field.cached_formula_type
     ):
+        from baserow.contrib.database.fields.registries import field_converter_registry
+        from baserow.contrib.database.trash.handler import RowArchiveHandler
+
+        # The type of the formula can change because of a change in another table,
+        # so the archived trashed rows must be moved back to the table here for
+        # their values to be recalculated like the other ones.
+        RowArchiveHandler().restore_table_archive(field.table)
+
         model = field.table.get_model(
             fields=[field], field_ids=[], add_dependencies=False
         )
-        from baserow.contrib.database.fields.registries import field_converter_registry
 
         field_converter_registry.get("formula").alter_field(
             old_field,
@@ -2,8 +2,6 @@
 
 from django.db import migrations, transaction
 
-from baserow.contrib.database.models import TableWebhook, TableWebhookEvent
-
 
 def forward(apps, schema_editor):
     """
@@ -12,6 +10,9 @@ def forward(apps, schema_editor):
     set to True.
     """
 
+    TableWebhook = apps.get_model("database", "TableWebhook")
+    TableWebhookEvent = apps.get_model("database", "TableWebhookEvent")
+
     with transaction.atomic():
         webhooks = TableWebhook.objects.filter(include_all_events=True)
         create_webhooks = []
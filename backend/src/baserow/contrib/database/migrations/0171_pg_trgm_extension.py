@@ -0,0 +1,24 @@
+from django.db import migrations
+
+# The extension is required by the indexes of the trigram search mode. Creating it
+# requires privileges that not every database user has, in which case the search
+# mode keeps working without using indexes, so any error is ignored.
+create_pg_trgm_extension = """
+do $$
+begin
+    create extension if not exists pg_trgm;
+exception when others then
+    raise notice 'Could not create the pg_trgm extension: %', sqlerrm;
+end
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0170_update_password_tsv_fields"),
+    ]
+
+    operations = [
+        migrations.RunSQL(create_pg_trgm_extension, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0171_pg_trgm_extension"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="row_search_document_column_added",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the table has a single search document "
+                "column for all fields instead of a tsvector column per field.",
+            ),
+        ),
+    ]
@@ -0,0 +1,74 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0172_table_row_search_document_column_added"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkspaceSearchEntry",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "row_id",
+                    models.PositiveIntegerField(
+                        help_text="The id of the row in the table the search vector "
+                        "is computed for."
+                    ),
+                ),
+                (
+                    "tsv",
+                    django.contrib.postgres.search.SearchVectorField(
+                        help_text="The search vector of the value of the cell."
+                    ),
+                ),
+                (
+                    "field",
+                    models.ForeignKey(
+                        help_text="The field the search vector is computed for.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="database.field",
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        help_text="The table the row belongs to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["table", "row_id"], name="database_ws_search_entry_row"
+                    ),
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["tsv"], name="database_ws_search_entry_tsv"
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="workspacesearchentry",
+            constraint=models.UniqueConstraint(
+                fields=("field", "row_id"), name="database_ws_search_entry_cell_key"
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0173_workspacesearchentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tablewebhook",
+            name="batch_events",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the events occurring within a short "
+                "window must be delivered together in a single call.",
+            ),
+        ),
+        migrations.CreateModel(
+            name="TableWebhookBatchedEvent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event_id",
+                    models.UUIDField(help_text="The unique id of the event."),
+                ),
+                ("event_type", models.CharField(max_length=50)),
+                (
+                    "payload",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="The payload of the event.",
+                    ),
+                ),
+                (
+                    "webhook",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="batched_events",
+                        to="database.tablewebhook",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("id",),
+            },
+        ),
+    ]
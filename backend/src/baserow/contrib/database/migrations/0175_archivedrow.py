@@ -0,0 +1,52 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0174_tablewebhook_batch_events"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedRow",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("row_id", models.PositiveIntegerField()),
+                (
+                    "values",
+                    models.JSONField(
+                        help_text="The values of the row in the table, mapped by "
+                        "column name."
+                    ),
+                ),
+                (
+                    "relations",
+                    models.JSONField(
+                        default=dict,
+                        help_text="The ids of the rows, select options or users "
+                        "related to the row, mapped by the name of the many to many "
+                        "field.",
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("table", "row_id")},
+            },
+        ),
+    ]
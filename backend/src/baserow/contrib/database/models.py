@@ -28,6 +28,7 @@ from .views.models import (
 )
 from .webhooks.models import (
     TableWebhook,
+    TableWebhookBatchedEvent,
     TableWebhookCall,
     TableWebhookEvent,
     TableWebhookHeader,
@@ -61,6 +62,7 @@ __all__ = [
     "TableWebhookEvent",
     "TableWebhookHeader",
     "TableWebhookCall",
+    "TableWebhookBatchedEvent",
     "FieldDependency",
 ]
 
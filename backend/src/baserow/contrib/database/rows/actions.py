@@ -1,7 +1,7 @@
 import dataclasses
 from copy import deepcopy
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -236,9 +236,10 @@ class ImportRowsActionType(UndoableActionType):
         cls,
         user: AbstractUser,
         table: Table,
-        data=List[List[Any]],
+        data: Iterable[List[Any]],
         progress: Optional[Progress] = None,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Any]]:
+        row_count: Optional[int] = None,
+    ) -> Tuple[List[int], Dict[str, Any]]:
         """
         Creates rows for a given table with the provided values if the user
         belongs to the related workspace. It also calls the table_updated signal.
@@ -246,14 +247,17 @@ class ImportRowsActionType(UndoableActionType):
         it generates an import error report and allow to track the progress.
         Undoing this action trashes the rows and redoing restores them all.
         The new rows are appended to the existing rows.
-        See the baserow.contrib.database.rows.handler.RowHandler.import_rows
+        See the baserow.contrib.database.rows.handler.RowHandler.import_rows_by_chunk
         for more information.
 
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be imported.
-        :param data: List of rows values for rows that need to be created.
+        :param data: Iterable of rows values for rows that need to be created. It's
+            consumed chunk by chunk, so it doesn't have to be a list.
         :param progress: An optional progress object to track the task progress.
-        :return: The created list of rows instances and the error report.
+        :param row_count: The number of rows in the data. Must be provided if the
+            data is not a list.
+        :return: The ids of the created rows and the error report.
         """
 
         if hasattr(table, "data_sync") and table.data_sync is not None:
@@ -261,8 +265,11 @@ class ImportRowsActionType(UndoableActionType):
                 "Can't create rows because it has a data sync."
             )
 
-        created_rows, error_report = RowHandler().import_rows(
-            user, table, data, progress=progress
+        if row_count is None:
+            row_count = len(data)
+
+        created_row_ids, error_report = RowHandler().import_rows_by_chunk(
+            user, table, data, row_count, progress=progress
         )
 
         workspace = table.database.workspace
@@ -271,13 +278,13 @@ class ImportRowsActionType(UndoableActionType):
             table.name,
             table.database.id,
             table.database.name,
-            [row.id for row in created_rows],
+            created_row_ids,
         )
         cls.register_action(
             user, params, scope=cls.scope(table.id), workspace=workspace
         )
 
-        return created_rows, error_report
+        return created_row_ids, error_report
 
     @classmethod
     def scope(cls, table_id) -> ActionScopeStr:
@@ -10,6 +10,7 @@ from typing import (
     NamedTuple,
     NewType,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -17,6 +18,7 @@ from typing import (
     cast,
 )
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db import connection, transaction
@@ -28,6 +30,7 @@ from django.utils.encoding import force_str
 
 from opentelemetry import metrics, trace
 
+from baserow.contrib.database.db.bulk_insert import bulk_insert_with_copy
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
 from baserow.contrib.database.fields.dependencies.update_collector import (
     FieldUpdateCollector,
@@ -62,7 +65,7 @@ from ..table.constants import (
 )
 from .constants import ROW_IMPORT_CREATION, ROW_IMPORT_VALIDATION
 from .error_report import RowErrorReport
-from .exceptions import RowDoesNotExist, RowIdsNotUnique
+from .exceptions import ReportMaxErrorCountExceeded, RowDoesNotExist, RowIdsNotUnique
 from .operations import (
     DeleteDatabaseRowOperationType,
     MoveRowDatabaseRowOperationType,
@@ -91,6 +94,9 @@ RowsForUpdate = NewType("RowsForUpdate", QuerySet)
 
 
 BATCH_SIZE = 1024
+# The number of rows that are validated and created at once by
+# `RowHandler.import_rows_by_chunk`.
+IMPORT_CHUNK_SIZE = 10 * BATCH_SIZE
 
 meter = metrics.get_meter(__name__)
 rows_created_counter = meter.create_counter(
@@ -972,6 +978,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if getattr(model, LAST_MODIFIED_BY_COLUMN_NAME, None):
             setattr(row, LAST_MODIFIED_BY_COLUMN_NAME, user if user.id else None)
             always_updated_fields.append(LAST_MODIFIED_BY_COLUMN_NAME)
+        if table.needs_background_update_column_added:
+            always_updated_fields.append(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME)
 
         row.save(update_fields=update_row_fields + always_updated_fields)
         rows_updated_counter.add(1)
@@ -1076,6 +1084,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         send_webhook_events: bool = True,
         generate_error_report: bool = False,
         skip_search_update: bool = False,
+        use_copy: bool = False,
     ) -> List[GeneratedTableModel]:
         """
         Creates new rows for a given table without checking permissions. It also calls
@@ -1096,6 +1105,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_search_update: If you want to instead trigger the search handler
             cells update later on after many create_rows calls then set this to True
             but make sure you trigger it eventually.
+        :param use_copy: Inserts the rows and their relations with the PostgreSQL
+            `COPY` statement, which is a lot faster for a big number of rows. Should
+            only be used for trusted bulk sources like imports.
         :return: The created row instances.
 
         """
@@ -1145,9 +1157,11 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             # saved.
             instance._m2m_values = relations
 
-        inserted_rows = model.objects.bulk_create(
-            [row for (row, _) in rows_relationships]
-        )
+        rows_to_insert = [row for (row, _) in rows_relationships]
+        if use_copy:
+            inserted_rows = bulk_insert_with_copy(model, rows_to_insert)
+        else:
+            inserted_rows = model.objects.bulk_create(rows_to_insert)
         rows_created_counter.add(len(rows_relationships))
 
         many_to_many = defaultdict(list)
@@ -1168,7 +1182,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         for field_name, values in many_to_many.items():
             through = getattr(model, field_name).through
-            through.objects.bulk_create(values)
+            if use_copy:
+                bulk_insert_with_copy(through, values)
+            else:
+                through.objects.bulk_create(values)
 
         _, dependant_fields = self.update_dependencies_of_rows_created(
             model,
@@ -1224,6 +1241,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         send_webhook_events: bool = True,
         generate_error_report: bool = False,
         skip_search_update: bool = False,
+        use_copy: bool = False,
     ) -> List[GeneratedTableModel]:
         """
         Creates new rows for a given table if the user
@@ -1244,6 +1262,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_search_update: If you want to instead trigger the search handler
             cells update later on after many create_rows calls then set this to True
             but make sure you trigger it eventually.
+        :param use_copy: Inserts the rows and their relations with the PostgreSQL
+            `COPY` statement, which is a lot faster for a big number of rows. Should
+            only be used for trusted bulk sources like imports.
         :param values_already_prepared: Whether or not the values are already sanitized
             and validated for every field and can be used directly by the handler
             without any further check.
@@ -1269,6 +1290,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             send_webhook_events,
             generate_error_report,
             skip_search_update,
+            use_copy,
         )
 
     def update_dependencies_of_rows_created(
@@ -1435,6 +1457,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         rows: List[Dict[str, Any]],
         progress: Optional[Progress] = None,
         model: Optional[Type[GeneratedTableModel]] = None,
+        use_copy: bool = False,
     ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
         """
         Creates rows by batch and generates an error report instead of failing on first
@@ -1445,6 +1468,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param rows: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
         :param model: Optional model to prevent recomputing table model.
+        :param use_copy: Inserts the rows with the PostgreSQL `COPY` statement. See
+            `force_create_rows` for more information.
         :return: The created rows and the error report.
         """
 
@@ -1472,6 +1497,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 # Don't trigger loads of search updates for every batch of rows we
                 # create but instead a single one for this entire table at the end.
                 skip_search_update=True,
+                use_copy=use_copy,
             )
 
             for valid_index, field_errors in creation_report.items():
@@ -1525,9 +1551,110 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             context=table,
         )
 
-        error_report = RowErrorReport(data)
+        model = table.get_model()
+        fields = self._get_import_fields(model)
+
+        created_rows, error_report = self._import_rows_chunk(
+            user, table, model, fields, data, validate=validate, progress=progress
+        )
+
+        if send_realtime_update:
+            # Just send a single table_updated here as realtime update instead
+            # of rows_created because we might import a lot of rows.
+            table_updated.send(self, table=table, user=user, force_table_refresh=True)
+
+        return created_rows, error_report
+
+    def import_rows_by_chunk(
+        self,
+        user: AbstractUser,
+        table: Table,
+        data: Iterable[List[Any]],
+        row_count: int,
+        validate: bool = True,
+        progress: Optional[Progress] = None,
+        send_realtime_update: bool = True,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> Tuple[List[int], Dict[int, Dict[str, Any]]]:
+        """
+        Works like `import_rows`, except that the data are consumed, validated and
+        created chunk by chunk. Only the current chunk, the ids of the created rows
+        and the errors are kept in memory, so the data can be any iterable, like
+        rows lazily read from a file.
+
+        :param user: The user of whose behalf the rows are created.
+        :param table: The table for which the rows should be created.
+        :param data: Iterable of rows values for rows that need to be created.
+        :param row_count: The number of rows in the data. It's used to track the
+            progress.
+        :param validate: If True the data are validated before the import.
+        :param progress: Give a progress instance to track the progress of the
+            import.
+        :param send_realtime_update: Indicates if a table_updated signal should be
+            sent when all the rows have been imported.
+        :param chunk_size: The number of rows that are imported at once.
+        :raise ReportMaxErrorCountExceeded: If the total number of errors exceeds
+            the BASEROW_MAX_ROW_REPORT_ERROR_COUNT setting.
+        :return: The ids of the created rows and the error report.
+        """
+
+        workspace = table.database.workspace
+        CoreHandler().check_permissions(
+            user,
+            ImportRowsDatabaseTableOperationType.type,
+            workspace=workspace,
+            context=table,
+        )
 
         model = table.get_model()
+        fields = self._get_import_fields(model)
+
+        import_progress = progress.create_child(100, row_count) if progress else None
+
+        created_row_ids = []
+        error_report = {}
+        for count, chunk in enumerate(grouper(chunk_size, data)):
+            row_start_index = count * chunk_size
+            chunk_progress = (
+                import_progress.create_child(len(chunk), 100)
+                if import_progress
+                else None
+            )
+
+            try:
+                created_rows, chunk_error_report = self._import_rows_chunk(
+                    user,
+                    table,
+                    model,
+                    fields,
+                    chunk,
+                    validate=validate,
+                    progress=chunk_progress,
+                    error_limit=(
+                        settings.BASEROW_MAX_ROW_REPORT_ERROR_COUNT - len(error_report)
+                    ),
+                )
+            except ReportMaxErrorCountExceeded as exc:
+                for index, error in exc.report.items():
+                    error_report[index + row_start_index] = error
+                raise ReportMaxErrorCountExceeded(error_report) from exc
+
+            for index, error in chunk_error_report.items():
+                error_report[index + row_start_index] = error
+            created_row_ids.extend(row.id for row in created_rows)
+
+        if send_realtime_update:
+            # Just send a single table_updated here as realtime update instead
+            # of rows_created because we might import a lot of rows.
+            table_updated.send(self, table=table, user=user, force_table_refresh=True)
+
+        return created_row_ids, error_report
+
+    def _get_import_fields(self, model: Type[GeneratedTableModel]) -> List["Field"]:
+        """
+        Returns the fields of the model the imported values are matched with by
+        position, sorted by order then by id.
+        """
 
         fields = [
             field_object["field"]
@@ -1538,6 +1665,33 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         # Sort by order then by id
         fields.sort(key=lambda f: (f.order, f.id))
+        return fields
+
+    def _import_rows_chunk(
+        self,
+        user: AbstractUser,
+        table: Table,
+        model: Type[GeneratedTableModel],
+        fields: List["Field"],
+        data: Sequence[List[Any]],
+        validate: bool = True,
+        progress: Optional[Progress] = None,
+        error_limit: Optional[int] = None,
+    ) -> Tuple[List[GeneratedTableModel], Dict[int, Dict[str, Any]]]:
+        """
+        Validates and creates the provided rows values. See `import_rows` for more
+        information.
+
+        :param error_limit: The maximum number of errors before the import fails.
+            Defaults to the BASEROW_MAX_ROW_REPORT_ERROR_COUNT setting.
+        :return: The created row instances and the error report, indexed by the
+            position of the row in the provided data.
+        """
+
+        if error_limit is None:
+            error_limit = settings.BASEROW_MAX_ROW_REPORT_ERROR_COUNT
+
+        error_report = RowErrorReport(data, error_limit=error_limit)
 
         for index, row in enumerate(data):
             # Check row length
@@ -1590,8 +1744,15 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             else None
         )
 
+        # Imports are trusted bulk sources, so the rows can be inserted with the
+        # faster `COPY` statement.
         created_rows, creation_report = self.create_rows_by_batch(
-            user, table, valid_rows, progress=creation_sub_progress, model=model
+            user,
+            table,
+            valid_rows,
+            progress=creation_sub_progress,
+            model=model,
+            use_copy=True,
         )
 
         # Add errors to global report
@@ -1601,11 +1762,6 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 error,
             )
 
-        if send_realtime_update:
-            # Just send a single table_updated here as realtime update instead
-            # of rows_created because we might import a lot of rows.
-            table_updated.send(self, table=table, user=user, force_table_refresh=True)
-
         return created_rows, error_report.to_dict()
 
     def get_fields_metadata_for_row_history(
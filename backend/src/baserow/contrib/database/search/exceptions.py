@@ -3,3 +3,10 @@ class PostgresFullTextSearchDisabledException(Exception):
     Raised when the Postgres full-text specific search handler methods
     are called, and `USE_PG_FULLTEXT_SEARCH` is disabled.
     """
+
+
+class WorkspaceSearchIndexDisabledException(Exception):
+    """
+    Raised when a workspace is searched, and `WORKSPACE_SEARCH_INDEX_ENABLED` is
+    disabled.
+    """
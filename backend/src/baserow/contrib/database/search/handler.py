@@ -1,14 +1,41 @@
 import math
 import traceback
 from enum import Enum
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Type,
+)
 
 from django.conf import settings
-from django.contrib.postgres.indexes import GinIndex
-from django.contrib.postgres.search import SearchVector
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorExact,
+    SearchVectorField,
+)
 from django.core.cache import cache
 from django.db import connection, transaction
-from django.db.models import Expression, Func, Q, QuerySet, TextField, Value
+from django.db.models import (
+    Case,
+    Expression,
+    F,
+    Func,
+    Q,
+    QuerySet,
+    TextField,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce, Replace, Upper
 from django.utils.encoding import force_str
 
 from loguru import logger
@@ -19,8 +46,10 @@ from redis.exceptions import LockNotOwnedError
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.search.exceptions import (
     PostgresFullTextSearchDisabledException,
+    WorkspaceSearchIndexDisabledException,
 )
 from baserow.contrib.database.search.expressions import LocalisedSearchVector
+from baserow.contrib.database.search.models import WorkspaceSearchEntry
 from baserow.contrib.database.search.regexes import (
     RE_ONE_OR_MORE_WHITESPACE,
     RE_REMOVE_ALL_PUNCTUATION_ALREADY_REMOVED_FROM_TSVS_FOR_QUERY,
@@ -29,17 +58,36 @@ from baserow.contrib.database.search.regexes import (
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
 from baserow.contrib.database.table.constants import (
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
+    ROW_SEARCH_DOCUMENT_COLUMN_NAME,
 )
+from baserow.core.db import transaction_atomic
 from baserow.core.telemetry.utils import baserow_trace_methods
 from baserow.core.utils import ChildProgressBuilder, exception_capturer
 
 if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser
+
     from baserow.contrib.database.fields.models import Field
     from baserow.contrib.database.table.handler import TableForUpdate
     from baserow.contrib.database.table.models import GeneratedTableModel, Table
+    from baserow.core.models import Workspace
 
 tracer = trace.get_tracer(__name__)
 
+# The highlighted snippets of the ranked search results contain at most this number
+# of fragments of the matching value, joined by the delimiter.
+HIGHLIGHT_MAX_FRAGMENTS = 3
+HIGHLIGHT_FRAGMENT_DELIMITER = " ... "
+# The characters escaped in the highlighted values, in the same way as `html.escape`,
+# so that only the `<b>` and `</b>` added by `ts_headline` are HTML markup.
+HIGHLIGHT_HTML_ESCAPES = [
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("'", "&#x27;"),
+]
+
 
 class SearchModes(str, Enum):
     # Use this mode to search rows using LIKE operators against each
@@ -52,6 +100,13 @@ class SearchModes(str, Enum):
     # method is much faster as tables grow in size.
     MODE_FT_WITH_COUNT = "full-text-with-count"
 
+    # Use this mode to search rows using the same case-insensitive substring
+    # matching as `MODE_COMPAT`, but backed by `pg_trgm` GIN indexes on the text
+    # fields, and return an accurate `count` in the response. The other fields
+    # are searched using their full-text search column, so that the whole search
+    # can be index driven instead of scanning the table.
+    MODE_TRIGRAM = "trigram"
+
 
 ALL_SEARCH_MODES = [getattr(mode, "value") for mode in SearchModes]
 
@@ -65,15 +120,36 @@ class FieldWithSearchVector(NamedTuple):
         return self.field.tsv_db_column
 
 
+class RowSearchDocumentVector(NamedTuple):
+    search_vector: Expression
+    field = None
+
+    @property
+    def field_tsv_db_column(self):
+        return ROW_SEARCH_DOCUMENT_COLUMN_NAME
+
+
+class RankedSearchResult(NamedTuple):
+    row: "GeneratedTableModel"
+    rank: float
+    # The highlighted snippet of every searched field matching the search, by id.
+    highlights: Dict[int, str]
+
+
 class SearchHandler(
     metaclass=baserow_trace_methods(
-        tracer, exclude=["full_text_enabled", "search_config"]
+        tracer,
+        exclude=["full_text_enabled", "row_search_document_enabled", "search_config"],
     )
 ):
     @classmethod
     def full_text_enabled(cls):
         return settings.USE_PG_FULLTEXT_SEARCH
 
+    @classmethod
+    def row_search_document_enabled(cls):
+        return cls.full_text_enabled() and settings.PG_SEARCH_ROW_DOCUMENT_ENABLED
+
     @classmethod
     def search_config(cls):
         return settings.PG_SEARCH_CONFIG
@@ -196,10 +272,14 @@ class SearchHandler(
 
         if field.tsvector_column_created:
             cls._create_tsv_column(field)
-            if not skip_search_updates:
-                cls.entire_field_values_changed_or_created(
-                    field.table, updated_fields=[field]
-                )
+
+        is_in_search_document = field.table.row_search_document_column_added
+        if (
+            field.tsvector_column_created or is_in_search_document
+        ) and not skip_search_updates:
+            cls.entire_field_values_changed_or_created(
+                field.table, updated_fields=[field]
+            )
 
     @classmethod
     def _create_tsv_column(cls, field):
@@ -235,6 +315,19 @@ class SearchHandler(
                 f"database_table_{field.table_id}", field.tsv_db_column
             )
 
+    @classmethod
+    def after_field_deleted(cls, field: "Field"):
+        """
+        Called when a field is trashed or deleted. The terms of a field can't be
+        removed from the row search document, so the documents of all the rows are
+        rebuilt without them.
+
+        :param field: The field which was trashed or deleted from its table.
+        """
+
+        if field.table.row_search_document_column_added:
+            cls.entire_field_values_changed_or_created(field.table)
+
     @staticmethod
     def _drop_column_if_table_exists(table_name: str, column_to_drop: str):
         with connection.cursor() as cursor:
@@ -260,6 +353,13 @@ class SearchHandler(
         the field type is searchable.
         """
 
+        if model.baserow_table.row_search_document_column_added:
+            # The document always contains all the fields, so it's rebuilt
+            # entirely even if only some fields must be updated.
+            return [
+                RowSearchDocumentVector(cls.get_row_search_document(model, queryset))
+            ]
+
         vector_updates: List[FieldWithSearchVector] = []
 
         for field in model.get_fields_with_search_index():
@@ -274,16 +374,68 @@ class SearchHandler(
 
     @classmethod
     def _get_field_with_vector_from_field(cls, field, queryset):
+        return FieldWithSearchVector(
+            field, cls.get_field_search_vector(field, queryset)
+        )
+
+    @classmethod
+    def get_field_search_vector(
+        cls, field: "Field", queryset: QuerySet, weight: Optional[str] = None
+    ) -> Expression:
+        """
+        Returns the search vector of the provided field, or a null value if the field
+        isn't searchable.
+
+        :param field: The field to get the search vector for.
+        :param queryset: The queryset of the rows the vector is computed for.
+        :param weight: The optional weight, `A` to `D`, of the lexemes of the vector.
+        :return: The search vector expression.
+        """
+
         from baserow.contrib.database.fields.registries import field_type_registry
 
         field_type = field_type_registry.get_by_model(field)
         if field_type.is_searchable(field):
-            search_vector = LocalisedSearchVector(
-                field_type.get_search_expression(field, queryset)
+            return LocalisedSearchVector(
+                field_type.get_search_expression(field, queryset), weight=weight
             )
         else:
-            search_vector = Value(None)
-        return FieldWithSearchVector(field, search_vector)
+            return Value(None)
+
+    @classmethod
+    def get_row_search_document(
+        cls, model: Type["GeneratedTableModel"], queryset: QuerySet
+    ) -> Expression:
+        """
+        Returns the expression computing the search document of a row, which is the
+        concatenation of the search vectors of all its searchable fields. The lexemes
+        of the primary field are weighted `A` and the others `D`, so that matches in
+        the primary field can be ranked higher.
+
+        :param model: The table model to compute the document for.
+        :param queryset: The queryset of the rows the document is computed for.
+        :return: The search document expression.
+        """
+
+        empty_vector = Cast(Value(""), output_field=SearchVectorField())
+        search_vectors = [
+            Coalesce(
+                cls.get_field_search_vector(
+                    field, queryset, weight="A" if field.primary else "D"
+                ),
+                empty_vector,
+            )
+            for field in model.get_searchable_fields()
+        ]
+        if not search_vectors:
+            return empty_vector
+
+        return Func(
+            *search_vectors,
+            function="",
+            arg_joiner=" || ",
+            output_field=SearchVectorField(),
+        )
 
     @classmethod
     def sync_tsvector_columns(cls, table: "TableForUpdate") -> "TableForUpdate":
@@ -299,6 +451,9 @@ class SearchHandler(
         if not cls.full_text_enabled():
             raise PostgresFullTextSearchDisabledException()
 
+        if cls.row_search_document_enabled() or table.row_search_document_column_added:
+            return cls._sync_row_search_document_column(table)
+
         # Prepare a fresh model we can use to create the column.
         model = table.get_model(force_add_tsvectors=True)
 
@@ -333,6 +488,51 @@ class SearchHandler(
 
         return table
 
+    @classmethod
+    def _sync_row_search_document_column(
+        cls, table: "TableForUpdate"
+    ) -> "TableForUpdate":
+        """
+        Converts the table to use a single row search document column instead of a
+        tsvector column per field. The existing tsvector columns are dropped and the
+        documents of all the rows are computed in a background task.
+        """
+
+        from baserow.contrib.database.fields.models import Field
+
+        if table.row_search_document_column_added:
+            return table
+
+        model = table.get_model()
+        fields_with_tsv = model.get_fields_with_search_index(include_trash=True)
+        with safe_django_schema_editor(atomic=False) as schema_editor:
+            for field in fields_with_tsv:
+                logger.debug(f"Removing {field.tsv_db_column} from table {table.id}")
+                schema_editor.remove_field(
+                    model, model._meta.get_field(field.tsv_db_column)
+                )
+                field.tsvector_column_created = False
+
+            table.row_search_document_column_added = True
+            table.save(update_fields=["row_search_document_column_added"])
+            model = table.get_model(use_cache=False)
+            schema_editor.add_field(
+                model, model._meta.get_field(ROW_SEARCH_DOCUMENT_COLUMN_NAME)
+            )
+            schema_editor.add_index(
+                model,
+                GinIndex(
+                    fields=[ROW_SEARCH_DOCUMENT_COLUMN_NAME],
+                    name=table.row_search_document_index_name,
+                ),
+            )
+
+        Field.objects.bulk_update(fields_with_tsv, ["tsvector_column_created"])
+        invalidate_table_in_model_cache(table.id)
+        cls.entire_field_values_changed_or_created(table)
+
+        return table
+
     @classmethod
     def get_update_changed_rows_only_lock_key(cls, table):
         return (
@@ -471,14 +671,25 @@ class SearchHandler(
             progress_builder, child_total=1000 if must_vacuum else 800
         )
 
+        def after_chunk_updated(row_ids: List[int]):
+            WorkspaceSearchHandler.update_row_entries(
+                model, row_ids, field_ids_to_restrict_update_to
+            )
+
         rows_updated_count = cls.run_tsvector_update_statement(
             collected_vectors,
             qs,
             # If we are updating all field ids, then we can safely unset the needs
-            # background update.
-            set_background_updated_false=field_ids_to_restrict_update_to is None,
+            # background update. The row search document is always entirely updated.
+            set_background_updated_false=(
+                field_ids_to_restrict_update_to is None
+                or table.row_search_document_column_added
+            ),
             update_tsvectors_for_changed_rows_only=update_tsvectors_for_changed_rows_only,
             progress_builder=progress.create_child_builder(represents_progress=800),
+            after_chunk_updated=(
+                after_chunk_updated if WorkspaceSearchHandler.enabled() else None
+            ),
         )
 
         if must_vacuum:
@@ -514,11 +725,13 @@ class SearchHandler(
         qs,
         update_query,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        after_chunk_updated: Optional[Callable[[List[int]], None]] = None,
     ) -> Optional[int]:
         """
         Split the queryset up into chunks based on the count, and update the tsv
         cells for the rows in the chunk. It will stop when max number of
-        precalculated iterations is reached.
+        precalculated iterations is reached. If provided, `after_chunk_updated` is
+        called with the ids of the rows of every chunk, in the same transaction.
         """
 
         total_count = qs.count()
@@ -539,7 +752,11 @@ class SearchHandler(
                     i : i + settings.TSV_UPDATE_CHUNK_SIZE
                 ]
                 next_chunk = qs.filter(id__in=next_ids).select_for_update(of=("self",))
+                if after_chunk_updated is not None:
+                    next_ids = list(next_chunk.values_list("id", flat=True))
                 total_updated += next_chunk.update(**update_query)
+                if after_chunk_updated is not None and next_ids:
+                    after_chunk_updated(next_ids)
             progress.increment()
         return total_updated
 
@@ -549,11 +766,13 @@ class SearchHandler(
         qs,
         update_query,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        after_chunk_updated: Optional[Callable[[List[int]], None]] = None,
     ) -> Optional[int]:
         """
         This method keeps iterating over the provided row queryset, fetch the not
         updated rows in chunks, and update the tsv cells of those chunks. It will
-        keep going until none are left.
+        keep going until none are left. If provided, `after_chunk_updated` is called
+        with the ids of the rows of every chunk, in the same transaction.
         """
 
         estimated_count = qs.count()
@@ -578,6 +797,8 @@ class SearchHandler(
                 next_ids = list(next_ids)
                 next_chunk = qs.filter(id__in=next_ids)
                 this_chunk_updated = next_chunk.update(**update_query)
+                if after_chunk_updated is not None and next_ids:
+                    after_chunk_updated(next_ids)
                 progress.increment()
                 total_updated += 0
                 if this_chunk_updated == 0:
@@ -591,6 +812,7 @@ class SearchHandler(
         set_background_updated_false: bool,
         update_tsvectors_for_changed_rows_only: bool,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        after_chunk_updated: Optional[Callable[[List[int]], None]] = None,
     ) -> Optional[int]:
         progress = ChildProgressBuilder.build(progress_builder, child_total=1000)
 
@@ -607,6 +829,7 @@ class SearchHandler(
                     progress_builder=progress.create_child_builder(
                         represents_progress=1000
                     ),
+                    after_chunk_updated=after_chunk_updated,
                 )
             else:
                 return cls.split_update_into_chunks_by_ranges(
@@ -615,6 +838,7 @@ class SearchHandler(
                     progress_builder=progress.create_child_builder(
                         represents_progress=1000
                     ),
+                    after_chunk_updated=after_chunk_updated,
                 )
         except Exception as e:
             progress.set_progress(0)
@@ -665,9 +889,11 @@ class SearchHandler(
         num_worked = 0
         for cv in collected_vectors:
             try:
-                # re-fetch the fields incase they changed since we got the model
-                refetched_field = FieldHandler().get_field(cv.field.id).specific
-                cv = cls._get_field_with_vector_from_field(refetched_field, qs)
+                # re-fetch the fields incase they changed since we got the model. The
+                # row search document doesn't belong to a field, so it's retried as is.
+                if cv.field is not None:
+                    refetched_field = FieldHandler().get_field(cv.field.id).specific
+                    cv = cls._get_field_with_vector_from_field(refetched_field, qs)
                 if update_tsvectors_for_changed_rows_only:
                     cls.split_update_into_chunks_until_all_background_done(
                         qs,
@@ -693,7 +919,7 @@ class SearchHandler(
                     + str(field)
                     + " and expression is "
                     + str(cv.search_vector),
-                    field_id=field.id,
+                    field_id=field and field.id,
                     field_type=str(type(field)),
                     e=str(another_e),
                 )
@@ -792,12 +1018,599 @@ class SearchHandler(
         traceback.print_exc()
         exception_capturer(e)
 
+    @classmethod
+    def get_ranked_search_results(
+        cls,
+        table: "Table",
+        search: str,
+        limit: int,
+        only_search_by_field_ids: Optional[Iterable[int]] = None,
+        model: Optional[Type["GeneratedTableModel"]] = None,
+    ) -> List[RankedSearchResult]:
+        """
+        Returns the rows of the table matching the search the best, ordered by
+        relevance. Only the ids and ranks of the matching rows are sorted, and only
+        the top `limit` rows are fetched afterwards, together with a highlighted
+        snippet of the value of every searched field matching the search. The
+        snippets are therefore only computed for the returned rows.
+
+        If the table doesn't support full-text search, the rows matching the compat
+        search are returned by id without rank or highlights.
+
+        :param table: The table to search in.
+        :param search: The search query.
+        :param limit: The maximum number of rows to return.
+        :param only_search_by_field_ids: If provided, only the fields with these ids
+            are searched.
+        :param model: The table model to use, generated if not provided.
+        :return: The ranked search results.
+        """
+
+        sanitized_search = cls.escape_postgres_query(search or "")
+        if not sanitized_search:
+            return []
+
+        if model is None:
+            model = table.get_model()
+
+        queryset = model.objects.all()
+        if table.tsvectors_are_supported:
+            ranked_queryset = queryset.rank_search_results(
+                search, only_search_by_field_ids
+            )
+        else:
+            ranked_queryset = (
+                queryset.compat_search(search, only_search_by_field_ids)
+                .annotate(search_rank=Value(0.0))
+                .order_by("id")
+            )
+
+        ranks = dict(ranked_queryset.values_list("id", "search_rank")[:limit])
+        if not ranks:
+            return []
+
+        queryset = queryset.filter(id__in=list(ranks)).enhance_by_fields()
+        highlighted_fields = []
+        if table.tsvectors_are_supported:
+            highlighted_fields = [
+                field
+                for field in model.get_searchable_fields()
+                if only_search_by_field_ids is None
+                or field.id in only_search_by_field_ids
+            ]
+            queryset = cls._annotate_search_highlights(
+                queryset, highlighted_fields, sanitized_search
+            )
+
+        rows = {row.id: row for row in queryset}
+        results = []
+        for row_id, rank in ranks.items():
+            if row_id not in rows:
+                continue
+            row = rows[row_id]
+            highlights = {}
+            for field in highlighted_fields:
+                highlight = getattr(row, f"search_highlight_{field.id}")
+                if highlight is not None:
+                    highlights[field.id] = highlight
+            results.append(RankedSearchResult(row, rank, highlights))
+        return results
+
+    @classmethod
+    def _annotate_search_highlights(
+        cls, queryset: QuerySet, fields: List["Field"], sanitized_search: str
+    ) -> QuerySet:
+        """
+        Annotates a `search_highlight_{id}` snippet of the value of every provided
+        field, with the matching words highlighted, or `None` if the value of the
+        field doesn't match the search. The value is HTML escaped before the
+        matching words are surrounded by `<b>` and `</b>`.
+        """
+
+        from baserow.contrib.database.fields.registries import field_type_registry
+
+        search_query = SearchQuery(
+            sanitized_search, search_type="raw", config=cls.search_config()
+        )
+        annotations = {}
+        for field in fields:
+            field_type = field_type_registry.get_by_model(field)
+            search_vector = cls.get_field_search_vector(field, queryset)
+            value = Cast(
+                field_type.get_search_expression(field, queryset),
+                output_field=TextField(),
+            )
+            for character, escaped_character in HIGHLIGHT_HTML_ESCAPES:
+                value = Replace(value, Value(character), Value(escaped_character))
+            annotations[f"search_highlight_{field.id}"] = Case(
+                When(
+                    Q(SearchVectorExact(search_vector, search_query)),
+                    then=SearchHeadline(
+                        value,
+                        search_query,
+                        config=cls.search_config(),
+                        max_fragments=HIGHLIGHT_MAX_FRAGMENTS,
+                        fragment_delimiter=HIGHLIGHT_FRAGMENT_DELIMITER,
+                    ),
+                ),
+                default=Value(None),
+                output_field=TextField(),
+            )
+        return queryset.annotate(**annotations)
+
     @classmethod
     def after_field_moved_between_tables(
         cls, moved_field: "Field", original_table_id: int
     ):
+        from baserow.contrib.database.table.models import Table
+
         if moved_field.tsvector_column_created:
             cls._drop_column_if_table_exists(
                 f"database_table_{original_table_id}", moved_field.tsv_db_column
             )
-            cls._create_tsv_column(moved_field)
+            if moved_field.table.row_search_document_column_added:
+                moved_field.tsvector_column_created = False
+                moved_field.save(update_fields=["tsvector_column_created"])
+            else:
+                cls._create_tsv_column(moved_field)
+
+        if moved_field.table.row_search_document_column_added:
+            cls.entire_field_values_changed_or_created(moved_field.table)
+
+        # The entries of the field still reference the rows of the original table.
+        WorkspaceSearchHandler.delete_field_entries(moved_field)
+
+        original_table = Table.objects.filter(
+            id=original_table_id, row_search_document_column_added=True
+        ).first()
+        if original_table is not None:
+            cls.entire_field_values_changed_or_created(original_table)
+
+
+class TrigramIndexingHandler(metaclass=baserow_trace_methods(tracer)):
+    """
+    Manages the `pg_trgm` GIN indexes used by the `MODE_TRIGRAM` search mode. Just
+    like the view indexes, they're created in a background task the first time they
+    are needed, so only the tables that are actually searched with this mode get
+    them. Whether an index exists is tracked by looking it up in the database, and
+    cached per field once it does, so that searching doesn't have to look it up. A
+    missing index is cached for a limited time after its creation is scheduled, so
+    that the creation isn't scheduled for every search if it fails.
+    """
+
+    EXTENSION_NAME = "pg_trgm"
+
+    @classmethod
+    def extension_is_available(cls) -> bool:
+        """
+        Returns whether the `pg_trgm` extension has been created in the database.
+        It's created by a migration, but that can fail if the database user isn't
+        allowed to create extensions. The search still works without it, but
+        without using an index.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_extension WHERE extname = %s", [cls.EXTENSION_NAME]
+            )
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def _get_index_exists_cache_key(cls, field: "Field") -> str:
+        """
+        Returns the cache key storing whether the trigram index of the field exists.
+        """
+
+        return f"trigram_index_exists__{field.id}"
+
+    @classmethod
+    def get_index(cls, field: "Field") -> GinIndex:
+        """
+        Returns the trigram index of the provided field. The indexed expression
+        matches the `UPPER("field_1"::text) LIKE UPPER(%s)` SQL generated by the
+        `icontains` lookup, so that it can be used by the query planner.
+
+        :param field: The field to get the index for.
+        :return: The index.
+        """
+
+        return GinIndex(
+            OpClass(Upper(F(field.db_column)), name="gin_trgm_ops"),
+            name=field.trigram_index_name,
+        )
+
+    @classmethod
+    def get_indexable_fields(
+        cls,
+        model: "GeneratedTableModel",
+        only_field_ids: Optional[Iterable[int]] = None,
+    ) -> List["Field"]:
+        """
+        Returns the fields of the model whose type can be trigram indexed.
+
+        :param model: The table model to get the fields from.
+        :param only_field_ids: If provided, only the fields with these ids are
+            returned.
+        :return: The list of fields.
+        """
+
+        return [
+            field_object["field"]
+            for field_object in model._field_objects.values()
+            if field_object["type"].can_be_trigram_indexed
+            and (only_field_ids is None or field_object["field"].id in only_field_ids)
+        ]
+
+    @classmethod
+    def get_fields_missing_index(
+        cls,
+        model: "GeneratedTableModel",
+        only_field_ids: Optional[Iterable[int]] = None,
+    ) -> List["Field"]:
+        """
+        Returns the indexable fields of the model that don't have a trigram index
+        yet, using a single query.
+
+        :param model: The table model to get the fields from.
+        :param only_field_ids: If provided, only the fields with these ids are
+            checked.
+        :return: The list of fields without a trigram index.
+        """
+
+        fields = cls.get_indexable_fields(model, only_field_ids)
+        if not fields:
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE indexname = ANY(%s)",
+                [[field.trigram_index_name for field in fields]],
+            )
+            existing_index_names = {row[0] for row in cursor.fetchall()}
+
+        return [
+            field
+            for field in fields
+            if field.trigram_index_name not in existing_index_names
+        ]
+
+    @classmethod
+    def schedule_index_creation_if_needed(
+        cls,
+        model: "GeneratedTableModel",
+        only_field_ids: Optional[Iterable[int]] = None,
+    ):
+        """
+        Schedules the creation of the missing trigram indexes in an asynchronous
+        task if some of the searched fields don't have one yet.
+
+        :param model: The table model that is searched.
+        :param only_field_ids: If provided, only the fields with these ids are
+            searched and must be indexed.
+        """
+
+        if not settings.AUTO_INDEX_TRIGRAM_SEARCH_ENABLED:
+            return
+
+        try:
+            fields = cls.get_indexable_fields(model, only_field_ids)
+            cache_keys = {
+                field.id: cls._get_index_exists_cache_key(field) for field in fields
+            }
+            cached = cache.get_many(cache_keys.values())
+            unknown_field_ids = [
+                field_id
+                for field_id, cache_key in cache_keys.items()
+                if cache_key not in cached
+            ]
+            if not unknown_field_ids:
+                return
+
+            missing_field_ids = {
+                field.id
+                for field in cls.get_fields_missing_index(model, unknown_field_ids)
+            }
+            cache.set_many(
+                {
+                    cache_keys[field_id]: True
+                    for field_id in unknown_field_ids
+                    if field_id not in missing_field_ids
+                }
+            )
+            if missing_field_ids:
+                # If the `pg_trgm` extension isn't available or the creation fails,
+                # the index stays missing, so it's only rechecked after a delay.
+                cache.set_many(
+                    {cache_keys[field_id]: False for field_id in missing_field_ids},
+                    timeout=settings.AUTO_INDEX_TRIGRAM_SEARCH_RECHECK_DELAY,
+                )
+                cls.schedule_index_update(model.baserow_table)
+        except Exception as exc:  # nosec
+            logger.error(
+                "Failed to check if table needs trigram indexes because of {e}",
+                e=str(exc),
+            )
+            traceback.print_exc()
+
+    @classmethod
+    def schedule_index_update(cls, table: "Table"):
+        """
+        This function schedules a celery task calling the update_trigram_indexes
+        method to create the missing trigram indexes of the table.
+
+        :param table: The table for which the indexes need to be created.
+        """
+
+        from baserow.contrib.database.search.tasks import schedule_trigram_index_update
+
+        schedule_trigram_index_update(table.id)
+
+    @classmethod
+    def update_indexes_by_table_id(cls, table_id: int, nowait: bool = True):
+        """
+        Creates the missing trigram indexes of the table with the provided id. If
+        nowait is set to True, the operation will not wait for a lock on the table,
+        raising a DatabaseError if the lock cannot be acquired immediately.
+
+        :param table_id: The id of the table to create the indexes for.
+        :param nowait: If set to True, the operation will not wait for a lock on the
+            table, raising a DatabaseError if the lock cannot be acquired immediately.
+        :raises TableDoesNotExist: When the table with the provided id does not
+            exist.
+        :raises DatabaseError: When the lock on the table cannot be acquired
+            immediately.
+        """
+
+        from baserow.contrib.database.table.handler import TableHandler
+
+        table = TableHandler().get_table(table_id)
+
+        if nowait:
+            first_sql_to_run = (
+                sql.SQL("LOCK TABLE {0} IN SHARE MODE NOWAIT"),
+                [sql.Identifier(table.get_database_table_name())],
+            )
+        else:
+            first_sql_to_run = None
+
+        with transaction_atomic(
+            first_sql_to_run_in_transaction_with_args=first_sql_to_run
+        ):
+            cls.update_indexes(table)
+
+    @classmethod
+    def update_indexes(
+        cls, table: "Table", model: Optional["GeneratedTableModel"] = None
+    ) -> List[str]:
+        """
+        Creates the trigram indexes of the indexable fields of the table that don't
+        have one yet. Nothing is created if the `pg_trgm` extension isn't available
+        or if the table belongs to a template, to save space.
+
+        :param table: The table to create the indexes for.
+        :param model: The model to use for the table. If not provided the model
+            will be generated.
+        :return: The names of the created indexes.
+        """
+
+        if not cls.extension_is_available() or table.database.workspace.has_template():
+            return []
+
+        if model is None:
+            model = table.get_model()
+
+        created_index_names = []
+        for field in cls.get_fields_missing_index(model):
+            db_index = cls.get_index(field)
+            with safe_django_schema_editor() as schema_editor:
+                schema_editor.add_index(model, db_index)
+            logger.info(
+                "Created trigram index {db_index_name} for field {field_id} of table "
+                "{table_id}",
+                db_index_name=db_index.name,
+                field_id=field.id,
+                table_id=table.id,
+            )
+            created_index_names.append(db_index.name)
+
+        return created_index_names
+
+    @classmethod
+    def drop_index_if_exists(cls, field: "Field"):
+        """
+        Drops the trigram index of the provided field if it exists. Must be called
+        before the type of the field changes, because the indexed expression might
+        not be valid for the new type of the column. The index is recreated the
+        next time it's needed if the new type can still be indexed.
+
+        :param field: The field to drop the index for.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("DROP INDEX IF EXISTS {index_name}").format(
+                    index_name=sql.Identifier(field.trigram_index_name)
+                )
+            )
+
+        # Deleted again on commit, because a concurrent search could have cached
+        # that the index exists before the drop is committed.
+        cache_key = cls._get_index_exists_cache_key(field)
+        cache.delete(cache_key)
+        transaction.on_commit(lambda: cache.delete(cache_key))
+
+
+class WorkspaceSearchHandler(
+    metaclass=baserow_trace_methods(tracer, exclude=["enabled"])
+):
+    """
+    Manages the `WorkspaceSearchEntry` side table, containing the search vector of
+    every cell of every table, so that all the tables of a workspace can be searched
+    with a single query. The entries of the rows are replaced by the tsvector update
+    task right after their tsvector columns are updated, so they're kept up to date
+    incrementally just like the per table search.
+    """
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return (
+            SearchHandler.full_text_enabled()
+            and settings.WORKSPACE_SEARCH_INDEX_ENABLED
+        )
+
+    @classmethod
+    def update_row_entries(
+        cls,
+        model: Type["GeneratedTableModel"],
+        row_ids: List[int],
+        field_ids: Optional[Iterable[int]] = None,
+    ):
+        """
+        Replaces the entries of the provided rows by the current search vectors of
+        their searchable fields. The vectors are read from the tsvector columns of
+        the fields if they have one, and computed otherwise, with a single
+        `INSERT ... SELECT` statement.
+
+        :param model: The model of the table the rows belong to.
+        :param row_ids: The ids of the rows to update the entries of.
+        :param field_ids: If provided, only the entries of these fields are updated.
+        """
+
+        table = model.baserow_table
+        if field_ids is not None:
+            field_ids = set(field_ids)
+
+        entries = WorkspaceSearchEntry.objects.filter(
+            table_id=table.id, row_id__in=row_ids
+        )
+        if field_ids is not None:
+            entries = entries.filter(field_id__in=field_ids)
+        entries.delete()
+
+        rows = model.objects.filter(id__in=row_ids).order_by()
+        querysets = []
+        for field in model.get_searchable_fields():
+            if field_ids is not None and field.id not in field_ids:
+                continue
+
+            if field.tsvector_column_created:
+                search_vector = F(field.tsv_db_column)
+            else:
+                search_vector = SearchHandler.get_field_search_vector(field, rows)
+            querysets.append(
+                rows.annotate(search_entry_vector=search_vector)
+                .filter(search_entry_vector__isnull=False)
+                .values(
+                    search_entry_table_id=Value(table.id),
+                    search_entry_field_id=Value(field.id),
+                    search_entry_row_id=F("id"),
+                    search_entry_tsv=F("search_entry_vector"),
+                )
+            )
+
+        if not querysets:
+            return
+
+        select_sql, params = (
+            querysets[0].union(*querysets[1:], all=True).query.sql_with_params()
+        )
+        insert_sql = sql.SQL(
+            "INSERT INTO {entry_table} (table_id, field_id, row_id, tsv) {select} "
+            "ON CONFLICT (field_id, row_id) DO UPDATE "
+            "SET table_id = EXCLUDED.table_id, tsv = EXCLUDED.tsv"
+        ).format(
+            entry_table=sql.Identifier(WorkspaceSearchEntry._meta.db_table),
+            select=sql.SQL(select_sql),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(insert_sql, params)
+
+    @classmethod
+    def rows_restored(cls, model: Type["GeneratedTableModel"], row_ids: List[int]):
+        """
+        Marks the restored rows as needing a background update, so that their
+        entries, which were deleted when they were trashed, are added back by the
+        tsvector update task.
+
+        :param model: The model of the table the rows belong to.
+        :param row_ids: The ids of the restored rows.
+        """
+
+        if cls.enabled() and model.baserow_table.needs_background_update_column_added:
+            model.objects.filter(id__in=row_ids).update(
+                **{ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME: True}
+            )
+
+    @classmethod
+    def delete_row_entries(cls, table: "Table", row_ids: List[int]):
+        """
+        Deletes the entries of the provided rows, because they've been trashed or
+        deleted.
+
+        :param table: The table the rows belong to.
+        :param row_ids: The ids of the rows to delete the entries of.
+        """
+
+        WorkspaceSearchEntry.objects.filter(
+            table_id=table.id, row_id__in=row_ids
+        ).delete()
+
+    @classmethod
+    def delete_field_entries(cls, field: "Field"):
+        """
+        Deletes all the entries of the provided field.
+
+        :param field: The field to delete the entries of.
+        """
+
+        WorkspaceSearchEntry.objects.filter(field_id=field.id).delete()
+
+    @classmethod
+    def search_workspace(
+        cls,
+        user: "AbstractUser",
+        workspace: "Workspace",
+        search: str,
+        limit: int,
+    ) -> QuerySet:
+        """
+        Searches the cells of all the tables of the workspace the user is allowed to
+        list, with a single query on the entries. Only the entries of the tables
+        returned by the `filter_queryset` method of the permission managers are
+        searched, and the entries of trashed tables and fields are ignored.
+
+        :param user: The user on whose behalf the search is done.
+        :param workspace: The workspace to search in.
+        :param search: The search query.
+        :param limit: The maximum number of matching cells to return.
+        :raises WorkspaceSearchIndexDisabledException: If the workspace search index
+            isn't enabled.
+        :return: The entries of the matching cells, ordered by relevance, annotated
+            with their `rank`.
+        """
+
+        from baserow.contrib.database.table.handler import TableHandler
+
+        if not cls.enabled():
+            raise WorkspaceSearchIndexDisabledException()
+
+        sanitized_search = SearchHandler.escape_postgres_query(search or "")
+        if not sanitized_search:
+            return WorkspaceSearchEntry.objects.none()
+
+        search_query = SearchQuery(
+            sanitized_search,
+            search_type="raw",
+            config=SearchHandler.search_config(),
+        )
+        tables = TableHandler().list_workspace_tables(user, workspace)
+
+        return (
+            WorkspaceSearchEntry.objects.filter(
+                table_id__in=tables.values("id"),
+                field__trashed=False,
+                tsv=search_query,
+            )
+            .annotate(rank=SearchRank(F("tsv"), search_query, cover_density=True))
+            .order_by("-rank", "table_id", "row_id", "field_id")[:limit]
+        )
@@ -0,0 +1,42 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+class WorkspaceSearchEntry(models.Model):
+    """
+    The search vector of a single cell, so the value of a field in a row. These
+    entries are kept up to date by the tsvector update task when the workspace search
+    index is enabled, and allow searching through all the tables of a workspace with
+    a single query instead of one query per table.
+    """
+
+    table = models.ForeignKey(
+        "database.Table",
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="The table the row belongs to.",
+    )
+    field = models.ForeignKey(
+        "database.Field",
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="The field the search vector is computed for.",
+    )
+    row_id = models.PositiveIntegerField(
+        help_text="The id of the row in the table the search vector is computed for."
+    )
+    tsv = SearchVectorField(help_text="The search vector of the value of the cell.")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["field", "row_id"], name="database_ws_search_entry_cell_key"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["table", "row_id"], name="database_ws_search_entry_row"
+            ),
+            GinIndex(fields=["tsv"], name="database_ws_search_entry_tsv"),
+        ]
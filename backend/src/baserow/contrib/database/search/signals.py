@@ -7,7 +7,11 @@ from django.dispatch import receiver
 from loguru import logger
 
 from baserow.contrib.database.fields.models import Field
-from baserow.contrib.database.search.handler import SearchHandler
+from baserow.contrib.database.rows.signals import rows_deleted
+from baserow.contrib.database.search.handler import (
+    SearchHandler,
+    WorkspaceSearchHandler,
+)
 from baserow.contrib.database.table.tasks import (
     setup_new_background_update_and_search_columns,
 )
@@ -57,9 +61,14 @@ def view_loaded_maybe_create_tsvector(
         # 1. Postgres full text is enabled in our config.
         # 2. The table doesn't have its background update column.
         # 3. There are one or more fields in the table without a tsvector column.
+        # 4. The table must be converted to use a row search document.
         migrate_table_for_search = SearchHandler.full_text_enabled() and (
             not table.needs_background_update_column_added
             or num_fields_to_add_tsvs_for > 0
+            or (
+                SearchHandler.row_search_document_enabled()
+                and not table.row_search_document_column_added
+            )
         )
 
         if migrate_table_for_search:
@@ -85,3 +94,9 @@ def view_loaded_maybe_create_tsvector(
 @receiver(post_delete, sender=Field)
 def clean_up_tsv_after_field_deleted(sender, instance, **kwargs):
     SearchHandler.after_field_perm_delete(instance)
+
+
+@receiver(rows_deleted)
+def delete_workspace_search_entries_after_rows_deleted(sender, rows, table, **kwargs):
+    if WorkspaceSearchHandler.enabled():
+        WorkspaceSearchHandler.delete_row_entries(table, [row.id for row in rows])
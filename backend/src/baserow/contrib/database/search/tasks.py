@@ -1,13 +1,24 @@
+import traceback
 from typing import List, Optional
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
 
+from celery_singleton import DuplicateTaskError, Singleton
 from loguru import logger
 
 from baserow.config.celery import app
 from baserow.contrib.database.search.exceptions import (
     PostgresFullTextSearchDisabledException,
 )
+from baserow.contrib.database.table.exceptions import TableDoesNotExist
+
+TRIGRAM_INDEX_CACHE_KEY = "trigram_index_table_cache_key"
+
+
+def get_trigram_index_cache_key(table_id):
+    return f"{TRIGRAM_INDEX_CACHE_KEY}:{table_id}"
 
 
 @app.task(
@@ -40,3 +51,87 @@ def async_update_tsvector_columns(
         )
     except PostgresFullTextSearchDisabledException:
         logger.debug(f"Postgres full-text search is disabled.")
+
+
+@app.task(
+    base=Singleton,
+    queue="export",
+    lock_expiry=settings.AUTO_INDEX_LOCK_EXPIRY,
+    raise_on_duplicate=True,
+)
+def update_trigram_indexes(table_id: int):
+    """
+    Creates the missing trigram indexes of the provided table if needed.
+
+    :param table_id: The id of the table for which the indexes should be created.
+    """
+
+    from baserow.contrib.database.search.handler import TrigramIndexingHandler
+
+    recheck_delay = 0
+    try:
+        TrigramIndexingHandler.update_indexes_by_table_id(table_id)
+    except TableDoesNotExist:
+        return  # can be ignored, the table doesn't exist anymore
+    except DatabaseError:
+        if "could not obtain lock on" in traceback.format_exc():
+            recheck_delay = 10
+            logger.debug("Retrying trigram index update in {0} seconds", recheck_delay)
+            _set_pending_trigram_index_update(table_id)
+
+    # check for any pending trigram index updates and schedule them out of this
+    # singleton task to avoid concurrency issues
+    _check_for_pending_trigram_index_updates.s(table_id).apply_async(
+        countdown=recheck_delay
+    )
+
+
+def _set_pending_trigram_index_update(table_id: int):
+    cache.set(
+        get_trigram_index_cache_key(table_id),
+        True,
+        timeout=settings.AUTO_INDEX_LOCK_EXPIRY * 2,
+    )
+
+
+@app.task(queue="export")
+def _check_for_pending_trigram_index_updates(table_id):
+    """
+    Checks if there are any pending trigram index updates and schedules them.
+    """
+
+    if cache.delete(get_trigram_index_cache_key(table_id)):
+        _schedule_trigram_index_update(table_id)
+
+
+def _schedule_trigram_index_update(table_id: int):
+    # another task has already scheduled the trigram index update
+    if cache.get(get_trigram_index_cache_key(table_id)):
+        return
+
+    try:
+        update_trigram_indexes.delay(table_id)
+    except DuplicateTaskError:
+        # Add the table_id in the cache so that `update_trigram_indexes` will
+        # re-schedule itself at the end of the currently running task.
+        _set_pending_trigram_index_update(table_id)
+    except Exception as exc:  # nosec
+        logger.error(
+            "Failed to schedule trigram index update because of {e}", e=str(exc)
+        )
+        traceback.print_exc()
+
+
+def schedule_trigram_index_update(table_id: int):
+    """
+    Schedules the creation of the missing trigram indexes of the provided table. If
+    the update is already scheduled then just add the table_id in the cache so that
+    `update_trigram_indexes` will re-schedule itself at the end.
+
+    :param table_id: The id of the table for which the indexes should be created.
+    """
+
+    if not settings.AUTO_INDEX_TRIGRAM_SEARCH_ENABLED:
+        return
+
+    transaction.on_commit(lambda: _schedule_trigram_index_update(table_id))
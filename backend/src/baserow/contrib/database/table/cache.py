@@ -12,10 +12,17 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+In front of the Redis backed cache, every worker process also keeps an in-memory LRU
+cache of the fully generated model classes keyed by the table id and version. If a
+model class for the current version of a table is found there, then the model doesn't
+have to be constructed at all.
 """
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
@@ -24,7 +31,7 @@ from django.core.exceptions import ImproperlyConfigured
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
@@ -43,6 +50,30 @@ def get_cached_model_field_attrs(table: "Table") -> Optional[Dict[str, Any]]:
         return None
 
 
+def get_many_cached_model_field_attrs(
+    tables: Iterable["Table"],
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Fetches the cached field attrs of all the provided tables with a single cache
+    round trip. Only the entries matching the current version of the table are
+    returned.
+
+    :param tables: The tables to get the cached field attrs for. Their version
+        must be up-to-date.
+    :return: A dict containing the field attrs per table id.
+    """
+
+    tables_by_cache_key = {table_model_cache_entry_key(t.id): t for t in tables}
+    cache_entries = generated_models_cache.get_many(tables_by_cache_key.keys())
+
+    field_attrs_per_table = {}
+    for cache_key, cache_entry in cache_entries.items():
+        table = tables_by_cache_key[cache_key]
+        if cache_entry and cache_entry["version"] == table.version:
+            field_attrs_per_table[table.id] = cache_entry["field_attrs"]
+    return field_attrs_per_table
+
+
 def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     cache_key = table_model_cache_entry_key(table.id)
     generated_models_cache.set(
@@ -52,8 +83,131 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     )
 
 
+class GeneratedModelClassLRUCache:
+    """
+    A thread safe, in-memory, least recently used cache of generated table model
+    classes. Besides limiting the number of entries, it also limits the total number
+    of fields of all the cached models combined because the memory footprint of a
+    model class mostly depends on the number of fields it has.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._total_size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Type["GeneratedTableModel"]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(
+        self,
+        key: Hashable,
+        model: Type["GeneratedTableModel"],
+        size: int,
+        max_entries: int,
+        max_size: int,
+    ):
+        """
+        Stores the model in the cache and evicts the least recently used entries
+        until both the `max_entries` and `max_size` limits are respected again.
+
+        :param key: The key to store the model under.
+        :param model: The generated model class that must be cached.
+        :param size: The weight of the model, used to respect the `max_size`.
+        :param max_entries: The maximum number of models that can be cached.
+        :param max_size: The maximum combined size of all the cached models.
+        """
+
+        if size > max_size:
+            return
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (model, size)
+            self._total_size += size
+
+            while self._entries and (
+                len(self._entries) > max_entries or self._total_size > max_size
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_size -= evicted_size
+
+    def delete_table(self, table_id: int):
+        """
+        Removes all the cached models of the provided table id, regardless of their
+        version.
+        """
+
+        with self._lock:
+            for key in [key for key in self._entries.keys() if key[0] == table_id]:
+                self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_size = 0
+
+    def _pop(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_size -= entry[1]
+
+
+generated_model_classes_cache = GeneratedModelClassLRUCache()
+
+
+def table_model_class_cache_key(table: "Table") -> Tuple:
+    # Besides the version, the columns that are added to the table lazily change the
+    # generated model without changing the version, so they're part of the key.
+    return (
+        table.id,
+        table.version,
+        table.needs_background_update_column_added,
+        table.created_by_column_added,
+        table.last_modified_by_column_added,
+        table.row_search_document_column_added,
+    )
+
+
+def model_class_cache_enabled() -> bool:
+    return (
+        settings.BASEROW_MODEL_CLASS_CACHE_MAX_ENTRIES > 0
+        and not settings.BASEROW_DISABLE_MODEL_CACHE
+    )
+
+
+def get_cached_model_class(table: "Table") -> Optional[Type["GeneratedTableModel"]]:
+    if not model_class_cache_enabled():
+        return None
+
+    return generated_model_classes_cache.get(table_model_class_cache_key(table))
+
+
+def set_cached_model_class(table: "Table", model: Type["GeneratedTableModel"]):
+    if not model_class_cache_enabled():
+        return
+
+    size = len(model._field_objects) + len(model._trashed_field_objects) + 1
+    generated_model_classes_cache.set(
+        table_model_class_cache_key(table),
+        model,
+        size,
+        max_entries=settings.BASEROW_MODEL_CLASS_CACHE_MAX_ENTRIES,
+        max_size=settings.BASEROW_MODEL_CLASS_CACHE_MAX_FIELDS,
+    )
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    generated_model_classes_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -70,6 +224,10 @@ def invalidate_table_in_model_cache(table_id: int):
     if settings.BASEROW_DISABLE_MODEL_CACHE:
         return None
 
+    # Other worker processes will detect the new version, but there is no need to
+    # keep the outdated models in the memory of this one.
+    generated_model_classes_cache.delete_table(table_id)
+
     new_version = str(uuid.uuid4())
     # Make sure to invalidate ourselves and any directly connected tables.
     from baserow.contrib.database.table.models import Table
@@ -18,5 +18,10 @@ def get_tsv_vector_field_name(field_id) -> str:
 ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME = "needs_background_update"
 TSV_FIELD_PREFIX = "tsv_field"
 
+# The optional single tsvector column containing the weighted search document of all
+# the searchable fields of a row. Tables using it don't have a tsvector column per
+# field.
+ROW_SEARCH_DOCUMENT_COLUMN_NAME = "tsv_row"
+
 LAST_MODIFIED_BY_COLUMN_NAME = "last_modified_by"
 CREATED_BY_COLUMN_NAME = "created_by"
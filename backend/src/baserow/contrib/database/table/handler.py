@@ -1,6 +1,6 @@
 import traceback
 from datetime import datetime, timezone
-from typing import Any, Dict, List, NewType, Optional, Tuple, cast
+from typing import Any, Dict, Iterable, List, NewType, Optional, Sequence, Tuple, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
@@ -32,6 +32,7 @@ from baserow.contrib.database.operations import (
     OrderTablesDatabaseTableOperationType,
 )
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.expressions import (
     BaserowTableFileUniques,
     BaserowTableRowCount,
@@ -434,7 +435,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         user: AbstractUser,
         database: Database,
         name: str,
-        data: Optional[List[List[Any]]] = None,
+        data: Optional[Sequence[List[Any]]] = None,
         first_row_header: bool = True,
         fill_example: bool = False,
         progress: Optional[Progress] = None,
@@ -449,7 +450,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         :param database: The database that the table instance belongs to.
         :param name: The name of the table is created.
         :param data: A list containing all the rows that need to be inserted is
-            expected. All the values will be inserted in the database.
+            expected. All the values will be inserted in the database. Any sized
+            collection that can be iterated multiple times, like rows lazily read
+            from a file, is accepted as well.
         :param first_row_header: Indicates if the first row are the fields. The names
             of these rows are going to be used as fields. If `fields` is provided,
             this options is ignored.
@@ -470,6 +473,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             progress.increment(0, state=TABLE_CREATION)
 
         if data is not None:
+            row_count = len(data) - 1 if first_row_header else len(data)
             (
                 fields,
                 data,
@@ -482,11 +486,17 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
                     fields, data = self.get_example_table_field_and_data()
                 else:
                     fields, data = self.get_minimal_table_field_and_data()
+            row_count = len(data)
 
         table = self.create_table_and_fields(user, database, name, fields)
 
-        _, error_report = RowHandler().import_rows(
-            user, table, data, progress=progress, send_realtime_update=False
+        _, error_report = RowHandler().import_rows_by_chunk(
+            user,
+            table,
+            data,
+            row_count,
+            progress=progress,
+            send_realtime_update=False,
         )
 
         table_created.send(self, table=table, user=user)
@@ -519,6 +529,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             order=last_order,
             name=name,
             needs_background_update_column_added=True,
+            row_search_document_column_added=(
+                SearchHandler.row_search_document_enabled()
+            ),
         )
 
         # Let's create the fields before creating the model so that the whole
@@ -534,7 +547,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
                 order=index,
                 primary=index == 0,
                 name=name,
-                tsvector_column_created=table.tsvectors_are_supported,
+                tsvector_column_created=table.field_tsvectors_are_supported,
                 **field_config,
             )
             if field_options:
@@ -566,13 +579,16 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         return table
 
     def normalize_initial_table_data(
-        self, data: List[List[Any]], first_row_header: bool
-    ) -> Tuple[List, List]:
+        self, data: Sequence[List[Any]], first_row_header: bool
+    ) -> Tuple[List, Iterable[List[str]]]:
         """
         Normalizes the provided initial table data. The amount of columns will be made
-        equal for each row. The header and the rows will also be separated.
+        equal for each row. The header and the rows will also be separated. The rows
+        are lazily normalized while they're iterated, so that the data doesn't have
+        to be copied in memory.
 
-        :param data: A list containing all the provided rows.
+        :param data: A sized collection containing all the provided rows. It's
+            iterated twice.
         :param first_row_header: Indicates if the first row is the header. For each
             of these header columns a field is going to be created.
         :raises InvalidInitialTableData: When the data doesn't contain a column or row.
@@ -581,8 +597,8 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         :raises ReservedBaserowFieldNameException: When the field name is reserved by
             Baserow.
         :raises InvalidBaserowFieldName: When the field name is invalid (empty).
-        :return: A list containing the field names with a type and a list containing all
-            the rows.
+        :return: A list containing the field names with a type and an iterable
+            containing all the rows.
         """
 
         if len(data) == 0:
@@ -595,12 +611,13 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
                 f"{settings.INITIAL_TABLE_DATA_LIMIT} rows when creating a table."
             )
 
-        largest_column_count = len(max(data, key=len))
+        largest_column_count = max(len(row) for row in data)
 
         if largest_column_count == 0:
             raise InvalidInitialTableData("At least one column should be provided.")
 
-        fields = data.pop(0) if first_row_header else []
+        rows = iter(data)
+        fields = list(next(rows)) if first_row_header else []
 
         for i in range(len(fields), largest_column_count):
             fields.append(_("Field %d") % (i + 1,))
@@ -631,7 +648,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             raise InvalidBaserowFieldName()
 
         fields_with_type = [(field_name, "text", {}) for field_name in fields]
-        result = [[str(value) for value in row] for row in data]
+        result = ([str(value) for value in row] for row in rows)
 
         return fields_with_type, result
 
@@ -0,0 +1,70 @@
+from typing import Dict, Iterable, Type
+
+from django.conf import settings
+
+from baserow.contrib.database.table.cache import (
+    get_cached_model_class,
+    get_many_cached_model_field_attrs,
+)
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
+
+
+class TableModelFactory:
+    """
+    Generates the models of multiple tables at once. Calling `Table.get_model` for
+    every table separately results in a query to refresh the version and a cache
+    round trip per table. This factory fetches the versions of all the tables with a
+    single query and the cached field attrs with a single cache round trip.
+    """
+
+    @classmethod
+    def get_models(
+        cls, tables: Iterable[Table]
+    ) -> Dict[int, Type[GeneratedTableModel]]:
+        """
+        Generates the default model of each provided table.
+
+        :param tables: The tables to generate the models for. Their version is
+            updated in place with the latest version from the database.
+        :return: A dict containing the generated model per table id.
+        """
+
+        tables_by_id = {table.id: table for table in tables}
+        if not tables_by_id:
+            return {}
+
+        if settings.BASEROW_DISABLE_MODEL_CACHE:
+            return {
+                table_id: table.get_model() for table_id, table in tables_by_id.items()
+            }
+
+        versions = dict(
+            Table.objects_and_trash.filter(id__in=tables_by_id.keys()).values_list(
+                "id", "version"
+            )
+        )
+        missing_table_ids = tables_by_id.keys() - versions.keys()
+        for table_id, version in versions.items():
+            tables_by_id[table_id].version = version
+
+        tables_without_model_class = [
+            table
+            for table_id, table in tables_by_id.items()
+            if table_id in versions and get_cached_model_class(table) is None
+        ]
+        field_attrs_per_table = get_many_cached_model_field_attrs(
+            tables_without_model_class
+        )
+
+        models = {}
+        for table_id, table in tables_by_id.items():
+            if table_id in missing_table_ids:
+                # Let the table raise the same error as it would have done when
+                # generating the model of a deleted table directly.
+                models[table_id] = table.get_model()
+            else:
+                models[table_id] = table.get_model(
+                    refresh_version=False,
+                    cached_field_attrs=field_attrs_per_table.get(table_id),
+                )
+        return models
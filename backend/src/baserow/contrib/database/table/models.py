@@ -1,19 +1,27 @@
 import itertools
 import re
+import threading
 import uuid
 from collections import defaultdict
 from types import MethodType
-from typing import Generator, Iterable, List, Optional, Type, TypedDict
+from typing import Any, Dict, Generator, Iterable, List, Optional, Type, TypedDict
 
 from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.postgres.indexes import GinIndex
-from django.contrib.postgres.search import SearchQuery, SearchVectorField
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVectorExact,
+    SearchVectorField,
+)
 from django.core.exceptions import FieldDoesNotExist as DjangoFieldDoesNotExist
 from django.db import models
+from django.db.models import ExpressionWrapper, F
 from django.db.models import Field as DjangoModelFieldClass
-from django.db.models import JSONField, Q, QuerySet, Value
+from django.db.models import FloatField, JSONField, Q, QuerySet, Value
+from django.db.models.functions import Coalesce
 
 from loguru import logger
 from opentelemetry import trace
@@ -37,15 +45,22 @@ from baserow.contrib.database.fields.models import (
 )
 from baserow.contrib.database.fields.registries import FieldType, field_type_registry
 from baserow.contrib.database.fields.utils import get_field_id_from_field_key
-from baserow.contrib.database.search.handler import SearchHandler, SearchModes
+from baserow.contrib.database.search.handler import (
+    SearchHandler,
+    SearchModes,
+    TrigramIndexingHandler,
+)
 from baserow.contrib.database.table.cache import (
+    get_cached_model_class,
     get_cached_model_field_attrs,
+    set_cached_model_class,
     set_cached_model_field_attrs,
 )
 from baserow.contrib.database.table.constants import (
     CREATED_BY_COLUMN_NAME,
     LAST_MODIFIED_BY_COLUMN_NAME,
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
+    ROW_SEARCH_DOCUMENT_COLUMN_NAME,
     TSV_FIELD_PREFIX,
     USER_TABLE_DATABASE_NAME_PREFIX,
 )
@@ -92,6 +107,13 @@ def get_row_needs_background_update_index(table):
     )
 
 
+def is_search_vector_column(column_name: str) -> bool:
+    return (
+        TSV_FIELD_PREFIX in column_name
+        or column_name == ROW_SEARCH_DOCUMENT_COLUMN_NAME
+    )
+
+
 class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
     def _insert(self, objs, fields, *args, **kwargs):
         """
@@ -104,7 +126,7 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
         if fields is not None:
             for f in fields:
                 field_name = getattr(f, "attname", f)
-                if TSV_FIELD_PREFIX not in field_name:
+                if not is_search_vector_column(field_name):
                     insertable_fields.append(f)
         else:
             insertable_fields = None
@@ -141,11 +163,107 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
 
         self._add_exact_id_search(filter_builder, input_search)
 
+        if self.model.baserow_table.row_search_document_column_added:
+            filter_builder.filter(
+                self._get_row_search_document_filter(
+                    search_query, only_search_by_field_ids
+                )
+            )
+            return filter_builder.apply_to_queryset(self)
+
         for field in self.model.get_searchable_fields():
             if only_search_by_field_ids is None or field.id in only_search_by_field_ids:
                 filter_builder.filter(Q(**{field.tsv_db_column: search_query}))
         return filter_builder.apply_to_queryset(self)
 
+    def _get_row_search_document_filter(
+        self,
+        search_query: SearchQuery,
+        only_search_by_field_ids: Optional[Iterable[int]] = None,
+    ) -> Q:
+        """
+        Returns the filter matching the rows whose search document matches the
+        search query. The document contains all the searchable fields of a row, so
+        if the search is restricted to some fields, the rows matched by the index of
+        the document are checked again against the search vectors of those fields
+        only. These are computed on the fly, but only for the matching rows.
+
+        :param search_query: The search query to match.
+        :param only_search_by_field_ids: If provided, only the values of the fields
+            with these ids must match the search query.
+        :return: The filter to apply.
+        """
+
+        searchable_fields = list(self.model.get_searchable_fields())
+        document_filter = Q(**{ROW_SEARCH_DOCUMENT_COLUMN_NAME: search_query})
+        if only_search_by_field_ids is None:
+            return document_filter
+
+        searched_fields = [
+            field for field in searchable_fields if field.id in only_search_by_field_ids
+        ]
+        if not searched_fields:
+            return Q(pk__in=[])
+        elif len(searched_fields) == len(searchable_fields):
+            return document_filter
+
+        fields_filter = Q()
+        for field in searched_fields:
+            search_vector = SearchHandler.get_field_search_vector(field, self)
+            fields_filter |= Q(SearchVectorExact(search_vector, search_query))
+        return document_filter & fields_filter
+
+    def rank_search_results(
+        self,
+        input_search: str,
+        only_search_by_field_ids: Optional[Iterable[int]] = None,
+    ) -> QuerySet:
+        """
+        Narrows the queryset down to the rows matching the Postgres full-text search
+        and orders them by relevance. The relevance is the cover density rank,
+        `ts_rank_cd`, of the row search document if the table has one, or the sum of
+        the ranks of the tsvector columns of the searched fields otherwise. The rank
+        is annotated as `search_rank`, so slicing the result uses a bounded top-N
+        sort instead of sorting all the matching rows.
+
+        :param input_search: The search query.
+        :param only_search_by_field_ids: If provided, only the fields with these ids
+            are searched and ranked.
+        :return: The queryset of the matching rows ordered by relevance.
+        """
+
+        queryset = self.pg_search(input_search, only_search_by_field_ids)
+        sanitized_search = SearchHandler.escape_postgres_query(input_search or "")
+        if not sanitized_search:
+            return queryset.annotate(search_rank=Value(0.0)).order_by("id")
+
+        search_query = SearchQuery(
+            sanitized_search,
+            search_type="raw",
+            config=SearchHandler.search_config(),
+        )
+
+        if self.model.baserow_table.row_search_document_column_added:
+            search_vectors = [F(ROW_SEARCH_DOCUMENT_COLUMN_NAME)]
+        else:
+            search_vectors = [
+                F(field.tsv_db_column)
+                for field in self.model.get_searchable_fields()
+                if only_search_by_field_ids is None
+                or field.id in only_search_by_field_ids
+            ]
+
+        search_rank = Value(0.0)
+        for search_vector in search_vectors:
+            search_rank += Coalesce(
+                SearchRank(search_vector, search_query, cover_density=True),
+                Value(0.0),
+            )
+
+        return queryset.annotate(
+            search_rank=ExpressionWrapper(search_rank, output_field=FloatField())
+        ).order_by("-search_rank", "id")
+
     def _add_exact_id_search(self, filter_builder, input_search):
         try:
             # Search for the row ID if the `input_search` can be cast to an integer.
@@ -207,7 +325,8 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
             ignored and not be filtered.
         :param search_mode: In `MODE_COMPAT` we will use the old search method, using
             the LIKE operator on each column. In `MODE_FT_WITH_COUNT`  we will switch
-            to using Postgres full-text search.
+            to using Postgres full-text search. In `MODE_TRIGRAM` the text fields are
+            searched with the LIKE operator backed by trigram indexes.
         :return: The queryset containing the search queries.
         :rtype: QuerySet
         """
@@ -227,6 +346,8 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
                 return self.compat_search(search, only_search_by_field_ids)
         elif search_mode == SearchModes.MODE_COMPAT:
             return self.compat_search(search, only_search_by_field_ids)
+        elif search_mode == SearchModes.MODE_TRIGRAM:
+            return self.trigram_search(search, only_search_by_field_ids)
         else:
             raise NotImplementedError(f"Unsupported search_mode {search_mode}.")
 
@@ -258,6 +379,75 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
 
         return filter_builder.apply_to_queryset(self)
 
+    def trigram_search(self, search: str, only_search_by_field_ids=None):
+        """
+        Searches with the same LIKE operator as the compat search for the fields
+        that can be trigram indexed, and schedules the creation of their missing
+        `pg_trgm` indexes. The other fields are searched using their tsvector column
+        or the row search document if the table supports it, so that every condition
+        of the search can use an index. They fall back to the compat search
+        otherwise.
+        """
+
+        TrigramIndexingHandler.schedule_index_creation_if_needed(
+            self.model, only_search_by_field_ids
+        )
+
+        search_query = None
+        sanitized_search = SearchHandler.escape_postgres_query(search)
+        if self.model.baserow_table.tsvectors_are_supported and sanitized_search:
+            search_query = SearchQuery(
+                sanitized_search,
+                search_type="raw",
+                config=SearchHandler.search_config(),
+            )
+
+        table = self.model.baserow_table
+        uses_search_document = table.row_search_document_column_added
+        document_field_ids = []
+
+        filter_builder = FilterBuilder(filter_type=FILTER_TYPE_OR)
+
+        self._add_exact_id_search(filter_builder, search)
+        for field_object in self.model._field_objects.values():
+            field = field_object["field"]
+            field_type = field_object["type"]
+            if (
+                only_search_by_field_ids is not None
+                and field.id not in only_search_by_field_ids
+            ):
+                continue
+
+            if (
+                not field_type.can_be_trigram_indexed
+                and search_query is not None
+                and (field.tsvector_column_created or uses_search_document)
+            ):
+                if not field_type.is_searchable(field):
+                    continue
+                elif uses_search_document:
+                    document_field_ids.append(field.id)
+                else:
+                    filter_builder.filter(Q(**{field.tsv_db_column: search_query}))
+                continue
+
+            field_name = field_object["name"]
+            model_field = self.model._meta.get_field(field_name)
+            try:
+                sub_filter = field_type.contains_query(
+                    field_name, search, model_field, field
+                )
+                filter_builder.filter(sub_filter)
+            except Exception:  # nosec B112
+                continue
+
+        if document_field_ids:
+            filter_builder.filter(
+                self._get_row_search_document_filter(search_query, document_field_ids)
+            )
+
+        return filter_builder.apply_to_queryset(self)
+
     def _get_field_name(self, field: str) -> str:
         """
         Helper method for parsing a field name from a string
@@ -485,6 +675,8 @@ class TableModelTrashAndObjectsManager(models.Manager):
             except DjangoFieldDoesNotExist:
                 # THe model has been generated without TSVs so no need to defer.
                 pass
+        if self.model.baserow_table.row_search_document_column_added:
+            qs = qs.defer(ROW_SEARCH_DOCUMENT_COLUMN_NAME)
         return qs
 
 
@@ -557,7 +749,7 @@ class GeneratedTableModel(HierarchicalModelMixin, models.Model):
         """
 
         if update_fields is not None:
-            update_fields = [f for f in update_fields if TSV_FIELD_PREFIX not in f]
+            update_fields = [f for f in update_fields if not is_search_vector_column(f)]
         else:
             update_fields = None
         return super()._do_update(
@@ -636,9 +828,13 @@ class GeneratedTableModel(HierarchicalModelMixin, models.Model):
     def get_fields_missing_search_index(cls) -> List[Field]:
         """
         Returns a list of fields which don't yet have a
-        corresponding tsvector column.
+        corresponding tsvector column. Always empty if the table uses a row search
+        document instead of a tsvector column per field.
         """
 
+        if cls.baserow_table.row_search_document_column_added:
+            return []
+
         return [
             field for field in cls.get_fields() if not field.tsvector_column_created
         ]
@@ -668,11 +864,14 @@ class GeneratedTableModel(HierarchicalModelMixin, models.Model):
         :return: A generator of Field.
         """
 
+        uses_search_document = cls.baserow_table.row_search_document_column_added
         for field_object in cls.get_field_objects(include_trash):
             field_type = field_object["type"]
             field = field_object["field"]
 
-            if field.tsvector_column_created and field_type.is_searchable(field):
+            if (
+                field.tsvector_column_created or uses_search_document
+            ) and field_type.is_searchable(field):
                 yield field
 
     @classmethod
@@ -683,6 +882,27 @@ class GeneratedTableModel(HierarchicalModelMixin, models.Model):
         abstract = True
 
 
+class GeneratedModelTableDescriptor:
+    """
+    The `baserow_table` attribute of a generated table model. A generated model class
+    can be cached and shared by multiple threads, and every `Table.get_model` call must
+    be able to provide its own table instance because the cached one can have
+    outdated values like the name. Instead of mutating the shared class, the table
+    instance is therefore stored per thread, falling back to the table instance the
+    model was generated with.
+    """
+
+    def __init__(self, table: "Table"):
+        self.table = table
+        self.local = threading.local()
+
+    def __get__(self, instance, owner=None) -> "Table":
+        return getattr(self.local, "table", self.table)
+
+    def set_for_current_thread(self, table: "Table"):
+        self.local.table = table
+
+
 class GeneratedModelAppsProxy:
     """
     A proxy class to the default apps registry. This class is needed to make our dynamic
@@ -907,6 +1127,11 @@ class Table(
         null=True,
         help_text="Indicates whether the table has had the created_by column added.",
     )
+    row_search_document_column_added = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the table has a single search document column "
+        "for all fields instead of a tsvector column per field.",
+    )
 
     class Meta:
         ordering = ("order",)
@@ -918,6 +1143,21 @@ class Table(
             and self.needs_background_update_column_added
         )
 
+    @property
+    def field_tsvectors_are_supported(self) -> bool:
+        """
+        Indicates whether new fields must get their own tsvector column, which is
+        not the case if the table uses a row search document.
+        """
+
+        return (
+            self.tsvectors_are_supported and not self.row_search_document_column_added
+        )
+
+    @property
+    def row_search_document_index_name(self) -> str:
+        return f"tsv_row_idx_{self.id}"
+
     @property
     def tsv_id_column_idx_name(self) -> str:
         return f"tsv_id_idx_{self.id}"
@@ -953,6 +1193,8 @@ class Table(
         use_cache=True,
         force_add_tsvectors: bool = False,
         app_label: Optional[str] = None,
+        refresh_version: bool = True,
+        cached_field_attrs: Optional[Dict[str, Any]] = None,
     ) -> Type[GeneratedTableModel]:
         """
         Generates a temporary Django model based on available fields that belong to
@@ -991,10 +1233,49 @@ class Table(
             have the same app_label. If passed along in this parameter, then the
             generated model will use that one instead of generating a unique one.
         :type app_label: Optional[String]
+        :param refresh_version: Indicates whether the version must be refreshed from
+            the database before using the cache. Can be set to False if the version
+            of the table instance is known to be up-to-date, for example because it
+            has just been fetched in bulk by the `TableModelFactory`.
+        :type refresh_version: bool
+        :param cached_field_attrs: The field attrs matching the current version of
+            the table if they have already been fetched from the cache.
+        :type cached_field_attrs: Optional[Dict[str, Any]]
         :return: The generated model.
         :rtype: Model
         """
 
+        use_cache = (
+            use_cache
+            and not fields
+            and field_ids is None
+            and add_dependencies is True
+            and attribute_names is False
+            and not settings.BASEROW_DISABLE_MODEL_CACHE
+        )
+        # The finished model class can only be reused if it's not related to models
+        # that are being generated at the same time and if it's the default variant.
+        use_model_class_cache = (
+            use_cache
+            and not manytomany_models
+            and field_names is None
+            and managed is False
+            and force_add_tsvectors is False
+            and app_label is None
+        )
+
+        if use_cache and refresh_version:
+            self.refresh_from_db(fields=["version"])
+
+        if use_model_class_cache:
+            model = get_cached_model_class(self)
+            if model is not None:
+                # Make sure that the model refers to the most recent table instance
+                # because the cached one can have outdated values like the name.
+                # The class is shared, so the instance is only set for this thread.
+                model.__dict__["baserow_table"].set_for_current_thread(self)
+                return model
+
         if app_label is None:
             # Generate a unique app_label to make the generation of the model thread
             # safe. Related fields generate pending operations in the `apps`
@@ -1054,7 +1335,7 @@ class Table(
             "__module__": "database.models",
             # An indication that the model is a generated table model.
             "_generated_table_model": True,
-            "baserow_table": self,
+            "baserow_table": GeneratedModelTableDescriptor(self),
             "baserow_table_id": self.id,
             "baserow_models": apps.baserow_models,
             # We are using our own table model manager to implement some queryset
@@ -1064,17 +1345,9 @@ class Table(
             "__str__": __str__,
         }
 
-        use_cache = (
-            use_cache
-            and len(fields) == 0
-            and field_ids is None
-            and add_dependencies is True
-            and attribute_names is False
-            and not settings.BASEROW_DISABLE_MODEL_CACHE
-        )
-
-        if use_cache:
-            self.refresh_from_db(fields=["version"])
+        if use_cache and cached_field_attrs is not None:
+            field_attrs = cached_field_attrs
+        elif use_cache:
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -1122,9 +1395,12 @@ class Table(
             default=1,
         )
 
-        self._add_search_tsvector_fields_to_model(
-            field_attrs, indexes, force_add_tsvectors
-        )
+        if self.row_search_document_column_added:
+            self._add_row_search_document_to_model(field_attrs, indexes)
+        else:
+            self._add_search_tsvector_fields_to_model(
+                field_attrs, indexes, force_add_tsvectors
+            )
 
         if self.needs_background_update_column_added:
             self._add_needs_background_update_column(field_attrs, indexes)
@@ -1154,6 +1430,9 @@ class Table(
         if not manytomany_models:
             self._after_model_generation(attrs, model)
 
+        if use_model_class_cache:
+            set_cached_model_class(self, model)
+
         return model
 
     def _add_search_tsvector_fields_to_model(self, field_attrs, indexes, force_add):
@@ -1169,6 +1448,15 @@ class Table(
                     GinIndex(fields=[field.tsv_db_column], name=field.tsv_index_name)
                 )
 
+    def _add_row_search_document_to_model(self, field_attrs, indexes):
+        field_attrs[ROW_SEARCH_DOCUMENT_COLUMN_NAME] = SearchVectorField(null=True)
+        indexes.append(
+            GinIndex(
+                fields=[ROW_SEARCH_DOCUMENT_COLUMN_NAME],
+                name=self.row_search_document_index_name,
+            )
+        )
+
     def _add_needs_background_update_column(self, field_attrs, indexes):
         field_attrs[ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME] = AutoTrueBooleanField(
             default=True,
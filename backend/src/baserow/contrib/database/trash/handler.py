@@ -0,0 +1,363 @@
+import json
+from collections import defaultdict
+from typing import List, Optional, Type
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, models, transaction
+
+from opentelemetry import trace
+from psycopg2 import sql
+
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
+from baserow.contrib.database.trash.models import ArchivedRow
+from baserow.core.telemetry.utils import baserow_trace_methods
+
+tracer = trace.get_tracer(__name__)
+
+
+class RowArchiveHandler(metaclass=baserow_trace_methods(tracer)):
+    """
+    When the `TRASH_ARCHIVE_ROWS` setting is enabled, the trashed rows are moved out
+    of their table to the `ArchivedRow` table, along with their many to many
+    relations, so that the view queries, counts, aggregations and indexes of the table
+    don't have to skip them until they're permanently deleted. They're moved back to
+    the table when they're restored.
+    """
+
+    @staticmethod
+    def schedule_archiving(table_id: int, row_ids: Optional[List[int]] = None):
+        """
+        Schedules the archiving of the trashed rows of the table once the current
+        transaction has been committed, if archiving rows is enabled. The rows are
+        archived afterwards because the dependencies of the trashed rows, like the
+        formulas of the rows linking to them, are updated using their relations.
+
+        :param table_id: The id of the table to archive the trashed rows of.
+        :param row_ids: If provided only the trashed rows with these ids are
+            archived.
+        """
+
+        if not settings.TRASH_ARCHIVE_ROWS:
+            return
+
+        from baserow.contrib.database.trash.tasks import archive_trashed_rows
+
+        transaction.on_commit(lambda: archive_trashed_rows.delay(table_id, row_ids))
+
+    def archive_trashed_rows(
+        self, table: Table, row_ids: Optional[List[int]] = None
+    ) -> List[int]:
+        """
+        Moves the trashed rows of the table, along with their many to many relations,
+        out of the table to the archive. The rows are locked while they're moved, so
+        the rows restored in the meantime are not archived. Must be called in a
+        transaction.
+
+        :param table: The table to archive the trashed rows of.
+        :param row_ids: If provided only the trashed rows with these ids are
+            archived.
+        :return: The ids of the archived rows.
+        """
+
+        model = table.get_model()
+        queryset = model.objects_and_trash.filter(trashed=True)
+        if row_ids is not None:
+            queryset = queryset.filter(id__in=row_ids)
+        archived_row_ids = list(
+            queryset.select_for_update().order_by("id").values_list("id", flat=True)
+        )
+        if not archived_row_ids:
+            return []
+
+        relations = defaultdict(dict)
+        with connection.cursor() as cursor:
+            for field in model._meta.many_to_many:
+                through_table = field.remote_field.through._meta.db_table
+                cursor.execute(
+                    sql.SQL(
+                        "DELETE FROM {through_table} WHERE {column} = ANY(%s) "
+                        "RETURNING {column}, {reverse_column}"
+                    ).format(
+                        through_table=sql.Identifier(through_table),
+                        column=sql.Identifier(field.m2m_column_name()),
+                        reverse_column=sql.Identifier(field.m2m_reverse_name()),
+                    ),
+                    [archived_row_ids],
+                )
+                for row_id, related_id in cursor.fetchall():
+                    relations[row_id].setdefault(
+                        through_table,
+                        {
+                            "column": field.m2m_column_name(),
+                            "reverse_column": field.m2m_reverse_name(),
+                            "related_table": field.related_model._meta.db_table,
+                            "ids": [],
+                        },
+                    )["ids"].append(related_id)
+
+            cursor.execute(
+                sql.SQL(
+                    """
+                    WITH archived AS (
+                        DELETE FROM {table} t WHERE t.id = ANY(%s)
+                        RETURNING t.id, to_jsonb(t) AS values
+                    )
+                    INSERT INTO {archive} (table_id, row_id, values, relations)
+                    SELECT %s, archived.id, archived.values,
+                        COALESCE(%s::jsonb -> archived.id::text, '{{}}'::jsonb)
+                    FROM archived
+                    """
+                ).format(
+                    table=sql.Identifier(table.get_database_table_name()),
+                    archive=sql.Identifier(ArchivedRow._meta.db_table),
+                ),
+                [archived_row_ids, table.id, json.dumps(relations)],
+            )
+
+        return archived_row_ids
+
+    def restore_archived_rows(
+        self, table: Table, model: Type[GeneratedTableModel], row_ids: List[int]
+    ) -> List[int]:
+        """
+        Moves the archived rows with the provided ids back to the table, along with
+        their many to many relations. The rows are still trashed afterwards. The
+        fields created after the rows have been archived get their default value and
+        the relations to the rows, select options or users which don't exist anymore
+        are ignored.
+
+        :param table: The table the rows belong to.
+        :param model: The generated model of the table.
+        :param row_ids: The ids of the rows to restore, the ones that aren't archived
+            are ignored.
+        :return: The ids of the restored rows.
+        """
+
+        if settings.TRASH_ARCHIVE_ROWS:
+            # Waits until the rows are archived if it's in progress, so that they're
+            # either still in the table or in the committed archive.
+            list(
+                model.objects_and_trash.select_for_update()
+                .filter(id__in=row_ids)
+                .order_by("id")
+                .values_list("id", flat=True)
+            )
+
+        # The values of the fields that didn't exist when the rows were archived
+        # would be null otherwise, which isn't allowed for all the fields.
+        defaults = {
+            field.column: field.get_default()
+            for field in model._meta.concrete_fields
+            if not field.null and field.has_default() and not field.primary_key
+        }
+        table_name = sql.Identifier(table.get_database_table_name())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    """
+                    INSERT INTO {table}
+                    SELECT r.* FROM {archive} a,
+                        jsonb_populate_record(NULL::{table}, %s::jsonb || a.values) r
+                    WHERE a.table_id = %s AND a.row_id = ANY(%s)
+                    RETURNING id
+                    """
+                ).format(
+                    table=table_name,
+                    archive=sql.Identifier(ArchivedRow._meta.db_table),
+                ),
+                [json.dumps(defaults, cls=DjangoJSONEncoder), table.id, row_ids],
+            )
+            restored_row_ids = [row[0] for row in cursor.fetchall()]
+            if not restored_row_ids:
+                return []
+
+            cursor.execute(
+                sql.SQL(
+                    "DELETE FROM {archive} WHERE table_id = %s AND row_id = ANY(%s) "
+                    "RETURNING row_id, relations"
+                ).format(archive=sql.Identifier(ArchivedRow._meta.db_table)),
+                [table.id, restored_row_ids],
+            )
+            archived_relations = cursor.fetchall()
+
+        self._restore_archived_relations(archived_relations)
+        return restored_row_ids
+
+    def _restore_archived_relations(self, archived_relations: List):
+        """
+        Inserts the archived many to many relations back in their through tables,
+        except for the through tables that have been deleted, because the field was
+        permanently deleted for example, and the related items that don't exist
+        anymore.
+
+        :param archived_relations: The archived rows ids and their relations.
+        """
+
+        relations_by_through_table = {}
+        for row_id, relations in archived_relations:
+            if isinstance(relations, str):
+                relations = json.loads(relations)
+            for through_table, relation in relations.items():
+                restored = relations_by_through_table.setdefault(
+                    through_table, {**relation, "row_ids": [], "ids": []}
+                )
+                restored["row_ids"] += [row_id] * len(relation["ids"])
+                restored["ids"] += relation["ids"]
+
+        if not relations_by_through_table:
+            return
+
+        existing_tables = set(connection.introspection.table_names())
+        with connection.cursor() as cursor:
+            for through_table, relation in relations_by_through_table.items():
+                if (
+                    through_table not in existing_tables
+                    or relation["related_table"] not in existing_tables
+                ):
+                    continue
+
+                cursor.execute(
+                    sql.SQL(
+                        """
+                        INSERT INTO {through_table} ({column}, {reverse_column})
+                        SELECT r.row_id, r.related_id
+                        FROM unnest(%s::int[], %s::int[]) AS r(row_id, related_id)
+                        WHERE EXISTS (
+                            SELECT 1 FROM {related_table} WHERE id = r.related_id
+                        )
+                        """
+                    ).format(
+                        through_table=sql.Identifier(through_table),
+                        column=sql.Identifier(relation["column"]),
+                        reverse_column=sql.Identifier(relation["reverse_column"]),
+                        related_table=sql.Identifier(relation["related_table"]),
+                    ),
+                    [relation["row_ids"], relation["ids"]],
+                )
+
+    def restore_table_archive(self, table: Table) -> List[int]:
+        """
+        Moves all the archived rows of the table back to the table and schedules
+        archiving them again once the transaction has been committed. This must be
+        done before changing the schema of the table, so that the values of the
+        archived rows are converted like the other ones. The archived rows are
+        restored even if archiving rows has been disabled in the meantime, because
+        their values couldn't be converted afterwards.
+
+        :param table: The table to restore the archived rows of.
+        :return: The ids of the restored rows.
+        """
+
+        row_ids = list(
+            ArchivedRow.objects.filter(table=table).values_list("row_id", flat=True)
+        )
+        if not row_ids:
+            return []
+
+        restored_row_ids = self.restore_archived_rows(table, table.get_model(), row_ids)
+        self.schedule_archiving(table.id)
+        return restored_row_ids
+
+    def delete_archived_field_values(
+        self, table_id: int, model_field: models.Field
+    ) -> int:
+        """
+        Removes the values of a permanently deleted field from the archived rows of
+        its table. The many to many relations are archived by through table, so
+        those of a many to many field are removed as well.
+
+        :param table_id: The id of the table the field belonged to.
+        :param model_field: The model field of the deleted field.
+        :return: The number of updated archived rows.
+        """
+
+        if model_field.many_to_many:
+            column = "relations"
+            key = model_field.remote_field.through._meta.db_table
+        else:
+            column = "values"
+            key = model_field.column
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "UPDATE {archive} SET {column} = {column} - %s::text "
+                    "WHERE table_id = %s AND {column} ? %s::text"
+                ).format(
+                    archive=sql.Identifier(ArchivedRow._meta.db_table),
+                    column=sql.Identifier(column),
+                ),
+                [key, table_id, key],
+            )
+            return cursor.rowcount
+
+    def is_archived(self, table_id: int, row_id: int) -> bool:
+        """
+        :param table_id: The id of the table the row belongs to.
+        :param row_id: The id of the row.
+        :return: Whether the row is archived.
+        """
+
+        return ArchivedRow.objects.filter(table_id=table_id, row_id=row_id).exists()
+
+    def delete_archived_rows(self, table_id: int, row_ids: List[int]) -> List[int]:
+        """
+        Permanently deletes the archived rows with the provided ids, along with their
+        archived relations and the relations of the other rows linking to them.
+
+        :param table_id: The id of the table the rows belong to.
+        :param row_ids: The ids of the rows to delete.
+        :return: The ids of the deleted archived rows.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "DELETE FROM {archive} WHERE table_id = %s AND row_id = ANY(%s) "
+                    "RETURNING row_id"
+                ).format(archive=sql.Identifier(ArchivedRow._meta.db_table)),
+                [table_id, row_ids],
+            )
+            deleted_row_ids = [row[0] for row in cursor.fetchall()]
+
+        if deleted_row_ids:
+            self._delete_relations_to_rows(table_id, deleted_row_ids)
+
+        return deleted_row_ids
+
+    def _delete_relations_to_rows(self, table_id: int, row_ids: List[int]):
+        """
+        Deletes the relations of the rows linking to the provided rows. Only the
+        relations of the link row fields of the table are archived with the rows, so
+        the ones of the link row fields of other tables without a related field and
+        the reverse ones of the self referencing link row fields are left in their
+        through tables, where they're found again if the rows are restored.
+
+        :param table_id: The id of the table the rows belong to.
+        :param row_ids: The ids of the rows to delete the relations to.
+        """
+
+        from baserow.contrib.database.fields.models import LinkRowField
+
+        link_row_fields = LinkRowField.objects_and_trash.filter(
+            link_row_table_id=table_id
+        )
+        model_name = Table.get_table_model_name(table_id).lower()
+        with connection.cursor() as cursor:
+            for link_row_field in link_row_fields:
+                # The column names of the through tables created by Django.
+                column = (
+                    f"to_{model_name}_id"
+                    if link_row_field.is_self_referencing
+                    else f"{model_name}_id"
+                )
+                cursor.execute(
+                    sql.SQL(
+                        "DELETE FROM {through_table} WHERE {column} = ANY(%s)"
+                    ).format(
+                        through_table=sql.Identifier(link_row_field.through_table_name),
+                        column=sql.Identifier(column),
+                    ),
+                    [row_ids],
+                )
@@ -14,3 +14,25 @@ class TrashedRows(models.Model):
     @property
     def trashed(self):
         return True
+
+
+class ArchivedRow(models.Model):
+    """
+    A trashed row moved out of its table, so that the table doesn't have to carry it
+    until it's permanently deleted. The values are stored by column name and are
+    moved back to the table when the row is restored.
+    """
+
+    table = models.ForeignKey(Table, on_delete=models.CASCADE)
+    row_id = models.PositiveIntegerField()
+    values = models.JSONField(
+        help_text="The values of the row in the table, mapped by column name."
+    )
+    relations = models.JSONField(
+        default=dict,
+        help_text="The ids of the rows, select options or users related to the row, "
+        "mapped by the name of the many to many field.",
+    )
+
+    class Meta:
+        unique_together = ("table", "row_id")
@@ -0,0 +1,28 @@
+from typing import List, Optional
+
+from django.db import transaction
+
+from baserow.config.celery import app
+from baserow.contrib.database.table.exceptions import TableDoesNotExist
+
+
+@app.task(queue="export")
+def archive_trashed_rows(table_id: int, row_ids: Optional[List[int]] = None):
+    """
+    Moves the trashed rows of the table out of the table to the archive.
+
+    :param table_id: The id of the table to archive the trashed rows of.
+    :param row_ids: If provided only the trashed rows with these ids are archived.
+    """
+
+    from baserow.contrib.database.table.handler import TableHandler
+    from baserow.contrib.database.trash.handler import RowArchiveHandler
+
+    with transaction.atomic():
+        try:
+            table = TableHandler().get_table(table_id)
+        except TableDoesNotExist:
+            # The rows are left in the table if it has been trashed in the meantime.
+            return
+
+        RowArchiveHandler().archive_trashed_rows(table, row_ids)
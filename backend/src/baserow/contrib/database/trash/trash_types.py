@@ -34,9 +34,10 @@ from baserow.core.trash.registries import TrashableItemType
 
 from ..fields.operations import RestoreFieldOperationType
 from ..rows.operations import RestoreDatabaseRowOperationType
-from ..search.handler import SearchHandler
+from ..search.handler import SearchHandler, WorkspaceSearchHandler
 from ..table.operations import RestoreDatabaseTableOperationType
 from ..views.operations import RestoreViewOperationType
+from .handler import RowArchiveHandler
 from .models import TrashedRows
 
 User = get_user_model()
@@ -244,6 +245,7 @@ class FieldTrashableItemType(TrashableItemType):
             from_model = table.get_model(field_ids=[], fields=[field])
             model_field = from_model._meta.get_field(field.db_column)
             schema_editor.remove_field(from_model, model_field)
+            RowArchiveHandler().delete_archived_field_values(table.id, model_field)
 
             field.delete()
 
@@ -258,6 +260,7 @@ class FieldTrashableItemType(TrashableItemType):
 class RowTrashableItemType(TrashableItemType):
     type = "row"
     model_class = GeneratedTableModel
+    supports_bulk_permanent_deletion = True
 
     @property
     def requires_parent_id(self) -> bool:
@@ -283,11 +286,22 @@ class RowTrashableItemType(TrashableItemType):
     def get_names(self, trashed_item: Any) -> str:
         return [str(trashed_item) or f"unnamed row {trashed_item.id}"]
 
-    def restore(self, trashed_item, trash_entry: TrashEntry):
-        super().restore(trashed_item, trash_entry)
+    def trash(self, item_to_trash, requesting_user, trash_entry: TrashEntry):
+        super().trash(item_to_trash, requesting_user, trash_entry)
+        RowArchiveHandler.schedule_archiving(
+            item_to_trash.baserow_table_id, [item_to_trash.id]
+        )
 
+    def restore(self, trashed_item, trash_entry: TrashEntry):
         table = self.get_parent(trashed_item)
         model = table.get_model()
+
+        # An archived row must be moved back to the table before it's restored.
+        if RowArchiveHandler().restore_archived_rows(table, model, [trashed_item.id]):
+            trashed_item.refresh_from_db()
+
+        super().restore(trashed_item, trash_entry)
+
         rows_to_restore = [trashed_item]
 
         updated_fields = [f["field"] for f in model._field_objects.values()]
@@ -297,6 +311,7 @@ class RowTrashableItemType(TrashableItemType):
         )
 
         ViewHandler().field_value_updated(updated_fields + dependant_fields)
+        WorkspaceSearchHandler.rows_restored(model, [trashed_item.id])
         SearchHandler.field_value_updated_or_created(table)
 
         rows_to_return = list(
@@ -312,10 +327,12 @@ class RowTrashableItemType(TrashableItemType):
         )
 
     def permanently_delete_item(self, row, trash_item_lookup_cache=None):
+        row_id = row.id
         RichTextFieldMention.objects.filter(
-            table_id=row.baserow_table_id, row_id=row.id
+            table_id=row.baserow_table_id, row_id=row_id
         ).delete()
         row.delete()
+        RowArchiveHandler().delete_archived_rows(row.baserow_table_id, [row_id])
 
     def lookup_trashed_item(
         self, trashed_entry: TrashEntry, trash_item_lookup_cache=None
@@ -331,26 +348,59 @@ class RowTrashableItemType(TrashableItemType):
         :return: An instance of the model_class with trashed_item_id
         """
 
-        # Cache the expensive table.get_model function call if we are looking up
-        # many trash items at once.
-        if trash_item_lookup_cache is not None:
-            model_cache = trash_item_lookup_cache.setdefault(
-                "row_table_model_cache", {}
-            )
-            try:
-                model = model_cache[trashed_entry.parent_trash_item_id]
-            except KeyError:
-                model = model_cache.setdefault(
-                    trashed_entry.parent_trash_item_id,
-                    self._get_table_model(trashed_entry.parent_trash_item_id),
-                )
-        else:
-            model = self._get_table_model(trashed_entry.parent_trash_item_id)
+        model = self._get_cached_table_model(
+            trashed_entry.parent_trash_item_id, trash_item_lookup_cache
+        )
 
         try:
             return model.trash.get(id=trashed_entry.trash_item_id)
         except model.DoesNotExist:
-            raise TrashItemDoesNotExist()
+            pass
+
+        # The row could have been moved out of the table to the archive, in which
+        # case only its id is needed to restore or delete it.
+        if RowArchiveHandler().is_archived(
+            trashed_entry.parent_trash_item_id, trashed_entry.trash_item_id
+        ):
+            return model(id=trashed_entry.trash_item_id, trashed=True)
+
+        raise TrashItemDoesNotExist()
+
+    def permanently_delete_items_in_bulk(
+        self, parent_id, trash_entries, trash_item_lookup_cache=None
+    ):
+        model = self._get_cached_table_model(parent_id, trash_item_lookup_cache)
+        trash_item_ids = [trash_entry.trash_item_id for trash_entry in trash_entries]
+        rows = list(model.trash.filter(id__in=trash_item_ids).only("id"))
+        row_ids = {row.id for row in rows}
+        # Only the ids are loaded, the relations to the other rows are deleted by
+        # the collector with one query per relation.
+        model.objects_and_trash.filter(id__in=row_ids).only("id").delete()
+        # The archived rows are deleted afterwards, because the rows found in the
+        # table can have been archived before they could be deleted.
+        rows += [
+            model(id=row_id, trashed=True)
+            for row_id in RowArchiveHandler().delete_archived_rows(
+                parent_id, trash_item_ids
+            )
+            if row_id not in row_ids
+        ]
+        RichTextFieldMention.objects.filter(
+            table_id=parent_id, row_id__in=[row.id for row in rows]
+        ).delete()
+        return rows
+
+    def _get_cached_table_model(self, table_id, trash_item_lookup_cache=None):
+        # Cache the expensive table.get_model function call if we are looking up
+        # many trash items at once.
+        if trash_item_lookup_cache is None:
+            return self._get_table_model(table_id)
+
+        model_cache = trash_item_lookup_cache.setdefault("row_table_model_cache", {})
+        try:
+            return model_cache[table_id]
+        except KeyError:
+            return model_cache.setdefault(table_id, self._get_table_model(table_id))
 
     def _get_table_model(self, table_id):
         table = self._get_table(table_id)
@@ -366,6 +416,7 @@ class RowTrashableItemType(TrashableItemType):
 class RowsTrashableItemType(TrashableItemType):
     type = "rows"
     model_class = TrashedRows
+    supports_bulk_permanent_deletion = True
 
     @property
     def requires_parent_id(self) -> bool:
@@ -403,6 +454,7 @@ class RowsTrashableItemType(TrashableItemType):
     def restore(self, trashed_item, trash_entry: TrashEntry):
         table = self._get_table(trashed_item.table_id)
         model = self._get_table_model(trashed_item.table_id)
+        RowArchiveHandler().restore_archived_rows(table, model, trashed_item.row_ids)
         rows_to_restore_queryset = model.objects_and_trash.filter(
             id__in=trashed_item.row_ids
         )
@@ -417,6 +469,7 @@ class RowsTrashableItemType(TrashableItemType):
         )
 
         ViewHandler().field_value_updated(updated_fields + dependant_fields)
+        WorkspaceSearchHandler.rows_restored(model, trashed_item.row_ids)
         SearchHandler.field_value_updated_or_created(table)
 
         if len(rows_to_restore) < 50:
@@ -445,17 +498,53 @@ class RowsTrashableItemType(TrashableItemType):
 
         table_model = self._get_table_model(item_to_trash.table_id)
         table_model.objects.filter(id__in=item_to_trash.row_ids).update(trashed=True)
+        RowArchiveHandler.schedule_archiving(
+            item_to_trash.table_id, item_to_trash.row_ids
+        )
 
     def permanently_delete_item(self, trashed_item, trash_item_lookup_cache=None):
         table_model = self._get_table_model(trashed_item.table_id)
         delete_qs = table_model.objects_and_trash.filter(id__in=trashed_item.row_ids)
         delete_qs._raw_delete(delete_qs.db)
+        # Rows permanently deleted without being trashed first can't be archived.
+        if trashed_item.id is not None:
+            RowArchiveHandler().delete_archived_rows(
+                trashed_item.table_id, trashed_item.row_ids
+            )
         trashed_item.delete()
         RichTextFieldMention.objects.filter(
             table_id=trashed_item.table_id,
             row_id__in=trashed_item.row_ids,
         ).delete()
 
+    def permanently_delete_items_in_bulk(
+        self, parent_id, trash_entries, trash_item_lookup_cache=None
+    ):
+        trashed_rows_list = list(
+            TrashedRows.objects.filter(
+                id__in=[trash_entry.trash_item_id for trash_entry in trash_entries]
+            )
+        )
+        if not trashed_rows_list:
+            return []
+
+        row_ids = [
+            row_id
+            for trashed_rows in trashed_rows_list
+            for row_id in trashed_rows.row_ids
+        ]
+        table_model = self._get_table_model(parent_id)
+        delete_qs = table_model.objects_and_trash.filter(id__in=row_ids)
+        delete_qs._raw_delete(delete_qs.db)
+        RowArchiveHandler().delete_archived_rows(parent_id, row_ids)
+        TrashedRows.objects.filter(
+            id__in=[trashed_rows.id for trashed_rows in trashed_rows_list]
+        ).delete()
+        RichTextFieldMention.objects.filter(
+            table_id=parent_id, row_id__in=row_ids
+        ).delete()
+        return trashed_rows_list
+
     def lookup_trashed_item(
         self, trashed_entry: TrashEntry, trash_item_lookup_cache=None
     ):
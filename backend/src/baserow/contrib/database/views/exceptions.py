@@ -113,6 +113,13 @@ class FieldAggregationNotSupported(Exception):
     """Raised when the view type does not support field aggregation."""
 
 
+class AggregationDeltaNotApplicable(Exception):
+    """
+    Raised when a cached aggregation value can't be updated incrementally and must be
+    recomputed instead.
+    """
+
+
 class AggregationTypeDoesNotExist(InstanceTypeDoesNotExist):
     """Raised when trying to get an aggregation type that does not exist."""
 
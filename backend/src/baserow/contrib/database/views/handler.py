@@ -4,18 +4,31 @@ import traceback
 from collections import defaultdict, namedtuple
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import partial
 from hashlib import shake_128
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
-from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist, ValidationError
 from django.db import connection
 from django.db import models as django_models
-from django.db.models import Count, Q
-from django.db.models.expressions import F, OrderBy
+from django.db import transaction
+from django.db.models import BooleanField, Count, Exists, OuterRef, Q
+from django.db.models.expressions import ExpressionWrapper, F, OrderBy
 from django.db.models.query import QuerySet
 
 import jwt
@@ -26,13 +39,14 @@ from redis.exceptions import LockNotOwnedError
 
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.db.schema import safe_django_schema_editor
+from baserow.contrib.database.fields.dependencies.models import FieldDependency
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_filters import (
     AdvancedFilterBuilder,
     FilterBuilder,
 )
 from baserow.contrib.database.fields.field_sortings import OptionallyAnnotatedOrderBy
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.operations import ReadFieldOperationType
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
@@ -103,6 +117,7 @@ from baserow.core.utils import (
 )
 
 from .exceptions import (
+    AggregationDeltaNotApplicable,
     CannotShareViewTypeError,
     DecoratorValueProviderTypeNotCompatible,
     FieldAggregationNotSupported,
@@ -181,6 +196,21 @@ PerViewTableIndexUpdate = namedtuple(
 )
 
 
+class RowCount(NamedTuple):
+    count: int
+    exact: bool
+
+
+class ViewAggregationsSnapshot(NamedTuple):
+    view: View
+    # The decomposable (Field, aggregation_type) of the view having a cached value.
+    aggregations: List[Tuple[Field, str]]
+    # The cached {"value", "version"} per aggregation name.
+    cached: Dict[str, Dict[str, Any]]
+    # The aggregation values of the changed rows matching the view filters.
+    values: Dict[str, Any]
+
+
 @dataclasses.dataclass
 class UpdatedViewWithChangedAttributes:
     updated_view_instance: View
@@ -1352,6 +1382,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        self.clear_row_count_cache({field.table_id for field in updated_fields})
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_value_update(updated_fields)
@@ -1369,6 +1401,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        self.clear_row_count_cache({field.table_id for field in updated_fields})
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_update(updated_fields)
@@ -2674,6 +2708,32 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return f"aggregation_version__{view.pk}_{name}"
 
+    def _get_table_has_cached_aggregations_cache_key(self, table_id: int) -> str:
+        """
+        Returns the cache key flagging that aggregation values of views of the
+        specified table have been cached.
+        """
+
+        return f"has_cached_aggregations__{table_id}"
+
+    def _cache_aggregation_values(self, view: View, to_cache: Dict[str, Any]):
+        """
+        Caches the provided aggregation values of the view and flags its table as
+        having cached aggregation values, so that row changes of tables without any
+        can skip updating them incrementally.
+
+        :param view: The view the aggregation values belong to.
+        :param to_cache: The aggregation values per value cache key.
+        """
+
+        if not to_cache:
+            return
+
+        flag_cache_key = self._get_table_has_cached_aggregations_cache_key(
+            view.table_id
+        )
+        cache.set_many({**to_cache, flag_cache_key: True})
+
     def clear_full_aggregation_cache(self, view: View):
         """
         Clears the cache key for the specified view.
@@ -2700,6 +2760,92 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 # No cache key, we create one
                 cache.set(cache_key, 2)
 
+    def _get_row_count_version_cache_key(self, table_id: int) -> str:
+        """
+        Returns the row count version cache key for the specified table.
+        """
+
+        return f"row_count_version__{table_id}"
+
+    def _get_row_count_value_cache_key(self, view: View, queryset_hash: str) -> str:
+        """
+        Returns the row count value cache key for the specified view and queryset.
+        """
+
+        return f"row_count_value__{view.pk}_{queryset_hash}"
+
+    def clear_row_count_cache(self, table_ids: Iterable[int]):
+        """
+        Increments the row count version in cache for the specified tables, which
+        invalidates the cached row counts of all the views of those tables.
+        """
+
+        for table_id in set(table_ids):
+            cache_key = self._get_row_count_version_cache_key(table_id)
+            try:
+                cache.incr(cache_key, 1)
+            except ValueError:
+                # No cache key, we create one
+                cache.set(cache_key, 2, timeout=None)
+
+    def _get_estimated_row_count(self, model: GeneratedTableModel) -> int:
+        """
+        Returns the number of rows of the table estimated by the PostgreSQL
+        statistics, or -1 if the table has never been analyzed yet.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)",
+                [model._meta.db_table],
+            )
+            result = cursor.fetchone()
+        return int(result[0]) if result else -1
+
+    def get_view_row_count(self, view: View, queryset: QuerySet) -> RowCount:
+        """
+        Counts the rows of the provided queryset of the view. Counting the rows of a
+        large table requires a full scan, so for tables having more rows than the
+        `BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD`, the count of an unfiltered queryset
+        is estimated using the PostgreSQL statistics, and the exact count of a
+        filtered queryset is cached until the values of the table change.
+
+        :param view: The view the queryset belongs to.
+        :param queryset: The queryset of the view for which the rows must be counted.
+        :return: The count and whether it's exact or estimated. An estimated count can
+            be off in both directions, so it must only be reported and not be used
+            to validate a page number or offset.
+        """
+
+        model = queryset.model
+        estimated_count = self._get_estimated_row_count(model)
+        if estimated_count < settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD:
+            return RowCount(queryset.count(), True)
+
+        if queryset.query.where == model.objects.all().query.where:
+            return RowCount(estimated_count, False)
+
+        queryset = queryset.order_by()
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return RowCount(0, True)
+        queryset_hash = shake_128(f"{sql}{params}".encode("utf-8")).hexdigest(10)
+
+        value_cache_key = self._get_row_count_value_cache_key(view, queryset_hash)
+        version_cache_key = self._get_row_count_version_cache_key(
+            model.baserow_table_id
+        )
+        cached = cache.get_many([value_cache_key, version_cache_key])
+        version = cached.get(version_cache_key, 1)
+        cached_value = cached.get(value_cache_key, {"version": 0})
+        if cached_value["version"] == version:
+            return RowCount(cached_value["value"], True)
+
+        count = queryset.count()
+        cache.set(value_cache_key, {"value": count, "version": version})
+        return RowCount(count, True)
+
     def _get_aggregations_to_compute(
         self,
         view: View,
@@ -2887,7 +3033,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                         }
 
                 # Let's cache the newly computed values
-                cache.set_many(to_cache)
+                self._cache_aggregation_values(view, to_cache)
 
             # Merged cached values and computed one
             values.update(db_result)
@@ -2915,6 +3061,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         search_mode: Optional[SearchModes] = None,
         skip_perm_check: bool = False,
         restrict_to_field_ids: Optional[Set[int]] = None,
+        row_ids: Optional[List[int]] = None,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -2938,6 +3085,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_perm_check: Skips the permission check if not necessary.
         :param restrict_to_field_ids: Restrict the aggregations only to certain
             fields, for example if the aggregation is requested for public views.
+        :param row_ids: Optionally only aggregate the rows having these ids.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -2960,6 +3108,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             adhoc_filters = AdHocFilters()
 
         queryset = model.objects.all().enhance_by_fields()
+        if row_ids is not None:
+            queryset = queryset.filter(id__in=row_ids)
 
         view_type = view_type_registry.get_by_model(view.specific_class)
 
@@ -3022,6 +3172,251 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return queryset.aggregate(**aggregation_dict)
 
+    def _row_changes_are_isolated(
+        self, table: Table, model: GeneratedTableModel
+    ) -> bool:
+        """
+        Checks whether changing rows of the table can only change the cell values of
+        those rows. That's not the case if the table links to itself or if one of its
+        fields depends on another table, because the change can then propagate back
+        to other rows of the table.
+        """
+
+        for field_object in model._field_objects.values():
+            field = field_object["field"]
+            if isinstance(field, LinkRowField) and field.link_row_table_id == table.id:
+                return False
+
+        return not FieldDependency.objects.filter(
+            dependant__table_id=table.id, via__isnull=False
+        ).exists()
+
+    def get_view_aggregations_snapshots(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        rows: List[GeneratedTableModel],
+    ) -> List[ViewAggregationsSnapshot]:
+        """
+        Collects, for each view of the table having cached decomposable aggregation
+        values, the cached values and the aggregation values of the provided rows.
+        Taken before the rows are updated or deleted, or after they're created, so
+        that the cached values can be updated incrementally afterwards with
+        `apply_view_aggregations_deltas` instead of being recomputed.
+
+        :param table: The table the rows belong to.
+        :param model: The model of the table.
+        :param rows: The rows that are changed.
+        :return: A snapshot per view that can be updated incrementally. Empty if the
+            changes of the rows can affect other rows of the table.
+        """
+
+        # Avoids querying the views and their cached values on every row change of
+        # tables whose aggregation values have never been cached.
+        if not cache.get(self._get_table_has_cached_aggregations_cache_key(table.id)):
+            return []
+
+        views = [
+            view
+            for view_type in view_type_registry.get_all()
+            if view_type.can_aggregate_field
+            for view in view_type.model_class.objects.filter(table_id=table.id)
+        ]
+        names = [
+            field_object["field"].db_column
+            for field_object in model._field_objects.values()
+        ]
+        if not views or not names:
+            return []
+
+        cached = cache.get_many(
+            [
+                self._get_aggregation_value_cache_key(view, name)
+                for view in views
+                for name in names
+            ]
+            + [
+                self._get_aggregation_version_cache_key(view, name)
+                for view in views
+                for name in names
+            ]
+        )
+
+        cached_per_view = {}
+        for view in views:
+            for name in names:
+                cached_value = cached.get(
+                    self._get_aggregation_value_cache_key(view, name)
+                )
+                version = cached.get(
+                    self._get_aggregation_version_cache_key(view, name), 1
+                )
+                # The version has already been incremented once if the snapshot is
+                # taken after the rows have been created.
+                if cached_value is not None and cached_value["version"] >= version - 1:
+                    cached_per_view.setdefault(view, {})[name] = cached_value
+
+        if not cached_per_view or not self._row_changes_are_isolated(table, model):
+            return []
+
+        row_ids = [row.id for row in rows]
+        snapshots = []
+        for view, cached_values in cached_per_view.items():
+            view_type = view_type_registry.get_by_model(view)
+            aggregations = [
+                (field, aggregation_type_name)
+                for field, aggregation_type_name in view_type.get_aggregations(view)
+                if field.db_column in cached_values
+                and view_aggregation_type_registry.get(
+                    aggregation_type_name
+                ).decomposable
+            ]
+            if not aggregations:
+                continue
+
+            values = self.get_field_aggregations(
+                None,
+                view,
+                aggregations,
+                model,
+                skip_perm_check=True,
+                row_ids=row_ids,
+            )
+            snapshots.append(
+                ViewAggregationsSnapshot(view, aggregations, cached_values, values)
+            )
+
+        return snapshots
+
+    def apply_view_aggregations_deltas(
+        self,
+        snapshots: List[ViewAggregationsSnapshot],
+        model: GeneratedTableModel,
+        rows: List[GeneratedTableModel],
+        created: bool = False,
+        invalidated_field_ids: Optional[Set[int]] = None,
+    ):
+        """
+        Updates the cached decomposable aggregation values of the views with the
+        difference between the aggregation values of the changed rows before and
+        after the change. Because the view filters are applied when aggregating the
+        changed rows, rows entering or leaving the view are taken into account.
+
+        The new values are only cached when the transaction commits and if the cached
+        value has only been invalidated by this change in the meantime. Otherwise,
+        the aggregation is recomputed the next time it's requested.
+
+        :param snapshots: The snapshots taken with `get_view_aggregations_snapshots`.
+        :param model: The model of the table.
+        :param rows: The rows that have been created, updated or deleted.
+        :param created: Whether the snapshots have been taken after the rows have
+            been created, in which case they contain the values that have been added.
+        :param invalidated_field_ids: The ids of the fields whose aggregation cache
+            has been invalidated by the change. All of them if not provided.
+        """
+
+        row_ids = [row.id for row in rows]
+        for snapshot in snapshots:
+            if created:
+                removed_values, added_values = {}, snapshot.values
+            else:
+                removed_values = snapshot.values
+                added_values = self.get_field_aggregations(
+                    None,
+                    snapshot.view,
+                    snapshot.aggregations,
+                    model,
+                    skip_perm_check=True,
+                    row_ids=row_ids,
+                )
+
+            new_values, to_invalidate = {}, []
+            for field, aggregation_type_name in snapshot.aggregations:
+                name = field.db_column
+                cached_value = snapshot.cached[name]
+                aggregation_type = view_aggregation_type_registry.get(
+                    aggregation_type_name
+                )
+                try:
+                    value = aggregation_type.apply_delta(
+                        cached_value["value"],
+                        added_values.get(name),
+                        removed_values.get(name),
+                    )
+                except AggregationDeltaNotApplicable:
+                    to_invalidate.append(name)
+                    continue
+
+                invalidated = (
+                    invalidated_field_ids is None or field.id in invalidated_field_ids
+                )
+                expected_version = cached_value["version"] + int(invalidated)
+                new_values[name] = (cached_value, expected_version, value)
+
+            transaction.on_commit(
+                partial(
+                    self._cache_view_aggregations_deltas,
+                    snapshot.view,
+                    new_values,
+                    to_invalidate,
+                )
+            )
+
+    def _cache_view_aggregations_deltas(
+        self,
+        view: View,
+        new_values: Dict[str, Tuple[Dict[str, Any], int, Any]],
+        to_invalidate: List[str],
+    ):
+        """
+        Caches the incrementally updated aggregation values computed by
+        `apply_view_aggregations_deltas` if the cached values are still the ones the
+        deltas have been applied to and the version has only been incremented by the
+        change itself. If not, a still valid cached value doesn't contain the
+        change, so it's invalidated.
+
+        :param view: The view the aggregations belong to.
+        :param new_values: The cached value the delta has been applied to, the
+            expected current version and the new value per aggregation name.
+        :param to_invalidate: The aggregation names that must be recomputed.
+        """
+
+        use_lock = hasattr(cache, "lock")
+        if use_lock:
+            cache_lock = cache.lock(
+                self._get_aggregation_lock_cache_key(view), timeout=10
+            )
+            cache_lock.acquire()
+
+        names = list(new_values.keys())
+        cached = cache.get_many(
+            [self._get_aggregation_value_cache_key(view, name) for name in names]
+            + [self._get_aggregation_version_cache_key(view, name) for name in names]
+        )
+
+        to_cache = {}
+        to_invalidate = list(to_invalidate)
+        for name, (old_cached_value, expected_version, value) in new_values.items():
+            value_cache_key = self._get_aggregation_value_cache_key(view, name)
+            cached_value = cached.get(value_cache_key, {"version": 0})
+            version = cached.get(self._get_aggregation_version_cache_key(view, name), 1)
+            if cached_value == old_cached_value and version == expected_version:
+                to_cache[value_cache_key] = {"value": value, "version": version}
+            elif cached_value["version"] == version:
+                to_invalidate.append(name)
+
+        self._cache_aggregation_values(view, to_cache)
+        if to_invalidate:
+            self.clear_aggregation_cache(view, to_invalidate)
+
+        if use_lock:
+            try:
+                cache_lock.release()
+            except LockNotOwnedError:
+                # If the lock release fails, it might be because of the timeout
+                # and it's been stolen so we don't really care
+                pass
+
     def rotate_view_slug(
         self, user: AbstractUser, view: View, slug_field: str = "slug"
     ) -> View:
@@ -3424,15 +3819,26 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return queryset, field_ids, visible_field_options
 
+    def _get_group_by_metadata_cache_key(self, view: View, queryset_hash: str) -> str:
+        """
+        Returns the group by metadata cache key for the specified view and query.
+        """
+
+        return f"group_by_metadata__{view.pk}_{queryset_hash}"
+
     def get_group_by_metadata_in_rows(
         self,
         fields: List[Field],
         rows: List["GeneratedTableModel"],
         base_queryset: QuerySet,
-    ) -> Dict[Field, QuerySet]:
+        view: Optional[View] = None,
+    ) -> Dict[Field, List[Dict[str, Any]]]:
         """
         This method calculates the count of each unique value within the provided rows,
-        grouped accordingly.
+        grouped accordingly. The counts of all the group by levels are computed in a
+        single `GROUPING SETS` query. If the view is provided and the table is large,
+        the counts are cached until the values of the table change. Because the
+        filters are part of the query, changing them results in another cache key.
 
         :param fields: A list of the fields of the group bys in the right order.
         :param rows: The rows of the paginated query set. The unique values will be
@@ -3440,8 +3846,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param base_queryset: The base_queryset before the pagination was applied.
             This is needed because the rows that must be counted can be outside of
             the paginated range.
+        :param view: The view the rows belong to, used to cache the counts.
         :return: A dictionary where the key is the grouped by field, and the value a
-            queryset containing the count per field.
+            list containing the count per unique value.
         :raises ValueError: if a field is provided that cannot be grouped by.
         """
 
@@ -3467,46 +3874,144 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 )
                 all_values += (unique_value,)
 
-                if all_values not in unique_value_per_level[level]:
-                    (
-                        filters,
-                        annotations,
-                    ) = field_type.get_group_by_field_filters_and_annotations(
-                        field, field_name, base_queryset, unique_value
-                    )
+                # The filters of the parent levels are needed for the deeper
+                # levels, even if the parent values have already been seen.
+                (
+                    filters,
+                    annotations,
+                ) = field_type.get_group_by_field_filters_and_annotations(
+                    field, field_name, base_queryset, unique_value
+                )
+                all_filters.update(**filters)
 
-                    all_filters.update(**filters)
+                if all_values not in unique_value_per_level[level]:
                     all_annotations.update(**annotations)
                     qs_per_level[level] |= Q(**all_filters)
                     unique_value_per_level[level].add(all_values)
 
-        by_level = {}
-        for level, q in qs_per_level.items():
-            field_names = []
+        if not qs_per_level:
+            return {}
+
+        levels = list(qs_per_level.keys())
+        value_aliases = [f"group_by_value_{level}" for level in levels]
+        match_aliases = [f"group_by_match_{level}" for level in levels]
+
+        # Wrap the queryset to avoid conflicts with annotations, orders, joins,
+        # etc that can have an impact on the count.
+        queryset = base_queryset.model.objects.filter(
+            id__in=base_queryset.clear_multi_field_prefetch().values("id")
+        ).values()
+
+        if len(all_annotations) > 0:
+            queryset = queryset.annotate(**all_annotations)
+
+        # The rows matching the unique values of the first level are the only ones
+        # that have to be counted for every level. Whether a group matches the
+        # unique values of its level is annotated, so that the other groups can be
+        # excluded from the result.
+        queryset = (
+            queryset.annotate(
+                **{
+                    value_aliases[level]: F(fields[level].db_column) for level in levels
+                },
+                **{
+                    match_aliases[level]: ExpressionWrapper(
+                        qs_per_level[level], output_field=BooleanField()
+                    )
+                    for level in levels
+                },
+            )
+            .filter(qs_per_level[levels[0]])
+            .values(*value_aliases, *match_aliases)
+            .order_by()
+        )
 
-            for field in fields[: level + 1]:
-                field_name = field.db_column
-                field_names.append(field_name)
+        compiler = queryset.query.get_compiler(connection=connection)
+        inner_sql, params = compiler.as_sql()
+        select_per_alias = {alias: expr for expr, _, alias in compiler.select}
+        converters = compiler.get_converters(
+            [select_per_alias[alias] for alias in value_aliases]
+        )
 
-            # Wrap the queryset to avoid conflicts with annotations, orders, joins,
-            # etc that can have an impact on the count.
-            queryset = base_queryset.model.objects.filter(
-                id__in=base_queryset.clear_multi_field_prefetch().values("id")
-            ).values()
+        qn = connection.ops.quote_name
+        value_columns = [qn(alias) for alias in value_aliases]
+        grouping = f"GROUPING({', '.join(value_columns)})"
+        grouping_sets = ", ".join(
+            f"({', '.join(value_columns[: level + 1])})" for level in levels
+        )
+        # `GROUPING` returns a bit mask where the bits of the columns that are not
+        # part of the grouping set are set.
+        grouping_per_level = {
+            level: (1 << (len(levels) - level - 1)) - 1 for level in levels
+        }
+        matches = " ".join(
+            f"WHEN {grouping_per_level[level]} THEN bool_or({qn(match_aliases[level])})"
+            for level in levels
+        )
+        sql = (
+            f"SELECT {', '.join(value_columns)}, COUNT(*), {grouping} "
+            f"FROM ({inner_sql}) {qn('group_by_rows')} "
+            f"GROUP BY GROUPING SETS ({grouping_sets}) "
+            f"HAVING CASE {grouping} {matches} END"
+        )
 
-            if len(all_annotations) > 0:
-                queryset = queryset.annotate(**all_annotations)
+        result = self._get_group_by_metadata_rows(
+            view, base_queryset.model, sql, params
+        )
+
+        level_per_grouping = {value: key for key, value in grouping_per_level.items()}
+        by_level = {fields[level]: [] for level in levels}
+        for *values, count, grouping_value in compiler.apply_converters(
+            result, converters
+        ):
+            level = level_per_grouping[grouping_value]
+            entry = {"count": count}
+            for field, value in zip(fields[: level + 1], values):
+                entry[field.db_column] = value
+            by_level[fields[level]].append(entry)
+
+        return by_level
+
+    def _get_group_by_metadata_rows(
+        self,
+        view: Optional[View],
+        model: GeneratedTableModel,
+        sql: str,
+        params: Tuple[Any],
+    ) -> List[Tuple[Any]]:
+        """
+        Executes the group by metadata query and returns the resulting rows. If the
+        view is provided and the table has more rows than the
+        `BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD`, the rows are cached until the values
+        of the table change.
+        """
 
-            queryset = (
-                queryset.filter(q)
-                .values(*field_names)
-                .annotate(count=Count("id"))
-                .order_by()
+        use_cache = (
+            view is not None
+            and self._get_estimated_row_count(model)
+            >= settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD
+        )
+
+        if use_cache:
+            queryset_hash = shake_128(f"{sql}{params}".encode("utf-8")).hexdigest(10)
+            value_cache_key = self._get_group_by_metadata_cache_key(view, queryset_hash)
+            version_cache_key = self._get_row_count_version_cache_key(
+                model.baserow_table_id
             )
+            cached = cache.get_many([value_cache_key, version_cache_key])
+            version = cached.get(version_cache_key, 1)
+            cached_value = cached.get(value_cache_key, {"version": 0})
+            if cached_value["version"] == version:
+                return cached_value["value"]
 
-            by_level[fields[level]] = queryset
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            result = cursor.fetchall()
 
-        return by_level
+        if use_cache:
+            cache.set(value_cache_key, {"value": result, "version": version})
+
+        return result
 
     def _get_prepared_values_for_data(
         self, view_type: ViewType, view: View, changed_allowed_keys: Iterable[str]
@@ -3544,7 +4049,8 @@ class CachingPublicViewRowChecker:
     A helper class to check which public views a row is visible in. Will pre-calculate
     upfront for a specific table which public views are always visible, which public
     views can have row check results cached for and finally will pre-construct and
-    reuse querysets for performance reasons.
+    reuse querysets for performance reasons. The rows are checked against all the
+    views with filters in a single query.
     """
 
     def __init__(
@@ -3554,6 +4060,7 @@ class CachingPublicViewRowChecker:
         only_include_views_which_want_realtime_events: bool,
         updated_field_ids: Optional[Iterable[int]] = None,
     ):
+        self._model = model
         self._public_views = (
             table.view_set.filter(public=True)
             .prefetch_related("viewfilter_set", "filter_groups")
@@ -3606,16 +4113,23 @@ class CachingPublicViewRowChecker:
         :return: A list of views where the row is visible for this checkers table.
         """
 
+        views_to_check = {
+            view.id: filter_qs
+            for view, filter_qs, can_use_cache in self._views_with_filters
+            if not can_use_cache or row.id not in self._view_row_check_cache[view.id]
+        }
+        visible_row_ids = self._check_rows_visible_in_views(views_to_check, {row.id})
+
         views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                if row.id not in self._view_row_check_cache[view.id]:
-                    self._view_row_check_cache[view.id][
-                        row.id
-                    ] = self._check_row_visible(filter_qs, row)
-                if self._view_row_check_cache[view.id][row.id]:
-                    views.append(view)
-            elif self._check_row_visible(filter_qs, row):
+        for view, _, can_use_cache in self._views_with_filters:
+            if view.id in visible_row_ids:
+                visible = row.id in visible_row_ids[view.id]
+                if can_use_cache:
+                    self._view_row_check_cache[view.id][row.id] = visible
+            else:
+                visible = self._view_row_check_cache[view.id][row.id]
+
+            if visible:
                 views.append(view)
 
         return views + self._always_visible_views
@@ -3636,26 +4150,30 @@ class CachingPublicViewRowChecker:
             are visible for this checkers table.
         """
 
-        visible_views_rows = []
         row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                for id in row_ids:
-                    if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                        for visible_id in visible_ids:
-                            self._view_row_check_cache[view.id][visible_id] = True
-                        break
-                else:
-                    visible_ids = row_ids
-
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+        views_to_check = {
+            view.id: filter_qs
+            for view, filter_qs, can_use_cache in self._views_with_filters
+            if not can_use_cache
+            or not row_ids.issubset(self._view_row_check_cache[view.id])
+        }
+        visible_row_ids = self._check_rows_visible_in_views(views_to_check, row_ids)
 
+        visible_views_rows = []
+        for view, _, can_use_cache in self._views_with_filters:
+            view_row_check_cache = self._view_row_check_cache[view.id]
+            if view.id in visible_row_ids:
+                visible_ids = visible_row_ids[view.id]
+                if can_use_cache:
+                    for row_id in row_ids:
+                        view_row_check_cache[row_id] = row_id in visible_ids
             else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+                visible_ids = {
+                    row_id for row_id in row_ids if view_row_check_cache[row_id]
+                }
+
+            if len(visible_ids) > 0:
+                visible_views_rows.append(PublicViewRows(view, visible_ids))
 
         for visible_view in self._always_visible_views:
             visible_views_rows.append(
@@ -3664,15 +4182,41 @@ class CachingPublicViewRowChecker:
 
         return visible_views_rows
 
-    # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
-        return filter_qs.filter(id=row.id).exists()
+    def _check_rows_visible_in_views(
+        self, filter_querysets: Dict[int, QuerySet], row_ids: Set[int]
+    ) -> Dict[int, Set[int]]:
+        """
+        Checks in which of the views the rows are visible using a single query, no
+        matter how many views there are. Every view is evaluated by an `EXISTS`
+        subquery applying its filters to the row, so that the filters needing
+        annotations work exactly like when the view is listed.
+
+        :param filter_querysets: The querysets with the filters of the views to check,
+            keyed by view id.
+        :param row_ids: The ids of the rows to check.
+        :return: The ids of the visible rows keyed by view id.
+        """
+
+        visible_row_ids = {view_id: set() for view_id in filter_querysets}
+        if not filter_querysets or not row_ids:
+            return visible_row_ids
 
-    # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
+        annotations = {
+            f"visible_in_view_{view_id}": Exists(filter_qs.filter(id=OuterRef("id")))
+            for view_id, filter_qs in filter_querysets.items()
+        }
+        view_ids = list(filter_querysets.keys())
+        rows_visibility = (
+            self._model.objects.filter(id__in=row_ids)
+            .annotate(**annotations)
+            .values_list("id", *annotations.keys())
         )
+        for row_id, *visible_in_views in rows_visibility:
+            for view_id, visible in zip(view_ids, visible_in_views):
+                if visible:
+                    visible_row_ids[view_id].add(row_id)
+
+        return visible_row_ids
 
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
@@ -0,0 +1,48 @@
+from django.dispatch import receiver
+
+from baserow.contrib.database.rows.signals import (
+    before_rows_delete,
+    before_rows_update,
+    rows_created,
+    rows_deleted,
+    rows_updated,
+)
+
+from .handler import ViewHandler
+
+
+# Rows signals to incrementally update the cached view aggregations
+@receiver([before_rows_update, before_rows_delete])
+def snapshot_view_aggregations_before_rows_change(
+    sender, rows, user, table, model, **kwargs
+):
+    return ViewHandler().get_view_aggregations_snapshots(table, model, rows)
+
+
+@receiver(rows_created)
+def update_view_aggregations_on_rows_created(
+    sender, rows, user, table, model, **kwargs
+):
+    view_handler = ViewHandler()
+    snapshots = view_handler.get_view_aggregations_snapshots(table, model, rows)
+    view_handler.apply_view_aggregations_deltas(snapshots, model, rows, created=True)
+
+
+@receiver(rows_updated)
+def update_view_aggregations_on_rows_updated(
+    sender, rows, user, table, model, before_return, updated_field_ids, **kwargs
+):
+    snapshots = dict(before_return).get(snapshot_view_aggregations_before_rows_change)
+    if snapshots:
+        ViewHandler().apply_view_aggregations_deltas(
+            snapshots, model, rows, invalidated_field_ids=set(updated_field_ids)
+        )
+
+
+@receiver(rows_deleted)
+def update_view_aggregations_on_rows_deleted(
+    sender, rows, user, table, model, before_return, **kwargs
+):
+    snapshots = dict(before_return).get(snapshot_view_aggregations_before_rows_change)
+    if snapshots:
+        ViewHandler().apply_view_aggregations_deltas(snapshots, model, rows)
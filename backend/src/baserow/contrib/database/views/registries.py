@@ -43,6 +43,7 @@ from baserow.core.utils import (
 )
 
 from .exceptions import (
+    AggregationDeltaNotApplicable,
     AggregationTypeAlreadyRegistered,
     AggregationTypeDoesNotExist,
     DecoratorTypeAlreadyRegistered,
@@ -1003,6 +1004,14 @@ class ViewAggregationType(Instance):
     aggregation. For example you can compute a sum of all values of a field in a table.
     """
 
+    decomposable = False
+    """
+    Indicates whether the aggregation value of all the rows can be derived from the
+    aggregation values of subsets of those rows. If so, the cached aggregation value
+    is updated incrementally with `apply_delta` when rows are created, updated or
+    deleted instead of being recomputed.
+    """
+
     def get_aggregation(
         self,
         field_name: str,
@@ -1026,6 +1035,25 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def apply_delta(self, value: Any, added_value: Any, removed_value: Any) -> Any:
+        """
+        Updates the aggregation value of all the rows incrementally. Only called if
+        the aggregation type is `decomposable`.
+
+        :param value: The current aggregation value of all the rows.
+        :param added_value: The aggregation value of the rows that have been added to
+            the view, or `None` if no rows have been added.
+        :param removed_value: The aggregation value of the rows that have been
+            removed from the view, or `None` if no rows have been removed.
+        :raises AggregationDeltaNotApplicable: When the new value can't be derived
+            from the provided values and must be recomputed.
+        :return: The new aggregation value of all the rows.
+        """
+
+        raise AggregationDeltaNotApplicable(
+            f"The {self.type} aggregation can't be updated incrementally."
+        )
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Callable, Dict
 
 from django.db.models import (
     Avg,
@@ -52,6 +52,7 @@ from baserow.contrib.database.formula.types.formula_types import (
     BaserowFormulaSingleFileType,
 )
 
+from .exceptions import AggregationDeltaNotApplicable
 from .registries import ViewAggregationType
 from .utils import AnnotatedAggregation
 
@@ -71,6 +72,29 @@ def get_has_relations_annotation(field_name: str, model_field: Field) -> Dict:
     return {f"has_relations_{field_name}": Exists(subquery)}
 
 
+def apply_extremum_delta(
+    value: Any, added_value: Any, removed_value: Any, extremum: Callable
+) -> Any:
+    """
+    Updates a min or max aggregation value incrementally. If the removed rows
+    contained the current extremum, the next one is unknown and the value must be
+    recomputed.
+    """
+
+    if removed_value is not None and (
+        value is None or extremum(value, removed_value) == removed_value
+    ):
+        raise AggregationDeltaNotApplicable(
+            "The removed rows contain the current extremum."
+        )
+
+    if value is None:
+        return added_value
+    elif added_value is None:
+        return value
+    return extremum(value, added_value)
+
+
 class EmptyCountViewAggregationType(ViewAggregationType):
     """
     The empty count aggregation counts how many values are considered empty for
@@ -78,6 +102,7 @@ class EmptyCountViewAggregationType(ViewAggregationType):
     """
 
     type = "empty_count"
+    decomposable = True
 
     compatible_field_types = [
         TextFieldType.type,
@@ -129,6 +154,9 @@ class EmptyCountViewAggregationType(ViewAggregationType):
                 filter=field_type.empty_query(field_name, model_field, field),
             )
 
+    def apply_delta(self, value, added_value, removed_value):
+        return value + (added_value or 0) - (removed_value or 0)
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -202,6 +230,7 @@ class MinViewAggregationType(ViewAggregationType):
     """
 
     type = "min"
+    decomposable = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -220,6 +249,9 @@ class MinViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Min(field_name)
 
+    def apply_delta(self, value, added_value, removed_value):
+        return apply_extremum_delta(value, added_value, removed_value, min)
+
 
 class MaxViewAggregationType(ViewAggregationType):
     """
@@ -227,6 +259,7 @@ class MaxViewAggregationType(ViewAggregationType):
     """
 
     type = "max"
+    decomposable = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -246,6 +279,9 @@ class MaxViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Max(field_name)
 
+    def apply_delta(self, value, added_value, removed_value):
+        return apply_extremum_delta(value, added_value, removed_value, max)
+
 
 class SumViewAggregationType(ViewAggregationType):
     """
@@ -253,6 +289,7 @@ class SumViewAggregationType(ViewAggregationType):
     """
 
     type = "sum"
+    decomposable = True
 
     compatible_field_types = [
         NumberFieldType.type,
@@ -266,6 +303,21 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def apply_delta(self, value, added_value, removed_value):
+        if removed_value is not None:
+            if value is None:
+                raise AggregationDeltaNotApplicable("The removed values are unknown.")
+            value -= removed_value
+
+        if added_value is not None:
+            value = added_value if value is None else value + added_value
+        elif removed_value is not None and not value:
+            # The sum of the remaining rows is `None` instead of zero if they
+            # don't have any value, which can only be found out by recomputing it.
+            raise AggregationDeltaNotApplicable("The sum might not have any value.")
+
+        return value
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -1,9 +1,13 @@
 import json
+import math
+import random
+import time
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from django.conf import settings
 from django.contrib.auth.models import User as DjangoUser
+from django.core.cache import cache
 from django.db.models import Q
 from django.db.models.query import QuerySet
 
@@ -21,6 +25,7 @@ from .exceptions import (
 )
 from .models import (
     TableWebhook,
+    TableWebhookBatchedEvent,
     TableWebhookCall,
     TableWebhookEvent,
     TableWebhookHeader,
@@ -34,9 +39,15 @@ from .operations import (
     UpdateWebhookOperationType,
 )
 from .registries import webhook_event_type_registry
+from .tasks import call_webhook_batched_events
 from .typing import EventConfigItem
 from .validators import get_webhook_request_function
 
+# The event type of the calls delivering multiple batched events at once.
+BATCH_EVENT_TYPE = "batch"
+# The maximum number of seconds a call waits for a free call slot of its webhook.
+CALL_SLOT_MAX_WAIT_SECONDS = 60
+
 
 class WebhookHandler:
     def find_webhooks_to_call(self, table_id: int, event_type: str) -> QuerySet:
@@ -219,6 +230,7 @@ class WebhookHandler:
             "request_method",
             "name",
             "include_all_events",
+            "batch_events",
         ]
         values = extract_allowed(kwargs, allowed_fields)
         webhook = TableWebhook.objects.create(table_id=table.id, **values)
@@ -295,6 +307,7 @@ class WebhookHandler:
             "name",
             "include_all_events",
             "active",
+            "batch_events",
         ]
         webhook = set_allowed_attrs(kwargs, allowed_fields, webhook)
         webhook.save()
@@ -422,6 +435,258 @@ class WebhookHandler:
 
         return first_request, response
 
+    def _get_call_slot_cache_key(self, webhook_id: int, slot: int) -> str:
+        """
+        Returns the cache key of the specified call slot of the webhook.
+        """
+
+        return f"webhook_call_slot__{webhook_id}_{slot}"
+
+    def acquire_call_slot(self, webhook_id: int) -> Optional[str]:
+        """
+        Acquires one of the `BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK` slots
+        limiting the number of calls of the webhook that can be in progress at the
+        same time. The slots expire on their own, so that a worker that died during a
+        call can't block the webhook forever.
+
+        :param webhook_id: The id of the webhook that is going to be called.
+        :return: The key of the acquired slot that must be released with
+            `release_call_slot` once the call is done, an empty string if the number
+            of calls isn't limited or None if all the slots are in use.
+        """
+
+        max_concurrent_calls = (
+            settings.BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK
+        )
+        if max_concurrent_calls <= 0:
+            return ""
+
+        # A request can follow redirects, so give it more time than a single timeout.
+        timeout = settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS * 4
+        for slot in range(max_concurrent_calls):
+            cache_key = self._get_call_slot_cache_key(webhook_id, slot)
+            if cache.add(cache_key, True, timeout=timeout):
+                return cache_key
+
+        return None
+
+    def get_call_slot_wait_countdown(self, waits: int) -> float:
+        """
+        Returns the number of seconds a call must wait before trying to acquire a
+        call slot of the webhook again. The wait grows exponentially with the number
+        of times the call already waited, up to `CALL_SLOT_MAX_WAIT_SECONDS`, and is
+        randomized so that the waiting calls don't all try again at the same time.
+
+        :param waits: The number of times the call already waited for a slot.
+        :return: The countdown in seconds.
+        """
+
+        countdown = min(2**waits, CALL_SLOT_MAX_WAIT_SECONDS)
+        return countdown / 2 + random.uniform(0, countdown / 2)  # nosec
+
+    def release_call_slot(self, slot_key: str):
+        """
+        Releases a call slot acquired with `acquire_call_slot`.
+
+        :param slot_key: The key of the slot returned by `acquire_call_slot`.
+        """
+
+        if slot_key:
+            cache.delete(slot_key)
+
+    def _get_batched_events_scheduled_cache_key(self, webhook_id: int) -> str:
+        """
+        Returns the cache key indicating that a task delivering the batched events
+        of the webhook is scheduled.
+        """
+
+        return f"webhook_batched_events_scheduled__{webhook_id}"
+
+    def _get_batched_events_lock_cache_key(self, webhook_id: int) -> str:
+        """
+        Returns the cache key of the lock held while delivering the batched events
+        of the webhook.
+        """
+
+        return f"webhook_batched_events_lock__{webhook_id}"
+
+    def _get_batched_events_retry_cache_key(self, webhook_id: int) -> str:
+        """
+        Returns the cache key of the retry state of the failed batched events call
+        of the webhook.
+        """
+
+        return f"webhook_batched_events_retry__{webhook_id}"
+
+    def add_batched_events(self, batched_events: List[TableWebhookBatchedEvent]):
+        """
+        Stores events that must be delivered in batches and makes sure that a task
+        delivering them is scheduled for every related webhook.
+
+        :param batched_events: The unsaved batched events.
+        """
+
+        TableWebhookBatchedEvent.objects.bulk_create(batched_events)
+
+        for webhook_id in {event.webhook_id for event in batched_events}:
+            self.schedule_batched_events_call(webhook_id)
+
+    def schedule_batched_events_call(
+        self, webhook_id: int, countdown: Optional[int] = None
+    ):
+        """
+        Schedules the task delivering the batched events of the webhook, unless it's
+        already scheduled, so that all the events occurring within the batch window
+        are delivered together.
+
+        :param webhook_id: The id of the webhook having batched events.
+        :param countdown: The number of seconds to wait before delivering the events.
+            Defaults to `BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS`.
+        """
+
+        if countdown is None:
+            countdown = settings.BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS
+
+        # The key expires on its own, so that a lost task doesn't prevent the
+        # following events from being delivered.
+        if cache.add(
+            self._get_batched_events_scheduled_cache_key(webhook_id),
+            True,
+            timeout=countdown + 60,
+        ):
+            call_webhook_batched_events.apply_async(
+                args=(webhook_id,), countdown=countdown
+            )
+
+    def clear_batched_events_call_scheduled(self, webhook_id: int):
+        """
+        Indicates that the scheduled task delivering the batched events of the
+        webhook has started, so that the new events schedule another one.
+
+        :param webhook_id: The id of the webhook having batched events.
+        """
+
+        cache.delete(self._get_batched_events_scheduled_cache_key(webhook_id))
+
+    def acquire_batched_events_lock(self, webhook_id: int) -> bool:
+        """
+        Acquires the lock ensuring that only one task delivers the batched events of
+        the webhook at the same time, so that they're delivered in order. It expires
+        on its own if it's not extended with `extend_batched_events_lock` before
+        every call.
+
+        :param webhook_id: The id of the webhook having batched events.
+        :return: Whether the lock has been acquired.
+        """
+
+        return cache.add(
+            self._get_batched_events_lock_cache_key(webhook_id),
+            True,
+            timeout=settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS * 4,
+        )
+
+    def extend_batched_events_lock(self, webhook_id: int):
+        """
+        Gives the task holding the batched events lock of the webhook the time to
+        make another call.
+
+        :param webhook_id: The id of the webhook having batched events.
+        """
+
+        cache.touch(
+            self._get_batched_events_lock_cache_key(webhook_id),
+            timeout=settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS * 4,
+        )
+
+    def release_batched_events_lock(self, webhook_id: int):
+        """
+        Releases the lock acquired with `acquire_batched_events_lock`.
+
+        :param webhook_id: The id of the webhook having batched events.
+        """
+
+        cache.delete(self._get_batched_events_lock_cache_key(webhook_id))
+
+    def get_batched_events_retries(self, webhook_id: int) -> int:
+        """
+        Returns the number of times the failed batched events call of the webhook
+        has already been retried.
+
+        :param webhook_id: The id of the webhook having batched events.
+        :return: The number of retries, 0 if the last call didn't fail.
+        """
+
+        retry_state = cache.get(self._get_batched_events_retry_cache_key(webhook_id))
+        return retry_state["retries"] if retry_state else 0
+
+    def get_batched_events_retry_countdown(self, webhook_id: int) -> int:
+        """
+        Returns the number of seconds to wait before the failed batched events call
+        of the webhook can be retried. The tasks scheduled by new events in the
+        meantime must wait as well, so that they don't defeat the backoff.
+
+        :param webhook_id: The id of the webhook having batched events.
+        :return: The number of seconds to wait, 0 if the call can be made now.
+        """
+
+        retry_state = cache.get(self._get_batched_events_retry_cache_key(webhook_id))
+        if not retry_state:
+            return 0
+
+        return max(math.ceil(retry_state["next_attempt"] - time.time()), 0)
+
+    def schedule_batched_events_retry(self, webhook_id: int, retries: int):
+        """
+        Records that the failed batched events call of the webhook will be retried
+        after an exponential backoff and schedules the task making it.
+
+        :param webhook_id: The id of the webhook having batched events.
+        :param retries: The number of times the call has already been retried.
+        """
+
+        countdown = 2**retries
+        cache.set(
+            self._get_batched_events_retry_cache_key(webhook_id),
+            {"retries": retries + 1, "next_attempt": time.time() + countdown},
+            timeout=None,
+        )
+        self.schedule_batched_events_call(webhook_id, countdown=countdown)
+
+    def clear_batched_events_retry(self, webhook_id: int):
+        """
+        Indicates that the batched events call of the webhook succeeded or that its
+        events have been skipped, so that the next calls are made right away.
+
+        :param webhook_id: The id of the webhook having batched events.
+        """
+
+        cache.delete(self._get_batched_events_retry_cache_key(webhook_id))
+
+    def get_batch_payload(
+        self,
+        webhook: TableWebhook,
+        event_id: str,
+        batched_events: List[TableWebhookBatchedEvent],
+    ) -> Dict[str, Any]:
+        """
+        Returns the payload of a call delivering multiple batched events at once.
+
+        :param webhook: The webhook object related to the call.
+        :param event_id: The id of the call, which is the id of its first event.
+        :param batched_events: The events delivered by the call, in the order they
+            occurred.
+        :return: A JSON serializable dict containing the payloads of the events.
+        """
+
+        return {
+            "table_id": webhook.table_id,
+            "database_id": webhook.table.database_id,
+            "workspace_id": webhook.table.database.workspace_id,
+            "event_id": str(event_id),
+            "event_type": BATCH_EVENT_TYPE,
+            "events": [event.payload for event in batched_events],
+        }
+
     def get_headers(self, event_type: str, event_id: str):
         """Returns the default headers that must be added to every request."""
 
@@ -1,5 +1,6 @@
 import uuid
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxLengthValidator
 from django.db import models
 
@@ -53,6 +54,11 @@ class TableWebhook(CreatedAndUpdatedOnMixin, models.Model):
     failed_triggers = models.IntegerField(
         default=0, help_text="The amount of failed webhook calls."
     )
+    batch_events = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the events occurring within a short window must "
+        "be delivered together in a single call.",
+    )
 
     @property
     def header_dict(self):
@@ -84,6 +90,25 @@ class TableWebhookHeader(models.Model):
         ordering = ("id",)
 
 
+class TableWebhookBatchedEvent(models.Model):
+    """
+    An event waiting to be delivered with the other events of the same batch, for a
+    webhook having `batch_events` enabled.
+    """
+
+    webhook = models.ForeignKey(
+        TableWebhook, related_name="batched_events", on_delete=models.CASCADE
+    )
+    event_id = models.UUIDField(help_text="The unique id of the event.")
+    event_type = models.CharField(max_length=50)
+    payload = models.JSONField(
+        encoder=DjangoJSONEncoder, help_text="The payload of the event."
+    )
+
+    class Meta:
+        ordering = ("id",)
+
+
 class TableWebhookCall(models.Model):
     event_id = models.UUIDField(
         default=uuid.uuid4,
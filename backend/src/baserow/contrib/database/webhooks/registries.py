@@ -111,12 +111,14 @@ class WebhookEventType(Instance):
         """
         Called after the signal is triggered and the transaction commits. By default it
         will figure out which webhooks need to be called and will trigger the async task
-        that will actually do so.
+        that will actually do so. The events of the webhooks having `batch_events`
+        enabled are stored instead, so that they can be delivered together.
 
         :param kwargs: The arguments of the signal.
         """
 
         from baserow.contrib.database.webhooks.handler import WebhookHandler
+        from baserow.contrib.database.webhooks.models import TableWebhookBatchedEvent
 
         if not kwargs.get("send_webhooks_events", True):
             return
@@ -125,9 +127,21 @@ class WebhookEventType(Instance):
         webhook_handler = WebhookHandler()
         webhooks = webhook_handler.find_webhooks_to_call(table.id, self.type)
         event_id = uuid.uuid4()
+        batched_events = []
         for webhook in webhooks:
             try:
                 payload = self.get_payload(event_id, webhook, **kwargs)
+                if webhook.batch_events:
+                    batched_events.append(
+                        TableWebhookBatchedEvent(
+                            webhook=webhook,
+                            event_id=event_id,
+                            event_type=self.type,
+                            payload=payload,
+                        )
+                    )
+                    continue
+
                 headers = webhook.header_dict
                 headers.update(**webhook_handler.get_headers(self.type, event_id))
                 call_webhook.delay(
@@ -144,6 +158,9 @@ class WebhookEventType(Instance):
             except SkipWebhookCall:
                 pass
 
+        if batched_events:
+            webhook_handler.add_batched_events(batched_events)
+
 
 class WebhookEventTypeRegistry(ModelRegistryMixin, Registry):
     name = "webhook_event"
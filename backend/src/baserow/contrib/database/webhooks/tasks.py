@@ -1,18 +1,16 @@
 from datetime import datetime, timezone
+from typing import List, Optional
 
 from django.conf import settings
 from django.db import transaction
 
+from loguru import logger
+
 from baserow.config.celery import app
 
 
-@app.task(
-    bind=True,
-    max_retries=settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL,
-    queue="export",
-)
-def call_webhook(
-    self,
+def _make_and_store_webhook_call(
+    handler,
     webhook_id: int,
     event_id: str,
     event_type: str,
@@ -20,75 +18,70 @@ def call_webhook(
     url: str,
     headers: dict,
     payload: dict,
-    **kwargs: dict,
-):
+) -> Optional[bool]:
     """
-    This task should be called asynchronously when the webhook call must be trigged.
-    All the raw values should be provided as argument. If the call fails for whatever
-    reason, it tries again until the max retries have been reached.
+    Makes the webhook call and stores its result in a `TableWebhookCall`. The failed
+    triggers counter and the active state of the webhook are updated accordingly.
 
+    :param handler: The webhook handler making the request.
     :param webhook_id: The id of the webhook related to the call.
     :param event_id: A unique event id that can used as id for the table webhook call
         model.
     :param event_type: The event type related to the webhook trigger.
     :param method: The request method the must be used.
     :param url: The URL can must be called.
-    :param headers: The additional headers that must be added to the request. The key
-        is the name and the value is the value.
+    :param headers: The additional headers that must be added to the request.
     :param payload: The JSON serializable payload that must be used as request body.
+    :return: Whether the call was successful, or None if the webhook has been deleted
+        during the call.
     """
 
     from advocate import UnacceptableAddressException
     from requests import RequestException
 
-    from .handler import WebhookHandler
     from .models import TableWebhook, TableWebhookCall
 
-    with transaction.atomic():
-        handler = WebhookHandler()
+    request = None
+    response = None
+    success = False
+    error = ""
 
+    # The request is made without any transaction or lock held, so that a slow
+    # receiver doesn't keep a database connection busy or block the other calls.
+    try:
+        request, response = handler.make_request(method, url, headers, payload)
+        success = response.ok
+    except RequestException as exception:
+        request = exception.request
+        response = exception.response
+        error = str(exception)
+    except UnacceptableAddressException as exception:
+        error = f"UnacceptableAddressException: {exception}"
+
+    call_values = {
+        "called_time": datetime.now(tz=timezone.utc),
+        "called_url": url,
+        "request": handler.format_request(request) if request is not None else None,
+        "response": handler.format_response(response) if response is not None else None,
+        "response_status": response.status_code if response is not None else None,
+        "error": error,
+    }
+
+    with transaction.atomic():
         try:
             webhook = TableWebhook.objects.select_for_update(of=("self",)).get(
                 id=webhook_id
             )
         except TableWebhook.DoesNotExist:
-            # If the webhook has been deleted while executing, we don't want to continue
-            # trying to call the URL because we can't update the state of the webhook.
-            return
-
-        request = None
-        response = None
-        success = False
-        error = ""
-
-        try:
-            request, response = handler.make_request(method, url, headers, payload)
-            success = response.ok
-        except RequestException as exception:
-            request = exception.request
-            response = exception.response
-            error = str(exception)
-        except UnacceptableAddressException as exception:
-            error = f"UnacceptableAddressException: {exception}"
+            # The webhook has been deleted during the call, so there is no state
+            # left to update.
+            return None
 
         TableWebhookCall.objects.update_or_create(
             event_id=event_id,
             event_type=event_type,
             webhook=webhook,
-            defaults={
-                "called_time": datetime.now(tz=timezone.utc),
-                "called_url": url,
-                "request": handler.format_request(request)
-                if request is not None
-                else None,
-                "response": handler.format_response(response)
-                if response is not None
-                else None,
-                "response_status": response.status_code
-                if response is not None
-                else None,
-                "error": error,
-            },
+            defaults=call_values,
         )
         handler.clean_webhook_calls(webhook)
 
@@ -115,13 +108,220 @@ def call_webhook(
             webhook.active = False
             webhook.save()
 
+    return success
+
+
+@app.task(
+    bind=True,
+    max_retries=settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL,
+    queue=settings.BASEROW_WEBHOOKS_QUEUE_NAME,
+)
+def call_webhook(
+    self,
+    webhook_id: int,
+    event_id: str,
+    event_type: str,
+    method: str,
+    url: str,
+    headers: dict,
+    payload: dict,
+    slot_waits: int = 0,
+    **kwargs: dict,
+):
+    """
+    This task should be called asynchronously when the webhook call must be trigged.
+    All the raw values should be provided as argument. If the call fails for whatever
+    reason, it tries again until the max retries have been reached.
+
+    At most `BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK` calls of the same
+    webhook are in progress at the same time. If they are all in use, the call waits
+    with an exponential backoff, and once it waited
+    `BASEROW_WEBHOOKS_MAX_CALL_SLOT_WAITS` times, it counts as a failed attempt. Note
+    that because of the concurrent calls, and the retries, the receiver can get the
+    events of a webhook in another order than they occurred. The webhooks having
+    batching enabled are delivered in order by `call_webhook_batched_events`.
+
+    :param webhook_id: The id of the webhook related to the call.
+    :param event_id: A unique event id that can used as id for the table webhook call
+        model.
+    :param event_type: The event type related to the webhook trigger.
+    :param method: The request method the must be used.
+    :param url: The URL can must be called.
+    :param headers: The additional headers that must be added to the request. The key
+        is the name and the value is the value.
+    :param payload: The JSON serializable payload that must be used as request body.
+    :param slot_waits: The number of times the call already waited for a free call
+        slot of the webhook.
+    """
+
+    from .handler import WebhookHandler
+    from .models import TableWebhook
+
+    handler = WebhookHandler()
+
+    if not TableWebhook.objects.filter(id=webhook_id).exists():
+        # If the webhook has been deleted while executing, we don't want to continue
+        # trying to call the URL because we can't update the state of the webhook.
+        return
+
+    call_slot = handler.acquire_call_slot(webhook_id)
+    if call_slot is None and slot_waits < settings.BASEROW_WEBHOOKS_MAX_CALL_SLOT_WAITS:
+        # Too many calls of this webhook are in progress. Try again later without
+        # counting it as a failed attempt.
+        self.apply_async(
+            args=self.request.args,
+            kwargs={**(self.request.kwargs or {}), "slot_waits": slot_waits + 1},
+            countdown=handler.get_call_slot_wait_countdown(slot_waits),
+            retries=self.request.retries,
+        )
+        return
+    elif call_slot is None:
+        # The webhook has been busy for too long, so this counts as a failed attempt
+        # and the retry waits for a slot all over again.
+        success = False
+        logger.warning(
+            "Webhook {webhook_id} call {event_id} didn't get a free call slot.",
+            webhook_id=webhook_id,
+            event_id=event_id,
+        )
+    else:
+        try:
+            success = _make_and_store_webhook_call(
+                handler,
+                webhook_id,
+                event_id,
+                event_type,
+                method,
+                url,
+                headers,
+                payload,
+            )
+        finally:
+            handler.release_call_slot(call_slot)
+
     # This part must be outside of the transaction block, otherwise it could cause
     # the transaction to rollback when the retry exception is raised, and we don't want
     # that to happen.
     if (
-        not success
+        success is False
         and self.request.retries < settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL
     ):
         # If the task is still operating within the max retries per call limit,
         # then we want to retry the task with an exponential backoff.
-        self.retry(countdown=2**self.request.retries)
+        self.retry(
+            kwargs={**(self.request.kwargs or {}), "slot_waits": 0},
+            countdown=2**self.request.retries,
+        )
+
+
+@app.task(bind=True, queue=settings.BASEROW_WEBHOOKS_QUEUE_NAME)
+def call_webhook_batched_events(self, webhook_id: int):
+    """
+    Delivers the batched events of the webhook in the order they occurred, with calls
+    containing at most `BASEROW_WEBHOOKS_BATCH_MAX_EVENTS` events. Only one task
+    delivers the events of a webhook at the same time, and a call is only made once
+    the previous one succeeded, so that the receiver gets them in order. If a call
+    fails, it's retried with an exponential backoff until the max retries have been
+    reached, and then the events of that call are skipped. The retry state is kept
+    per webhook rather than per task, because the tasks scheduled by new events
+    during the backoff must wait for it as well.
+
+    :param webhook_id: The id of the webhook having batched events.
+    """
+
+    from .handler import WebhookHandler
+    from .models import TableWebhookBatchedEvent
+
+    handler = WebhookHandler()
+    handler.clear_batched_events_call_scheduled(webhook_id)
+
+    if not handler.acquire_batched_events_lock(webhook_id):
+        # Another task is delivering the events of this webhook. Try again a bit
+        # later.
+        self.apply_async(
+            args=self.request.args, kwargs=self.request.kwargs, countdown=1
+        )
+        return
+
+    try:
+        retry_countdown = handler.get_batched_events_retry_countdown(webhook_id)
+        if retry_countdown > 0:
+            # A failed call is waiting for its backoff, the new events will be
+            # delivered after it.
+            handler.schedule_batched_events_call(webhook_id, countdown=retry_countdown)
+            return
+
+        retries = handler.get_batched_events_retries(webhook_id)
+        failed_event_ids = _call_webhook_batches(handler, webhook_id)
+    finally:
+        handler.release_batched_events_lock(webhook_id)
+
+    if not failed_event_ids:
+        handler.clear_batched_events_retry(webhook_id)
+    elif retries < settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL:
+        handler.schedule_batched_events_retry(webhook_id, retries)
+    else:
+        # Give up on these events, like `call_webhook` gives up on a single event, so
+        # that the following ones can still be delivered.
+        TableWebhookBatchedEvent.objects.filter(id__in=failed_event_ids).delete()
+        handler.clear_batched_events_retry(webhook_id)
+        handler.schedule_batched_events_call(webhook_id, countdown=0)
+
+
+def _call_webhook_batches(handler, webhook_id: int) -> List[int]:
+    """
+    Delivers the batched events of the webhook, one call after the other, until there
+    are none left or a call fails. Must be called while holding the batched events
+    lock of the webhook.
+
+    :param handler: The webhook handler making the requests.
+    :param webhook_id: The id of the webhook having batched events.
+    :return: The ids of the batched events of the failed call, if any.
+    """
+
+    from .handler import BATCH_EVENT_TYPE
+    from .models import TableWebhook, TableWebhookBatchedEvent
+
+    while True:
+        webhook = (
+            TableWebhook.objects.select_related("table__database")
+            .filter(id=webhook_id, active=True)
+            .first()
+        )
+        if webhook is None:
+            # The events of a deleted or deactivated webhook won't be delivered.
+            TableWebhookBatchedEvent.objects.filter(webhook_id=webhook_id).delete()
+            return []
+
+        batched_events = list(
+            TableWebhookBatchedEvent.objects.filter(webhook_id=webhook_id)[
+                : settings.BASEROW_WEBHOOKS_BATCH_MAX_EVENTS
+            ]
+        )
+        if len(batched_events) == 0:
+            return []
+
+        # The id of the first event identifies the call, so that the retries of the
+        # same call update the same `TableWebhookCall`.
+        event_id = str(batched_events[0].event_id)
+        payload = handler.get_batch_payload(webhook, event_id, batched_events)
+        headers = webhook.header_dict
+        headers.update(**handler.get_headers(BATCH_EVENT_TYPE, event_id))
+
+        handler.extend_batched_events_lock(webhook_id)
+        success = _make_and_store_webhook_call(
+            handler,
+            webhook_id,
+            event_id,
+            BATCH_EVENT_TYPE,
+            webhook.request_method,
+            webhook.url,
+            headers,
+            payload,
+        )
+        batched_event_ids = [event.id for event in batched_events]
+
+        if not success:
+            return [] if success is None else batched_event_ids
+
+        TableWebhookBatchedEvent.objects.filter(id__in=batched_event_ids).delete()
@@ -1,4 +1,6 @@
+import threading
 from http.client import _is_illegal_header_value, _is_legal_header_name
+from http.cookiejar import DefaultCookiePolicy
 from socket import gaierror, timeout
 from typing import Callable
 from urllib.parse import urlparse
@@ -12,30 +14,75 @@ from advocate.connection import (
     UnacceptableAddressException,
     validating_create_connection,
 )
+from requests import Session
 
 INVALID_URL_CODE = "invalid_url"
 
+_webhook_sessions = threading.local()
 
-def get_webhook_request_function() -> Callable:
+
+def get_webhook_session() -> Session:
     """
-    Return the appropriate request function based on production environment
-    or settings.
-    In production mode, the advocate library is used so that the internal
-    network can't be reached. This can be disabled by changing the Django
-    setting BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS.
+    Returns the session of the current thread used to make the webhook requests. It
+    keeps the connections alive, so that the following calls to the same host don't
+    have to open a new connection and do a new TLS handshake, but it doesn't keep
+    any cookie. A new session is created when the settings restricting the
+    addresses that can be reached change.
+
+    In production mode, the advocate library is used so that the internal network
+    can't be reached. The address is validated when a connection is opened, so the
+    reused connections are only the ones to addresses that have been accepted. This
+    can be disabled by changing the Django setting
+    BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS.
     """
 
-    if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
-        from requests import request
+    session_config = (
+        settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True,
+        tuple(settings.BASEROW_WEBHOOKS_IP_BLACKLIST),
+        tuple(settings.BASEROW_WEBHOOKS_IP_WHITELIST),
+        tuple(settings.BASEROW_WEBHOOKS_URL_REGEX_BLACKLIST),
+    )
+    session = getattr(_webhook_sessions, "session", None)
+
+    if session is None or _webhook_sessions.config != session_config:
+        if session is not None:
+            session.close()
+
+        if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
+            session = Session()
+        else:
+            addr_validator = get_advocate_address_validator()
+            session = RequestsAPIWrapper(addr_validator).Session()
+
+        # The session is shared by the webhooks of all the users, so the cookies set
+        # by a receiver must not be sent with the calls of the other webhooks.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        _webhook_sessions.session = session
+        _webhook_sessions.config = session_config
 
-        return request
-    else:
-        from advocate import request
+    return session
 
-        addr_validator = get_advocate_address_validator()
-        baserow_advocate = RequestsAPIWrapper(addr_validator)
 
-        return baserow_advocate.request
+def close_webhook_session():
+    """
+    Closes the webhook session of the current thread and its connections, if any.
+    """
+
+    session = getattr(_webhook_sessions, "session", None)
+    if session is not None:
+        session.close()
+        _webhook_sessions.session = None
+
+
+def get_webhook_request_function() -> Callable:
+    """
+    Return the appropriate request function based on production environment
+    or settings. The requests are made using the keep-alive session of the current
+    thread, see `get_webhook_session`.
+    """
+
+    return get_webhook_session().request
 
 
 def get_advocate_address_validator() -> AddrValidator:
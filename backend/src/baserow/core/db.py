@@ -2,6 +2,7 @@ import contextlib
 from collections import defaultdict
 from decimal import Decimal
 from functools import cache
+from itertools import islice
 from math import ceil
 from typing import (
     Any,
@@ -472,6 +473,20 @@ class MultiFieldPrefetchQuerysetMixin(Generic[ModelInstance]):
                 f(self, self._result_cache)
             self._multi_field_prefetch_done = True
 
+    def _iterator(self, use_chunked_fetch, chunk_size):
+        iterator = super()._iterator(use_chunked_fetch, chunk_size)
+        if not self._multi_field_prefetch_related_funcs:
+            yield from iterator
+            return
+
+        # Like Django does with `prefetch_related`, the prefetch functions are called
+        # for every chunk when iterating over the queryset with `.iterator()`,
+        # because the result cache is not used then.
+        while results := list(islice(iterator, chunk_size or 2000)):
+            for f in self._multi_field_prefetch_related_funcs:
+                f(self, results)
+            yield from results
+
     def _clone(self, *args, **kwargs):
         c = super()._clone(*args, **kwargs)
         c._multi_field_prefetch_related_funcs = (
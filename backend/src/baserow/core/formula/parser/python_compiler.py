@@ -0,0 +1,166 @@
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, List
+
+from django.conf import settings
+
+from baserow.core.formula import BaserowFormula, BaserowFormulaVisitor
+from baserow.core.formula.parser.exceptions import (
+    BaserowFormulaSyntaxError,
+    FieldByIdReferencesAreDeprecated,
+    FormulaFunctionTypeDoesNotExist,
+    UnknownOperator,
+)
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.types import (
+    FormulaContext,
+    FormulaFunction,
+    FunctionCollection,
+)
+
+CompiledFormula = Callable[[FunctionCollection, FormulaContext], Any]
+
+
+class BaserowPythonCompiler(BaserowFormulaVisitor):
+    """
+    Compiles a parse tree into a Python closure that produces the result of the
+    formula when called with the functions and the formula context. The tree is only
+    walked once, so the compiled formula can be evaluated over and over again
+    without parsing the formula or visiting the tree.
+    """
+
+    def visitRoot(self, ctx: BaserowFormula.RootContext) -> CompiledFormula:
+        return ctx.expr().accept(self)
+
+    def visitStringLiteral(
+        self, ctx: BaserowFormula.StringLiteralContext
+    ) -> CompiledFormula:
+        return self._constant(self.process_string(ctx))
+
+    def visitDecimalLiteral(
+        self, ctx: BaserowFormula.DecimalLiteralContext
+    ) -> CompiledFormula:
+        return self._constant(Decimal(ctx.getText()))
+
+    def visitBooleanLiteral(
+        self, ctx: BaserowFormula.BooleanLiteralContext
+    ) -> CompiledFormula:
+        return self._constant(ctx.TRUE() is not None)
+
+    def visitIntegerLiteral(
+        self, ctx: BaserowFormula.IntegerLiteralContext
+    ) -> CompiledFormula:
+        return self._constant(int(ctx.getText()))
+
+    def visitBrackets(self, ctx: BaserowFormula.BracketsContext) -> CompiledFormula:
+        return ctx.expr().accept(self)
+
+    def process_string(self, ctx):
+        literal_without_outer_quotes = ctx.getText()[1:-1]
+        if ctx.SINGLEQ_STRING_LITERAL() is not None:
+            literal = literal_without_outer_quotes.replace("\\'", "'")
+        else:
+            literal = literal_without_outer_quotes.replace('\\"', '"')
+        return literal
+
+    def visitFunctionCall(
+        self, ctx: BaserowFormula.FunctionCallContext
+    ) -> CompiledFormula:
+        function_name = ctx.func_name().accept(self).lower()
+        return self._compile_func(ctx.expr(), function_name)
+
+    def visitBinaryOp(self, ctx: BaserowFormula.BinaryOpContext) -> CompiledFormula:
+        if ctx.PLUS():
+            op = "add"
+        elif ctx.MINUS():
+            op = "minus"
+        elif ctx.SLASH():
+            op = "divide"
+        elif ctx.EQUAL():
+            op = "equal"
+        elif ctx.BANG_EQUAL():
+            op = "not_equal"
+        elif ctx.STAR():
+            op = "multiply"
+        elif ctx.GT():
+            op = "greater_than"
+        elif ctx.LT():
+            op = "less_than"
+        elif ctx.GTE():
+            op = "greater_than_or_equal"
+        elif ctx.LTE():
+            op = "less_than_or_equal"
+        else:
+            raise UnknownOperator(ctx.getText())
+
+        return self._compile_func(ctx.expr(), op)
+
+    def visitFunc_name(self, ctx: BaserowFormula.Func_nameContext) -> str:
+        return ctx.getText()
+
+    def visitIdentifier(self, ctx: BaserowFormula.IdentifierContext) -> str:
+        return ctx.getText()
+
+    def visitFieldByIdReference(self, ctx: BaserowFormula.FieldByIdReferenceContext):
+        raise FieldByIdReferencesAreDeprecated()
+
+    def visitLeftWhitespaceOrComments(
+        self, ctx: BaserowFormula.LeftWhitespaceOrCommentsContext
+    ) -> CompiledFormula:
+        return ctx.expr().accept(self)
+
+    def visitRightWhitespaceOrComments(
+        self, ctx: BaserowFormula.RightWhitespaceOrCommentsContext
+    ) -> CompiledFormula:
+        return ctx.expr().accept(self)
+
+    def _constant(self, value: Any) -> CompiledFormula:
+        def constant(functions: FunctionCollection, context: FormulaContext) -> Any:
+            return value
+
+        return constant
+
+    def _compile_func(
+        self, function_argument_expressions: List, function_name: str
+    ) -> CompiledFormula:
+        compiled_args = [expr.accept(self) for expr in function_argument_expressions]
+
+        def call_function(functions: FunctionCollection, context: FormulaContext):
+            # The function is resolved when the formula is called because the
+            # compiled formula can be used with any collection of functions.
+            args = [compiled_arg(functions, context) for compiled_arg in compiled_args]
+            formula_function_type = _get_formula_function_type(functions, function_name)
+
+            formula_function_type.validate_args(args)
+
+            args_parsed = formula_function_type.parse_args(args)
+
+            return formula_function_type.execute(context, args_parsed)
+
+        return call_function
+
+
+def _get_formula_function_type(
+    functions: FunctionCollection, function_name: str
+) -> FormulaFunction:
+    try:
+        return functions.get(function_name)
+    except FormulaFunctionTypeDoesNotExist:
+        raise BaserowFormulaSyntaxError(f"{function_name} is not a valid function")
+
+
+@lru_cache(maxsize=settings.BASEROW_RUNTIME_FORMULA_CACHE_SIZE)
+def compile_formula(formula: str) -> CompiledFormula:
+    """
+    Parses and compiles the formula into a Python closure accepting the functions
+    and the formula context. The compiled formulas are cached by their text, because
+    the same formulas are resolved for every element, data source and row each time
+    a page is dispatched.
+
+    :param formula: The formula to compile.
+    :raises BaserowFormulaSyntaxError: If the formula isn't valid.
+    :return: The compiled formula.
+    """
+
+    tree = get_parse_tree_for_formula(formula)
+    return BaserowPythonCompiler().visit(tree)
@@ -200,19 +200,24 @@ class ServiceHandler:
         self,
         service: Service,
         dispatch_context: DispatchContext,
+        resolved_values: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """
         Dispatch the given service.
 
         :param service: The service to be dispatched.
         :param dispatch_context: The context used for the dispatch.
+        :param resolved_values: The resolved formulas of the service if they have
+            already been resolved for this dispatch.
         :return: The result of dispatching the service.
         """
 
         if service.integration_id is None:
             raise ServiceImproperlyConfigured("The integration property is missing.")
 
-        return service.get_type().dispatch(service, dispatch_context)
+        return service.get_type().dispatch(
+            service, dispatch_context, resolved_values=resolved_values
+        )
 
     def export_service(
         self,
@@ -197,6 +197,7 @@ class ServiceType(
         self,
         service: ServiceSubClass,
         dispatch_context: DispatchContext,
+        resolved_values: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """
         Responsible for calling `dispatch_data` and `dispatch_transform` to execute
@@ -204,10 +205,13 @@ class ServiceType(
 
         :param service: The service instance to dispatch with.
         :param dispatch_context: The context used for the dispatch.
+        :param resolved_values: The result of `resolve_service_formulas` if the
+            formulas have already been resolved for this dispatch.
         :return: The service dispatch result if any.
         """
 
-        resolved_values = self.resolve_service_formulas(service, dispatch_context)
+        if resolved_values is None:
+            resolved_values = self.resolve_service_formulas(service, dispatch_context)
         data = self.dispatch_data(service, resolved_values, dispatch_context)
         return self.dispatch_transform(data)
 
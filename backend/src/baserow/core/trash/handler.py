@@ -1,10 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
-from django.db import IntegrityError, OperationalError, transaction
+from django.db import IntegrityError, OperationalError, connection, transaction
 from django.db.models import Q, QuerySet
 
 from loguru import logger
@@ -34,7 +35,7 @@ from baserow.core.trash.operations import (
     ReadWorkspaceTrashOperationType,
 )
 from baserow.core.trash.registries import TrashableItemType, trash_item_type_registry
-from baserow.core.trash.signals import permanently_deleted
+from baserow.core.trash.signals import items_permanently_deleted, permanently_deleted
 
 User = get_user_model()
 
@@ -280,10 +281,13 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
         """
         Looks up every trash item marked for permanent deletion and removes them
         irreversibly from the database along with their corresponding trash entries.
+        The items of the types supporting it, like the rows, are first deleted in
+        bulk and the remaining ones are then deleted one by one.
         """
 
+        deleted_count = TrashHandler._permanently_delete_marked_trash_in_bulk()
+
         trash_item_lookup_cache = {}
-        deleted_count = 0
         while True:
             with transaction.atomic():
                 # Perm deleting a workspace or application can cause cascading deletion
@@ -307,6 +311,168 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
             "trashed items."
         )
 
+    @staticmethod
+    def _permanently_delete_marked_trash_in_bulk() -> int:
+        """
+        Permanently deletes the trash items marked for permanent deletion of the types
+        supporting bulk deletion. The workspaces are independent of each other, so
+        they're processed concurrently on a bounded thread pool, each thread using its
+        own database connection. They're processed one after the other if the thread
+        pool is disabled with the `TRASH_PERMANENT_DELETION_MAX_WORKERS` setting or
+        if we're in a transaction because the other connections wouldn't see its
+        changes.
+
+        :raises PermanentDeletionMaxLocksExceededException: If a single trash entry
+            exceeds the maximum number of locks per transaction.
+        :return: The number of deleted trash entries.
+        """
+
+        trash_item_types = [
+            trash_item_type.type
+            for trash_item_type in trash_item_type_registry.get_all()
+            if trash_item_type.supports_bulk_permanent_deletion
+        ]
+        workspace_ids = list(
+            TrashEntry.objects.filter(
+                should_be_permanently_deleted=True,
+                trash_item_type__in=trash_item_types,
+            )
+            .order_by("workspace_id")
+            .values_list("workspace_id", flat=True)
+            .distinct()
+        )
+
+        max_workers = settings.TRASH_PERMANENT_DELETION_MAX_WORKERS
+        if max_workers < 2 or len(workspace_ids) < 2 or connection.in_atomic_block:
+            return sum(
+                TrashHandler._permanently_delete_workspace_marked_trash_in_bulk(
+                    workspace_id, trash_item_types
+                )
+                for workspace_id in workspace_ids
+            )
+
+        def delete_in_thread(workspace_id: int) -> int:
+            try:
+                return TrashHandler._permanently_delete_workspace_marked_trash_in_bulk(
+                    workspace_id, trash_item_types
+                )
+            finally:
+                # Every thread has its own connection that must not be left open.
+                connection.close()
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(workspace_ids))
+        ) as executor:
+            return sum(executor.map(delete_in_thread, workspace_ids))
+
+    @staticmethod
+    def _permanently_delete_workspace_marked_trash_in_bulk(
+        workspace_id: int, trash_item_types: List[str]
+    ) -> int:
+        """
+        Permanently deletes the trash items of the workspace marked for permanent
+        deletion and having one of the provided types. The trash entries are grouped
+        by type and parent, and every group is deleted by batches of at most
+        `TRASH_PERMANENT_DELETION_BATCH_SIZE` entries, each in its own transaction.
+        The batch size is halved every time a batch exceeds the maximum number of
+        locks per transaction.
+
+        :param workspace_id: The id of the workspace to delete the trash items of.
+        :param trash_item_types: The types of the trash items to delete, they must
+            all support bulk permanent deletion.
+        :raises PermanentDeletionMaxLocksExceededException: If a single trash entry
+            exceeds the maximum number of locks per transaction.
+        :return: The number of deleted trash entries.
+        """
+
+        trash_entries = TrashEntry.objects.filter(
+            should_be_permanently_deleted=True,
+            workspace_id=workspace_id,
+            trash_item_type__in=trash_item_types,
+        )
+        groups = list(
+            trash_entries.order_by("trash_item_type", "parent_trash_item_id")
+            .values_list("trash_item_type", "parent_trash_item_id")
+            .distinct()
+        )
+
+        trash_item_lookup_cache = {}
+        batch_size = max(settings.TRASH_PERMANENT_DELETION_BATCH_SIZE, 1)
+        deleted_count = 0
+        for trash_item_type_name, parent_id in groups:
+            trash_item_type = trash_item_type_registry.get(trash_item_type_name)
+            group_trash_entries = trash_entries.filter(
+                trash_item_type=trash_item_type_name, parent_trash_item_id=parent_id
+            ).order_by("id")
+            while True:
+                batch = list(group_trash_entries[:batch_size])
+                if not batch:
+                    break
+
+                try:
+                    with transaction.atomic():
+                        TrashHandler._permanently_delete_trash_entries_in_bulk(
+                            trash_item_type, parent_id, batch, trash_item_lookup_cache
+                        )
+                except PermanentDeletionMaxLocksExceededException:
+                    if batch_size == 1:
+                        raise
+                    batch_size //= 2
+                    logger.warning(
+                        "Exceeded the maximum number of locks while permanently "
+                        f"deleting trash, retrying by batches of {batch_size} entries."
+                    )
+                    continue
+
+                deleted_count += len(batch)
+
+        return deleted_count
+
+    @staticmethod
+    def _permanently_delete_trash_entries_in_bulk(
+        trash_item_type: TrashableItemType,
+        parent_id: Optional[int],
+        trash_entries: List[TrashEntry],
+        trash_item_lookup_cache: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Permanently deletes the trash items of the provided trash entries, all having
+        the same type and parent, in bulk. Triggers the `items_permanently_deleted`
+        signal so plugins can do appropriate clean-up and deletes the trash entries.
+
+        :param trash_item_type: The trashable item type of the items being deleted.
+        :param parent_id: The parent id of the items if required for their type.
+        :param trash_entries: The trash entries of the items to delete.
+        :param trash_item_lookup_cache: An optional dictionary used for caching during
+            many different invocations.
+        :raises PermanentDeletionMaxLocksExceededException: If the deletion exceeds
+            the maximum number of locks per transaction.
+        """
+
+        try:
+            deleted_items = trash_item_type.permanently_delete_items_in_bulk(
+                parent_id, trash_entries, trash_item_lookup_cache
+            )
+        except TrashItemDoesNotExist:
+            # The parent has already been deleted along with all of its children, so
+            # only the trash entries are left.
+            deleted_items = []
+        except OperationalError as e:
+            if is_max_lock_exceeded_exception(e):
+                raise PermanentDeletionMaxLocksExceededException()
+            raise e
+
+        if deleted_items:
+            items_permanently_deleted.send(
+                sender=trash_item_type.type,
+                trash_item_ids=[item.id for item in deleted_items],
+                trash_items=deleted_items,
+                parent_id=parent_id,
+            )
+        TrashEntry.objects.filter(
+            id__in=[trash_entry.id for trash_entry in trash_entries]
+        ).delete()
+
     @staticmethod
     def _permanently_delete_and_signal(
         trash_item_type: Any,
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from baserow.core.exceptions import TrashItemDoesNotExist
 from baserow.core.registry import (
@@ -18,6 +18,12 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
     A TrashableItemType specifies a baserow model which can be trashed.
     """
 
+    supports_bulk_permanent_deletion = False
+    """
+    Indicates whether the trashed items of this type can be permanently deleted in
+    bulk with `permanently_delete_items_in_bulk`, instead of one by one.
+    """
+
     def lookup_trashed_item(
         self, trashed_entry, trash_item_lookup_cache: Dict[str, Any] = None
     ):
@@ -55,6 +61,31 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
 
         pass
 
+    def permanently_delete_items_in_bulk(
+        self,
+        parent_id: Optional[int],
+        trash_entries: List[Any],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ) -> List[Any]:
+        """
+        Should be implemented by the types supporting bulk permanent deletion to
+        delete the trashed items of the provided trash entries, all having the same
+        parent, with set based queries and do any other required clean-up. Trash
+        entries whose item doesn't exist anymore must be ignored.
+
+        :param parent_id: The parent id of the trashed items, if required for the type.
+        :param trash_entries: The trash entries of the items to delete permanently.
+        :param trash_item_lookup_cache: An optional dictionary used for caching
+            during many different invocations.
+        :raises TrashItemDoesNotExist: If the parent of the items doesn't exist
+            anymore.
+        :return: The deleted items.
+        """
+
+        raise NotImplementedError(
+            f"The {self.type} trash item type doesn't support bulk permanent deletion."
+        )
+
     @property
     def requires_parent_id(self) -> bool:
         """
@@ -9,3 +9,13 @@ Sent when any trashable item in Baserow is permanently deleted with kwargs conta
     None.
 :param parent_id: The parent id of the trashable item if required for that type.
 """
+
+items_permanently_deleted = django.dispatch.Signal()
+"""
+Sent when trashable items of the same type and parent are permanently deleted together
+in bulk, instead of `permanently_deleted` for every item, with kwargs containing:
+
+:param trash_items: The actual instances of the trashable items that were deleted.
+:param trash_item_ids: The ids of the items that were deleted.
+:param parent_id: The parent id of the trashable items if required for that type.
+"""
@@ -118,7 +118,10 @@ class FieldFixtures:
         if "order" not in kwargs:
             kwargs["order"] = 0
 
-        kwargs.setdefault("tsvector_column_created", True)
+        kwargs.setdefault(
+            "tsvector_column_created",
+            not kwargs["table"].row_search_document_column_added,
+        )
 
     def create_long_text_field(self, user=None, create_field=True, **kwargs):
         self.set_test_field_kwarg_defaults(user, kwargs)
@@ -1,7 +1,8 @@
-import json
+from io import BytesIO
 
 from django.core.files.base import ContentFile
 
+from baserow.contrib.database.file_import.data_file import write_data_file
 from baserow.contrib.database.file_import.models import FileImportJob
 
 data = [["test-1"]]
@@ -36,7 +37,12 @@ class FileImportFixtures:
         else:
             data = kwargs.pop("data")
 
-        data_file = kwargs.get("data_file", ContentFile(json.dumps(data)))
+        if "data_file" in kwargs:
+            data_file = kwargs.pop("data_file")
+        else:
+            buffer = BytesIO()
+            write_data_file(data, buffer)
+            data_file = ContentFile(buffer.getvalue())
 
         job = FileImportJob.objects.create(**kwargs)
 
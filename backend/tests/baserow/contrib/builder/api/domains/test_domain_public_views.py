@@ -7,6 +7,7 @@ import pytest
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_202_ACCEPTED,
+    HTTP_304_NOT_MODIFIED,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
 )
@@ -16,10 +17,12 @@ from baserow.contrib.builder.data_sources.exceptions import (
     DataSourceDoesNotExist,
     DataSourceImproperlyConfigured,
 )
+from baserow.contrib.builder.domains.handler import DomainHandler
 from baserow.contrib.builder.elements.models import Element
 from baserow.core.exceptions import PermissionException
 from baserow.core.services.exceptions import DoesNotExist, ServiceImproperlyConfigured
 from baserow.core.user_sources.user_source_user import UserSourceUser
+from baserow.core.utils import Progress
 from tests.baserow.contrib.builder.api.user_sources.helpers import (
     create_user_table_and_role,
 )
@@ -383,6 +386,94 @@ def test_get_elements_of_public_builder_permission_denied(api_client, data_fixtu
     assert response.status_code == HTTP_401_UNAUTHORIZED
 
 
+@pytest.mark.django_db
+@override_settings(BUILDER_PUBLIC_PAYLOAD_CACHE_TTL_SECONDS=60)
+def test_get_elements_of_public_builder_is_cached(api_client, data_fixture):
+    user = data_fixture.create_user()
+    builder_from = data_fixture.create_builder_application(user=user)
+    builder_to = data_fixture.create_builder_application(user=user, workspace=None)
+    page = data_fixture.create_builder_page(builder=builder_to, user=user)
+    data_fixture.create_builder_heading_element(page=page)
+
+    domain = data_fixture.create_builder_custom_domain(
+        domain_name="test.getbaserow.io",
+        published_to=page.builder,
+        builder=builder_from,
+    )
+
+    url = reverse(
+        "api:builder:domains:list_elements",
+        kwargs={"page_id": page.id},
+    )
+    response = api_client.get(url, format="json")
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()) == 1
+    etag = response["ETag"]
+    assert "no-cache" in response["Cache-Control"]
+
+    # A published builder can't be modified, so the payload is cached.
+    data_fixture.create_builder_heading_element(page=page)
+    response = api_client.get(url, format="json")
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()) == 1
+    assert response["ETag"] == etag
+
+    response = api_client.get(url, format="json", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+
+    # The permissions are still checked when the payload is cached.
+    domain.published_to = None
+    domain.save()
+    response = api_client.get(url, format="json")
+
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+@override_settings(BUILDER_PUBLIC_PAYLOAD_CACHE_TTL_SECONDS=60)
+def test_get_elements_of_public_builder_cache_is_invalidated_by_publishing(
+    api_client, data_fixture
+):
+    builder = data_fixture.create_builder_application()
+    page = data_fixture.create_builder_page(builder=builder)
+    data_fixture.create_builder_heading_element(page=page)
+    domain = data_fixture.create_builder_custom_domain(builder=builder)
+
+    DomainHandler().publish(domain, Progress(100))
+    published_page = domain.published_to.page_set.get(name=page.name)
+    response = api_client.get(
+        reverse(
+            "api:builder:domains:list_elements",
+            kwargs={"page_id": published_page.id},
+        ),
+        format="json",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()) == 1
+    etag = response["ETag"]
+
+    data_fixture.create_builder_heading_element(page=page)
+    DomainHandler().publish(domain, Progress(100))
+    published_page = domain.published_to.page_set.get(name=page.name)
+    response = api_client.get(
+        reverse(
+            "api:builder:domains:list_elements",
+            kwargs={"page_id": published_page.id},
+        ),
+        format="json",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()) == 2
+    assert response["ETag"] != etag
+
+
 @pytest.mark.django_db
 def test_get_data_source_of_public_builder(api_client, data_fixture):
     user = data_fixture.create_user()
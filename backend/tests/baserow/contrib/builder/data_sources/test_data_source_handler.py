@@ -1,8 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from unittest.mock import patch
 
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from django.http import HttpRequest
 from django.shortcuts import reverse
+from django.test.utils import override_settings
 
 import pytest
 
@@ -10,8 +14,12 @@ from baserow.contrib.builder.data_sources.builder_dispatch_context import (
     BuilderDispatchContext,
 )
 from baserow.contrib.builder.data_sources.exceptions import DataSourceDoesNotExist
-from baserow.contrib.builder.data_sources.handler import DataSourceHandler
+from baserow.contrib.builder.data_sources.handler import (
+    DataSourceHandler,
+    get_data_sources_dispatch_executor,
+)
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowGetRow,
     LocalBaserowListRows,
@@ -352,6 +360,92 @@ def test_dispatch_data_sources(data_fixture):
     assert isinstance(result[data_source3.id], Exception)
 
 
+@pytest.mark.django_db(transaction=True)
+@override_settings(BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS=4)
+@patch("baserow.contrib.builder.data_sources.handler._dispatch_executor", None)
+@patch(
+    "baserow.contrib.builder.data_sources.handler.ThreadPoolExecutor",
+    wraps=ThreadPoolExecutor,
+)
+def test_dispatch_independent_data_sources_concurrently(
+    mock_thread_pool_executor, data_fixture
+):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[
+            ("Name", "text"),
+            ("My Color", "text"),
+        ],
+        rows=[
+            ["BMW", "Blue"],
+            ["Audi", "Orange"],
+            ["Volkswagen", "White"],
+        ],
+    )
+    view = data_fixture.create_grid_view(user, table=table)
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id="2",
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id="3",
+    )
+    # Depends on the first data source, so it's dispatched afterward.
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id=f"get('data_source.{data_source.id}.id')",
+    )
+
+    dispatch_context = BuilderDispatchContext(
+        HttpRequest(), page, only_expose_public_formula_fields=False
+    )
+    result = DataSourceHandler().dispatch_data_sources(
+        [data_source3, data_source, data_source2], dispatch_context
+    )
+
+    assert list(result.keys()) == [data_source3.id, data_source.id, data_source2.id]
+    assert result[data_source.id][fields[0].db_column] == "Audi"
+    assert result[data_source2.id][fields[0].db_column] == "Volkswagen"
+    assert result[data_source3.id] == result[data_source.id]
+    assert dispatch_context.cache["data_source_contents"] == result
+    assert dispatch_context.call_stack == set()
+
+    # The thread pool and the connections of its threads are reused by the next
+    # dispatches.
+    dispatch_context = BuilderDispatchContext(
+        HttpRequest(), page, only_expose_public_formula_fields=False
+    )
+    assert DataSourceHandler().dispatch_data_sources(
+        [data_source, data_source2], dispatch_context
+    ) == {
+        data_source.id: result[data_source.id],
+        data_source2.id: result[data_source2.id],
+    }
+    mock_thread_pool_executor.assert_called_once_with(
+        max_workers=4, thread_name_prefix="builder-data-source-dispatch"
+    )
+    get_data_sources_dispatch_executor().shutdown()
+
+
 @pytest.mark.django_db
 def test_update_data_source_invalid_values(data_fixture):
     data_source = data_fixture.create_builder_local_baserow_get_row_data_source()
@@ -601,3 +695,73 @@ def test_dispatch_data_source_returns_formula_field_names(
             },
         ],
     }
+
+
+@pytest.mark.django_db
+def test_dispatch_data_source_public_cache(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"]],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user, page=page, integration=integration, table=table, row_id="2"
+    )
+    builder.workspace = None
+    builder.save()
+
+    def dispatch():
+        request = HttpRequest()
+        request.user = AnonymousUser()
+        dispatch_context = BuilderDispatchContext(
+            request, page, only_expose_public_formula_fields=False
+        )
+        result = DataSourceHandler().dispatch_data_source(data_source, dispatch_context)
+        return result[fields[0].db_column]
+
+    model = table.get_model()
+
+    # The cache is disabled by default.
+    assert dispatch() == "Audi"
+    model.objects.filter(id=rows[1].id).update(**{fields[0].db_column: "Opel"})
+    assert dispatch() == "Opel"
+
+    data_source.public_cache_ttl = 60
+    data_source.save()
+
+    assert dispatch() == "Opel"
+    # Changing the table without sending the rows signals keeps the cached result.
+    model.objects.filter(id=rows[1].id).update(**{fields[0].db_column: "Fiat"})
+    assert dispatch() == "Opel"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().update_row_by_id(
+            user, table, rows[1].id, {fields[0].db_column: "Renault"}
+        )
+    assert dispatch() == "Renault"
+
+    # The rows changes of a table not read by a cached data source aren't tracked.
+    other_table = data_fixture.create_database_table(user=user)
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().create_row(user, other_table, {})
+    version_cache_key = DataSourceHandler()._get_dispatch_version_cache_key
+    assert cache.get(version_cache_key(other_table.id)) is None
+
+    # The results cached with an evicted data version aren't served anymore.
+    cache.delete(version_cache_key(table.id))
+    model.objects.filter(id=rows[1].id).update(**{fields[0].db_column: "Peugeot"})
+    assert dispatch() == "Peugeot"
+
+    # A visitor of the editor preview always gets the latest result.
+    builder.workspace = data_fixture.create_workspace(user=user)
+    builder.save()
+    model.objects.filter(id=rows[1].id).update(**{fields[0].db_column: "Tesla"})
+    assert dispatch() == "Tesla"
@@ -1,3 +1,7 @@
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test.utils import override_settings
+
 import pytest
 
 from baserow.contrib.builder.domains.domain_types import CustomDomainType
@@ -7,6 +11,9 @@ from baserow.contrib.builder.domains.exceptions import (
 )
 from baserow.contrib.builder.domains.handler import DomainHandler
 from baserow.contrib.builder.domains.models import Domain
+from baserow.contrib.builder.domains.public_payload_handler import (
+    PublicPagePayloadHandler,
+)
 from baserow.contrib.builder.exceptions import BuilderDoesNotExist
 from baserow.contrib.builder.models import Builder
 from baserow.core.utils import Progress
@@ -199,3 +206,28 @@ def test_domain_publishing(data_fixture):
     DomainHandler().publish(domain1, progress)
 
     assert Builder.objects.count() == 2
+
+
+@pytest.mark.django_db
+@override_settings(BUILDER_PUBLIC_PAYLOAD_CACHE_TTL_SECONDS=60)
+def test_domain_publishing_populates_public_payload_cache(data_fixture):
+    builder = data_fixture.create_builder_application()
+    domain = data_fixture.create_builder_custom_domain(builder=builder)
+    page = data_fixture.create_builder_page(builder=builder)
+    data_fixture.create_builder_heading_element(page=page)
+
+    DomainHandler().publish(domain, Progress(100))
+
+    published_page = domain.published_to.page_set.get(name=page.name)
+    for payload_name in ["elements", "data_sources", "workflow_actions"]:
+        cache_key = PublicPagePayloadHandler().get_cache_key(
+            payload_name, AnonymousUser(), published_page
+        )
+        assert cache.get(cache_key) is not None
+
+    payload, etag = cache.get(
+        PublicPagePayloadHandler().get_cache_key(
+            "elements", AnonymousUser(), published_page
+        )
+    )
+    assert len(payload) == 1
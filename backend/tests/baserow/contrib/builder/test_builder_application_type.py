@@ -200,6 +200,7 @@ def test_builder_application_export(data_fixture):
                         "id": shared_datasource.id,
                         "name": shared_datasource.name,
                         "order": "1.00000000000000000000",
+                        "public_cache_ttl": 0,
                         "service": {
                             "id": shared_datasource.service.id,
                             "integration_id": integration.id,
@@ -239,6 +240,7 @@ def test_builder_application_export(data_fixture):
                         "id": datasource1.id,
                         "name": "source 1",
                         "order": "1.00000000000000000000",
+                        "public_cache_ttl": 0,
                         "service": {
                             "id": datasource1.service.id,
                             "integration_id": integration.id,
@@ -405,6 +407,7 @@ def test_builder_application_export(data_fixture):
                         "id": datasource2.id,
                         "name": "source 2",
                         "order": "1.00000000000000000000",
+                        "public_cache_ttl": 0,
                         "service": {
                             "id": datasource2.service.id,
                             "integration_id": integration.id,
@@ -421,6 +424,7 @@ def test_builder_application_export(data_fixture):
                         "id": datasource3.id,
                         "name": "source 3",
                         "order": "2.00000000000000000000",
+                        "public_cache_ttl": 0,
                         "service": {
                             "id": datasource3.service.id,
                             "integration_id": integration.id,
@@ -5,7 +5,9 @@ import pytest
 
 from baserow.contrib.builder.formula_property_extractor import (
     FormulaFieldVisitor,
+    _get_formula_data_source_dependencies,
     get_builder_used_property_names,
+    get_data_source_dependencies,
     get_data_source_property_names,
     get_element_property_names,
     get_workflow_action_property_names,
@@ -24,6 +26,7 @@ from baserow.contrib.builder.workflow_actions.workflow_action_types import (
 from baserow.core.formula import BaserowFormula
 from baserow.core.formula.exceptions import InvalidBaserowFormula
 from baserow.core.formula.parser.exceptions import BaserowFormulaSyntaxError
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
 from baserow.core.formula.registries import DataProviderType
 from baserow.core.formula.runtime_formula_context import RuntimeFormulaContext
 
@@ -1024,3 +1027,57 @@ def test_get_builder_used_property_names_returns_merged_property_names_integrati
             data_source_4.service_id: [f"field_{fields[0].id}"],  # From workflow_act_2
         },
     }
+
+
+@pytest.mark.django_db
+def test_get_data_source_dependencies(data_fixture):
+    page = data_fixture.create_builder_page()
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id="get('page_parameter.id')"
+    )
+    data_source_2 = data_fixture.create_builder_local_baserow_list_rows_data_source(
+        page=page
+    )
+    data_source_3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page,
+        row_id=(
+            f"concat(get('data_source.{data_source.id}.id'), "
+            f"get('data_source.{data_source_2.id}.0.id'), "
+            f"get('data_source_context.{data_source.id}.fields'))"
+        ),
+    )
+    data_source_4 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id="get('data_source."
+    )
+
+    assert get_data_source_dependencies(data_source) == set()
+    assert get_data_source_dependencies(data_source_2) == set()
+    assert get_data_source_dependencies(data_source_3) == {
+        data_source.id,
+        data_source_2.id,
+    }
+    assert get_data_source_dependencies(data_source_4) == set()
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.builder.formula_property_extractor.get_parse_tree_for_formula",
+    wraps=get_parse_tree_for_formula,
+)
+def test_get_data_source_dependencies_only_parses_a_formula_once(
+    mock_parse, data_fixture
+):
+    _get_formula_data_source_dependencies.cache_clear()
+    page = data_fixture.create_builder_page()
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page
+    )
+    formula = f"get('data_source.{data_source.id}.id')"
+    data_source_2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id=formula
+    )
+
+    for _ in range(3):
+        assert get_data_source_dependencies(data_source_2) == {data_source.id}
+
+    mock_parse.assert_called_once_with(formula)
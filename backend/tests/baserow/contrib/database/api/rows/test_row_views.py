@@ -3266,6 +3266,61 @@ def test_get_row_adjacent_search(api_client, data_fixture, search_mode):
     assert response.status_code == HTTP_204_NO_CONTENT, response.json()
 
 
+@pytest.mark.django_db
+def test_search_rows_by_relevance(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(name="table", user=user)
+    field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    table_2 = data_fixture.create_database_table()
+
+    [row_1, row_2, _] = RowHandler().create_rows(
+        user,
+        table,
+        rows_values=[
+            {f"field_{field.id}": "apple"},
+            {f"field_{field.id}": "apple and apple"},
+            {f"field_{field.id}": "banana"},
+        ],
+    )
+    SearchHandler.update_tsvector_columns(
+        table, update_tsvectors_for_changed_rows_only=False
+    )
+    url = reverse("api:database:rows:search", kwargs={"table_id": table.id})
+
+    response = api_client.get(
+        reverse("api:database:rows:search", kwargs={"table_id": table_2.id}),
+        data={"search": "apple"},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+    response = api_client.get(
+        url, data={"search": "apple"}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_200_OK, response.json()
+    results = response.json()["results"]
+    assert [result["row"]["id"] for result in results] == [row_2.id, row_1.id]
+    assert results[0]["rank"] > results[1]["rank"]
+    assert "<b>apple</b>" in results[0]["highlights"][f"field_{field.id}"]
+    assert results[0]["row"][f"field_{field.id}"] == "apple and apple"
+
+    response = api_client.get(
+        url,
+        data={"search": "apple", "size": 1, "user_field_names": True},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK, response.json()
+    results = response.json()["results"]
+    assert len(results) == 1
+    assert list(results[0]["highlights"]) == ["Name"]
+    assert results[0]["row"]["Name"] == "apple and apple"
+
+
 @pytest.mark.django_db
 @pytest.mark.row_history
 def test_list_row_history_for_different_rows(data_fixture, api_client):
@@ -4164,3 +4219,57 @@ def test_list_rows_can_combine_view_id_with_include_exclude(
         {"id": AnyInt(), "order": AnyStr(), "Name": "Paul"},
         {"id": AnyInt(), "order": AnyStr(), "Name": "Jack"},
     ]
+
+
+@pytest.mark.django_db
+def test_list_rows_cursor_pagination(data_fixture, api_client):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    model = table.get_model(attribute_names=True)
+    rows = [model.objects.create(name=name) for name in ["b", None, "a", "b", "c"]]
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    def get_all_pages(**params):
+        ids, cursor, pages = [], "", 0
+        while cursor is not None:
+            response = api_client.get(
+                url,
+                {**params, "cursor": cursor, "size": 2},
+                HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+            )
+            assert response.status_code == HTTP_200_OK
+            response_json = response.json()
+            assert "count" not in response_json
+            assert len(response_json["results"]) <= 2
+            ids += [row["id"] for row in response_json["results"]]
+            cursor = response_json["next_cursor"]
+            pages += 1
+        return ids, pages
+
+    ids, pages = get_all_pages()
+    assert ids == [row.id for row in rows]
+    assert pages == 3
+
+    ids, _ = get_all_pages(order_by=f"-field_{field.id}")
+    expected = model.objects.all().order_by_fields_string(f"-field_{field.id}")
+    assert ids == [row.id for row in expected]
+
+    ids, _ = get_all_pages(order_by=f"field_{field.id}")
+    expected = model.objects.all().order_by_fields_string(f"field_{field.id}")
+    assert ids == [row.id for row in expected]
+
+
+@pytest.mark.django_db
+def test_list_rows_cursor_pagination_invalid_cursor(data_fixture, api_client):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(name="Name", table=table, primary=True)
+
+    response = api_client.get(
+        reverse("api:database:rows:list", kwargs={"table_id": table.id}),
+        {"cursor": "not-a-cursor"},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
@@ -0,0 +1,65 @@
+from django.shortcuts import reverse
+from django.test.utils import override_settings
+
+import pytest
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
+
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.handler import SearchHandler
+
+
+@pytest.mark.django_db
+@override_settings(WORKSPACE_SEARCH_INDEX_ENABLED=True)
+def test_search_workspace(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    workspace = data_fixture.create_workspace(user=user)
+    other_workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    field = data_fixture.create_text_field(table=table, primary=True)
+    row = RowHandler().create_row(user, table, {field.id: "Apple"})
+    SearchHandler.update_tsvector_columns(table, True)
+
+    response = api_client.get(
+        reverse("api:database:search:workspace", kwargs={"workspace_id": 0}),
+        {"search": "apple"},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_GROUP_DOES_NOT_EXIST"
+
+    response = api_client.get(
+        reverse(
+            "api:database:search:workspace",
+            kwargs={"workspace_id": other_workspace.id},
+        ),
+        {"search": "apple"},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    url = reverse(
+        "api:database:search:workspace", kwargs={"workspace_id": workspace.id}
+    )
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+    response = api_client.get(
+        url, {"search": "apple"}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_200_OK, response.json()
+    results = response.json()["results"]
+    assert len(results) == 1
+    assert results[0]["table_id"] == table.id
+    assert results[0]["row_id"] == row.id
+    assert results[0]["field_id"] == field.id
+    assert results[0]["rank"] > 0
+
+    with override_settings(WORKSPACE_SEARCH_INDEX_ENABLED=False):
+        response = api_client.get(
+            url, {"search": "apple"}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+        )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_WORKSPACE_SEARCH_INDEX_DISABLED"
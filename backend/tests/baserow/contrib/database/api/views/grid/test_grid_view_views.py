@@ -1,9 +1,11 @@
 import json
 from decimal import Decimal
 from typing import Any, Dict, List
+from unittest.mock import patch
 
 from django.core.cache import cache
 from django.shortcuts import reverse
+from django.test.utils import override_settings
 
 import pytest
 from pytest_unordered import unordered
@@ -181,8 +183,7 @@ def test_list_rows(api_client, data_fixture):
         url, data={"count": ""}, **{"HTTP_AUTHORIZATION": f"JWT {token}"}
     )
     response_json = response.json()
-    assert response_json["count"] == 4
-    assert len(response_json.keys()) == 1
+    assert response_json == {"count": 4, "count_is_exact": True}
 
     row_1.delete()
     row_2.delete()
@@ -465,6 +466,38 @@ def test_list_rows_with_group_by_with_filter(api_client, data_fixture):
     }
 
 
+@pytest.mark.django_db
+def test_list_rows_cursor_pagination_with_view_sorts(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table, name="Horsepower")
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=number_field, order="DESC")
+
+    model = grid.table.get_model()
+    for value in [10, None, 100, 10, 1000, None, 1]:
+        model.objects.create(**{f"field_{number_field.id}": value})
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(url, **{"HTTP_AUTHORIZATION": f"JWT {token}"})
+    expected_ids = [row["id"] for row in response.json()["results"]]
+
+    ids, cursor = [], ""
+    while cursor is not None:
+        response = api_client.get(
+            url,
+            {"cursor": cursor, "size": 3},
+            **{"HTTP_AUTHORIZATION": f"JWT {token}"},
+        )
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        ids += [row["id"] for row in response_json["results"]]
+        cursor = response_json["next_cursor"]
+
+    assert len(ids) == 7
+    assert ids == expected_ids
+
+
 @pytest.mark.django_db
 def test_list_rows_include_field_options(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -855,7 +888,9 @@ def test_field_aggregation(api_client, data_fixture):
 
 
 @pytest.mark.django_db
-def test_view_aggregations(api_client, data_fixture):
+def test_view_aggregations(
+    api_client, data_fixture, django_capture_on_commit_callbacks
+):
     user, token = data_fixture.create_user_and_token(
         email="test@test.nl", password="password", first_name="Test1"
     )
@@ -992,13 +1027,15 @@ def test_view_aggregations(api_client, data_fixture):
         boolean_field.db_column: "sentinel",
     }
 
+    # The cached values are updated with the delta of the changed rows, so they
+    # must match the (still empty) table.
     cache.set(
         f"aggregation_value__{grid.id}_{number_field.db_column}",
-        {"value": "sentinel", "version": 1},
+        {"value": None, "version": 1},
     )
     cache.set(
         f"aggregation_value__{grid.id}_{boolean_field.db_column}",
-        {"value": "sentinel", "version": 3},
+        {"value": 0, "version": 3},
     )
     cache.set(
         f"aggregation_version__{grid.id}_{boolean_field.db_column}",
@@ -1006,25 +1043,26 @@ def test_view_aggregations(api_client, data_fixture):
     )
 
     # Add data through the API to trigger cache update
-    api_client.post(
-        reverse("api:database:rows:list", kwargs={"table_id": table.id}),
-        {
-            f"field_{text_field.id}": "Green",
-            f"field_{number_field.id}": 10,
-            f"field_{boolean_field.id}": True,
-        },
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {token}",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.post(
+            reverse("api:database:rows:list", kwargs={"table_id": table.id}),
+            {
+                f"field_{text_field.id}": "Green",
+                f"field_{number_field.id}": 10,
+                f"field_{boolean_field.id}": True,
+            },
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
 
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
-        "value": "sentinel",
-        "version": 1,
+        "value": 10,
+        "version": 2,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 2
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
-        "value": "sentinel",
-        "version": 3,
+        "value": 0,
+        "version": 4,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 4
 
@@ -2027,7 +2065,9 @@ def test_public_view_aggregations_hidden_fields(api_client, data_fixture):
 
 
 @pytest.mark.django_db
-def test_public_view_aggregations(api_client, data_fixture):
+def test_public_view_aggregations(
+    api_client, data_fixture, django_capture_on_commit_callbacks
+):
     user, token = data_fixture.create_user_and_token(
         email="test@test.nl", password="password", first_name="Test1"
     )
@@ -2129,13 +2169,15 @@ def test_public_view_aggregations(api_client, data_fixture):
         boolean_field.db_column: "sentinel",
     }
 
+    # The cached values are updated with the delta of the changed rows, so they
+    # must match the (still empty) table.
     cache.set(
         f"aggregation_value__{grid.id}_{number_field.db_column}",
-        {"value": "sentinel", "version": 1},
+        {"value": None, "version": 1},
     )
     cache.set(
         f"aggregation_value__{grid.id}_{boolean_field.db_column}",
-        {"value": "sentinel", "version": 3},
+        {"value": 0, "version": 3},
     )
     cache.set(
         f"aggregation_version__{grid.id}_{boolean_field.db_column}",
@@ -2143,25 +2185,26 @@ def test_public_view_aggregations(api_client, data_fixture):
     )
 
     # Add data through the API to trigger cache update
-    api_client.post(
-        reverse("api:database:rows:list", kwargs={"table_id": table.id}),
-        {
-            f"field_{text_field.id}": "Green",
-            f"field_{number_field.id}": 10,
-            f"field_{boolean_field.id}": True,
-        },
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {token}",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.post(
+            reverse("api:database:rows:list", kwargs={"table_id": table.id}),
+            {
+                f"field_{text_field.id}": "Green",
+                f"field_{number_field.id}": 10,
+                f"field_{boolean_field.id}": True,
+            },
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
 
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
-        "value": "sentinel",
-        "version": 1,
+        "value": 10,
+        "version": 2,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 2
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
-        "value": "sentinel",
-        "version": 3,
+        "value": 0,
+        "version": 4,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 4
 
@@ -3343,6 +3386,7 @@ def test_list_rows_public_doesnt_show_hidden_columns(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
     assert response_json == {
         "count": 1,
+        "count_is_exact": True,
         "next": None,
         "previous": None,
         "results": [
@@ -4952,3 +4996,63 @@ def test_list_grid_rows_adhoc_filtering_advanced_filters(api_client, data_fixtur
         response_json = response.json()
         assert response.status_code == HTTP_400_BAD_REQUEST
         assert response_json["error"] == "ERROR_FILTERS_PARAM_VALIDATION_ERROR"
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD=1)
+def test_list_rows_with_estimated_count_paginates_on_the_actual_rows(
+    api_client, data_fixture
+):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    rows = [model.objects.create() for _ in range(3)]
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+
+    # The estimate is lower than the actual number of rows.
+    with patch.object(ViewHandler, "_get_estimated_row_count", return_value=1):
+        response = api_client.get(
+            url, {"size": 1, "page": 2}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        response_json = response.json()
+        assert response.status_code == HTTP_200_OK
+        assert response_json["count"] == 1
+        assert response_json["count_is_exact"] is False
+        assert response_json["previous"]
+        assert response_json["next"]
+        assert [row["id"] for row in response_json["results"]] == [rows[1].id]
+
+        response = api_client.get(
+            url, {"size": 1, "page": 3}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        response_json = response.json()
+        assert response.status_code == HTTP_200_OK
+        assert not response_json["next"]
+        assert [row["id"] for row in response_json["results"]] == [rows[2].id]
+
+        response = api_client.get(
+            url, {"limit": 1, "offset": 1}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        response_json = response.json()
+        assert response.status_code == HTTP_200_OK
+        assert response_json["count"] == 1
+        assert "offset=2" in response_json["next"]
+        assert [row["id"] for row in response_json["results"]] == [rows[1].id]
+
+    # The estimate is higher than the actual number of rows.
+    with patch.object(ViewHandler, "_get_estimated_row_count", return_value=100):
+        response = api_client.get(
+            url, {"size": 1, "page": 4}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()["error"] == "ERROR_INVALID_PAGE"
+
+        response = api_client.get(
+            url, {"limit": 2, "offset": 2}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        response_json = response.json()
+        assert response.status_code == HTTP_200_OK
+        assert response_json["count"] == 100
+        assert not response_json["next"]
+        assert [row["id"] for row in response_json["results"]] == [rows[2].id]
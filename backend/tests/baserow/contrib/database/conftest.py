@@ -3,6 +3,8 @@ from unittest.mock import patch
 import pytest
 from fakeredis import FakeRedis, FakeServer
 
+from baserow.contrib.database.webhooks.validators import close_webhook_session
+
 
 @pytest.fixture(scope="function", autouse=True)
 def mock_periodic_field_update_handler_redis_client():
@@ -12,3 +14,10 @@ def mock_periodic_field_update_handler_redis_client():
         redis_client_fn, lambda: FakeRedis(server=fake_redis_server)
     ) as _fixture:
         yield _fixture
+
+
+@pytest.fixture(scope="function", autouse=True)
+def close_webhook_session_after_test():
+    # The mocked connections kept alive by the session must not leak into other tests.
+    yield
+    close_webhook_session()
@@ -0,0 +1,97 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from baserow.contrib.database.db.bulk_insert import bulk_insert_with_copy
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+@pytest.mark.django_db
+def test_bulk_insert_with_copy(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    date_field = data_fixture.create_date_field(table=table)
+    file_field = data_fixture.create_file_field(table=table)
+    autonumber_field = data_fixture.create_autonumber_field(table=table)
+    model = table.get_model()
+
+    rows = [
+        model(
+            order=Decimal("1.00000000000000000000"),
+            **{
+                text_field.db_column: "tab\tnew line\nback\\slash",
+                number_field.db_column: Decimal("1.50"),
+                boolean_field.db_column: True,
+                date_field.db_column: date(2020, 1, 1),
+                file_field.db_column: [{"name": "a.txt"}],
+            },
+        ),
+        model(order=Decimal("2.00000000000000000000")),
+    ]
+
+    with CaptureQueriesContext(connection) as captured:
+        inserted_rows = bulk_insert_with_copy(model, rows)
+
+    assert not any("INSERT" in query["sql"] for query in captured.captured_queries)
+    assert inserted_rows[0].id is not None
+    assert inserted_rows[1].id == inserted_rows[0].id + 1
+    assert getattr(inserted_rows[0], autonumber_field.db_column) == 1
+    assert getattr(inserted_rows[1], autonumber_field.db_column) == 2
+
+    row_1, row_2 = model.objects.order_by("id")
+    assert row_1.id == inserted_rows[0].id
+    assert getattr(row_1, text_field.db_column) == "tab\tnew line\nback\\slash"
+    assert getattr(row_1, number_field.db_column) == Decimal("1.50")
+    assert getattr(row_1, boolean_field.db_column) is True
+    assert getattr(row_1, date_field.db_column) == date(2020, 1, 1)
+    assert getattr(row_1, file_field.db_column) == [{"name": "a.txt"}]
+    assert getattr(row_1, autonumber_field.db_column) == 1
+    assert row_1.created_on is not None
+    assert row_1.needs_background_update is True
+    assert getattr(row_2, text_field.db_column) is None
+    assert getattr(row_2, boolean_field.db_column) is False
+    assert getattr(row_2, autonumber_field.db_column) == 2
+
+
+@pytest.mark.django_db
+def test_import_rows_inserts_rows_and_relations_with_copy(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    linked_table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, order=1)
+    link_field = data_fixture.create_link_row_field(
+        table=table, link_row_table=linked_table, order=2
+    )
+    linked_model = linked_table.get_model()
+    linked_row = linked_model.objects.create()
+
+    with CaptureQueriesContext(connection) as captured:
+        rows, report = RowHandler().import_rows(
+            user, table, [["a", [linked_row.id]], ["b", []]]
+        )
+
+    assert report == {}
+    assert not any(
+        str(query["sql"]).startswith("INSERT INTO")
+        and (
+            table.get_database_table_name() in query["sql"]
+            or link_field.through_table_name in query["sql"]
+        )
+        for query in captured.captured_queries
+    )
+
+    model = table.get_model()
+    row_a, row_b = model.objects.order_by("order", "id")
+    assert [row_a.id, row_b.id] == [row.id for row in rows]
+    assert getattr(row_a, text_field.db_column) == "a"
+    assert [r.id for r in getattr(row_a, link_field.db_column).all()] == [linked_row.id]
+    assert getattr(row_b, link_field.db_column).count() == 0
@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
 from io import BytesIO
 from typing import List
 from unittest.mock import MagicMock, patch
@@ -7,6 +8,8 @@ from django.db import connection
 from django.test.utils import CaptureQueriesContext
 from django.utils.dateparse import parse_date, parse_datetime
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from freezegun import freeze_time
 
@@ -20,6 +23,7 @@ from baserow.contrib.database.export.exceptions import (
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
+from baserow.contrib.database.export.file_writer import PaginatedExportJobFileWriter
 from baserow.contrib.database.export.handler import ExportHandler
 from baserow.contrib.database.export.models import (
     EXPORT_JOB_CANCELLED_STATUS,
@@ -34,6 +38,9 @@ from baserow.contrib.database.export.registries import (
     TableExporter,
     table_exporter_registry,
 )
+from baserow.contrib.database.export.table_exporters.parquet_table_exporter import (
+    ParquetQuerysetSerializer,
+)
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.exceptions import ViewNotInTable
@@ -961,3 +968,102 @@ def test_csv_is_escaped(get_storage_mock, data_fixture):
     bom = "\ufeff"
     expected = bom + "id,text_field\r\n1,'=1+2\r\n"
     assert contents == expected
+
+
+@pytest.mark.django_db
+def test_paginated_export_job_file_writer_streams_rows(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    for value in ["a", "b", "c"]:
+        model.objects.create(**{text_field.db_column: value})
+    job = ExportHandler().create_pending_export_job(
+        user, table, None, {"exporter_type": "csv"}
+    )
+
+    written = []
+    file_writer = PaginatedExportJobFileWriter(BytesIO(), job)
+    file_writer.EXPORT_JOB_CHUNK_SIZE = 2
+    file_writer.write_rows(
+        model.objects.all(),
+        lambda row, is_last_row: written.append(
+            (getattr(row, text_field.db_column), is_last_row)
+        ),
+    )
+
+    assert written == [("a", False), ("b", False), ("c", True)]
+    job.refresh_from_db()
+    assert job.progress_percentage == 100
+
+    written = []
+    file_writer.write_rows(
+        model.objects.none(), lambda row, is_last_row: written.append(row)
+    )
+    assert written == []
+
+
+@pytest.mark.django_db
+def test_paginated_export_job_file_writer_stops_if_job_is_cancelled(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    model.objects.create()
+    job = ExportHandler().create_pending_export_job(
+        user, table, None, {"exporter_type": "csv"}
+    )
+    ExportJob.objects.filter(id=job.id).update(state=EXPORT_JOB_CANCELLED_STATUS)
+
+    file_writer = PaginatedExportJobFileWriter(BytesIO(), job)
+    with pytest.raises(ExportJobCanceledException):
+        file_writer.write_rows(model.objects.all(), lambda row, is_last_row: None)
+
+
+@pytest.mark.django_db
+def test_parquet_export_writes_typed_columns(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text", order=0)
+    number_field = data_fixture.create_number_field(
+        table=table, name="number", number_decimal_places=2, order=1
+    )
+    boolean_field = data_fixture.create_boolean_field(
+        table=table, name="boolean", order=2
+    )
+    date_field = data_fixture.create_date_field(
+        table=table, name="date", date_include_time=False, order=3
+    )
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{
+            text_field.db_column: "a",
+            number_field.db_column: Decimal("1.50"),
+            boolean_field.db_column: True,
+            date_field.db_column: date(2020, 1, 1),
+        }
+    )
+    row_2 = model.objects.create(**{text_field.db_column: "b"})
+    job = ExportHandler().create_pending_export_job(
+        user, table, None, {"exporter_type": "csv"}
+    )
+
+    file = BytesIO()
+    serializer = ParquetQuerysetSerializer.for_table(table)
+    serializer.write_to_file(PaginatedExportJobFileWriter(file, job))
+
+    file.seek(0)
+    result = pq.read_table(file)
+    assert result.schema.names == ["id", "text", "number", "boolean", "date"]
+    assert result.schema.field("number").type == pa.decimal256(52, 2)
+    assert result.schema.field("boolean").type == pa.bool_()
+    assert result.schema.field("date").type == pa.date32()
+    assert result.to_pylist() == [
+        {
+            "id": row_1.id,
+            "text": "a",
+            "number": Decimal("1.50"),
+            "boolean": True,
+            "date": date(2020, 1, 1),
+        },
+        {"id": row_2.id, "text": "b", "number": None, "boolean": False, "date": None},
+    ]
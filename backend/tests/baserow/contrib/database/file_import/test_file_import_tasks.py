@@ -1,6 +1,8 @@
+import json
 from datetime import datetime, timedelta, timezone
 
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.test.utils import override_settings
 
 import pytest
@@ -500,6 +502,31 @@ def test_run_file_import_test_chunk(data_fixture, patch_filefield_storage):
     assert job.progress_percentage == 100
 
 
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_with_legacy_data_file(
+    data_fixture, patch_filefield_storage
+):
+    data = [["A", "B"], ["1-1", "1-2"], ["2-1", "2-2"]]
+
+    with patch_filefield_storage():
+        # Data files used to contain all the rows in a single JSON array.
+        job = data_fixture.create_file_import_job(
+            data=data, data_file=ContentFile(json.dumps(data))
+        )
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+
+    model = job.table.get_model()
+    text_fields = TextField.objects.filter(table=job.table).order_by("order")
+    assert [field.name for field in text_fields] == ["A", "B"]
+    assert [
+        [getattr(row, field.db_column) for field in text_fields]
+        for row in model.objects.all()
+    ] == [["1-1", "1-2"], ["2-1", "2-2"]]
+
+
 @pytest.mark.django_db()
 def test_run_file_import_limit(data_fixture, patch_filefield_storage):
     row_count = 2000
@@ -0,0 +1,82 @@
+import pickle
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test.utils import override_settings
+
+import pytest
+
+from baserow.contrib.database.formula import FormulaHandler
+from baserow.contrib.database.formula.handler import (
+    _get_cached_untyped_expression,
+    _get_untyped_expression_cache_key,
+)
+from baserow.contrib.database.formula.parser.ast_mapper import (
+    raw_formula_to_untyped_expression,
+)
+from baserow.contrib.database.formula.registries import formula_function_registry
+from baserow.core.formula.parser.exceptions import BaserowFormulaSyntaxError
+
+
+@pytest.fixture(autouse=True)
+def clear_untyped_expression_cache():
+    _get_cached_untyped_expression.cache_clear()
+    yield
+    _get_cached_untyped_expression.cache_clear()
+
+
+@patch(
+    "baserow.contrib.database.formula.handler.raw_formula_to_untyped_expression",
+    wraps=raw_formula_to_untyped_expression,
+)
+def test_raw_formula_to_untyped_expression_is_cached(mock_parse):
+    formula = "concat(field('a'), 'b')"
+
+    expression_1 = FormulaHandler.raw_formula_to_untyped_expression(formula)
+    expression_2 = FormulaHandler.raw_formula_to_untyped_expression(formula)
+
+    mock_parse.assert_called_once_with(formula)
+    assert str(expression_1) == str(expression_2)
+    # Every caller gets its own copy because the expressions are modified when
+    # they're typed, but the function definitions are shared.
+    assert expression_1 is not expression_2
+    assert expression_1.args[0] is not expression_2.args[0]
+    assert expression_1.function_def is formula_function_registry.get("concat")
+    assert expression_2.function_def is formula_function_registry.get("concat")
+
+
+def test_raw_formula_to_untyped_expression_syntax_errors_are_not_cached():
+    for _ in range(2):
+        with pytest.raises(BaserowFormulaSyntaxError):
+            FormulaHandler.raw_formula_to_untyped_expression("concat(")
+    assert _get_cached_untyped_expression.cache_info().currsize == 0
+
+
+def test_pickled_untyped_expression_references_registered_functions():
+    expression = FormulaHandler.raw_formula_to_untyped_expression("upper('a')")
+
+    unpickled_expression = pickle.loads(pickle.dumps(expression))
+
+    assert str(unpickled_expression) == str(expression)
+    assert unpickled_expression.function_def is formula_function_registry.get("upper")
+
+
+@override_settings(BASEROW_FORMULA_AST_SHARED_CACHE_TIMEOUT=60)
+@patch(
+    "baserow.contrib.database.formula.handler.raw_formula_to_untyped_expression",
+    wraps=raw_formula_to_untyped_expression,
+)
+def test_raw_formula_to_untyped_expression_uses_shared_cache(mock_parse):
+    formula = "lower('shared')"
+    cache.delete(_get_untyped_expression_cache_key(formula))
+
+    expression = FormulaHandler.raw_formula_to_untyped_expression(formula)
+    assert mock_parse.call_count == 1
+    assert str(cache.get(_get_untyped_expression_cache_key(formula))) == str(expression)
+
+    # Another process only has the expression in the shared cache.
+    _get_cached_untyped_expression.cache_clear()
+    assert str(FormulaHandler.raw_formula_to_untyped_expression(formula)) == str(
+        expression
+    )
+    assert mock_parse.call_count == 1
@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
 from django.db import connection, models
-from django.test.utils import CaptureQueriesContext
+from django.test.utils import CaptureQueriesContext, override_settings
 
 import pytest
 from freezegun import freeze_time
@@ -16,7 +16,10 @@ from baserow.contrib.database.api.utils import (
     extract_user_field_names_from_params,
     get_include_exclude_fields,
 )
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.rows.exceptions import (
+    ReportMaxErrorCountExceeded,
+    RowDoesNotExist,
+)
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.trash.handler import TrashHandler
@@ -1071,6 +1074,60 @@ def test_import_rows_with_read_only_field(
     assert len(rows) == 0
 
 
+@pytest.mark.django_db
+def test_import_rows_by_chunk(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name", order=1)
+    data_fixture.create_number_field(table=table, name="Speed", order=2)
+
+    data = [
+        ["Tesla", 240],
+        ["Giulietta", "bad"],
+        ["Panda", 160],
+        ["Clio", 180],
+        ["Twingo", 150, "too many values"],
+    ]
+
+    row_ids, report = RowHandler().import_rows_by_chunk(
+        user=user,
+        table=table,
+        data=(row for row in data),
+        row_count=len(data),
+        chunk_size=2,
+    )
+
+    assert sorted(report.keys()) == [1, 4]
+    model = table.get_model()
+    assert list(model.objects.order_by("id").values_list("id", flat=True)) == row_ids
+    assert [
+        getattr(row, name_field.db_column) for row in model.objects.order_by("id")
+    ] == [
+        "Tesla",
+        "Panda",
+        "Clio",
+    ]
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MAX_ROW_REPORT_ERROR_COUNT=2)
+def test_import_rows_by_chunk_error_limit_is_shared_by_chunks(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_number_field(table=table, name="Speed", order=1)
+
+    with pytest.raises(ReportMaxErrorCountExceeded) as exc:
+        RowHandler().import_rows_by_chunk(
+            user=user,
+            table=table,
+            data=[["bad"], [1], ["bad"], [2], ["bad"]],
+            row_count=5,
+            chunk_size=2,
+        )
+
+    assert sorted(exc.value.report.keys()) == [0, 2]
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.rows.signals.rows_updated.send")
 @patch("baserow.contrib.database.rows.signals.before_rows_update.send")
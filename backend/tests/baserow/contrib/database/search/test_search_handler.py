@@ -4,9 +4,20 @@ from django.db import connection
 from django.test.utils import override_settings
 
 import pytest
+from freezegun import freeze_time
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.search.handler import SearchHandler, SearchModes
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.exceptions import (
+    WorkspaceSearchIndexDisabledException,
+)
+from baserow.contrib.database.search.handler import (
+    SearchHandler,
+    SearchModes,
+    TrigramIndexingHandler,
+    WorkspaceSearchHandler,
+)
+from baserow.contrib.database.table.constants import ROW_SEARCH_DOCUMENT_COLUMN_NAME
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -402,3 +413,360 @@ def test_split_update_into_chunks_until_all_background_done(data_fixture):
     assert rows[2].needs_background_update is False
     assert getattr(rows[3], field.tsv_db_column) == "'4':2 'test':1"
     assert rows[3].needs_background_update is False
+
+
+@pytest.mark.django_db
+def test_trigram_search(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    email_field = data_fixture.create_email_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{text_field.db_column: "Hello world", number_field.db_column: 10}
+    )
+    row_2 = model.objects.create(
+        **{email_field.db_column: "peter@baserow.io", number_field.db_column: 42}
+    )
+    SearchHandler.update_tsvector_columns(table, False)
+
+    def search(value, only_search_by_field_ids=None):
+        return list(
+            model.objects.all()
+            .search_all_fields(
+                value, only_search_by_field_ids, search_mode=SearchModes.MODE_TRIGRAM
+            )
+            .order_by("id")
+        )
+
+    assert search("LO WOR") == [row_1]
+    assert search("row.i") == [row_2]
+    assert search("42") == [row_2]
+    assert search(str(row_1.id)) == [row_1]
+    assert search("nothing") == []
+    assert search("world", only_search_by_field_ids=[email_field.id]) == []
+
+
+@pytest.mark.django_db
+def test_trigram_indexes_are_created_and_dropped_on_type_change(data_fixture):
+    if not TrigramIndexingHandler.extension_is_available():
+        pytest.skip("The pg_trgm extension isn't available.")
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    long_text_field = data_fixture.create_long_text_field(table=table)
+    data_fixture.create_number_field(table=table)
+
+    model = table.get_model()
+    assert TrigramIndexingHandler.get_fields_missing_index(model) == [
+        text_field,
+        long_text_field,
+    ]
+
+    assert TrigramIndexingHandler.update_indexes(table) == [
+        text_field.trigram_index_name,
+        long_text_field.trigram_index_name,
+    ]
+    assert TrigramIndexingHandler.get_fields_missing_index(model) == []
+    assert TrigramIndexingHandler.update_indexes(table) == []
+
+    FieldHandler().update_field(user, long_text_field, new_type_name="number")
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexname FROM pg_indexes WHERE indexname = %s",
+            [long_text_field.trigram_index_name],
+        )
+        assert cursor.fetchone() is None
+
+
+@pytest.mark.django_db
+@override_settings(AUTO_INDEX_TRIGRAM_SEARCH_ENABLED=True)
+@patch("baserow.contrib.database.search.tasks.schedule_trigram_index_update")
+def test_trigram_search_schedules_missing_index_creation(
+    mock_schedule_trigram_index_update, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+
+    model = table.get_model()
+    model.objects.all().search_all_fields(
+        "test", [number_field.id], search_mode=SearchModes.MODE_TRIGRAM
+    )
+    mock_schedule_trigram_index_update.assert_not_called()
+
+    model.objects.all().search_all_fields(
+        "test", [text_field.id], search_mode=SearchModes.MODE_TRIGRAM
+    )
+    mock_schedule_trigram_index_update.assert_called_once_with(table.id)
+
+
+@pytest.mark.django_db
+@override_settings(AUTO_INDEX_TRIGRAM_SEARCH_ENABLED=True)
+@patch("baserow.contrib.database.search.tasks.schedule_trigram_index_update")
+def test_trigram_index_existence_is_cached(
+    mock_schedule_trigram_index_update, data_fixture, django_assert_num_queries
+):
+    if not TrigramIndexingHandler.extension_is_available():
+        pytest.skip("The pg_trgm extension isn't available.")
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+
+    TrigramIndexingHandler.update_indexes(table)
+    model = table.get_model()
+    TrigramIndexingHandler.schedule_index_creation_if_needed(model)
+    with django_assert_num_queries(0):
+        TrigramIndexingHandler.schedule_index_creation_if_needed(model)
+    mock_schedule_trigram_index_update.assert_not_called()
+
+    FieldHandler().update_field(user, text_field, new_type_name="long_text")
+
+    TrigramIndexingHandler.schedule_index_creation_if_needed(table.get_model())
+    mock_schedule_trigram_index_update.assert_called_once_with(table.id)
+
+
+@pytest.mark.django_db
+@override_settings(
+    AUTO_INDEX_TRIGRAM_SEARCH_ENABLED=True, AUTO_INDEX_TRIGRAM_SEARCH_RECHECK_DELAY=60
+)
+@patch("baserow.contrib.database.search.tasks.schedule_trigram_index_update")
+def test_missing_trigram_index_is_only_rechecked_after_a_delay(
+    mock_schedule_trigram_index_update, data_fixture, django_assert_num_queries
+):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    model = table.get_model()
+
+    with freeze_time("2024-01-01 12:00"):
+        TrigramIndexingHandler.schedule_index_creation_if_needed(model)
+        mock_schedule_trigram_index_update.assert_called_once_with(table.id)
+
+        # The index creation failed or isn't done yet, but it's not scheduled again.
+        with django_assert_num_queries(0):
+            TrigramIndexingHandler.schedule_index_creation_if_needed(model)
+        mock_schedule_trigram_index_update.assert_called_once_with(table.id)
+
+    with freeze_time("2024-01-01 12:01:01"):
+        TrigramIndexingHandler.schedule_index_creation_if_needed(model)
+        assert mock_schedule_trigram_index_update.call_count == 2
+
+
+@pytest.mark.django_db
+def test_search_with_row_search_document(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(
+        user=user, row_search_document_column_added=True
+    )
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    assert not text_field.tsvector_column_created
+    assert not number_field.tsvector_column_created
+
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{text_field.db_column: "Hello world", number_field.db_column: 10}
+    )
+    row_2 = model.objects.create(
+        **{text_field.db_column: "Goodbye", number_field.db_column: 42}
+    )
+    SearchHandler.update_tsvector_columns(table, False)
+
+    document = (
+        model.objects.filter(id=row_1.id)
+        .values_list(ROW_SEARCH_DOCUMENT_COLUMN_NAME, flat=True)
+        .get()
+    )
+    # The lexemes of the primary field are weighted higher.
+    assert "'hello':1A" in document
+    assert "'world':2A" in document
+    assert "'10':3" in document
+
+    def search(value, only_search_by_field_ids=None):
+        return list(
+            model.objects.all()
+            .search_all_fields(
+                value,
+                only_search_by_field_ids,
+                search_mode=SearchModes.MODE_FT_WITH_COUNT,
+            )
+            .order_by("id")
+        )
+
+    assert search("hell") == [row_1]
+    assert search("42") == [row_2]
+    assert search("42", only_search_by_field_ids=[number_field.id]) == [row_2]
+    assert search("42", only_search_by_field_ids=[text_field.id]) == []
+    assert search("hello", only_search_by_field_ids=[]) == []
+
+
+@pytest.mark.django_db
+def test_get_ranked_search_results(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    long_text_field = data_fixture.create_long_text_field(table=table)
+
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{text_field.db_column: "Apple", long_text_field.db_column: "Pear"}
+    )
+    row_2 = model.objects.create(
+        **{
+            text_field.db_column: "Apple and apple",
+            long_text_field.db_column: "Apple pie",
+        }
+    )
+    model.objects.create(**{text_field.db_column: "Banana"})
+    SearchHandler.update_tsvector_columns(table, False)
+
+    results = SearchHandler.get_ranked_search_results(table, "appl", 10)
+    assert [result.row.id for result in results] == [row_2.id, row_1.id]
+    assert results[0].rank > results[1].rank > 0
+    assert set(results[0].highlights) == {text_field.id, long_text_field.id}
+    assert "<b>apple</b>" in results[0].highlights[text_field.id].lower()
+    assert set(results[1].highlights) == {text_field.id}
+
+    results = SearchHandler.get_ranked_search_results(table, "appl", 1)
+    assert [result.row.id for result in results] == [row_2.id]
+
+    results = SearchHandler.get_ranked_search_results(
+        table, "pie", 10, only_search_by_field_ids=[text_field.id]
+    )
+    assert results == []
+
+    assert SearchHandler.get_ranked_search_results(table, "  ", 10) == []
+
+
+@pytest.mark.django_db
+def test_get_ranked_search_results_highlights_are_html_escaped(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+
+    model = table.get_model()
+    model.objects.create(
+        **{text_field.db_column: 'apple & pear <img src="x" onerror="alert(1)">'}
+    )
+    SearchHandler.update_tsvector_columns(table, False)
+
+    results = SearchHandler.get_ranked_search_results(table, "apple", 10)
+    highlight = results[0].highlights[text_field.id]
+    assert "<img" not in highlight
+    assert "&lt;img src=&quot;x&quot;" in highlight
+    assert "<b>apple</b> &amp; pear" in highlight
+
+
+@pytest.mark.django_db
+def test_get_ranked_search_results_with_row_search_document(data_fixture):
+    table = data_fixture.create_database_table(row_search_document_column_added=True)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    long_text_field = data_fixture.create_long_text_field(table=table)
+
+    model = table.get_model()
+    row_1 = model.objects.create(**{long_text_field.db_column: "Apple"})
+    row_2 = model.objects.create(**{text_field.db_column: "Apple"})
+    SearchHandler.update_tsvector_columns(table, False)
+
+    # The matches in the primary field are ranked higher.
+    results = SearchHandler.get_ranked_search_results(table, "apple", 10)
+    assert [result.row.id for result in results] == [row_2.id, row_1.id]
+    assert set(results[0].highlights) == {text_field.id}
+    assert set(results[1].highlights) == {long_text_field.id}
+
+
+@pytest.mark.django_db
+@override_settings(PG_SEARCH_ROW_DOCUMENT_ENABLED=True)
+def test_sync_tsvector_columns_converts_table_to_row_search_document(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    assert text_field.tsvector_column_created
+
+    model = table.get_model()
+    row = model.objects.create(**{text_field.db_column: "Hello world"})
+
+    table = SearchHandler.sync_tsvector_columns(table)
+    text_field.refresh_from_db()
+    assert table.row_search_document_column_added
+    assert not text_field.tsvector_column_created
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = %s AND column_name LIKE 'tsv_%%'",
+            [table.get_database_table_name()],
+        )
+        assert [column for (column,) in cursor.fetchall()] == [
+            ROW_SEARCH_DOCUMENT_COLUMN_NAME
+        ]
+
+    SearchHandler.update_tsvector_columns(table, False)
+    model = table.get_model()
+    assert [
+        r.id
+        for r in model.objects.all().search_all_fields(
+            "world", search_mode=SearchModes.MODE_FT_WITH_COUNT
+        )
+    ] == [row.id]
+
+
+@pytest.mark.django_db
+@override_settings(WORKSPACE_SEARCH_INDEX_ENABLED=True)
+def test_workspace_search_index(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table_1 = data_fixture.create_database_table(database=database)
+    table_2 = data_fixture.create_database_table(database=database)
+    other_table = data_fixture.create_database_table()
+    text_field_1 = data_fixture.create_text_field(table=table_1)
+    text_field_2 = data_fixture.create_text_field(table=table_2, primary=True)
+    other_text_field = data_fixture.create_text_field(table=other_table)
+
+    row_handler = RowHandler()
+    row_1 = row_handler.create_row(user, table_1, {text_field_1.id: "Apple"})
+    row_2 = row_handler.create_row(user, table_2, {text_field_2.id: "Apple pie"})
+    row_handler.force_create_row(user, other_table, {other_text_field.id: "Apple"})
+
+    def update_entries(*tables):
+        for table in tables:
+            SearchHandler.update_tsvector_columns(table, True)
+
+    def search(value):
+        return [
+            (entry.table_id, entry.row_id, entry.field_id)
+            for entry in WorkspaceSearchHandler.search_workspace(
+                user, workspace, value, 10
+            )
+        ]
+
+    update_entries(table_1, table_2, other_table)
+    assert search("appl") == [
+        (table_1.id, row_1.id, text_field_1.id),
+        (table_2.id, row_2.id, text_field_2.id),
+    ]
+    assert search("  ") == []
+
+    row_handler.update_row_by_id(user, table_1, row_1.id, {text_field_1.id: "Pear"})
+    update_entries(table_1)
+    assert search("apple") == [(table_2.id, row_2.id, text_field_2.id)]
+    assert search("pear") == [(table_1.id, row_1.id, text_field_1.id)]
+
+    row_handler.delete_row_by_id(user, table_2, row_2.id)
+    assert search("apple") == []
+
+    TrashHandler.restore_item(user, "row", row_2.id, parent_trash_item_id=table_2.id)
+    update_entries(table_2)
+    assert search("apple") == [(table_2.id, row_2.id, text_field_2.id)]
+
+    FieldHandler().delete_field(user, text_field_1)
+    assert search("pear") == []
+
+    with override_settings(WORKSPACE_SEARCH_INDEX_ENABLED=False):
+        with pytest.raises(WorkspaceSearchIndexDisabledException):
+            search("apple")
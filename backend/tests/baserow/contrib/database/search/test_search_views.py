@@ -65,6 +65,7 @@ def test_search_grid_with_compat_mode(api_client, data_fixture):
     response_json = response.json()
     assert response_json == {
         "count": 1,
+        "count_is_exact": True,
         "next": None,
         "previous": None,
         "results": [
@@ -108,6 +109,7 @@ def test_search_grid_with_full_text_disabled_compat_mode_used(
     response_json = response.json()
     assert response_json == {
         "count": 1,
+        "count_is_exact": True,
         "next": None,
         "previous": None,
         "results": [
@@ -151,7 +153,7 @@ def test_count_grid_with_compat_mode(api_client, data_fixture):
     )
     assert response.status_code == HTTP_200_OK
     response_json = response.json()
-    assert response_json == {"count": 1}
+    assert response_json == {"count": 1, "count_is_exact": True}
 
 
 @pytest.mark.django_db(transaction=True)
@@ -188,6 +190,7 @@ def test_search_grid_with_full_text_with_count_mode(
     response_json = response.json()
     assert response_json == {
         "count": 1,
+        "count_is_exact": True,
         "next": None,
         "previous": None,
         "results": [
@@ -235,7 +238,7 @@ def test_count_grid_with_full_text_with_count_mode(
     )
     assert response.status_code == HTTP_200_OK
     response_json = response.json()
-    assert response_json == {"count": 1}
+    assert response_json == {"count": 1, "count_is_exact": True}
 
 
 @pytest.mark.django_db(transaction=True)
@@ -302,6 +305,7 @@ def test_search_grid_defaults_to_compat_mode_when_env_var_not_set(
     response_json = response.json()
     assert response_json == {
         "count": 1,
+        "count_is_exact": True,
         "next": None,
         "previous": None,
         "results": [
@@ -344,6 +348,7 @@ def test_search_grid_defaults_to_mode_set_via_env_var(api_client, data_fixture):
     response_json = response.json()
     assert response_json == {
         "count": 0,
+        "count_is_exact": True,
         "next": None,
         "previous": None,
         "results": [],
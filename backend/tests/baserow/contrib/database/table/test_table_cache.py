@@ -1,9 +1,18 @@
+from threading import Thread
+
+from django.db import connection
 from django.test.utils import override_settings
 
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    GeneratedModelClassLRUCache,
+    generated_model_classes_cache,
+    get_cached_model_class,
+    get_cached_model_field_attrs,
+)
+from baserow.contrib.database.table.models import Table
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +213,145 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MODEL_CLASS_CACHE_MAX_ENTRIES=10)
+def test_model_class_is_reused_until_the_table_version_changes(data_fixture):
+    generated_model_classes_cache.clear()
+    field = data_fixture.create_text_field()
+    table = field.table
+
+    model = table.get_model()
+    assert get_cached_model_class(table) is model
+    assert table.get_model() is model
+    assert table.get_model(field_ids=[field.id]) is not model
+    assert table.get_model(attribute_names=True) is not model
+
+    data_fixture.create_text_field(table=table)
+
+    table.refresh_from_db()
+    assert get_cached_model_class(table) is None
+    new_model = table.get_model()
+    assert new_model is not model
+    assert len(new_model._field_objects) == 2
+    generated_model_classes_cache.clear()
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MODEL_CLASS_CACHE_MAX_ENTRIES=10)
+def test_cached_model_class_refers_to_the_latest_table_instance(data_fixture):
+    generated_model_classes_cache.clear()
+    table = data_fixture.create_database_table()
+
+    table.get_model()
+    other_table_instance = Table.objects.get(id=table.id)
+    model = other_table_instance.get_model()
+
+    assert model.baserow_table is other_table_instance
+    generated_model_classes_cache.clear()
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_MODEL_CLASS_CACHE_MAX_ENTRIES=10)
+def test_cached_model_class_table_instance_is_not_shared_between_threads(
+    data_fixture,
+):
+    generated_model_classes_cache.clear()
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+
+    other_thread_table_instance = Table.objects.get(id=table.id)
+    other_thread_tables = []
+
+    def get_model_in_other_thread():
+        try:
+            other_thread_model = other_thread_table_instance.get_model()
+            other_thread_tables.append(
+                (other_thread_model, other_thread_model.baserow_table)
+            )
+        finally:
+            connection.close()
+
+    thread = Thread(target=get_model_in_other_thread)
+    thread.start()
+    thread.join()
+
+    assert other_thread_tables == [(model, other_thread_table_instance)]
+    assert other_thread_tables[0][1] is other_thread_table_instance
+    assert model.baserow_table is table
+    generated_model_classes_cache.clear()
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MODEL_CLASS_CACHE_MAX_ENTRIES=10)
+def test_field_type_change_invalidates_the_cached_model_class(data_fixture):
+    generated_model_classes_cache.clear()
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+
+    table.refresh_from_db()
+    model = table.get_model()
+    assert table.get_model() is model
+
+    FieldHandler().update_field(user, field, new_type_name="number")
+
+    table.refresh_from_db()
+    new_model = table.get_model()
+    assert new_model is not model
+    assert new_model._field_objects[field.id]["type"].type == "number"
+    assert table.get_model() is new_model
+    generated_model_classes_cache.clear()
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MODEL_CLASS_CACHE_MAX_ENTRIES=10)
+def test_model_class_cache_is_not_used_with_disabled_model_cache(data_fixture):
+    generated_model_classes_cache.clear()
+    table = data_fixture.create_database_table()
+
+    with override_settings(BASEROW_DISABLE_MODEL_CACHE=True):
+        model = table.get_model()
+        assert get_cached_model_class(table) is None
+        assert table.get_model() is not model
+
+
+def test_model_class_lru_cache_evicts_least_recently_used_entries():
+    cache = GeneratedModelClassLRUCache()
+
+    cache.set((1, "a"), "model_1", 1, max_entries=2, max_size=100)
+    cache.set((2, "a"), "model_2", 1, max_entries=2, max_size=100)
+    assert cache.get((1, "a")) == "model_1"
+
+    cache.set((3, "a"), "model_3", 1, max_entries=2, max_size=100)
+    assert len(cache) == 2
+    assert cache.get((1, "a")) == "model_1"
+    assert cache.get((2, "a")) is None
+    assert cache.get((3, "a")) == "model_3"
+
+
+def test_model_class_lru_cache_respects_the_max_size():
+    cache = GeneratedModelClassLRUCache()
+
+    cache.set((1, "a"), "model_1", 6, max_entries=10, max_size=10)
+    cache.set((2, "a"), "model_2", 6, max_entries=10, max_size=10)
+    assert cache.get((1, "a")) is None
+    assert cache.get((2, "a")) == "model_2"
+
+    cache.set((3, "a"), "model_3", 11, max_entries=10, max_size=10)
+    assert cache.get((3, "a")) is None
+    assert cache.get((2, "a")) == "model_2"
+
+
+def test_model_class_lru_cache_delete_table():
+    cache = GeneratedModelClassLRUCache()
+
+    cache.set((1, "a"), "model_1a", 1, max_entries=10, max_size=10)
+    cache.set((1, "b"), "model_1b", 1, max_entries=10, max_size=10)
+    cache.set((2, "a"), "model_2", 1, max_entries=10, max_size=10)
+
+    cache.delete_table(1)
+
+    assert len(cache) == 1
+    assert cache.get((2, "a")) == "model_2"
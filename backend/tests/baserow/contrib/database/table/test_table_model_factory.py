@@ -0,0 +1,86 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+import pytest
+
+from baserow.contrib.database.fields.field_cache import FieldCache
+from baserow.contrib.database.table.model_factory import TableModelFactory
+from baserow.contrib.database.table.models import Table
+
+
+@pytest.mark.django_db
+def test_table_model_factory_get_models(data_fixture):
+    database = data_fixture.create_database_application()
+    table_a = data_fixture.create_database_table(database=database)
+    table_b = data_fixture.create_database_table(database=database)
+    field_a = data_fixture.create_text_field(table=table_a)
+    field_b = data_fixture.create_number_field(table=table_b)
+
+    models = TableModelFactory.get_models([table_a, table_b])
+
+    assert set(models.keys()) == {table_a.id, table_b.id}
+    assert models[table_a.id].baserow_table_id == table_a.id
+    assert models[table_b.id].baserow_table_id == table_b.id
+    assert list(models[table_a.id]._field_objects.keys()) == [field_a.id]
+    assert list(models[table_b.id]._field_objects.keys()) == [field_b.id]
+
+
+@pytest.mark.django_db
+def test_table_model_factory_get_models_uses_the_latest_version(data_fixture):
+    table = data_fixture.create_database_table()
+    outdated_table = Table.objects.get(id=table.id)
+    data_fixture.create_text_field(table=table)
+    table.refresh_from_db()
+
+    models = TableModelFactory.get_models([outdated_table])
+
+    assert outdated_table.version == table.version
+    assert len(models[table.id]._field_objects) == 1
+
+
+@pytest.mark.django_db
+def test_table_model_factory_get_models_fetches_versions_in_one_query(
+    data_fixture,
+):
+    database = data_fixture.create_database_application()
+    tables = [data_fixture.create_database_table(database=database) for _ in range(3)]
+    for table in tables:
+        data_fixture.create_text_field(table=table)
+
+    # Populate the field attrs cache for all the tables.
+    TableModelFactory.get_models(tables)
+
+    with CaptureQueriesContext(connection) as captured:
+        TableModelFactory.get_models(tables)
+
+    version_queries = [
+        query
+        for query in captured.captured_queries
+        if '"database_table"."version"' in query["sql"]
+    ]
+    assert len(version_queries) == 1
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_DISABLE_MODEL_CACHE=True)
+def test_table_model_factory_get_models_with_disabled_cache(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table)
+
+    models = TableModelFactory.get_models([table])
+
+    assert len(models[table.id]._field_objects) == 1
+
+
+@pytest.mark.django_db
+def test_field_cache_get_models_only_generates_uncached_models(data_fixture):
+    database = data_fixture.create_database_application()
+    table_a = data_fixture.create_database_table(database=database)
+    table_b = data_fixture.create_database_table(database=database)
+
+    field_cache = FieldCache()
+    model_a = field_cache.get_model(table_a)
+    models = field_cache.get_models([table_a, table_b])
+
+    assert models[table_a.id] is model_a
+    assert models[table_b.id] is field_cache.get_model(table_b)
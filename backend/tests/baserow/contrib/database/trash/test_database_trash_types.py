@@ -2,7 +2,8 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 from django.conf import settings
-from django.db import connection
+from django.db import OperationalError, connection
+from django.test.utils import override_settings
 from django.urls import reverse
 
 import pytest
@@ -30,6 +31,7 @@ from baserow.core.trash.exceptions import (
     RelatedTableTrashedException,
 )
 from baserow.core.trash.handler import TrashHandler
+from baserow.core.trash.registries import trash_item_type_registry
 
 
 @pytest.mark.django_db
@@ -67,7 +69,7 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
     invalidate_table_in_model_cache(table.id)
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(19):
         TrashHandler.permanently_delete_marked_trash()
 
     row_2 = handler.create_row(user=user, table=table)
@@ -82,21 +84,94 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
     invalidate_table_in_model_cache(table.id)
-    # We only want 8 more queries when deleting 2 rows instead of 1 compared to
-    # above:
-    # 1. An extra query to open the second trash entries savepoint
-    # 2. An extra query to lookup the second trash entry
-    # 3. A query to lookup the extra row we are deleting
-    # 4. A query to delete said row
-    # 5. A query to delete it's trash entry.
-    # 6. A query to delete any related row comments.
-    # 7. An extra query to close the second trash entries savepoint
-    # 8. An extra query to delete user mentions on the second row.
-    # If we weren't caching the table models an extra number of queries would be first
-    # performed to lookup the table information which breaks this assertion.
-    with django_assert_num_queries(23):
+    # The rows of the same table are deleted together with set based queries after
+    # looking up the table model once, so deleting more rows doesn't need more
+    # queries.
+    with django_assert_num_queries(19):
         TrashHandler.permanently_delete_marked_trash()
 
+    assert model.objects_and_trash.count() == 0
+    assert TrashEntry.objects.count() == 0
+
+
+@pytest.mark.django_db
+@patch("baserow.core.trash.handler.items_permanently_deleted.send")
+def test_perm_deleting_rows_and_batches_of_rows_in_bulk(send_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    other_table = data_fixture.create_database_table(user=user, database=table.database)
+    workspace = table.database.workspace
+
+    handler = RowHandler()
+    model = table.get_model()
+    other_model = other_table.get_model()
+    rows = [handler.create_row(user=user, table=table) for _ in range(3)]
+    other_row = handler.create_row(user=user, table=other_table)
+    kept_row = handler.create_row(user=user, table=table)
+
+    TrashHandler.trash(user, workspace, table.database, rows[0])
+    TrashHandler.trash(user, workspace, table.database, other_row)
+    handler.delete_rows(user, table, row_ids=[rows[1].id, rows[2].id])
+    trashed_rows = TrashedRows.objects.get()
+
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+    TrashHandler.permanently_delete_marked_trash()
+
+    assert list(model.objects_and_trash.values_list("id", flat=True)) == [kept_row.id]
+    assert other_model.objects_and_trash.count() == 0
+    assert TrashedRows.objects.count() == 0
+    assert TrashEntry.objects.count() == 0
+
+    signals = {
+        (call.kwargs["sender"], call.kwargs["parent_id"]): call.kwargs["trash_item_ids"]
+        for call in send_mock.call_args_list
+    }
+    assert signals == {
+        ("row", table.id): [rows[0].id],
+        ("row", other_table.id): [other_row.id],
+        ("rows", table.id): [trashed_rows.id],
+    }
+
+
+@pytest.mark.django_db
+@override_settings(TRASH_PERMANENT_DELETION_BATCH_SIZE=4)
+def test_perm_deleting_rows_in_bulk_halves_the_batch_size_when_exceeding_locks(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+
+    handler = RowHandler()
+    model = table.get_model()
+    rows = [handler.create_row(user=user, table=table) for _ in range(3)]
+    for row in rows:
+        TrashHandler.trash(user, table.database.workspace, table.database, row)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    row_trash_item_type = trash_item_type_registry.get("row")
+    delete_items_in_bulk = row_trash_item_type.permanently_delete_items_in_bulk
+    batch_sizes = []
+
+    def permanently_delete_items_in_small_batches(parent_id, trash_entries, cache):
+        batch_sizes.append(len(trash_entries))
+        if len(trash_entries) > 1:
+            raise OperationalError(
+                "ERROR: out of shared memory\n"
+                "HINT: You might need to increase max_locks_per_transaction."
+            )
+        return delete_items_in_bulk(parent_id, trash_entries, cache)
+
+    with patch.object(
+        row_trash_item_type,
+        "permanently_delete_items_in_bulk",
+        side_effect=permanently_delete_items_in_small_batches,
+    ):
+        TrashHandler.permanently_delete_marked_trash()
+
+    assert batch_sizes == [3, 2, 1, 1, 1]
+    assert model.objects_and_trash.count() == 0
+    assert TrashEntry.objects.count() == 0
+
 
 @pytest.mark.django_db
 def test_can_delete_fields_and_rows_in_the_same_perm_delete_batch(
@@ -0,0 +1,324 @@
+from unittest.mock import patch
+
+from django.test.utils import override_settings
+
+import pytest
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.trash.handler import RowArchiveHandler
+from baserow.contrib.database.trash.models import ArchivedRow
+from baserow.core.models import TrashEntry
+from baserow.core.trash.handler import TrashHandler
+
+
+@pytest.mark.django_db
+@override_settings(TRASH_ARCHIVE_ROWS=True)
+@patch("baserow.contrib.database.trash.tasks.archive_trashed_rows.delay")
+def test_trashing_rows_schedules_their_archiving(
+    mock_delay, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    rows = [RowHandler().create_row(user, table) for _ in range(3)]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().delete_row(user, table, rows[0])
+        RowHandler().delete_rows(user, table, [rows[1].id, rows[2].id])
+
+    assert [call.args for call in mock_delay.call_args_list] == [
+        (table.id, [rows[0].id]),
+        (table.id, [rows[1].id, rows[2].id]),
+    ]
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.trash.tasks.archive_trashed_rows.delay")
+def test_trashing_rows_doesnt_archive_them_by_default(
+    mock_delay, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    row = RowHandler().create_row(user, table)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().delete_row(user, table, row)
+
+    mock_delay.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_archive_and_restore_trashed_row_with_relations(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user, database=table.database)
+    text_field = data_fixture.create_text_field(table=table)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=other_table
+    )
+    other_row = RowHandler().create_row(user, other_table)
+    row = RowHandler().create_row(
+        user,
+        table,
+        values={text_field.db_column: "Car", link_field.db_column: [other_row.id]},
+    )
+    kept_row = RowHandler().create_row(user, table)
+    model = table.get_model()
+    through_model = model._meta.get_field(link_field.db_column).remote_field.through
+
+    RowHandler().delete_row(user, table, row)
+    assert RowArchiveHandler().archive_trashed_rows(table) == [row.id]
+
+    assert list(model.objects_and_trash.values_list("id", flat=True)) == [kept_row.id]
+    assert through_model.objects.count() == 0
+    archived_row = ArchivedRow.objects.get(table=table, row_id=row.id)
+    assert archived_row.values[text_field.db_column] == "Car"
+    assert archived_row.values["trashed"] is True
+
+    TrashHandler.restore_item(user, "row", row.id, parent_trash_item_id=table.id)
+
+    assert ArchivedRow.objects.count() == 0
+    restored_row = model.objects.get(id=row.id)
+    assert getattr(restored_row, text_field.db_column) == "Car"
+    linked_rows = getattr(restored_row, link_field.db_column).all()
+    assert [linked_row.id for linked_row in linked_rows] == [other_row.id]
+
+
+@pytest.mark.django_db
+def test_restoring_archived_rows_sets_defaults_of_new_fields(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    row_ids = [RowHandler().create_row(user, table).id for _ in range(2)]
+
+    RowHandler().delete_rows(user, table, row_ids)
+    assert RowArchiveHandler().archive_trashed_rows(table) == row_ids
+
+    boolean_field = FieldHandler().create_field(user, table, "boolean", name="Bool")
+    TrashHandler.restore_item(
+        user, "rows", TrashEntry.objects.get().trash_item_id, table.id
+    )
+
+    model = table.get_model()
+    assert list(
+        model.objects.order_by("id").values_list("id", boolean_field.db_column)
+    ) == [(row_ids[0], False), (row_ids[1], False)]
+
+
+@pytest.mark.django_db
+@override_settings(TRASH_ARCHIVE_ROWS=True)
+def test_updating_a_field_restores_the_archived_rows_first(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    row = RowHandler().create_row(user, table, values={text_field.db_column: "12"})
+
+    RowHandler().delete_row(user, table, row)
+    RowArchiveHandler().archive_trashed_rows(table)
+
+    with patch(
+        "baserow.contrib.database.trash.tasks.archive_trashed_rows.delay"
+    ) as mock_delay, django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().update_field(user, text_field, new_type_name="number")
+
+    mock_delay.assert_any_call(table.id, None)
+    assert ArchivedRow.objects.count() == 0
+    model = table.get_model()
+    assert getattr(model.trash.get(id=row.id), text_field.db_column) == 12
+
+
+@pytest.mark.django_db
+@override_settings(TRASH_ARCHIVE_ROWS=True)
+def test_renaming_a_field_doesnt_restore_the_archived_rows(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    row = RowHandler().create_row(user, table)
+
+    RowHandler().delete_row(user, table, row)
+    RowArchiveHandler().archive_trashed_rows(table)
+
+    with patch(
+        "baserow.contrib.database.trash.tasks.archive_trashed_rows.delay"
+    ) as mock_delay, django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().update_field(
+            user,
+            number_field,
+            name="Renamed",
+            number_decimal_places=number_field.number_decimal_places,
+        )
+
+    mock_delay.assert_not_called()
+    assert ArchivedRow.objects.filter(table=table, row_id=row.id).exists()
+
+
+@pytest.mark.django_db
+def test_perm_deleting_archived_rows(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    rows = [RowHandler().create_row(user, table) for _ in range(3)]
+
+    RowHandler().delete_row(user, table, rows[0])
+    RowHandler().delete_rows(user, table, [rows[1].id, rows[2].id])
+    RowArchiveHandler().archive_trashed_rows(table)
+    assert ArchivedRow.objects.count() == 3
+
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+    TrashHandler.permanently_delete_marked_trash()
+
+    assert ArchivedRow.objects.count() == 0
+    assert TrashEntry.objects.count() == 0
+    assert table.get_model().objects_and_trash.count() == 0
+
+
+@pytest.mark.django_db
+@override_settings(TRASH_ARCHIVE_ROWS=True)
+def test_creating_a_field_restores_the_archived_rows_first(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    row = RowHandler().create_row(user, table, values={text_field.db_column: "Car"})
+
+    RowHandler().delete_row(user, table, row)
+    RowArchiveHandler().archive_trashed_rows(table)
+
+    with patch(
+        "baserow.contrib.database.trash.tasks.archive_trashed_rows.delay"
+    ) as mock_delay, django_capture_on_commit_callbacks(execute=True):
+        formula_field = FieldHandler().create_field(
+            user, table, "formula", name="Formula", formula="concat(field('Name'), '!')"
+        )
+
+    mock_delay.assert_any_call(table.id, None)
+    assert ArchivedRow.objects.count() == 0
+    model = table.get_model()
+    assert getattr(model.trash.get(id=row.id), formula_field.db_column) == "Car!"
+
+
+@pytest.mark.django_db
+@override_settings(TRASH_ARCHIVE_ROWS=True)
+def test_changing_a_formula_type_from_another_table_restores_the_archived_rows(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user, database=table.database)
+    number_field = data_fixture.create_number_field(table=other_table, name="Number")
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=other_table
+    )
+    formula_field = FieldHandler().create_field(
+        user, table, "formula", name="Max", formula="max(lookup('Link', 'Number'))"
+    )
+    other_row = RowHandler().create_row(
+        user, other_table, values={number_field.db_column: 2}
+    )
+    row = RowHandler().create_row(
+        user, table, values={link_field.db_column: [other_row.id]}
+    )
+
+    RowHandler().delete_row(user, table, row)
+    RowArchiveHandler().archive_trashed_rows(table)
+
+    with patch(
+        "baserow.contrib.database.trash.tasks.archive_trashed_rows.delay"
+    ) as mock_delay, django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().update_field(user, number_field, new_type_name="text")
+
+    mock_delay.assert_any_call(table.id, None)
+    assert ArchivedRow.objects.count() == 0
+    formula_field.refresh_from_db()
+    assert formula_field.formula_type == "text"
+    model = table.get_model()
+    assert getattr(model.trash.get(id=row.id), formula_field.db_column) == "2"
+
+
+@pytest.mark.django_db
+def test_perm_deleting_a_field_removes_its_archived_values(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user, database=table.database)
+    text_field = data_fixture.create_text_field(table=table)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=other_table
+    )
+    other_row = RowHandler().create_row(user, other_table)
+    row = RowHandler().create_row(
+        user,
+        table,
+        values={text_field.db_column: "Car", link_field.db_column: [other_row.id]},
+    )
+    through_table = link_field.through_table_name
+
+    RowHandler().delete_row(user, table, row)
+    RowArchiveHandler().archive_trashed_rows(table)
+    FieldHandler().delete_field(user, text_field)
+    FieldHandler().delete_field(user, link_field)
+    TrashEntry.objects.filter(trash_item_type="field").update(
+        should_be_permanently_deleted=True
+    )
+    TrashHandler.permanently_delete_marked_trash()
+
+    archived_row = ArchivedRow.objects.get(table=table, row_id=row.id)
+    assert text_field.db_column not in archived_row.values
+    assert through_table not in archived_row.relations
+
+
+@pytest.mark.django_db
+def test_perm_deleting_archived_rows_deletes_the_relations_linking_to_them(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user, database=table.database)
+    one_way_link_field = FieldHandler().create_field(
+        user,
+        other_table,
+        "link_row",
+        name="One way",
+        link_row_table=table,
+        has_related_field=False,
+    )
+    self_link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Self", link_row_table=table
+    )
+    row, kept_row = [RowHandler().create_row(user, table) for _ in range(2)]
+    RowHandler().update_row_by_id(
+        user, table, kept_row.id, {self_link_field.db_column: [row.id]}
+    )
+    other_row = RowHandler().create_row(
+        user, other_table, values={one_way_link_field.db_column: [row.id, kept_row.id]}
+    )
+    one_way_through_model = (
+        other_table.get_model()
+        ._meta.get_field(one_way_link_field.db_column)
+        .remote_field.through
+    )
+    self_through_model = (
+        table.get_model()
+        ._meta.get_field(self_link_field.db_column)
+        .remote_field.through
+    )
+
+    RowHandler().delete_row(user, table, row)
+    RowArchiveHandler().archive_trashed_rows(table)
+    assert one_way_through_model.objects.count() == 2
+    assert self_through_model.objects.count() == 1
+
+    TrashEntry.objects.filter(trash_item_type="row").update(
+        should_be_permanently_deleted=True
+    )
+    TrashHandler.permanently_delete_marked_trash()
+
+    assert ArchivedRow.objects.count() == 0
+    assert self_through_model.objects.count() == 0
+    linked_rows = getattr(
+        other_table.get_model().objects.get(id=other_row.id),
+        one_way_link_field.db_column,
+    ).all()
+    assert [linked_row.id for linked_row in linked_rows] == [kept_row.id]
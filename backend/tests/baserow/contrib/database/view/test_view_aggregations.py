@@ -5,9 +5,16 @@ import pytest
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.exceptions import (
+    AggregationDeltaNotApplicable,
+    FieldAggregationNotSupported,
+)
 from baserow.contrib.database.views.handler import ViewHandler
-from baserow.contrib.database.views.registries import view_aggregation_type_registry
+from baserow.contrib.database.views.registries import (
+    view_aggregation_type_registry,
+    view_type_registry,
+)
 from baserow.core.trash.handler import TrashHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -467,3 +474,162 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
         user, grid_view_one
     )
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db
+def test_view_aggregations_apply_delta():
+    registry = view_aggregation_type_registry
+
+    assert registry.get("empty_count").apply_delta(3, 2, 1) == 4
+    assert registry.get("not_empty_count").apply_delta(3, None, 1) == 2
+    assert registry.get("sum").apply_delta(Decimal("3"), Decimal("2"), None) == 5
+    assert registry.get("sum").apply_delta(None, Decimal("2"), None) == 2
+    assert registry.get("sum").apply_delta(None, None, None) is None
+    assert registry.get("min").apply_delta(3, 1, None) == 1
+    assert registry.get("min").apply_delta(3, None, 4) == 3
+    assert registry.get("max").apply_delta(None, 1, None) == 1
+    assert registry.get("max").apply_delta(3, 5, 2) == 5
+
+    with pytest.raises(AggregationDeltaNotApplicable):
+        # The remaining rows might not have any value.
+        registry.get("sum").apply_delta(Decimal("3"), None, Decimal("3"))
+    with pytest.raises(AggregationDeltaNotApplicable):
+        # The current minimum has been removed.
+        registry.get("min").apply_delta(1, 4, 1)
+    with pytest.raises(AggregationDeltaNotApplicable):
+        registry.get("max").apply_delta(5, None, 5)
+    with pytest.raises(AggregationDeltaNotApplicable):
+        registry.get("median").apply_delta(1, 1, None)
+
+    assert registry.get("sum").decomposable is True
+    assert registry.get("median").decomposable is False
+    assert registry.get("decile").decomposable is False
+    assert registry.get("unique_count").decomposable is False
+
+
+def get_cached_and_missing_aggregations(view):
+    view_type = view_type_registry.get_by_model(view)
+    return ViewHandler()._get_aggregations_to_compute(
+        view, view_type.get_aggregations(view)
+    )
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_updated_incrementally(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="5"
+    )
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_raw_type": "sum"},
+            text_field.id: {"aggregation_raw_type": "empty_count"},
+        },
+    )
+
+    row_handler = RowHandler()
+    row_1 = row_handler.create_row(
+        user, table, {number_field.db_column: 10, text_field.db_column: "a"}
+    )
+    row_handler.create_row(user, table, {number_field.db_column: 20})
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 30,
+        text_field.db_column: 1,
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_3 = row_handler.create_row(user, table, {number_field.db_column: 6})
+    cached, missing = get_cached_and_missing_aggregations(grid_view)
+    assert missing == {}
+    assert cached == {number_field.db_column: 36, text_field.db_column: 2}
+
+    # The row leaves the view because of the filter.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_row_by_id(user, table, row_1.id, {number_field.db_column: 1})
+    cached, missing = get_cached_and_missing_aggregations(grid_view)
+    assert missing == {}
+    assert cached == {number_field.db_column: 26, text_field.db_column: 2}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_row_by_id(user, table, row_3.id)
+    cached, missing = get_cached_and_missing_aggregations(grid_view)
+    assert missing == {}
+    assert cached == {number_field.db_column: 20, text_field.db_column: 1}
+
+    assert view_handler.get_view_field_aggregations(
+        user, grid_view
+    ) == view_handler.get_field_aggregations(
+        user,
+        grid_view,
+        [(number_field, "sum"), (text_field, "empty_count")],
+    )
+
+
+@pytest.mark.django_db
+def test_view_aggregations_snapshots_are_skipped_if_nothing_is_cached(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={number_field.id: {"aggregation_raw_type": "sum"}},
+    )
+    row = RowHandler().create_row(user, table, {number_field.db_column: 1})
+    model = table.get_model()
+
+    with django_assert_num_queries(0):
+        assert view_handler.get_view_aggregations_snapshots(table, model, [row]) == []
+
+    view_handler.get_view_field_aggregations(user, grid_view)
+
+    snapshots = view_handler.get_view_aggregations_snapshots(table, model, [row])
+    assert [snapshot.view.id for snapshot in snapshots] == [grid_view.id]
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_recomputed_if_delta_not_applicable(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={number_field.id: {"aggregation_raw_type": "min"}},
+    )
+
+    row_handler = RowHandler()
+    row_1 = row_handler.create_row(user, table, {number_field.db_column: 1})
+    row_handler.create_row(user, table, {number_field.db_column: 2})
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 1,
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_row_by_id(user, table, row_1.id)
+    cached, missing = get_cached_and_missing_aggregations(grid_view)
+    assert cached == {}
+    assert list(missing.keys()) == [number_field.db_column]
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 2,
+    }
@@ -1957,6 +1957,46 @@ def test_public_view_row_checker_does_not_cache_when_any_filtered_fields_updated
     assert row_checker.get_public_views_where_row_is_visible(visible_row) == []
 
 
+@pytest.mark.django_db
+def test_public_view_row_checker_checks_all_views_in_one_query(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    public_views = []
+    for i, value in enumerate(["a", "b", "a"]):
+        public_view = data_fixture.create_grid_view(
+            user, table=table, public=True, order=i
+        )
+        data_fixture.create_view_filter(
+            view=public_view, field=field, type="equal", value=value
+        )
+        public_views.append(public_view.view_ptr.specific)
+
+    model = table.get_model()
+    row_a = model.objects.create(**{f"field_{field.id}": "a"})
+    row_b = model.objects.create(**{f"field_{field.id}": "b"})
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table,
+        model,
+        only_include_views_which_want_realtime_events=True,
+        updated_field_ids=[field.id],
+    )
+
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_rows_are_visible([row_a, row_b]) == [
+            PublicViewRows(view=public_views[0], allowed_row_ids={row_a.id}),
+            PublicViewRows(view=public_views[1], allowed_row_ids={row_b.id}),
+            PublicViewRows(view=public_views[2], allowed_row_ids={row_a.id}),
+        ]
+
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_row_is_visible(row_b) == [
+            public_views[1]
+        ]
+
+
 @pytest.mark.django_db
 def test_public_view_row_checker_runs_expected_queries_on_init(
     data_fixture, django_assert_num_queries
@@ -2074,14 +2114,14 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
         updated_field_ids=[filtered_field.id, unfiltered_field.id],
     )
     specific_another_view = another_public_grid_view.view_ptr.specific
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Still a single query, checking the row against all the public views
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             view_ptr_specific,
             specific_another_view,
         ]
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Still a single query, checking the row against all the public views
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
 
@@ -4289,3 +4329,157 @@ def test_get_queryset_apply_sorts(data_fixture):
 
     row_ids = [row.id for row in rows]
     assert row_ids == [row_3.id, row_2.id, row_1.id]
+
+
+@pytest.mark.django_db
+def test_get_view_row_count_of_small_table_is_exact(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.create()
+    model.objects.create()
+
+    queryset = ViewHandler().get_queryset(grid_view, model=model)
+    assert ViewHandler().get_view_row_count(grid_view, queryset) == (2, True)
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD=1)
+def test_get_view_row_count_of_large_table(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid_view = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(
+        user,
+        table,
+        [{text_field.db_column: "a"}, {text_field.db_column: "b"}],
+    )
+    view_handler = ViewHandler()
+
+    with patch.object(view_handler, "_get_estimated_row_count", return_value=10):
+        model = table.get_model()
+        queryset = view_handler.get_queryset(grid_view, model=model)
+        assert view_handler.get_view_row_count(grid_view, queryset) == (10, False)
+
+        data_fixture.create_view_filter(
+            view=grid_view, field=text_field, type="equal", value="a"
+        )
+        queryset = view_handler.get_queryset(grid_view, model=model)
+        assert view_handler.get_view_row_count(grid_view, queryset) == (1, True)
+
+        # Rows created without the handler don't invalidate the cached count.
+        model.objects.create(**{text_field.db_column: "a"})
+        assert view_handler.get_view_row_count(grid_view, queryset) == (1, True)
+
+        RowHandler().create_rows(user, table, [{text_field.db_column: "a"}])
+        assert view_handler.get_view_row_count(grid_view, queryset) == (3, True)
+
+
+@pytest.mark.django_db
+def test_get_group_by_metadata_in_rows_of_all_levels_in_one_query(
+    data_fixture, django_assert_num_queries
+):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+
+    model = table.get_model()
+    for text, number, boolean in [
+        ("Green", 10, False),
+        ("Green", 10, True),
+        ("Green", 20, True),
+        ("Orange", 10, True),
+        ("Red", 10, True),
+    ]:
+        model.objects.create(
+            **{
+                text_field.db_column: text,
+                number_field.db_column: number,
+                boolean_field.db_column: boolean,
+            }
+        )
+
+    queryset = model.objects.all()
+    # Only the first two rows are on the page, so the other groups must not be
+    # counted.
+    rows = list(queryset[:2])
+
+    with django_assert_num_queries(1):
+        counts = ViewHandler().get_group_by_metadata_in_rows(
+            [text_field, number_field, boolean_field], rows, queryset
+        )
+
+    assert counts == {
+        text_field: [{text_field.db_column: "Green", "count": 3}],
+        number_field: [
+            {
+                text_field.db_column: "Green",
+                number_field.db_column: Decimal("10"),
+                "count": 2,
+            }
+        ],
+        boolean_field: unordered(
+            [
+                {
+                    text_field.db_column: "Green",
+                    number_field.db_column: Decimal("10"),
+                    boolean_field.db_column: False,
+                    "count": 1,
+                },
+                {
+                    text_field.db_column: "Green",
+                    number_field.db_column: Decimal("10"),
+                    boolean_field.db_column: True,
+                    "count": 1,
+                },
+            ]
+        ),
+    }
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD=1)
+def test_get_group_by_metadata_in_rows_of_large_table_is_cached(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid_view = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(
+        user,
+        table,
+        [{text_field.db_column: "a"}, {text_field.db_column: "b"}],
+    )
+    view_handler = ViewHandler()
+
+    with patch.object(view_handler, "_get_estimated_row_count", return_value=10):
+        model = table.get_model()
+        queryset = view_handler.get_queryset(grid_view, model=model)
+        rows = list(queryset)
+
+        def get_counts():
+            return view_handler.get_group_by_metadata_in_rows(
+                [text_field], rows, queryset, view=grid_view
+            )[text_field]
+
+        expected = unordered(
+            [
+                {text_field.db_column: "a", "count": 1},
+                {text_field.db_column: "b", "count": 1},
+            ]
+        )
+        assert get_counts() == expected
+
+        # Rows created without the handler don't invalidate the cached counts.
+        model.objects.create(**{text_field.db_column: "a"})
+        assert get_counts() == expected
+
+        RowHandler().create_rows(user, table, [{text_field.db_column: "a"}])
+        assert get_counts() == unordered(
+            [
+                {text_field.db_column: "a", "count": 3},
+                {text_field.db_column: "b", "count": 1},
+            ]
+        )
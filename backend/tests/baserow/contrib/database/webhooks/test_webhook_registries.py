@@ -1,8 +1,12 @@
 from unittest.mock import patch
 
+from django.test import override_settings
+
 import pytest
 
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.webhooks.handler import WebhookHandler
+from baserow.contrib.database.webhooks.models import TableWebhookBatchedEvent
 
 
 @pytest.mark.django_db(transaction=True)
@@ -39,3 +43,36 @@ def test_signal_listener(mock_call_webhook, data_fixture):
         "event_type": "rows.created",
         "items": [{"id": 1, "order": "1.00000000000000000000"}],
     }
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS=3)
+@patch("baserow.contrib.database.webhooks.handler.call_webhook_batched_events")
+@patch("baserow.contrib.database.webhooks.registries.call_webhook")
+def test_signal_listener_batches_events(
+    mock_call_webhook, mock_call_webhook_batched_events, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    webhook = data_fixture.create_table_webhook(
+        user=user, table=table, url="http://localhost/", batch_events=True
+    )
+    WebhookHandler().clear_batched_events_call_scheduled(webhook.id)
+
+    RowHandler().create_row(user=user, table=table, values={})
+    RowHandler().create_row(user=user, table=table, values={})
+
+    mock_call_webhook.delay.assert_not_called()
+    # The delivery is only scheduled once for all the events of the window.
+    mock_call_webhook_batched_events.apply_async.assert_called_once_with(
+        args=(webhook.id,), countdown=3
+    )
+    batched_events = list(TableWebhookBatchedEvent.objects.filter(webhook=webhook))
+    assert [event.event_type for event in batched_events] == [
+        "rows.created",
+        "rows.created",
+    ]
+    assert [event.payload["items"][0]["id"] for event in batched_events] == [1, 2]
+    assert batched_events[0].event_id != batched_events[1].event_id
+
+    WebhookHandler().clear_batched_events_call_scheduled(webhook.id)
@@ -1,15 +1,25 @@
+import json
 from unittest.mock import patch
 
-from django.db import transaction
+from django.db import connection, transaction
 from django.test import override_settings
 
 import httpretty
 import pytest
 import responses
 from celery.exceptions import Retry
+from freezegun import freeze_time
+from requests import RequestException
 
-from baserow.contrib.database.webhooks.models import TableWebhookCall
-from baserow.contrib.database.webhooks.tasks import call_webhook
+from baserow.contrib.database.webhooks.handler import WebhookHandler
+from baserow.contrib.database.webhooks.models import (
+    TableWebhookBatchedEvent,
+    TableWebhookCall,
+)
+from baserow.contrib.database.webhooks.tasks import (
+    call_webhook,
+    call_webhook_batched_events,
+)
 from baserow.test_utils.helpers import stub_getaddrinfo
 
 
@@ -207,3 +217,197 @@ def test_can_call_webhook_to_localhost_when_private_addresses_allowed(
     assert not call.error
     assert call.response_status == 201
     assert webhook.active
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL=0,
+    BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES=1,
+)
+def test_call_webhook_makes_request_outside_of_transaction(data_fixture):
+    webhook = data_fixture.create_table_webhook()
+    in_atomic_block = []
+
+    def make_request(*args, **kwargs):
+        in_atomic_block.append(connection.in_atomic_block)
+        raise RequestException("Receiver is down")
+
+    with patch.object(WebhookHandler, "make_request", side_effect=make_request):
+        call_webhook.run(
+            webhook_id=webhook.id,
+            event_id="00000000-0000-0000-0000-000000000000",
+            event_type="rows.created",
+            method="POST",
+            url="http://localhost/",
+            headers={},
+            payload={"type": "rows.created"},
+        )
+
+    assert in_atomic_block == [False]
+    created_call = TableWebhookCall.objects.get(webhook=webhook)
+    assert created_call.error == "Receiver is down"
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK=1)
+def test_call_webhook_is_postponed_when_too_many_calls_in_progress(data_fixture):
+    webhook = data_fixture.create_table_webhook()
+    handler = WebhookHandler()
+    call_slot = handler.acquire_call_slot(webhook.id)
+    assert call_slot
+    assert handler.acquire_call_slot(webhook.id) is None
+
+    try:
+        with patch.object(WebhookHandler, "make_request") as mock_make_request:
+            with patch.object(call_webhook, "apply_async") as mock_apply_async:
+                call_webhook.run(
+                    webhook_id=webhook.id,
+                    event_id="00000000-0000-0000-0000-000000000000",
+                    event_type="rows.created",
+                    method="POST",
+                    url="http://localhost/",
+                    headers={},
+                    payload={"type": "rows.created"},
+                )
+    finally:
+        handler.release_call_slot(call_slot)
+
+    mock_make_request.assert_not_called()
+    mock_apply_async.assert_called_once()
+    assert 0.5 <= mock_apply_async.call_args.kwargs["countdown"] <= 1
+    assert mock_apply_async.call_args.kwargs["kwargs"]["slot_waits"] == 1
+    assert mock_apply_async.call_args.kwargs["retries"] == 0
+    assert TableWebhookCall.objects.count() == 0
+
+    # The slot is available again once released.
+    call_slot = handler.acquire_call_slot(webhook.id)
+    assert call_slot
+    handler.release_call_slot(call_slot)
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK=1,
+    BASEROW_WEBHOOKS_MAX_CALL_SLOT_WAITS=3,
+)
+def test_call_webhook_waiting_too_long_for_a_call_slot_counts_as_failed_attempt(
+    data_fixture,
+):
+    webhook = data_fixture.create_table_webhook()
+    handler = WebhookHandler()
+    call_slot = handler.acquire_call_slot(webhook.id)
+
+    try:
+        with patch.object(WebhookHandler, "make_request") as mock_make_request:
+            with patch.object(call_webhook, "apply_async") as mock_apply_async:
+                with pytest.raises(Retry):
+                    call_webhook.run(
+                        webhook_id=webhook.id,
+                        event_id="00000000-0000-0000-0000-000000000000",
+                        event_type="rows.created",
+                        method="POST",
+                        url="http://localhost/",
+                        headers={},
+                        payload={"type": "rows.created"},
+                        slot_waits=3,
+                    )
+    finally:
+        handler.release_call_slot(call_slot)
+
+    mock_make_request.assert_not_called()
+    mock_apply_async.assert_not_called()
+    assert TableWebhookCall.objects.count() == 0
+
+
+def test_get_call_slot_wait_countdown_grows_exponentially_up_to_a_maximum():
+    handler = WebhookHandler()
+
+    for waits, max_countdown in [(0, 1), (1, 2), (3, 8), (5, 32), (6, 60), (20, 60)]:
+        countdown = handler.get_call_slot_wait_countdown(waits)
+        assert max_countdown / 2 <= countdown <= max_countdown
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@override_settings(BASEROW_WEBHOOKS_BATCH_MAX_EVENTS=2)
+def test_call_webhook_batched_events(data_fixture):
+    webhook = data_fixture.create_table_webhook(
+        url="http://localhost/", batch_events=True
+    )
+    batched_events = [
+        TableWebhookBatchedEvent.objects.create(
+            webhook=webhook,
+            event_id=f"00000000-0000-0000-0000-00000000000{i}",
+            event_type="rows.created",
+            payload={"event_type": "rows.created", "items": [{"id": i}]},
+        )
+        for i in range(3)
+    ]
+    responses.add(responses.POST, "http://localhost/", json={}, status=200)
+
+    call_webhook_batched_events.run(webhook.id)
+
+    # The events are delivered in order, in calls of at most 2 events.
+    assert len(responses.calls) == 2
+    payloads = [json.loads(call.request.body) for call in responses.calls]
+    assert [payload["event_type"] for payload in payloads] == ["batch", "batch"]
+    assert [payload["event_id"] for payload in payloads] == [
+        str(batched_events[0].event_id),
+        str(batched_events[2].event_id),
+    ]
+    assert [payload["events"] for payload in payloads] == [
+        [batched_events[0].payload, batched_events[1].payload],
+        [batched_events[2].payload],
+    ]
+    assert responses.calls[0].request.headers["X-Baserow-Event"] == "batch"
+    assert TableWebhookBatchedEvent.objects.count() == 0
+    assert TableWebhookCall.objects.filter(event_type="batch").count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@override_settings(
+    BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL=1,
+    BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES=8,
+)
+def test_call_webhook_batched_events_keeps_events_until_delivered(data_fixture):
+    webhook = data_fixture.create_table_webhook(
+        url="http://localhost/", batch_events=True
+    )
+    TableWebhookBatchedEvent.objects.create(
+        webhook=webhook,
+        event_id="00000000-0000-0000-0000-000000000000",
+        event_type="rows.created",
+        payload={"event_type": "rows.created"},
+    )
+    responses.add(responses.POST, "http://localhost/", json={}, status=500)
+    mock_path = "baserow.contrib.database.webhooks.handler.call_webhook_batched_events"
+
+    with freeze_time("2024-01-01 00:00:00"), patch(mock_path) as mock_task:
+        call_webhook_batched_events.run(webhook.id)
+
+    assert len(responses.calls) == 1
+    assert TableWebhookBatchedEvent.objects.count() == 1
+    mock_task.apply_async.assert_called_once_with(args=(webhook.id,), countdown=1)
+
+    # A task scheduled by a new event during the backoff doesn't call the webhook,
+    # but waits until the failed call can be retried.
+    with freeze_time("2024-01-01 00:00:00.5"), patch(mock_path) as mock_task:
+        call_webhook_batched_events.run(webhook.id)
+
+    assert len(responses.calls) == 1
+    mock_task.apply_async.assert_called_once_with(args=(webhook.id,), countdown=1)
+
+    # The events are skipped once the max retries have been reached.
+    with freeze_time("2024-01-01 00:00:01"), patch(mock_path) as mock_task:
+        call_webhook_batched_events.run(webhook.id)
+
+    assert len(responses.calls) == 2
+    assert TableWebhookBatchedEvent.objects.count() == 0
+    assert TableWebhookCall.objects.filter(webhook=webhook).count() == 1
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 2
+    mock_task.apply_async.assert_called_once_with(args=(webhook.id,), countdown=0)
+    assert WebhookHandler().get_batched_events_retries(webhook.id) == 0
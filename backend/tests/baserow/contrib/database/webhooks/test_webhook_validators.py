@@ -1,4 +1,5 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from ipaddress import ip_network
 from unittest.mock import patch
 
@@ -7,8 +8,14 @@ from django.test import override_settings
 
 import httpretty as httpretty
 import pytest
+import responses
+from requests import Session
 
-from baserow.contrib.database.webhooks.validators import url_validator
+from baserow.contrib.database.webhooks.validators import (
+    get_webhook_request_function,
+    get_webhook_session,
+    url_validator,
+)
 from baserow.test_utils.helpers import stub_getaddrinfo
 
 URL_BLACKLIST_ONLY_ALLOWING_GOOGLE_WEBHOOKS = re.compile(r"(?!(www\.)?google\.com).*")
@@ -186,3 +193,41 @@ def test_advocate_hostname_blacklist_overrides_ip_lists(
 
     # This request should still go through
     url_validator("https://www.google.com/")
+
+
+@override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=False)
+def test_webhook_session_is_reused_by_the_thread():
+    session = get_webhook_session()
+
+    assert get_webhook_session() is session
+    assert get_webhook_request_function().__self__ is session
+    # The advocate session validates the addresses it connects to.
+    assert type(session) is not Session
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(get_webhook_session).result() is not session
+
+    with override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True):
+        assert type(get_webhook_session()) is Session
+
+    with override_settings(BASEROW_WEBHOOKS_IP_BLACKLIST=[ip_network("1.1.1.1/32")]):
+        assert type(get_webhook_session()) is not Session
+        assert get_webhook_session() is not session
+
+
+@responses.activate
+@override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True)
+def test_webhook_session_doesnt_keep_cookies():
+    responses.add(
+        responses.GET,
+        "http://localhost/",
+        headers={"Set-Cookie": "session=secret; Path=/"},
+        status=200,
+    )
+    session = get_webhook_session()
+
+    session.get("http://localhost/")
+    session.get("http://localhost/")
+
+    assert len(session.cookies) == 0
+    assert "Cookie" not in responses.calls[1].request.headers
@@ -468,6 +468,36 @@ def test_multi_field_prefetch(data_fixture):
     prefetch_function_2.assert_called_once()
 
 
+@pytest.mark.django_db
+def test_multi_field_prefetch_when_iterating_in_chunks(data_fixture):
+    data_fixture.create_workspace()
+    data_fixture.create_workspace()
+    data_fixture.create_workspace()
+
+    class TemporaryWorkspaceQueryset(MultiFieldPrefetchQuerysetMixin, QuerySet):
+        pass
+
+    class TemporaryWorkspace(Workspace):
+        temporary_multi_field_objects = TemporaryWorkspaceQueryset.as_manager()
+
+        class Meta:
+            proxy = True
+            app_label = Workspace._meta.app_label
+
+    prefetch_function = MagicMock()
+
+    queryset = (
+        TemporaryWorkspace.temporary_multi_field_objects.all()
+        .order_by("id")
+        .multi_field_prefetch(prefetch_function)
+    )
+    workspaces = list(queryset.iterator(chunk_size=2))
+
+    assert prefetch_function.call_count == 2
+    assert prefetch_function.call_args_list[0][0][1] == workspaces[:2]
+    assert prefetch_function.call_args_list[1][0][1] == workspaces[2:]
+
+
 # CombinedForeignKeyAndManyToManyMultipleFieldPrefetch
 @pytest.mark.django_db
 def test_combined_foreign_key_and_many_to_many_multiple_field_prefetch(
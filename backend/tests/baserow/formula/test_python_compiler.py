@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+import pytest
+
+from baserow.core.formula import resolve_formula
+from baserow.core.formula.parser.exceptions import (
+    BaserowFormulaSyntaxError,
+    InvalidNumberOfArguments,
+)
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.python_compiler import compile_formula
+from baserow.core.formula.registries import formula_runtime_function_registry
+from baserow.test_utils.helpers import load_test_cases
+
+TEST_DATA = load_test_cases("formula_runtime_cases")
+
+VALID_FORMULA_TESTS = TEST_DATA["VALID_FORMULA_TESTS"]
+INVALID_FORMULA_TESTS = TEST_DATA["INVALID_FORMULA_TESTS"]
+
+
+@pytest.mark.parametrize("test_data", VALID_FORMULA_TESTS)
+def test_valid_compiled_formulas(test_data):
+    formula = test_data["formula"]
+    result = test_data["result"]
+    context = test_data["context"]
+
+    compiled_formula = compile_formula(formula)
+    assert compiled_formula(formula_runtime_function_registry, context) == result
+
+
+@pytest.mark.parametrize("test_data", INVALID_FORMULA_TESTS)
+def test_invalid_compiled_formulas(test_data):
+    formula = test_data["formula"]
+    context = test_data["context"]
+
+    with pytest.raises(Exception):
+        compile_formula(formula)(formula_runtime_function_registry, context)
+
+
+def test_compiled_formula_function_does_not_exist():
+    compiled_formula = compile_formula("notExistingFunction(1,2,3)")
+    with pytest.raises(BaserowFormulaSyntaxError):
+        compiled_formula(formula_runtime_function_registry, {})
+
+
+def test_compiled_formula_invalid_number_of_arguments():
+    compiled_formula = compile_formula("get(1,2)")
+    with pytest.raises(InvalidNumberOfArguments):
+        compiled_formula(formula_runtime_function_registry, {})
+
+
+@patch(
+    "baserow.core.formula.parser.python_compiler.get_parse_tree_for_formula",
+    wraps=get_parse_tree_for_formula,
+)
+def test_resolve_formula_only_parses_a_formula_once(mock_parse):
+    compile_formula.cache_clear()
+    formula = "concat(get('a'), '-', get('b'))"
+
+    results = [
+        resolve_formula(
+            formula, formula_runtime_function_registry, {"a": str(i), "b": "x"}
+        )
+        for i in range(3)
+    ]
+
+    assert results == ["0-x", "1-x", "2-x"]
+    mock_parse.assert_called_once_with(formula)
@@ -2,7 +2,7 @@ from django.dispatch import receiver
 
 from baserow_premium.row_comments.models import RowComment
 
-from baserow.core.trash.signals import permanently_deleted
+from baserow.core.trash.signals import items_permanently_deleted, permanently_deleted
 
 
 @receiver(permanently_deleted, sender="row", dispatch_uid="row_comment_cleanup")
@@ -10,3 +10,12 @@ def permanently_deleted(sender, **kwargs):
     table_id = kwargs["parent_id"]
     trash_item_id = kwargs["trash_item_id"]
     RowComment.objects.filter(table_id=table_id, row_id=trash_item_id).delete()
+
+
+@receiver(
+    items_permanently_deleted, sender="row", dispatch_uid="row_comments_bulk_cleanup"
+)
+def rows_permanently_deleted(sender, **kwargs):
+    table_id = kwargs["parent_id"]
+    trash_item_ids = kwargs["trash_item_ids"]
+    RowComment.objects.filter(table_id=table_id, row_id__in=trash_item_ids).delete()